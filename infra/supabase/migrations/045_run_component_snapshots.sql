@@ -0,0 +1,45 @@
+-- ================================================
+-- Migration 045: Run Component Snapshots
+-- Description: 후보별 snapshot 중복 제거
+--   - Run 단위 컴포넌트 스냅샷을 (run_id, content_hash)로 1회 저장
+--   - candidates.snapshot_refs = {"target": hash, "antibody": hash, "linker": hash, "payload": hash}
+--   - 기존 후보의 candidates.snapshot은 그대로 유지 (하위 호환)
+-- ================================================
+
+CREATE TABLE IF NOT EXISTS public.run_component_snapshots (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    run_id UUID NOT NULL REFERENCES public.design_runs(id) ON DELETE CASCADE,
+    component_type TEXT NOT NULL,
+    -- Values: target / antibody / linker / payload
+    component_id TEXT,
+    content_hash TEXT NOT NULL,
+    snapshot JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE(run_id, content_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_run_component_snapshots_run
+    ON public.run_component_snapshots(run_id);
+
+ALTER TABLE public.candidates
+ADD COLUMN IF NOT EXISTS snapshot_refs JSONB;
+
+-- RLS
+ALTER TABLE public.run_component_snapshots ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can read run_component_snapshots"
+    ON public.run_component_snapshots
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+CREATE POLICY "Service role can manage run_component_snapshots"
+    ON public.run_component_snapshots
+    FOR ALL
+    TO service_role
+    USING (true);
+
+COMMENT ON TABLE public.run_component_snapshots IS 'Run 단위 컴포넌트 스냅샷 (content-addressed, 후보는 snapshot_refs로 참조)';
+COMMENT ON COLUMN public.candidates.snapshot_refs IS '역할별 run_component_snapshots.content_hash';
+
+NOTIFY pgrst, 'reload config';
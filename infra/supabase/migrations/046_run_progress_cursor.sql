@@ -0,0 +1,26 @@
+-- ================================================
+-- Migration 046: Run Progress Cursor
+-- Description: Design Run 조합 인덱스 커서 체크포인트 / 재개
+--   - candidates.combination_index = 혼합 기수 조합 인덱스 (target, antibody, linker, payload, conjugation)
+--   - run_progress.cursor = 저장 완료된 조합 인덱스 상한 (샤드 완료 시 갱신)
+--   - run_progress.checkpoint = {"key": 조합 공간/파라미터 키, "stats": 리젝트/적중 통계}
+--   - 재시도 시 key가 같으면 combination_index >= cursor 후보만 삭제 후 cursor부터 재개
+-- ================================================
+
+ALTER TABLE public.candidates
+ADD COLUMN IF NOT EXISTS combination_index BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_run_combination
+    ON public.candidates(run_id, combination_index);
+
+ALTER TABLE public.run_progress
+ADD COLUMN IF NOT EXISTS cursor BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE public.run_progress
+ADD COLUMN IF NOT EXISTS checkpoint JSONB;
+
+COMMENT ON COLUMN public.candidates.combination_index IS '조합 공간 혼합 기수 인덱스 (생성 순서, 후보 O(1) 복원)';
+COMMENT ON COLUMN public.run_progress.cursor IS '저장 완료 조합 인덱스 상한 (재개 시작점)';
+COMMENT ON COLUMN public.run_progress.checkpoint IS '커서 시점 생성 통계 + 재개 가능 여부 키';
+
+NOTIFY pgrst, 'reload config';
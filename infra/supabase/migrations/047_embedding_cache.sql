@@ -0,0 +1,34 @@
+-- ================================================
+-- Migration 047: Embedding Cache
+-- Description: 텍스트 임베딩 캐시 (EMBEDDING_CACHE_URL=supabase)
+--   - 키: (model, checksum) - checksum = 정규화 텍스트(공백 축약, 8000자 절단) sha256
+--   - 재청킹/재색인, 반복 시드 쿼리에서 같은 텍스트는 임베딩 API 재호출 없이 재사용
+--   - embedding은 차원 미지정 vector (모델별 차원 상이, 키 조회 전용이라 벡터 인덱스 불필요)
+-- ================================================
+
+CREATE TABLE IF NOT EXISTS public.embedding_cache (
+    model TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (model, checksum)
+);
+
+-- RLS
+ALTER TABLE public.embedding_cache ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can read embedding_cache"
+    ON public.embedding_cache
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+CREATE POLICY "Service role can manage embedding_cache"
+    ON public.embedding_cache
+    FOR ALL
+    TO service_role
+    USING (true);
+
+COMMENT ON TABLE public.embedding_cache IS '임베딩 캐시 (model + 정규화 텍스트 sha256 → 벡터)';
+
+NOTIFY pgrst, 'reload config';
@@ -0,0 +1,50 @@
+-- ================================================
+-- Migration 048: match_literature_chunks citation fields
+-- Description: 벡터 검색 결과에 인용/재순위에 필요한 컬럼 추가
+--   - polarity (negative 근거 부스팅), document_pmid (인용)
+--   - 임베딩 없는 청크 제외 (embedding_status pending/failed)
+--   - 반환 타입 변경이라 DROP 후 재생성 (기존 컬럼/순서 유지 → 기존 호출자 호환)
+-- ================================================
+
+DROP FUNCTION IF EXISTS public.match_literature_chunks(vector, float, int);
+
+CREATE OR REPLACE FUNCTION public.match_literature_chunks (
+  query_embedding vector(1536),
+  match_threshold float,
+  match_count int
+)
+RETURNS TABLE (
+  id uuid,
+  document_id uuid,
+  content text,
+  similarity float,
+  document_title text,
+  document_authors jsonb,
+  document_year date,
+  polarity text,
+  document_pmid text
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    lc.id,
+    lc.document_id,
+    lc.content,
+    1 - (lc.embedding <=> query_embedding) as similarity,
+    ld.title as document_title,
+    ld.authors as document_authors,
+    ld.publication_date as document_year,
+    lc.polarity,
+    ld.pmid as document_pmid
+  FROM public.literature_chunks lc
+  JOIN public.literature_documents ld ON lc.document_id = ld.id
+  WHERE lc.embedding IS NOT NULL
+    AND 1 - (lc.embedding <=> query_embedding) > match_threshold
+  ORDER BY lc.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
+
+NOTIFY pgrst, 'reload config';
@@ -0,0 +1,27 @@
+-- ================================================
+-- Migration 049: save_chunk_embeddings RPC
+-- Description: 청크 임베딩 일괄 저장 (배치당 UPDATE 1회)
+--   - id 기준으로 embedding / embedding_status만 갱신
+--     (조회 이후 재청킹이 chunk_index를 옮겨도 다른 컬럼을 되돌려 쓰지 않음)
+--   - items: [{"id": uuid, "embedding": [float, ...]}, ...]
+--   - 반환: 갱신된 행 수 (그 사이 삭제된 청크는 제외)
+-- ================================================
+
+CREATE OR REPLACE FUNCTION public.save_chunk_embeddings (
+  items jsonb
+)
+RETURNS int
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE public.literature_chunks lc
+    SET embedding = (item->>'embedding')::vector,
+        embedding_status = 'completed'
+    FROM jsonb_array_elements(items) AS item
+    WHERE lc.id = (item->>'id')::uuid
+    RETURNING lc.id
+  )
+  SELECT count(*)::int FROM updated;
+$$;
+
+NOTIFY pgrst, 'reload config';
@@ -5,11 +5,75 @@ Phase 2 DoD 검증용: 10,000 후보 p95 ≤ 60초
 
 사용법:
     python scripts/bench_run_10k.py
+    PARETO_BACKEND=python python scripts/bench_run_10k.py  # 백엔드 비교
 """
 import asyncio
+import os
+import sys
 import time
 import statistics
 from datetime import datetime
+from pathlib import Path
+
+# services/engine 의 app 패키지 사용
+ENGINE_DIR = Path(__file__).resolve().parent.parent / "services" / "engine"
+if str(ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(ENGINE_DIR))
+
+from app.scoring import (  # noqa: E402
+    BatchScoringEngine,
+    CandidateGenerator,
+    ObjectiveStore,
+    ParetoCalculator,
+)
+
+
+def build_synthetic_catalog(candidates: int = 10000):
+    """
+    벤치마크용 합성 카탈로그
+
+    10 targets × 2 antibodies × 5 linkers × 10 payloads × N conjugations ≈ candidates
+    """
+    targets = [
+        {
+            "id": f"t{i}",
+            "status": "active",
+            "expression": {"tumor": 20.0 + i * 7, "normal_max": 1.0 + i % 4},
+            "internalization": 0.5 + (i % 5) / 10,
+            "heterogeneity": 0.1 + (i % 3) / 10,
+            "critical_tissue_expression": i % 4 == 0,
+        }
+        for i in range(10)
+    ]
+    antibodies = [{"id": f"a{i}", "status": "active"} for i in range(2)]
+    linkers = [
+        {
+            "id": f"l{i}",
+            "status": "active",
+            "linker_type": "cleavable" if i % 2 else "non_cleavable",
+            "cleavage_risk": 0.1 * (i + 1),
+            "purification_difficulty": "high" if i == 4 else "normal",
+        }
+        for i in range(5)
+    ]
+    payloads = [
+        {
+            "id": f"p{i}",
+            "status": "active",
+            "logP": 1.5 + i * 0.4,
+            "solubility": 0.5,
+            "hazard_score": 0.2 + i * 0.05,
+            "bystander_capability": (i % 4) / 4,
+            "aggregation_prone": i % 3 == 0,
+        }
+        for i in range(10)
+    ]
+    n_conj = max(1, candidates // (len(targets) * 2 * 5 * 10))
+    conjugations = [
+        {"id": f"c{i}", "DAR": 2.0 + (i % 7), "site_specific": i % 2 == 0}
+        for i in range(n_conj)
+    ]
+    return targets, antibodies, linkers, payloads, conjugations
 
 
 async def simulate_run(candidates: int = 10000):
@@ -28,23 +92,57 @@ async def simulate_run(candidates: int = 10000):
     
     # Phase 1: 조합 생성 (generator)
     phase_start = time.perf_counter()
-    await asyncio.sleep(0.1)  # TODO: 실제 조합 생성
+    targets, antibodies, linkers, payloads, conjugations = build_synthetic_catalog(
+        candidates
+    )
+    generator = CandidateGenerator(
+        targets=targets,
+        antibodies=antibodies,
+        linkers=linkers,
+        payloads=payloads,
+        conjugations=conjugations,
+    )
     print(f"  - Combination build: {time.perf_counter() - phase_start:.2f}s")
     
-    # Phase 2: 하드리젝트
+    # Phase 2: 하드리젝트 (generator 순회, 인덱스 배치)
     phase_start = time.perf_counter()
-    await asyncio.sleep(0.05)  # TODO: 실제 하드리젝트
-    print(f"  - Hard reject: {time.perf_counter() - phase_start:.2f}s")
+    batches = list(generator.generate_index_batches())
+    print(
+        f"  - Hard reject: {time.perf_counter() - phase_start:.2f}s "
+        f"(accepted={generator.stats.accepted}, rejected={generator.stats.hard_rejected})"
+    )
     
-    # Phase 3: 벡터화 스코어 계산
+    # Phase 3: 벡터화 스코어 계산 (컴포넌트 부분 Term 1회 + 인덱스 결합)
     phase_start = time.perf_counter()
-    await asyncio.sleep(0.1)  # TODO: 실제 스코어 계산
-    print(f"  - Scoring: {time.perf_counter() - phase_start:.2f}s")
+    engine = BatchScoringEngine()
+    component_terms = engine.precompute_components(
+        generator.targets, generator.linkers, generator.payloads, generator.conjugations
+    )
+    scored = [
+        engine.score_indices(
+            component_terms,
+            batch.target_idx,
+            batch.linker_idx,
+            batch.payload_idx,
+            batch.conjugation_idx,
+        )
+        for batch in batches
+    ]
+    print(f"  - Scoring: {time.perf_counter() - phase_start:.2f}s ({sum(map(len, scored))} scored)")
     
     # Phase 4: 파레토 계산
     phase_start = time.perf_counter()
-    await asyncio.sleep(0.05)  # TODO: 실제 파레토 계산
-    print(f"  - Pareto: {time.perf_counter() - phase_start:.2f}s")
+    backend = os.getenv("PARETO_BACKEND", "auto")
+    with ObjectiveStore() as store:
+        for b, arrays in enumerate(scored):
+            store.append([f"{b}-{i}" for i in range(len(arrays))], arrays.objective_matrix())
+        fronts = ParetoCalculator(backend=backend).calculate_matrix(
+            store.matrix(), store.ids(), max_fronts=5
+        )
+    print(
+        f"  - Pareto[{backend}]: {time.perf_counter() - phase_start:.2f}s "
+        f"(front sizes={[f.member_count for f in fronts]})"
+    )
     
     total_time = time.perf_counter() - start
     return total_time
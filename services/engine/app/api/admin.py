@@ -1,6 +1,6 @@
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException
-from app.core.database import get_db
+from app.api.deps import get_async_db
 from app.core.security import require_admin
 import structlog
 
@@ -12,7 +12,7 @@ logger = structlog.get_logger()
 
 
 @router.post("/golden/seed")
-async def trigger_golden_seed(payload: Dict[str, Any], db=Depends(get_db)):
+async def trigger_golden_seed(payload: Dict[str, Any], db=Depends(get_async_db)):
     """
     Golden Seed 수집 트리거 (Target-Centric)
 
@@ -49,14 +49,14 @@ async def trigger_golden_seed(payload: Dict[str, Any], db=Depends(get_db)):
 
 
 @router.get("/golden/trend")
-async def get_golden_trend(db=Depends(get_db)):
+async def get_golden_trend(db=Depends(get_async_db)):
     """
     Golden Set 검증 트렌드 데이터 조회 (Real DB)
     """
     try:
         # 1. 최근 검증 실행 내역 조회
         runs_res = (
-            db.table("golden_validation_runs")
+            await db.table("golden_validation_runs")
             .select("*")
             .order("created_at", desc=True)
             .limit(20)
@@ -70,7 +70,7 @@ async def get_golden_trend(db=Depends(get_db)):
 
         # 2. 상세 지표 조회
         metrics_res = (
-            db.table("golden_validation_metrics")
+            await db.table("golden_validation_metrics")
             .select("*")
             .in_("run_id", run_ids)
             .execute()
@@ -3,13 +3,13 @@ Alerts API Endpoints
 시스템 알림 및 알람 관리
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 from datetime import datetime, timezone
 from pydantic import BaseModel
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -48,12 +48,11 @@ async def list_alerts(
     source: Optional[str] = Query(None),
     is_read: Optional[bool] = Query(None),
     limit: int = Query(50, ge=1, le=200),
+    db=Depends(get_async_db),
 ):
     """
     알림 목록 조회
     """
-    db = get_db()
-
     try:
         query = db.table("system_alerts").select("*")
 
@@ -64,7 +63,7 @@ async def list_alerts(
         if is_read is not None:
             query = query.eq("is_read", is_read)
 
-        result = query.order("created_at", desc=True).limit(limit).execute()
+        result = await query.order("created_at", desc=True).limit(limit).execute()
 
         return {
             "alerts": result.data,
@@ -79,12 +78,10 @@ async def list_alerts(
 
 
 @router.post("")
-async def create_alert(alert: AlertCreate):
+async def create_alert(alert: AlertCreate, db=Depends(get_async_db)):
     """
     새 알림 생성
     """
-    db = get_db()
-
     try:
         data = {
             "type": alert.type,
@@ -95,7 +92,7 @@ async def create_alert(alert: AlertCreate):
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        result = db.table("system_alerts").insert(data).execute()
+        result = await db.table("system_alerts").insert(data).execute()
 
         return {"id": result.data[0]["id"], "status": "created"}
 
@@ -105,15 +102,13 @@ async def create_alert(alert: AlertCreate):
 
 
 @router.post("/{alert_id}/read")
-async def mark_alert_read(alert_id: str):
+async def mark_alert_read(alert_id: str, db=Depends(get_async_db)):
     """
     알림 읽음 처리
     """
-    db = get_db()
-
     try:
         result = (
-            db.table("system_alerts")
+            await db.table("system_alerts")
             .update({"is_read": True})
             .eq("id", alert_id)
             .execute()
@@ -132,16 +127,17 @@ async def mark_alert_read(alert_id: str):
 
 
 @router.post("/read-all")
-async def mark_all_read():
+async def mark_all_read(db=Depends(get_async_db)):
     """
     모든 알림 읽음 처리
     """
-    db = get_db()
-
     try:
-        db.table("system_alerts").update({"is_read": True}).eq(
-            "is_read", False
-        ).execute()
+        await (
+            db.table("system_alerts")
+            .update({"is_read": True})
+            .eq("is_read", False)
+            .execute()
+        )
 
         return {"status": "all_marked_read"}
 
@@ -151,14 +147,12 @@ async def mark_all_read():
 
 
 @router.delete("/{alert_id}")
-async def delete_alert(alert_id: str):
+async def delete_alert(alert_id: str, db=Depends(get_async_db)):
     """
     알림 삭제
     """
-    db = get_db()
-
     try:
-        db.table("system_alerts").delete().eq("id", alert_id).execute()
+        await db.table("system_alerts").delete().eq("id", alert_id).execute()
 
         return {"status": "deleted"}
 
@@ -168,14 +162,12 @@ async def delete_alert(alert_id: str):
 
 
 @router.get("/stats")
-async def get_alert_stats():
+async def get_alert_stats(db=Depends(get_async_db)):
     """
     알림 통계
     """
-    db = get_db()
-
     try:
-        result = db.table("system_alerts").select("type, is_read").execute()
+        result = await db.table("system_alerts").select("type, is_read").execute()
 
         stats = {
             "total": len(result.data),
@@ -5,7 +5,7 @@ Automation API
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from typing import Dict, Any
-from app.core.database import get_supabase_client
+from app.api.deps import get_async_db
 from app.services.automation_service import get_automation_service
 from app.services.dataset_sync_service import get_dataset_sync_service
 
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/automation", tags=["automation"])
 async def trigger_validation(
     payload: Dict[str, Any],
     background_tasks: BackgroundTasks,
-    db=Depends(get_supabase_client),
+    db=Depends(get_async_db),
 ):
     """산식 변경에 따른 자동 검증 트리거 (Webhook용)"""
     service = get_automation_service(db)
@@ -26,7 +26,7 @@ async def trigger_validation(
 
 
 @router.post("/sync-clinical-trials")
-async def sync_clinical_trials(db=Depends(get_supabase_client)):
+async def sync_clinical_trials(db=Depends(get_async_db)):
     """ClinicalTrials.gov 데이터 동기화 실행"""
     service = get_dataset_sync_service(db)
     try:
@@ -2,12 +2,12 @@
 Catalog API Endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 from uuid import UUID
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 from app.core.queue import enqueue_compute_descriptors
 from app.schemas.catalog import (
     ComponentCreate,
@@ -23,18 +23,16 @@ logger = structlog.get_logger()
 
 
 @router.post("/components", response_model=ComponentResponse, status_code=201)
-async def create_component(data: ComponentCreate):
+async def create_component(data: ComponentCreate, db=Depends(get_async_db)):
     """
     새 카탈로그 컴포넌트 등록
 
     - 등록 시 status='pending_compute'로 시작
     - RDKit 워커가 디스크립터 계산 후 'active'로 전환
     """
-    db = get_db()
-
     try:
         result = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .insert(
                 {
                     "type": data.type,
@@ -82,6 +80,7 @@ async def list_components(
     search: Optional[str] = Query(None, description="이름 검색"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    db=Depends(get_async_db),
 ):
     """
     카탈로그 컴포넌트 목록 조회
@@ -90,8 +89,6 @@ async def list_components(
     - 이름 검색 지원
     - 페이지네이션 지원
     """
-    db = get_db()
-
     try:
         # 기본 쿼리
         query = db.table("component_catalog").select("*", count="exact")
@@ -110,7 +107,7 @@ async def list_components(
         query = query.order("created_at", desc=True)
         query = query.range(offset, offset + limit - 1)
 
-        result = query.execute()
+        result = await query.execute()
 
         return ComponentListResponse(
             items=[ComponentResponse(**item) for item in result.data],
@@ -125,13 +122,11 @@ async def list_components(
 
 
 @router.get("/components/{component_id}", response_model=ComponentResponse)
-async def get_component(component_id: UUID):
+async def get_component(component_id: UUID, db=Depends(get_async_db)):
     """컴포넌트 상세 조회"""
-    db = get_db()
-
     try:
         result = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -152,18 +147,18 @@ async def get_component(component_id: UUID):
 
 
 @router.patch("/components/{component_id}", response_model=ComponentResponse)
-async def update_component(component_id: UUID, data: ComponentUpdate):
+async def update_component(
+    component_id: UUID, data: ComponentUpdate, db=Depends(get_async_db)
+):
     """
     컴포넌트 수정
 
     - properties 수정 시 status가 'pending_compute'로 변경될 수 있음
     """
-    db = get_db()
-
     try:
         # 기존 컴포넌트 확인
         existing = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -184,7 +179,7 @@ async def update_component(component_id: UUID, data: ComponentUpdate):
             update_data["computed_at"] = None
 
         result = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .update(update_data)
             .eq("id", str(component_id))
             .execute()
@@ -206,18 +201,16 @@ async def update_component(component_id: UUID, data: ComponentUpdate):
 
 
 @router.delete("/components/{component_id}")
-async def delete_component(component_id: UUID):
+async def delete_component(component_id: UUID, db=Depends(get_async_db)):
     """
     컴포넌트 삭제 (deprecated 처리)
 
     - 실제 삭제 대신 status='deprecated'로 변경
     """
-    db = get_db()
-
     try:
         # 기존 컴포넌트 확인
         existing = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -226,9 +219,12 @@ async def delete_component(component_id: UUID):
             raise HTTPException(status_code=404, detail="Component not found")
 
         # deprecated로 변경
-        db.table("component_catalog").update({"status": "deprecated"}).eq(
-            "id", str(component_id)
-        ).execute()
+        await (
+            db.table("component_catalog")
+            .update({"status": "deprecated"})
+            .eq("id", str(component_id))
+            .execute()
+        )
 
         logger.info("component_deprecated", component_id=str(component_id))
         return {"status": "deprecated", "component_id": str(component_id)}
@@ -243,18 +239,16 @@ async def delete_component(component_id: UUID):
 
 
 @router.post("/components/{component_id}/retry")
-async def retry_compute(component_id: UUID):
+async def retry_compute(component_id: UUID, db=Depends(get_async_db)):
     """
     실패한 컴포넌트 재계산 요청
 
     - status='failed'인 컴포넌트에 대해 RDKit 재계산 트리거
     """
-    db = get_db()
-
     try:
         # 컴포넌트 확인
         existing = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -269,9 +263,12 @@ async def retry_compute(component_id: UUID):
             )
 
         # status를 pending_compute로 변경
-        db.table("component_catalog").update(
-            {"status": "pending_compute", "compute_error": None}
-        ).eq("id", str(component_id)).execute()
+        await (
+            db.table("component_catalog")
+            .update({"status": "pending_compute", "compute_error": None})
+            .eq("id", str(component_id))
+            .execute()
+        )
 
         # RDKit 워커 Job enqueue
         try:
@@ -297,14 +294,12 @@ async def retry_compute(component_id: UUID):
 
 
 @router.get("/components/stats/summary")
-async def get_catalog_stats():
+async def get_catalog_stats(db=Depends(get_async_db)):
     """카탈로그 통계 요약"""
-    db = get_db()
-
     try:
         # 타입별 카운트
         result = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("type, status", count="exact")
             .execute()
         )
@@ -3,13 +3,13 @@ Connectors API Endpoints
 커넥터 상태 조회, 실행, 재시도 관리
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Depends
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 from app.core.queue import get_redis_pool
 
 router = APIRouter()
@@ -119,20 +119,18 @@ class ConnectorConfigUpdate(BaseModel):
 
 
 @router.get("")
-async def list_connectors():
+async def list_connectors(db=Depends(get_async_db)):
     """
     전체 커넥터 목록 및 상태
     """
     try:
-        db = get_db()
-
         connectors = []
 
         for source, info in CONNECTOR_REGISTRY.items():
             # 모든 커서 상태 조회 (통계 합산용)
             try:
                 cursor_result = (
-                    db.table("ingestion_cursors")
+                    await db.table("ingestion_cursors")
                     .select("status, last_success_at, stats, error_message, updated_at")
                     .eq("source", source)
                     .order("last_success_at", desc=True)
@@ -198,15 +196,13 @@ async def list_connectors():
 
 
 @router.post("/setup-defaults")
-async def setup_default_connectors():
+async def setup_default_connectors(db=Depends(get_async_db)):
     """
     CONNECTOR_REGISTRY에 정의된 기본 커넥터들을 ingestion_cursors에 등록
     """
     try:
-        db = get_db()
-
         # 현재 등록된 커넥터 소스 목록 조회
-        existing_res = db.table("ingestion_cursors").select("source").execute()
+        existing_res = await db.table("ingestion_cursors").select("source").execute()
         existing_sources = {row["source"] for row in (existing_res.data or [])}
 
         new_cursors = []
@@ -222,7 +218,7 @@ async def setup_default_connectors():
                 )
 
         if new_cursors:
-            db.table("ingestion_cursors").insert(new_cursors).execute()
+            await db.table("ingestion_cursors").insert(new_cursors).execute()
 
         return {
             "status": "success",
@@ -235,20 +231,18 @@ async def setup_default_connectors():
 
 
 @router.get("/{source}")
-async def get_connector_detail(source: str):
+async def get_connector_detail(source: str, db=Depends(get_async_db)):
     """
     커넥터 상세 정보
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     info = CONNECTOR_REGISTRY[source]
 
     # 모든 커서 조회
     cursors = (
-        db.table("ingestion_cursors")
+        await db.table("ingestion_cursors")
         .select("*")
         .eq("source", source)
         .order("updated_at", desc=True)
@@ -258,7 +252,7 @@ async def get_connector_detail(source: str):
 
     # 최근 로그 조회
     logs = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .select("*")
         .eq("source", source)
         .order("created_at", desc=True)
@@ -270,18 +264,16 @@ async def get_connector_detail(source: str):
 
 
 @router.get("/{source}/status")
-async def get_connector_status(source: str):
+async def get_connector_status(source: str, db=Depends(get_async_db)):
     """
     커넥터 실시간 상태
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     # 가장 최근 커서
     cursor = (
-        db.table("ingestion_cursors")
+        await db.table("ingestion_cursors")
         .select("*")
         .eq("source", source)
         .order("updated_at", desc=True)
@@ -297,7 +289,10 @@ async def get_connector_status(source: str):
 
 @router.post("/{source}/run")
 async def run_connector(
-    source: str, request: ConnectorRunRequest, background_tasks: BackgroundTasks
+    source: str,
+    request: ConnectorRunRequest,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_async_db),
 ):
     """
     커넥터 실행
@@ -307,12 +302,10 @@ async def run_connector(
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         # 이미 실행 중인지 확인
         running = (
-            db.table("ingestion_cursors")
+            await db.table("ingestion_cursors")
             .select("id")
             .eq("source", source)
             .eq("status", "running")
@@ -366,20 +359,22 @@ async def run_connector(
 
 
 @router.post("/{source}/stop")
-async def stop_connector(source: str):
+async def stop_connector(source: str, db=Depends(get_async_db)):
     """
     실행 중인 커넥터 중지
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         # 상태를 idle로 변경 (실제 job 취소는 워커에서 처리)
-        db.table("ingestion_cursors").update(
-            {"status": "idle", "updated_at": datetime.utcnow().isoformat()}
-        ).eq("source", source).eq("status", "running").execute()
+        await (
+            db.table("ingestion_cursors")
+            .update({"status": "idle", "updated_at": datetime.utcnow().isoformat()})
+            .eq("source", source)
+            .eq("status", "running")
+            .execute()
+        )
 
         logger.info("connector_stop_requested", source=source)
 
@@ -391,19 +386,17 @@ async def stop_connector(source: str):
 
 
 @router.post("/{source}/retry")
-async def retry_connector(source: str):
+async def retry_connector(source: str, db=Depends(get_async_db)):
     """
     실패한 커넥터 재시도
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         # 실패한 커서 조회
         failed = (
-            db.table("ingestion_cursors")
+            await db.table("ingestion_cursors")
             .select("*")
             .eq("source", source)
             .eq("status", "failed")
@@ -418,13 +411,18 @@ async def retry_connector(source: str):
         cursor = failed.data[0]
 
         # 상태를 idle로 변경
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("id", cursor["id"]).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("id", cursor["id"])
+            .execute()
+        )
 
         # Job enqueue (기존 설정으로)
         pool = await get_redis_pool()
@@ -455,6 +453,7 @@ async def get_connector_logs(
     status: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    db=Depends(get_async_db),
 ):
     """
     커넥터 실행 로그 조회
@@ -462,8 +461,6 @@ async def get_connector_logs(
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         query = (
             db.table("ingestion_logs").select("*", count="exact").eq("source", source)
@@ -475,7 +472,7 @@ async def get_connector_logs(
         query = query.order("created_at", desc=True)
         query = query.range(offset, offset + limit - 1)
 
-        result = query.execute()
+        result = await query.execute()
 
         return {
             "logs": result.data,
@@ -490,19 +487,17 @@ async def get_connector_logs(
 
 
 @router.get("/{source}/stats")
-async def get_connector_stats(source: str):
+async def get_connector_stats(source: str, db=Depends(get_async_db)):
     """
     커넥터 통계
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         # 전체 로그에서 통계 계산
         logs = (
-            db.table("ingestion_logs")
+            await db.table("ingestion_logs")
             .select(
                 "status, records_fetched, records_new, records_updated, duration_ms"
             )
@@ -546,19 +541,19 @@ async def get_connector_stats(source: str):
 
 
 @router.patch("/{source}/config")
-async def update_connector_config(source: str, config: ConnectorConfigUpdate):
+async def update_connector_config(
+    source: str, config: ConnectorConfigUpdate, db=Depends(get_async_db)
+):
     """
     커넥터 설정 업데이트
     """
     if source not in CONNECTOR_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown connector: {source}")
 
-    db = get_db()
-
     try:
         # 기존 커서 또는 새로 생성
         existing = (
-            db.table("ingestion_cursors")
+            await db.table("ingestion_cursors")
             .select("id, config")
             .eq("source", source)
             .order("updated_at", desc=True)
@@ -581,18 +576,27 @@ async def update_connector_config(source: str, config: ConnectorConfigUpdate):
             new_config["enabled"] = config.enabled
 
         if existing.data:
-            db.table("ingestion_cursors").update(
-                {"config": new_config, "updated_at": datetime.utcnow().isoformat()}
-            ).eq("id", existing.data[0]["id"]).execute()
+            await (
+                db.table("ingestion_cursors")
+                .update(
+                    {"config": new_config, "updated_at": datetime.utcnow().isoformat()}
+                )
+                .eq("id", existing.data[0]["id"])
+                .execute()
+            )
         else:
-            db.table("ingestion_cursors").insert(
-                {
-                    "source": source,
-                    "query_hash": "default",
-                    "config": new_config,
-                    "status": "idle",
-                }
-            ).execute()
+            await (
+                db.table("ingestion_cursors")
+                .insert(
+                    {
+                        "source": source,
+                        "query_hash": "default",
+                        "config": new_config,
+                        "status": "idle",
+                    }
+                )
+                .execute()
+            )
 
         logger.info("connector_config_updated", source=source, config=new_config)
 
@@ -0,0 +1,14 @@
+"""
+API 공용 의존성
+"""
+
+from fastapi import HTTPException, Request
+from supabase import AsyncClient
+
+
+def get_async_db(request: Request) -> AsyncClient:
+    """lifespan에서 생성한 공유 AsyncClient (HTTP/2 커넥션 풀)"""
+    db = getattr(request.app.state, "db", None)
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not configured")
+    return db
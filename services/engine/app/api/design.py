@@ -13,24 +13,15 @@ from datetime import datetime
 import uuid
 import structlog
 from app.services.report_service import get_report_service
+from app.services.snapshot_store import get_snapshot_store
+from app.services.progress_reporter import read_cached_progress
+from app.core.queue import get_redis_client
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
 
 
-def get_db():
-    """Supabase 클라이언트 의존성"""
-    from supabase import create_client
-
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        raise HTTPException(status_code=500, detail="Database not configured")
-
-    return create_client(supabase_url, supabase_key)
-
-
 # === Schemas ===
 
 
@@ -98,7 +89,7 @@ class RunProgress(BaseModel):
 
 
 @router.post("/runs", response_model=RunResponse)
-async def create_run(run_data: RunCreate, db=Depends(get_db)):
+async def create_run(run_data: RunCreate, db=Depends(get_async_db)):
     """
     새 Design Run 생성
 
@@ -122,7 +113,7 @@ async def create_run(run_data: RunCreate, db=Depends(get_db)):
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        result = db.table("design_runs").insert(run_record).execute()
+        result = await db.table("design_runs").insert(run_record).execute()
 
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to create run")
@@ -180,7 +171,7 @@ async def list_runs(
     workspace_id: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """런 목록 조회"""
     try:
@@ -192,11 +183,13 @@ async def list_runs(
             query = query.eq("workspace_id", workspace_id)
 
         # Count query
-        count_result = db.table("design_runs").select("id", count="exact").execute()
+        count_result = (
+            await db.table("design_runs").select("id", count="exact").execute()
+        )
         total = count_result.count if count_result.count else 0
 
         # Paginated query
-        result = query.range(offset, offset + limit - 1).execute()
+        result = await query.range(offset, offset + limit - 1).execute()
 
         return {
             "items": result.data or [],
@@ -211,10 +204,10 @@ async def list_runs(
 
 
 @router.get("/runs/{run_id}", response_model=RunResponse)
-async def get_run(run_id: str, db=Depends(get_db)):
+async def get_run(run_id: str, db=Depends(get_async_db)):
     """런 상세 조회"""
     try:
-        result = db.table("design_runs").select("*").eq("id", run_id).execute()
+        result = await db.table("design_runs").select("*").eq("id", run_id).execute()
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Run not found")
@@ -239,10 +232,21 @@ async def get_run(run_id: str, db=Depends(get_db)):
 
 
 @router.get("/runs/{run_id}/progress", response_model=RunProgress)
-async def get_run_progress(run_id: str, db=Depends(get_db)):
-    """런 진행률 조회"""
+async def get_run_progress(run_id: str, db=Depends(get_async_db)):
+    """런 진행률 조회 (Worker가 기록한 Redis 캐시 우선, 없으면 DB)"""
     try:
-        result = db.table("run_progress").select("*").eq("run_id", run_id).execute()
+        cached = await read_cached_progress(get_redis_client(), run_id)
+        if cached:
+            return RunProgress(
+                phase=cached.get("phase", "unknown"),
+                processed_candidates=cached.get("processed_candidates", 0),
+                accepted_candidates=cached.get("accepted_candidates", 0),
+                rejected_candidates=cached.get("rejected_candidates", 0),
+            )
+
+        result = (
+            await db.table("run_progress").select("*").eq("run_id", run_id).execute()
+        )
 
         if not result.data:
             return RunProgress(
@@ -276,7 +280,7 @@ async def list_candidates(
     pareto_rank: Optional[int] = None,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     런의 후보 목록 조회
@@ -289,7 +293,7 @@ async def list_candidates(
             db.table("candidates")
             .select(
                 """
-            id, candidate_hash, snapshot,
+            id, candidate_hash, snapshot, snapshot_refs,
             candidate_scores(eng_fit, bio_fit, safety_fit, evidence_fit),
             run_pareto_members(rank)
             """
@@ -300,11 +304,14 @@ async def list_candidates(
         if pareto_rank is not None:
             query = query.eq("run_pareto_members.rank", pareto_rank)
 
-        result = query.range(offset, offset + limit - 1).execute()
+        result = await query.range(offset, offset + limit - 1).execute()
+
+        # 스냅샷 참조 일괄 해석 (조회 1회 + 캐시)
+        candidates = await get_snapshot_store(db).resolve(run_id, result.data or [])
 
         # Transform results
         items = []
-        for c in result.data or []:
+        for c in candidates:
             scores = (
                 c.get("candidate_scores", [{}])[0] if c.get("candidate_scores") else {}
             )
@@ -341,11 +348,11 @@ async def list_candidates(
 
 
 @router.get("/runs/{run_id}/candidates/{candidate_id}")
-async def get_candidate(run_id: str, candidate_id: str, db=Depends(get_db)):
+async def get_candidate(run_id: str, candidate_id: str, db=Depends(get_async_db)):
     """후보 상세 조회 (스코어 컴포넌트 포함)"""
     try:
         result = (
-            db.table("candidates")
+            await db.table("candidates")
             .select(
                 """
             *,
@@ -362,7 +369,7 @@ async def get_candidate(run_id: str, candidate_id: str, db=Depends(get_db)):
         if not result.data:
             raise HTTPException(status_code=404, detail="Candidate not found")
 
-        return result.data[0]
+        return (await get_snapshot_store(db).resolve(run_id, result.data[:1]))[0]
 
     except HTTPException:
         raise
@@ -372,11 +379,13 @@ async def get_candidate(run_id: str, candidate_id: str, db=Depends(get_db)):
 
 
 @router.post("/runs/{run_id}/cancel")
-async def cancel_run(run_id: str, db=Depends(get_db)):
+async def cancel_run(run_id: str, db=Depends(get_async_db)):
     """런 취소"""
     try:
         # 상태 확인
-        result = db.table("design_runs").select("status").eq("id", run_id).execute()
+        result = (
+            await db.table("design_runs").select("status").eq("id", run_id).execute()
+        )
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Run not found")
@@ -390,9 +399,14 @@ async def cancel_run(run_id: str, db=Depends(get_db)):
             )
 
         # 취소
-        db.table("design_runs").update(
-            {"status": "cancelled", "completed_at": datetime.utcnow().isoformat()}
-        ).eq("id", run_id).execute()
+        await (
+            db.table("design_runs")
+            .update(
+                {"status": "cancelled", "completed_at": datetime.utcnow().isoformat()}
+            )
+            .eq("id", run_id)
+            .execute()
+        )
 
         return {"status": "cancelled", "run_id": run_id}
 
@@ -404,11 +418,11 @@ async def cancel_run(run_id: str, db=Depends(get_db)):
 
 
 @router.post("/runs/{run_id}/rerun")
-async def rerun(run_id: str, db=Depends(get_db)):
+async def rerun(run_id: str, db=Depends(get_async_db)):
     """런 재실행 (동일 설정으로 새 런 생성)"""
     try:
         # 기존 런 조회
-        result = db.table("design_runs").select("*").eq("id", run_id).execute()
+        result = await db.table("design_runs").select("*").eq("id", run_id).execute()
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Run not found")
@@ -428,7 +442,7 @@ async def rerun(run_id: str, db=Depends(get_db)):
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        db.table("design_runs").insert(new_run).execute()
+        await db.table("design_runs").insert(new_run).execute()
 
         # Job enqueue
         try:
@@ -458,11 +472,11 @@ async def rerun(run_id: str, db=Depends(get_db)):
 
 
 @router.get("/runs/{run_id}/pareto")
-async def get_pareto_fronts(run_id: str, db=Depends(get_db)):
+async def get_pareto_fronts(run_id: str, db=Depends(get_async_db)):
     """런의 파레토 프론트 조회"""
     try:
         result = (
-            db.table("run_pareto_fronts")
+            await db.table("run_pareto_fronts")
             .select(
                 """
             *,
@@ -487,7 +501,7 @@ async def compare_candidates(
     candidate_ids: List[str] = Query(
         ..., description="List of candidate IDs to compare"
     ),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     여러 후보 물질 비교 데이터 조회 (Scores + Assay Results)
@@ -498,7 +512,7 @@ async def compare_candidates(
 
         # 1. Fetch Candidates with Scores
         result = (
-            db.table("candidates")
+            await db.table("candidates")
             .select(
                 """
             *,
@@ -511,11 +525,11 @@ async def compare_candidates(
             .execute()
         )
 
-        candidates = result.data or []
+        candidates = await get_snapshot_store(db).resolve(run_id, result.data or [])
 
         # 2. Fetch Assay Results
         assay_result = (
-            db.table("assay_results")
+            await db.table("assay_results")
             .select("*")
             .in_("candidate_id", candidate_ids)
             .execute()
@@ -544,7 +558,7 @@ async def compare_candidates(
 
 
 @router.post("/runs/{run_id}/report")
-async def generate_run_report(run_id: str, db=Depends(get_db)):
+async def generate_run_report(run_id: str, db=Depends(get_async_db)):
     """
     특정 Run에 대한 분석 리포트 생성 (캐시 지원)
     """
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends, Body
 from pydantic import BaseModel, Field
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 from app.services.discovery import (
     DiscoveryService,
     DiscoveryRequest,
@@ -55,7 +55,7 @@ class QueryPreviewResponse(BaseModel):
 async def get_query_preview(
     axis: PlatformAxis = Query(..., description="Platform axis"),
     additional_query: Optional[str] = Query(None, description="Additional search terms"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ) -> QueryPreviewResponse:
     """
     검색 쿼리 미리보기 (실제 검색 없이 쿼리 확인)
@@ -94,7 +94,7 @@ async def list_axes():
 @router.post("/search")
 async def search_candidates(
     request: DiscoveryRequest = Body(...),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ) -> DiscoveryResult:
     """
     2단 검색 실행
@@ -115,7 +115,7 @@ async def search_candidates(
 @router.post("/check-duplicate")
 async def check_duplicate(
     drug_name: str = Query(..., description="Drug name to check"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     기존 Golden Seed에 해당 약물이 있는지 확인 (동의어 포함)
@@ -126,7 +126,7 @@ async def check_duplicate(
         
         if existing_id:
             # 기존 데이터 조회
-            result = db.table("golden_seed_items").select(
+            result = await db.table("golden_seed_items").select(
                 "id, drug_name_canonical, platform_axis, clinical_stage"
             ).eq("id", existing_id).execute()
             
@@ -148,7 +148,7 @@ async def check_duplicate(
 @router.get("/synonyms/{drug_id}")
 async def get_drug_synonyms(
     drug_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     특정 약물의 모든 동의어 조회
@@ -158,7 +158,7 @@ async def get_drug_synonyms(
         synonyms = await resolver.get_all_synonyms(drug_id)
         
         # 상세 정보도 조회
-        result = db.table("synonym_map").select("*").eq(
+        result = await db.table("synonym_map").select("*").eq(
             "canonical_drug_id", drug_id
         ).execute()
         
@@ -175,7 +175,7 @@ async def get_drug_synonyms(
 @router.post("/synonyms")
 async def add_synonym(
     request: SynonymCreate,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     새 동의어 추가
@@ -205,7 +205,7 @@ async def add_synonym(
 @router.get("/synonyms/resolve")
 async def resolve_synonym(
     drug_name: str = Query(..., description="Drug name or synonym to resolve"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     동의어를 canonical drug ID로 해결
@@ -216,7 +216,7 @@ async def resolve_synonym(
         
         if canonical_id:
             # canonical drug 정보도 조회
-            result = db.table("golden_seed_items").select(
+            result = await db.table("golden_seed_items").select(
                 "id, drug_name_canonical, platform_axis"
             ).eq("id", canonical_id).execute()
             
@@ -236,13 +236,13 @@ async def resolve_synonym(
 @router.delete("/synonyms/{synonym_id}")
 async def delete_synonym(
     synonym_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     동의어 삭제
     """
     try:
-        db.table("synonym_map").delete().eq("id", synonym_id).execute()
+        await db.table("synonym_map").delete().eq("id", synonym_id).execute()
         return {"status": "deleted", "id": synonym_id}
     except Exception as e:
         logger.error("delete_synonym_failed", error=str(e))
@@ -254,7 +254,7 @@ async def delete_synonym(
 @router.post("/synonyms/batch")
 async def add_synonyms_batch(
     synonyms: List[SynonymCreate] = Body(...),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     동의어 일괄 추가
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 import structlog
 from datetime import datetime
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -50,7 +50,7 @@ async def search_evidence(
     source: Optional[str] = Query(
         None, description="Filter by source (e.g., pubmed, patent)"
     ),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     문헌 검색 API (Vector Search)
@@ -74,7 +74,7 @@ async def search_evidence(
             "match_threshold": 0.5,  # Adjust threshold
             "match_count": limit,
         }
-        result = db.rpc("match_literature_chunks", params).execute()
+        result = await db.rpc("match_literature_chunks", params).execute()
 
         items = []
         for row in result.data or []:
@@ -110,7 +110,7 @@ async def search_evidence(
 @router.get("/quality/issues", response_model=List[QualityIssueResponse])
 async def get_quality_issues(
     status: Optional[str] = Query(None, description="Filter by status"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     근거 품질 이슈 목록 조회
@@ -121,7 +121,7 @@ async def get_quality_issues(
         if status:
             query = query.eq("status", status)
 
-        result = query.execute()
+        result = await query.execute()
 
         return [
             QualityIssueResponse(
@@ -145,14 +145,16 @@ async def resolve_issue(
     issue_id: str,
     resolution: str,
     user_id: str = "system",  # In real app, get from auth context
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     품질 이슈 해결 처리
     """
     try:
         # 1. Check if issue exists
-        result = db.table("quality_issues").select("*").eq("id", issue_id).execute()
+        result = (
+            await db.table("quality_issues").select("*").eq("id", issue_id).execute()
+        )
         if not result.data:
             raise HTTPException(status_code=404, detail="Issue not found")
 
@@ -162,7 +164,9 @@ async def resolve_issue(
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-        db.table("quality_issues").update(update_data).eq("id", issue_id).execute()
+        await (
+            db.table("quality_issues").update(update_data).eq("id", issue_id).execute()
+        )
 
         return {"status": "resolved", "issue_id": issue_id}
 
@@ -7,7 +7,6 @@ Human-in-the-loop 피드백 시스템
 - outlier 제외 플래그
 """
 
-import os
 from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
 from typing import Optional, Literal
@@ -15,23 +14,12 @@ from datetime import datetime
 import uuid
 import structlog
 
+from app.api.deps import get_async_db
+
 router = APIRouter()
 logger = structlog.get_logger()
 
 
-def get_db():
-    """Supabase 클라이언트"""
-    from supabase import create_client
-
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        raise HTTPException(status_code=500, detail="Database not configured")
-
-    return create_client(supabase_url, supabase_key)
-
-
 # === Schemas ===
 
 
@@ -95,7 +83,7 @@ async def create_feedback(
     feedback: FeedbackCreate,
     workspace_id: str = Query(..., description="워크스페이스 ID"),
     user_id: Optional[str] = None,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     피드백 생성
@@ -118,7 +106,7 @@ async def create_feedback(
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        result = db.table("human_feedback").insert(record).execute()
+        result = await db.table("human_feedback").insert(record).execute()
 
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to create feedback")
@@ -156,7 +144,7 @@ async def list_feedback(
     feedback_type: Optional[str] = None,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """피드백 목록 조회"""
     try:
@@ -174,7 +162,7 @@ async def list_feedback(
         if feedback_type:
             query = query.eq("feedback_type", feedback_type)
 
-        result = query.range(offset, offset + limit - 1).execute()
+        result = await query.range(offset, offset + limit - 1).execute()
 
         return {"items": result.data or [], "limit": limit, "offset": offset}
 
@@ -184,11 +172,11 @@ async def list_feedback(
 
 
 @router.get("/feedback/stats/{entity_id}")
-async def get_feedback_stats(entity_id: str, db=Depends(get_db)):
+async def get_feedback_stats(entity_id: str, db=Depends(get_async_db)):
     """엔티티별 피드백 통계"""
     try:
         result = (
-            db.table("human_feedback")
+            await db.table("human_feedback")
             .select("feedback_type")
             .eq("entity_id", entity_id)
             .execute()
@@ -219,7 +207,7 @@ async def get_feedback_stats(entity_id: str, db=Depends(get_db)):
 
 @router.post("/assay-results", response_model=AssayResultResponse)
 async def create_assay_result(
-    assay: AssayResultCreate, workspace_id: str = Query(...), db=Depends(get_db)
+    assay: AssayResultCreate, workspace_id: str = Query(...), db=Depends(get_async_db)
 ):
     """
     분석 결과 등록
@@ -242,7 +230,7 @@ async def create_assay_result(
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        result = db.table("assay_results").insert(record).execute()
+        result = await db.table("assay_results").insert(record).execute()
 
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to create assay result")
@@ -279,7 +267,7 @@ async def list_assay_results(
     exclude_outliers: bool = False,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """분석 결과 목록 조회"""
     try:
@@ -297,7 +285,7 @@ async def list_assay_results(
         if exclude_outliers:
             query = query.eq("is_outlier", False)
 
-        result = query.range(offset, offset + limit - 1).execute()
+        result = await query.range(offset, offset + limit - 1).execute()
 
         return {"items": result.data or [], "limit": limit, "offset": offset}
 
@@ -307,11 +295,11 @@ async def list_assay_results(
 
 
 @router.patch("/assay-results/{assay_id}/outlier")
-async def mark_as_outlier(assay_id: str, is_outlier: bool, db=Depends(get_db)):
+async def mark_as_outlier(assay_id: str, is_outlier: bool, db=Depends(get_async_db)):
     """분석 결과 outlier 플래그 설정"""
     try:
         result = (
-            db.table("assay_results")
+            await db.table("assay_results")
             .update({"is_outlier": is_outlier})
             .eq("id", assay_id)
             .execute()
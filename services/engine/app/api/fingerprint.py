@@ -3,12 +3,12 @@ Fingerprint API Endpoints
 구조 유사도 검색 및 분자 descriptor API
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional, List
 from pydantic import BaseModel
 
 from app.services.fingerprint import FingerprintService
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 
@@ -153,7 +153,9 @@ async def calculate_similarity(request: SimilarityRequest):
 
 
 @router.post("/search", response_model=List[SimilarCompound])
-async def search_similar_compounds(request: SimilaritySearchRequest):
+async def search_similar_compounds(
+    request: SimilaritySearchRequest, db=Depends(get_async_db)
+):
     """
     카탈로그에서 유사 화합물 검색
 
@@ -163,7 +165,6 @@ async def search_similar_compounds(request: SimilaritySearchRequest):
     - threshold: 최소 유사도 (기본 0.5)
     - component_type: 컴포넌트 타입 필터 (payload, linker 등)
     """
-    db = get_db()
     service = FingerprintService(db)
 
     results = await service.search_similar(
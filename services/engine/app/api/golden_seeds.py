@@ -10,7 +10,7 @@ import structlog
 from datetime import datetime
 from enum import Enum
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -192,14 +192,14 @@ def check_gate_conditions(seed: dict) -> GateCheckResult:
 @router.get("/{seed_id}")
 async def get_golden_seed(
     seed_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     Golden Seed Item 조회
     """
     try:
         result = (
-            db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
+            await db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
         )
         if not result.data:
             raise HTTPException(status_code=404, detail="Seed not found")
@@ -214,7 +214,7 @@ async def get_golden_seed(
 @router.get("/{seed_id}/gate-check")
 async def check_gate(
     seed_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     Gate Checklist 검사
@@ -222,7 +222,7 @@ async def check_gate(
     try:
         # 1. Fetch seed
         result = (
-            db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
+            await db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
         )
         if not result.data:
             raise HTTPException(status_code=404, detail="Seed not found")
@@ -231,7 +231,7 @@ async def check_gate(
 
         # 2. Fetch evidence count
         ev_result = (
-            db.table("evidence_items")
+            await db.table("evidence_items")
             .select("id")
             .eq("golden_seed_item_id", seed_id)
             .execute()
@@ -264,7 +264,7 @@ async def check_gate(
 async def add_evidence(
     seed_id: str,
     evidence: EvidenceItemCreate,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     근거 추가
@@ -272,7 +272,7 @@ async def add_evidence(
     try:
         # Check if seed exists
         seed_result = (
-            db.table("golden_seed_items").select("id").eq("id", seed_id).execute()
+            await db.table("golden_seed_items").select("id").eq("id", seed_id).execute()
         )
         if not seed_result.data:
             raise HTTPException(status_code=404, detail="Seed not found")
@@ -287,7 +287,7 @@ async def add_evidence(
             "snippet": evidence.snippet,
             "source_quality": evidence.source_quality,
         }
-        result = db.table("evidence_items").insert(data).execute()
+        result = await db.table("evidence_items").insert(data).execute()
 
         return {"status": "created", "id": result.data[0]["id"]}
 
@@ -301,14 +301,14 @@ async def add_evidence(
 @router.get("/{seed_id}/evidence")
 async def get_evidence_list(
     seed_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     근거 목록 조회
     """
     try:
         result = (
-            db.table("evidence_items")
+            await db.table("evidence_items")
             .select("*")
             .eq("golden_seed_item_id", seed_id)
             .order("created_at", desc=True)
@@ -328,7 +328,7 @@ async def get_evidence_list(
 async def add_provenance(
     seed_id: str,
     provenance: FieldProvenanceCreate,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     필드 추적성 추가
@@ -346,7 +346,7 @@ async def add_provenance(
             "char_end": provenance.char_end,
             "note": provenance.note,
         }
-        result = db.table("field_provenance").insert(data).execute()
+        result = await db.table("field_provenance").insert(data).execute()
 
         return {"status": "created", "id": result.data[0]["id"]}
 
@@ -359,7 +359,7 @@ async def add_provenance(
 async def get_provenance_list(
     seed_id: str,
     field_name: Optional[str] = Query(None),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     필드 추적성 조회
@@ -374,7 +374,7 @@ async def get_provenance_list(
         if field_name:
             query = query.eq("field_name", field_name)
 
-        result = query.order("created_at", desc=True).execute()
+        result = await query.order("created_at", desc=True).execute()
         return {"items": result.data or [], "total": len(result.data or [])}
 
     except Exception as e:
@@ -389,7 +389,7 @@ async def get_provenance_list(
 async def approve_high_confidence(
     seed_id: str,
     threshold: float = Query(0.9, ge=0.5, le=1.0),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     고신뢰도 필드 일괄 승인
@@ -398,7 +398,7 @@ async def approve_high_confidence(
     try:
         # 1. Get high confidence provenance
         prov_result = (
-            db.table("field_provenance")
+            await db.table("field_provenance")
             .select("*")
             .eq("golden_seed_item_id", seed_id)
             .gte("confidence", threshold)
@@ -423,7 +423,7 @@ async def approve_high_confidence(
 
         # 3. Update seed
         update_data["updated_at"] = datetime.utcnow().isoformat()
-        db.table("golden_seed_items").update(update_data).eq(
+        await db.table("golden_seed_items").update(update_data).eq(
             "id", seed_id
         ).execute()
 
@@ -483,7 +483,7 @@ class ApplyDiffRequest(BaseModel):
 async def queue_enrich_job(
     seed_id: str,
     request: EnrichRequest = Body(default=EnrichRequest()),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     LLM Enrich 작업 대기열에 추가
@@ -492,7 +492,7 @@ async def queue_enrich_job(
     try:
         # Check seed exists
         seed_result = (
-            db.table("golden_seed_items").select("id").eq("id", seed_id).execute()
+            await db.table("golden_seed_items").select("id").eq("id", seed_id).execute()
         )
         if not seed_result.data:
             raise HTTPException(status_code=404, detail="Seed not found")
@@ -508,7 +508,7 @@ async def queue_enrich_job(
                 "model": request.model,
             },
         }
-        result = db.table("llm_jobs").insert(job_data).execute()
+        result = await db.table("llm_jobs").insert(job_data).execute()
 
         return EnrichJobResponse(
             job_id=result.data[0]["id"],
@@ -528,7 +528,7 @@ async def queue_enrich_job(
 async def get_enrich_job_status(
     seed_id: str,
     job_id: str,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     LLM Enrich 작업 상태 조회
@@ -536,7 +536,7 @@ async def get_enrich_job_status(
     """
     try:
         result = (
-            db.table("llm_jobs")
+            await db.table("llm_jobs")
             .select("*")
             .eq("id", job_id)
             .eq("golden_seed_item_id", seed_id)
@@ -570,7 +570,7 @@ async def list_enrich_jobs(
     seed_id: str,
     status: Optional[str] = Query(None),
     limit: int = Query(10, ge=1, le=50),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     해당 Seed의 LLM 작업 목록 조회
@@ -585,7 +585,7 @@ async def list_enrich_jobs(
         if status:
             query = query.eq("status", status)
 
-        result = query.order("created_at", desc=True).limit(limit).execute()
+        result = await query.order("created_at", desc=True).limit(limit).execute()
 
         return {"jobs": result.data or [], "total": len(result.data or [])}
 
@@ -599,7 +599,7 @@ async def apply_enrich_diff(
     seed_id: str,
     request: ApplyDiffRequest,
     job_id: str = Query(..., description="LLM Job ID to apply from"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     LLM이 생성한 diff 중 선택된 필드만 적용
@@ -607,7 +607,7 @@ async def apply_enrich_diff(
     try:
         # 1. Get job
         job_result = (
-            db.table("llm_jobs")
+            await db.table("llm_jobs")
             .select("*")
             .eq("id", job_id)
             .eq("golden_seed_item_id", seed_id)
@@ -645,7 +645,7 @@ async def apply_enrich_diff(
                         "quote_span": diff.get("source"),
                         "note": f"LLM Enriched (job: {job_id})",
                     }
-                    db.table("field_provenance").insert(prov_data).execute()
+                    await db.table("field_provenance").insert(prov_data).execute()
 
         if not update_data:
             return {"status": "no_changes", "applied_count": 0}
@@ -653,7 +653,9 @@ async def apply_enrich_diff(
         # 3. Update seed
         update_data["updated_at"] = datetime.utcnow().isoformat()
         update_data["curation_level"] = CurationLevel.REVIEW.value  # LLM 수정은 Review 상태로
-        db.table("golden_seed_items").update(update_data).eq("id", seed_id).execute()
+        await db.table("golden_seed_items").update(update_data).eq(
+            "id", seed_id
+        ).execute()
 
         return {
             "status": "applied",
@@ -672,7 +674,7 @@ async def apply_enrich_diff(
 async def get_diff_preview(
     seed_id: str,
     job_id: str = Query(..., description="LLM Job ID"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     LLM이 생성한 diff 미리보기 (현재 값과 비교)
@@ -680,7 +682,7 @@ async def get_diff_preview(
     try:
         # 1. Get current seed
         seed_result = (
-            db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
+            await db.table("golden_seed_items").select("*").eq("id", seed_id).execute()
         )
         if not seed_result.data:
             raise HTTPException(status_code=404, detail="Seed not found")
@@ -689,7 +691,7 @@ async def get_diff_preview(
 
         # 2. Get job output
         job_result = (
-            db.table("llm_jobs")
+            await db.table("llm_jobs")
             .select("output_json, status")
             .eq("id", job_id)
             .eq("golden_seed_item_id", seed_id)
@@ -6,9 +6,11 @@ Ingestion API
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Depends
 from pydantic import BaseModel
 
+from app.api.deps import get_async_db
+
 router = APIRouter()
 
 
@@ -44,11 +46,9 @@ async def get_ingestion_logs(
     status: Optional[str] = None,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    db=Depends(get_async_db),
 ):
     """Ingestion 로그 조회"""
-    from app.core.database import get_db as get_client
-
-    db = get_client()
 
     query = db.table("ingestion_logs").select("*", count="exact")
 
@@ -59,7 +59,7 @@ async def get_ingestion_logs(
 
     query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
 
-    result = query.execute()
+    result = await query.execute()
 
     logs = []
     for row in result.data:
@@ -104,15 +104,12 @@ class OverallStats(BaseModel):
 
 
 @router.get("/stats", response_model=OverallStats)
-async def get_overall_stats():
+async def get_overall_stats(db=Depends(get_async_db)):
     """전체 Ingestion 통계"""
-    from app.core.database import get_db as get_client
-
-    db = get_client()
 
     # 전체 로그 조회
     all_logs = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .select("id, source, status, records_fetched, records_new, created_at")
         .execute()
     )
@@ -160,13 +157,10 @@ class SourceStats(BaseModel):
 
 
 @router.get("/stats/{source}", response_model=SourceStats)
-async def get_source_stats(source: str):
+async def get_source_stats(source: str, db=Depends(get_async_db)):
     """특정 소스 통계"""
-    from app.core.database import get_db as get_client
-
-    db = get_client()
 
-    logs = db.table("ingestion_logs").select("*").eq("source", source).execute()
+    logs = await db.table("ingestion_logs").select("*").eq("source", source).execute()
 
     if not logs.data:
         return SourceStats(
@@ -223,11 +217,9 @@ class DailyStats(BaseModel):
 async def get_ingestion_history(
     days: int = Query(7, ge=1, le=30),
     source: Optional[str] = None,
+    db=Depends(get_async_db),
 ):
     """일별 Ingestion 히스토리"""
-    from app.core.database import get_db as get_client
-
-    db = get_client()
 
     now = datetime.utcnow()
     cutoff = (now - timedelta(days=days)).isoformat()
@@ -241,7 +233,7 @@ async def get_ingestion_history(
     if source:
         query = query.eq("source", source)
 
-    result = query.execute()
+    result = await query.execute()
 
     # 일별 집계
     daily = {}
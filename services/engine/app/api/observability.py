@@ -3,12 +3,12 @@ Observability API Endpoints
 커넥터 및 시스템 모니터링 메트릭 제공
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 from datetime import datetime, timedelta
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -23,6 +23,7 @@ logger = structlog.get_logger()
 async def get_connector_metrics(
     source: Optional[str] = Query(None, description="Source filter"),
     days: int = Query(7, ge=1, le=30, description="Days to look back"),
+    db=Depends(get_async_db),
 ):
     """
     커넥터별 처리량 메트릭 조회
@@ -31,8 +32,6 @@ async def get_connector_metrics(
         - source별 fetched/new/updated/errors 통계
         - 일별 처리량 트렌드
     """
-    db = get_db()
-
     try:
         # ingestion_logs에서 집계
         since = (datetime.utcnow() - timedelta(days=days)).isoformat()
@@ -43,7 +42,7 @@ async def get_connector_metrics(
         if source:
             query = query.eq("source", source)
 
-        result = query.order("created_at", desc=True).limit(1000).execute()
+        result = await query.order("created_at", desc=True).limit(1000).execute()
 
         # 집계
         by_source = {}
@@ -117,12 +116,11 @@ async def get_connector_metrics(
 async def get_recent_errors(
     source: Optional[str] = Query(None, description="Source filter"),
     limit: int = Query(50, ge=1, le=200),
+    db=Depends(get_async_db),
 ):
     """
     최근 오류 로그 조회
     """
-    db = get_db()
-
     try:
         query = db.table("ingestion_logs").select("*")
         query = query.eq("status", "failed")
@@ -130,7 +128,7 @@ async def get_recent_errors(
         if source:
             query = query.eq("source", source)
 
-        result = query.order("created_at", desc=True).limit(limit).execute()
+        result = await query.order("created_at", desc=True).limit(limit).execute()
 
         errors = []
         for log in result.data:
@@ -157,12 +155,10 @@ async def get_recent_errors(
 
 
 @router.get("/health")
-async def get_system_health():
+async def get_system_health(db=Depends(get_async_db)):
     """
     시스템 상태 확인
     """
-    db = get_db()
-
     health = {
         "status": "healthy",
         "components": {},
@@ -171,7 +167,7 @@ async def get_system_health():
 
     # Supabase 연결 확인
     try:
-        db.table("ingestion_logs").select("id").limit(1).execute()
+        await db.table("ingestion_logs").select("id").limit(1).execute()
         health["components"]["database"] = {"status": "up"}
     except Exception as e:
         health["components"]["database"] = {"status": "down", "error": str(e)}
@@ -181,7 +177,7 @@ async def get_system_health():
     try:
         since = (datetime.utcnow() - timedelta(hours=1)).isoformat()
         logs = (
-            db.table("ingestion_logs")
+            await db.table("ingestion_logs")
             .select("status")
             .gte("created_at", since)
             .execute()
@@ -212,19 +208,18 @@ async def get_system_health():
 @router.get("/cursors")
 async def get_cursor_status(
     source: Optional[str] = Query(None, description="Source filter"),
+    db=Depends(get_async_db),
 ):
     """
     Ingestion 커서 상태 조회
     """
-    db = get_db()
-
     try:
         query = db.table("ingestion_cursors").select("*")
 
         if source:
             query = query.eq("source", source)
 
-        result = query.order("last_success_at", desc=True).execute()
+        result = await query.order("last_success_at", desc=True).execute()
 
         cursors = []
         for cursor in result.data:
@@ -2,7 +2,7 @@ from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel
 import structlog
-from app.core.database import get_db
+from app.api.deps import get_async_db
 from app.core.security import require_admin, mask_log_entry
 
 router = APIRouter(dependencies=[Depends(require_admin)])
@@ -64,7 +64,7 @@ async def retry_job(job_id: str):
 
 @router.get("/audit", response_model=List[AuditLog])
 async def get_audit_logs(
-    limit: int = Query(50), action: Optional[str] = None, db=Depends(get_db)
+    limit: int = Query(50), action: Optional[str] = None, db=Depends(get_async_db)
 ):
     """
     감사 로그 조회 (Real DB, Admin Only)
@@ -75,7 +75,7 @@ async def get_audit_logs(
         if action:
             query = query.eq("event_type", action)
 
-        result = query.limit(limit).execute()
+        result = await query.limit(limit).execute()
 
         items = []
         for row in result.data or []:
@@ -100,7 +100,7 @@ async def get_audit_logs(
 
 @router.get("/logs", response_model=List[SystemLog])
 async def get_system_logs(
-    limit: int = Query(100), level: Optional[str] = None, db=Depends(get_db)
+    limit: int = Query(100), level: Optional[str] = None, db=Depends(get_async_db)
 ):
     """
     시스템 로그 조회 (Ingestion Logs, Admin Only)
@@ -113,7 +113,7 @@ async def get_system_logs(
             # Map level to status if needed
             pass
 
-        result = query.limit(limit).execute()
+        result = await query.limit(limit).execute()
 
         items = []
         for row in result.data or []:
@@ -7,7 +7,8 @@ from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
 from typing import List, Optional
 import structlog
-from app.core.database import get_db
+from app.api.deps import get_async_db
+from app.core.queue import get_redis_client
 from app.services.pipeline import PipelineService
 
 router = APIRouter()
@@ -22,13 +23,15 @@ class PipelineRunRequest(BaseModel):
 
 @router.post("/run-seed-set")
 async def run_seed_set_pipeline(
-    request: PipelineRunRequest, background_tasks: BackgroundTasks, db=Depends(get_db)
+    request: PipelineRunRequest,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_async_db),
 ):
     """
     Seed Set 기반 수집 파이프라인 실행 (백그라운드)
     """
     try:
-        service = PipelineService(db)
+        service = PipelineService(db, redis=get_redis_client())
         # 백그라운드에서 실행하여 즉시 응답 반환
         background_tasks.add_task(
             service.run_seed_set,
@@ -3,14 +3,14 @@ Staging API Endpoints
 스테이징 컴포넌트 승인 워크플로우
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
 import structlog
 
-from app.core.database import get_db
+from app.api.deps import get_async_db
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -61,17 +61,17 @@ class BulkApproval(BaseModel):
 
 
 @router.post("/components", status_code=201)
-async def create_staging_component(data: StagingComponentCreate):
+async def create_staging_component(
+    data: StagingComponentCreate, db=Depends(get_async_db)
+):
     """
     스테이징 컴포넌트 등록
 
     자동 수집된 데이터나 수동 등록 데이터를 검수 대기 상태로 등록합니다.
     """
-    db = get_db()
-
     try:
         result = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .insert(
                 {
                     "type": data.type,
@@ -115,12 +115,11 @@ async def list_staging_components(
     search: Optional[str] = Query(None, description="이름 검색"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    db=Depends(get_async_db),
 ):
     """
     스테이징 컴포넌트 목록 조회
     """
-    db = get_db()
-
     try:
         query = db.table("staging_components").select("*", count="exact")
 
@@ -138,7 +137,7 @@ async def list_staging_components(
         query = query.order("created_at", desc=True)
         query = query.range(offset, offset + limit - 1)
 
-        result = query.execute()
+        result = await query.execute()
 
         return {
             "items": result.data,
@@ -153,13 +152,11 @@ async def list_staging_components(
 
 
 @router.get("/components/{component_id}")
-async def get_staging_component(component_id: UUID):
+async def get_staging_component(component_id: UUID, db=Depends(get_async_db)):
     """스테이징 컴포넌트 상세 조회"""
-    db = get_db()
-
     try:
         result = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -178,14 +175,14 @@ async def get_staging_component(component_id: UUID):
 
 
 @router.patch("/components/{component_id}")
-async def update_staging_component(component_id: UUID, data: StagingComponentUpdate):
+async def update_staging_component(
+    component_id: UUID, data: StagingComponentUpdate, db=Depends(get_async_db)
+):
     """스테이징 컴포넌트 수정"""
-    db = get_db()
-
     try:
         # 기존 확인
         existing = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -203,7 +200,7 @@ async def update_staging_component(component_id: UUID, data: StagingComponentUpd
             raise HTTPException(status_code=400, detail="No update data provided")
 
         result = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .update(update_data)
             .eq("id", str(component_id))
             .execute()
@@ -220,18 +217,18 @@ async def update_staging_component(component_id: UUID, data: StagingComponentUpd
 
 
 @router.post("/components/{component_id}/approve")
-async def approve_staging_component(component_id: UUID, data: StagingApproval = None):
+async def approve_staging_component(
+    component_id: UUID, data: StagingApproval = None, db=Depends(get_async_db)
+):
     """
     스테이징 컴포넌트 승인
 
     승인된 컴포넌트는 component_catalog로 복사됩니다.
     """
-    db = get_db()
-
     try:
         # 기존 확인
         existing = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -255,7 +252,9 @@ async def approve_staging_component(component_id: UUID, data: StagingApproval =
         # Source 정보 추가
         catalog_data["properties"]["source"] = staging.get("source", {})
 
-        catalog_result = db.table("component_catalog").insert(catalog_data).execute()
+        catalog_result = (
+            await db.table("component_catalog").insert(catalog_data).execute()
+        )
 
         if not catalog_result.data:
             raise HTTPException(
@@ -263,13 +262,18 @@ async def approve_staging_component(component_id: UUID, data: StagingApproval =
             )
 
         # 스테이징 상태 업데이트
-        db.table("staging_components").update(
-            {
-                "status": "approved",
-                "review_note": data.review_note if data else None,
-                "approved_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("id", str(component_id)).execute()
+        await (
+            db.table("staging_components")
+            .update(
+                {
+                    "status": "approved",
+                    "review_note": data.review_note if data else None,
+                    "approved_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("id", str(component_id))
+            .execute()
+        )
 
         logger.info(
             "staging_component_approved",
@@ -291,13 +295,13 @@ async def approve_staging_component(component_id: UUID, data: StagingApproval =
 
 
 @router.post("/components/{component_id}/reject")
-async def reject_staging_component(component_id: UUID, data: StagingApproval = None):
+async def reject_staging_component(
+    component_id: UUID, data: StagingApproval = None, db=Depends(get_async_db)
+):
     """스테이징 컴포넌트 거절"""
-    db = get_db()
-
     try:
         existing = (
-            db.table("staging_components")
+            await db.table("staging_components")
             .select("*")
             .eq("id", str(component_id))
             .execute()
@@ -308,12 +312,17 @@ async def reject_staging_component(component_id: UUID, data: StagingApproval = N
         if existing.data[0]["status"] != "pending":
             raise HTTPException(status_code=400, detail="Component is not pending")
 
-        db.table("staging_components").update(
-            {
-                "status": "rejected",
-                "review_note": data.review_note if data else None,
-            }
-        ).eq("id", str(component_id)).execute()
+        await (
+            db.table("staging_components")
+            .update(
+                {
+                    "status": "rejected",
+                    "review_note": data.review_note if data else None,
+                }
+            )
+            .eq("id", str(component_id))
+            .execute()
+        )
 
         logger.info("staging_component_rejected", id=str(component_id))
 
@@ -327,17 +336,18 @@ async def reject_staging_component(component_id: UUID, data: StagingApproval = N
 
 
 @router.post("/components/bulk/approve")
-async def bulk_approve_staging_components(data: BulkApproval):
+async def bulk_approve_staging_components(data: BulkApproval, db=Depends(get_async_db)):
     """
     스테이징 컴포넌트 일괄 승인
     """
-    get_db()
     results = {"approved": 0, "failed": 0, "errors": []}
 
     for component_id in data.ids:
         try:
             await approve_staging_component(
-                UUID(component_id), StagingApproval(review_note=data.review_note)
+                UUID(component_id),
+                StagingApproval(review_note=data.review_note),
+                db=db,
             )
             results["approved"] += 1
         except Exception as e:
@@ -355,18 +365,20 @@ async def bulk_approve_staging_components(data: BulkApproval):
 async def get_duplicate_groups(
     field: str = Query("smiles", description="중복 체크 필드 (smiles/inchi_key/name)"),
     limit: int = Query(50, ge=1, le=100),
+    db=Depends(get_async_db),
 ):
     """
     중복 후보 그룹 조회
 
     동일한 SMILES 또는 InChIKey를 가진 스테이징 컴포넌트를 그룹화합니다.
     """
-    db = get_db()
-
     try:
         # pending 상태만 조회
         result = (
-            db.table("staging_components").select("*").eq("status", "pending").execute()
+            await db.table("staging_components")
+            .select("*")
+            .eq("status", "pending")
+            .execute()
         )
 
         groups = {}
@@ -407,12 +419,10 @@ async def get_duplicate_groups(
 
 
 @router.get("/stats")
-async def get_staging_stats():
+async def get_staging_stats(db=Depends(get_async_db)):
     """스테이징 통계"""
-    db = get_db()
-
     try:
-        result = db.table("staging_components").select("type, status").execute()
+        result = await db.table("staging_components").select("type, status").execute()
 
         stats = {"total": len(result.data), "by_status": {}, "by_type": {}}
 
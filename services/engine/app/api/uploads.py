@@ -12,23 +12,12 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 import structlog
 
+from app.api.deps import get_async_db
+
 router = APIRouter()
 logger = structlog.get_logger()
 
 
-def get_db():
-    """Supabase 클라이언트 의존성"""
-    from supabase import create_client
-
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        raise HTTPException(status_code=500, detail="Database not configured")
-
-    return create_client(supabase_url, supabase_key)
-
-
 # === Schemas ===
 
 
@@ -74,7 +63,7 @@ class UploadResponse(BaseModel):
 
 
 @router.post("/presign", response_model=PresignResponse)
-async def presign_upload(request: PresignRequest, db=Depends(get_db)):
+async def presign_upload(request: PresignRequest, db=Depends(get_async_db)):
     """
     업로드 URL 발급 (Pre-sign)
 
@@ -108,7 +97,7 @@ async def presign_upload(request: PresignRequest, db=Depends(get_db)):
             "status": "uploaded",
         }
 
-        result = db.table("uploads").insert(upload_record).execute()
+        result = await db.table("uploads").insert(upload_record).execute()
 
         if not result.data:
             raise HTTPException(
@@ -122,7 +111,7 @@ async def presign_upload(request: PresignRequest, db=Depends(get_db)):
         expires_in = 3600  # 1 hour
 
         try:
-            signed_url_result = db.storage.from_(bucket).create_signed_upload_url(
+            signed_url_result = await db.storage.from_(bucket).create_signed_upload_url(
                 storage_key
             )
             presigned_url = signed_url_result.get("signedURL", "")
@@ -154,7 +143,7 @@ async def presign_upload(request: PresignRequest, db=Depends(get_db)):
 
 
 @router.post("/commit")
-async def commit_upload(request: CommitRequest, db=Depends(get_db)):
+async def commit_upload(request: CommitRequest, db=Depends(get_async_db)):
     """
     업로드 완료 알림 (Commit)
 
@@ -167,7 +156,7 @@ async def commit_upload(request: CommitRequest, db=Depends(get_db)):
     try:
         # 1. 업로드 레코드 확인
         result = (
-            db.table("uploads")
+            await db.table("uploads")
             .select("*")
             .eq("id", request.upload_id)
             .eq("owner_user_id", request.user_id)
@@ -187,9 +176,12 @@ async def commit_upload(request: CommitRequest, db=Depends(get_db)):
             )
 
         # 2. status 변경
-        db.table("uploads").update({"status": "parsing"}).eq(
-            "id", request.upload_id
-        ).execute()
+        await (
+            db.table("uploads")
+            .update({"status": "parsing"})
+            .eq("id", request.upload_id)
+            .execute()
+        )
 
         log.info("upload_committed")
 
@@ -237,7 +229,7 @@ async def list_uploads(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
 ):
     """
     내 업로드 목록 조회
@@ -256,7 +248,7 @@ async def list_uploads(
             query = query.eq("status", status)
 
         query = query.range(offset, offset + limit - 1)
-        result = query.execute()
+        result = await query.execute()
 
         return [
             UploadResponse(
@@ -276,13 +268,13 @@ async def list_uploads(
 
 
 @router.get("/{upload_id}", response_model=UploadResponse)
-async def get_upload(upload_id: str, user_id: str, db=Depends(get_db)):
+async def get_upload(upload_id: str, user_id: str, db=Depends(get_async_db)):
     """
     업로드 상세 조회
     """
     try:
         result = (
-            db.table("uploads")
+            await db.table("uploads")
             .select("*")
             .eq("id", upload_id)
             .eq("owner_user_id", user_id)
@@ -311,7 +303,7 @@ async def get_upload(upload_id: str, user_id: str, db=Depends(get_db)):
 
 
 @router.delete("/{upload_id}")
-async def delete_upload(upload_id: str, user_id: str, db=Depends(get_db)):
+async def delete_upload(upload_id: str, user_id: str, db=Depends(get_async_db)):
     """
     업로드 삭제
     """
@@ -320,7 +312,7 @@ async def delete_upload(upload_id: str, user_id: str, db=Depends(get_db)):
     try:
         # 1. 업로드 확인
         result = (
-            db.table("uploads")
+            await db.table("uploads")
             .select("*")
             .eq("id", upload_id)
             .eq("owner_user_id", user_id)
@@ -334,15 +326,22 @@ async def delete_upload(upload_id: str, user_id: str, db=Depends(get_db)):
 
         # 2. Storage에서 파일 삭제
         try:
-            db.storage.from_(upload["storage_bucket"]).remove([upload["storage_key"]])
+            await db.storage.from_(upload["storage_bucket"]).remove(
+                [upload["storage_key"]]
+            )
         except Exception as e:
             log.warning("storage_delete_failed", error=str(e))
 
         # 3. 관련 candidates 삭제 (cascade)
-        db.table("user_candidates").delete().eq("source_upload_id", upload_id).execute()
+        await (
+            db.table("user_candidates")
+            .delete()
+            .eq("source_upload_id", upload_id)
+            .execute()
+        )
 
         # 4. 업로드 레코드 삭제
-        db.table("uploads").delete().eq("id", upload_id).execute()
+        await db.table("uploads").delete().eq("id", upload_id).execute()
 
         log.info("upload_deleted")
 
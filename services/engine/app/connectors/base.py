@@ -1,6 +1,6 @@
 """
 Connector Framework - Base Classes and Utilities
-공통 인터페이스, Rate Limiter, Retry 정책
+공통 인터페이스, Rate Limiter, Retry 정책, 공유 HTTP 클라이언트
 """
 
 import asyncio
@@ -9,7 +9,8 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
 import httpx
 import structlog
 from tenacity import (
@@ -19,6 +20,15 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from app.connectors.cache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    get_response_cache,
+    is_cacheable,
+)
+from app.core.database import execute_nonblocking
+
 logger = structlog.get_logger()
 
 
@@ -94,31 +104,119 @@ class UpsertResult:
 
 class RateLimiter:
     """
-    소스별 Rate Limiting
+    소스별 Rate Limiting (토큰 버킷, 프로세스 로컬)
+
+    초당 qps개 토큰이 채워지고 최대 burst개까지 쌓임.
+    acquire()는 토큰 1개를 예약하고 부족분만큼 대기 (예약 순서 = 호출 순서)
 
     사용법:
-        limiter = RateLimiter(qps=3.0)  # 초당 3회
+        limiter = RateLimiter(qps=3.0, burst=3)  # 초당 3회, 유휴 후 3회 연속 허용
         await limiter.acquire()
         response = await client.get(url)
     """
 
-    def __init__(self, qps: float = 1.0):
+    def __init__(self, qps: float = 1.0, burst: int = 1):
         """
         Args:
             qps: Queries per second (requests per second)
+            burst: 버킷 용량 (연속 허용 요청 수, 최소 1)
         """
-        self.interval = 1.0 / qps if qps > 0 else 0
-        self.last_call = 0.0
         self._lock = asyncio.Lock()
+        self.set_rate(qps, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+
+    def set_rate(self, qps: float, burst: Optional[int] = None) -> None:
+        """속도/용량 변경 (예: API Key 확인 후 상향)"""
+        self.qps = qps
+        self.burst = max(1, burst if burst is not None else getattr(self, "burst", 1))
+        self.interval = 1.0 / qps if qps > 0 else 0
 
     async def acquire(self):
         """다음 요청 전 대기"""
+        if self.qps <= 0:
+            return
         async with self._lock:
             now = time.monotonic()
-            wait_time = self.last_call + self.interval - now
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            self.last_call = time.monotonic()
+            self.tokens = min(
+                float(self.burst), self.tokens + (now - self.updated_at) * self.qps
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            wait_time = -self.tokens / self.qps if self.tokens < 0 else 0
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Redis 공유 토큰 버킷 (소스별 전역 쿼터)
+
+    여러 Worker 프로세스/Job이 같은 키(rate_limit:{source})의 버킷을 나눠 씀.
+    버킷 갱신 + 예약은 Lua 스크립트 1회 호출로 원자적으로 처리하고 시계는 Redis TIME 사용
+    (프로세스 간 시계 차이 무관). Redis 오류 시 로컬 버킷으로 대체
+    """
+
+    KEY_PREFIX = "rate_limit:"
+
+    # KEYS[1]=버킷, ARGV[1]=qps, ARGV[2]=burst → 대기 시간(ms)
+    SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = burst
+  ts = now
+end
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+local wait = 0
+if tokens < 0 then
+  wait = math.ceil(-tokens * 1000 / rate)
+end
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst + 1) * 1000 / rate) + wait)
+return wait
+"""
+
+    def __init__(self, redis, source: str, qps: float = 1.0, burst: int = 1):
+        """
+        Args:
+            redis: redis.asyncio 클라이언트 (ArqRedis 포함)
+            source: 버킷 키 (커넥터 source)
+            qps: 전역 초당 요청 수
+            burst: 전역 버킷 용량
+        """
+        super().__init__(qps=qps, burst=burst)
+        self.redis = redis
+        self.key = f"{self.KEY_PREFIX}{source}"
+        self._script = redis.register_script(self.SCRIPT)
+
+    async def acquire(self):
+        """전역 버킷에서 토큰 예약 후 대기"""
+        if self.qps <= 0:
+            return
+        try:
+            wait_ms = await self._script(keys=[self.key], args=[self.qps, self.burst])
+        except Exception as e:
+            logger.warning("rate_limit_redis_failed", key=self.key, error=str(e))
+            await super().acquire()
+            return
+        if wait_ms and int(wait_ms) > 0:
+            await asyncio.sleep(int(wait_ms) / 1000)
+
+
+def create_rate_limiter(
+    source: str, qps: float, burst: int = 1, redis=None
+) -> RateLimiter:
+    """Redis 클라이언트가 있으면 소스별 공유 버킷, 없으면 로컬 버킷"""
+    if redis is not None:
+        return RedisRateLimiter(redis, source, qps=qps, burst=burst)
+    return RateLimiter(qps=qps, burst=burst)
 
 
 # ============================================================
@@ -126,6 +224,113 @@ class RateLimiter:
 # ============================================================
 
 
+@dataclass
+class HostMetrics:
+    """호스트별 요청 통계"""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    cache_hits: int = 0
+    not_modified: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.requests if self.requests else 0.0
+
+
+@dataclass
+class RequestMetrics:
+    """
+    커넥터 요청 단위 타이밍 (시도 1회 = 요청 1건)
+
+    - retries: 429/5xx/타임아웃으로 다시 보낸 시도 수
+    - errors: 응답 없이 실패한 시도 (타임아웃, 연결 오류)
+    - rate_limit_wait_ms: Rate limiter 대기 누적
+    - cache_hits: TTL 이내라 요청 없이 캐시로 응답한 수
+    - not_modified: 조건부 요청에 304를 받아 캐시 본문을 재사용한 수 (요청 수에도 포함)
+    """
+
+    hosts: Dict[str, HostMetrics] = field(default_factory=dict)
+    rate_limit_wait_ms: float = 0.0
+
+    def record(
+        self,
+        url: str,
+        elapsed_ms: float,
+        retry: bool = False,
+        error: bool = False,
+    ) -> None:
+        host = self.hosts.setdefault(urlsplit(url).netloc, HostMetrics())
+        host.requests += 1
+        host.retries += int(retry)
+        host.errors += int(error)
+        host.total_ms += elapsed_ms
+        host.max_ms = max(host.max_ms, elapsed_ms)
+
+    def record_cache(self, url: str, revalidated: bool = False) -> None:
+        host = self.hosts.setdefault(urlsplit(url).netloc, HostMetrics())
+        if revalidated:
+            host.not_modified += 1
+        else:
+            host.cache_hits += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(h.requests for h in self.hosts.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """run() 결과/로그용 요약"""
+        return {
+            "requests": self.requests,
+            "rate_limit_wait_ms": round(self.rate_limit_wait_ms, 1),
+            "hosts": {
+                name: {
+                    "requests": h.requests,
+                    "retries": h.retries,
+                    "errors": h.errors,
+                    "avg_ms": round(h.avg_ms, 1),
+                    "max_ms": round(h.max_ms, 1),
+                    "cache_hits": h.cache_hits,
+                    "not_modified": h.not_modified,
+                }
+                for name, h in self.hosts.items()
+            },
+        }
+
+
+def create_http_client(
+    timeout: float = 30.0,
+    max_connections: int = 10,
+    max_keepalive_connections: int = 5,
+    keepalive_expiry: float = 30.0,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """
+    커넥터 공유 HTTP 클라이언트 (호스트별 keep-alive 커넥션 재사용, HTTP/2 지원 시 다중화)
+
+    h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        follow_redirects=True,
+    )
+
+
 class RetryableHTTPError(Exception):
     """재시도 가능한 HTTP 에러"""
 
@@ -143,6 +348,10 @@ async def fetch_with_retry(
     json_data: Optional[Dict[str, Any]] = None,
     timeout: float = 30.0,
     max_retries: int = 3,
+    client: Optional[httpx.AsyncClient] = None,
+    metrics: Optional[RequestMetrics] = None,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> httpx.Response:
     """
     Rate limit + Retry가 적용된 HTTP 요청
@@ -156,10 +365,33 @@ async def fetch_with_retry(
         json_data: JSON body
         timeout: 타임아웃 (초)
         max_retries: 최대 재시도 횟수
+        client: 공유 HTTP 클라이언트 (없으면 요청마다 1회용 클라이언트 생성)
+        metrics: 요청 타이밍 기록 대상
+        cache: 응답 캐시 (있으면 TTL 이내 캐시 응답, 경과 시 ETag/Last-Modified 조건부 요청)
+        cache_ttl: 캐시 응답을 재검증 없이 쓰는 시간 (초, 0이면 매번 조건부 요청)
 
     Returns:
         httpx.Response
     """
+    if method.upper() not in ("GET", "POST"):
+        raise ValueError(f"Unsupported method: {method}")
+
+    attempts = 0
+    key = None
+    cached: Optional[CachedResponse] = None
+
+    if cache is not None:
+        key = cache_key(method, url, params, json_data)
+        try:
+            cached = await cache.get(key)
+        except Exception as e:
+            logger.warning("response_cache_read_failed", url=url, error=str(e))
+        if cached is not None:
+            if cached.is_fresh(cache_ttl):
+                if metrics is not None:
+                    metrics.record_cache(url)
+                return cached.to_response(method, url)
+            headers = {**(headers or {}), **cached.validators}
 
     @retry(
         stop=stop_after_attempt(max_retries),
@@ -168,32 +400,87 @@ async def fetch_with_retry(
         reraise=True,
     )
     async def _fetch():
+        nonlocal attempts
+        attempts += 1
+
         if rate_limiter:
+            waited = time.perf_counter()
             await rate_limiter.acquire()
+            if metrics is not None:
+                metrics.rate_limit_wait_ms += (time.perf_counter() - waited) * 1000
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(
-                    url, headers=headers, params=params, json=json_data
-                )
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+        if client is None:
+            async with httpx.AsyncClient(timeout=timeout) as one_off:
+                response = await _send(one_off)
+        else:
+            response = await _send(client)
 
-            # Rate limit (429) 또는 서버 에러 (5xx)는 재시도
-            if response.status_code == 429:
-                logger.warning("rate_limit_hit", url=url, status=429)
-                raise RetryableHTTPError(429, "Rate limited")
+        # Rate limit (429) 또는 서버 에러 (5xx)는 재시도
+        if response.status_code == 429:
+            logger.warning("rate_limit_hit", url=url, status=429)
+            raise RetryableHTTPError(429, "Rate limited")
 
-            if response.status_code >= 500:
-                logger.warning("server_error", url=url, status=response.status_code)
-                raise RetryableHTTPError(response.status_code, "Server error")
+        if response.status_code >= 500:
+            logger.warning("server_error", url=url, status=response.status_code)
+            raise RetryableHTTPError(response.status_code, "Server error")
 
-            response.raise_for_status()
+        if response.status_code == 304 and cached is not None:
             return response
 
-    return await _fetch()
+        response.raise_for_status()
+        return response
+
+    async def _send(http: httpx.AsyncClient) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await http.request(
+                method.upper(),
+                url,
+                headers=headers,
+                params=params,
+                json=json_data if method.upper() == "POST" else None,
+                timeout=timeout,
+            )
+        except httpx.HTTPError:
+            if metrics is not None:
+                metrics.record(
+                    url,
+                    (time.perf_counter() - started) * 1000,
+                    retry=attempts > 1,
+                    error=True,
+                )
+            raise
+        if metrics is not None:
+            metrics.record(
+                url, (time.perf_counter() - started) * 1000, retry=attempts > 1
+            )
+        return response
+
+    response = await _fetch()
+    if cache is None:
+        return response
+
+    if response.status_code == 304:
+        # 변경 없음: 캐시 본문 재사용 + 저장 시각 갱신 (다시 TTL 동안 요청 생략)
+        if metrics is not None:
+            metrics.record_cache(url, revalidated=True)
+        cached.stored_at = time.time()
+        await _store_cached(cache, key, cached, url)
+        return cached.to_response(method, url)
+
+    if is_cacheable(response):
+        await _store_cached(cache, key, CachedResponse.from_response(response), url)
+    return response
+
+
+async def _store_cached(
+    cache: ResponseCache, key: str, entry: CachedResponse, url: str
+) -> None:
+    """캐시 저장 실패는 요청 결과에 영향 없음"""
+    try:
+        await cache.set(key, entry)
+    except Exception as e:
+        logger.warning("response_cache_write_failed", url=url, error=str(e))
 
 
 # ============================================================
@@ -217,16 +504,93 @@ class BaseConnector(ABC):
     # 자식 클래스에서 설정
     source: str = ""
     rate_limit_qps: float = 1.0
+    rate_limit_burst: int = 1
     max_retries: int = 3
 
-    def __init__(self, db_client=None):
+    # run() 동시성: 동시 실행 쿼리 수 / 쿼리당 처리 대기 페이지 수
+    query_concurrency: int = 4
+    pipeline_depth: int = 2
+
+    # 공유 HTTP 클라이언트 (run() 동안 유지, 종료 시 close)
+    http_timeout: float = 30.0
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+
+    # 응답 캐시: 캐시 응답을 재검증 없이 쓰는 시간 (초, 0이면 매번 조건부 요청)
+    cache_ttl: float = 0.0
+    # 처리 완료 레코드 체크섬 마크 보관 기간 (경과 후 다시 정규화/Upsert)
+    checksum_retention: float = ResponseCache.DEFAULT_RETENTION
+
+    # 변경 감지: (source, external_id, checksum)을 보관하는 테이블.
+    # 설정하면 Upsert 전에 기존 체크섬을 일괄 조회해 신규/변경 레코드만 저장
+    checksum_table: Optional[str] = None
+    checksum_lookup_batch: int = 200
+
+    def __init__(
+        self,
+        db_client=None,
+        redis=None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         """
         Args:
             db_client: Supabase 클라이언트
+            redis: Redis 클라이언트 (있으면 source별 전역 Rate limit 공유)
+            response_cache: 응답 캐시 (없으면 CONNECTOR_CACHE_URL 설정, 미설정 시 캐시 없음)
         """
         self.db = db_client
-        self.rate_limiter = RateLimiter(qps=self.rate_limit_qps)
+        self.redis = redis
+        self.response_cache = response_cache or get_response_cache(redis)
+        self.rate_limiter = create_rate_limiter(
+            self.source, self.rate_limit_qps, self.rate_limit_burst, redis=redis
+        )
         self.logger = logger.bind(connector=self.source)
+        self.request_metrics = RequestMetrics()
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """커넥터 공유 HTTP 클라이언트 (첫 사용 시 생성, 닫힌 뒤 사용하면 재생성)"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_http_client(
+                timeout=self.http_timeout,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            )
+        return self._http_client
+
+    async def fetch(
+        self, url: str, cacheable: Optional[bool] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        공유 클라이언트 + Rate limit + Retry + 타이밍 기록 요청 (fetch_with_retry 인자)
+
+        Args:
+            cacheable: 응답 캐시 사용 여부 (기본: GET만, 멱등 POST는 명시적으로 True)
+        """
+        kwargs.setdefault("rate_limiter", self.rate_limiter)
+        kwargs.setdefault("max_retries", self.max_retries)
+        kwargs.setdefault("timeout", self.http_timeout)
+        if cacheable is None:
+            cacheable = kwargs.get("method", "GET").upper() == "GET"
+        if cacheable and self.response_cache is not None:
+            kwargs.setdefault("cache", self.response_cache)
+            kwargs.setdefault("cache_ttl", self.cache_ttl)
+        return await fetch_with_retry(
+            url, client=self.http_client, metrics=self.request_metrics, **kwargs
+        )
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> "BaseConnector":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
 
     @abstractmethod
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
@@ -338,10 +702,10 @@ class BaseConnector(ABC):
         # Bulk Upsert
         try:
             # Note: Supabase-py bulk upsert might need chunking for large sets
-            res = (
-                self.db.table(table_name)
-                .upsert(rows, on_conflict="source,source_hash", ignore_duplicates=True)
-                .execute()
+            res = await execute_nonblocking(
+                self.db.table(table_name).upsert(
+                    rows, on_conflict="source,source_hash", ignore_duplicates=True
+                )
             )
 
             # Return IDs (if available, otherwise empty)
@@ -356,71 +720,131 @@ class BaseConnector(ABC):
         seed: Dict[str, Any],
         cursor: Optional[CursorState] = None,
         max_pages: int = 100,
+        concurrency: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         전체 수집 프로세스 실행 (Standardized)
 
+        - 쿼리는 최대 concurrency개 동시 실행 (요청 속도는 공유 Rate limiter가 제한)
+        - 쿼리 내부는 페이지 조회(생산자)와 RAW 저장/정규화/Upsert(소비자)를 겹쳐 실행,
+          조회가 앞서 나가는 페이지 수는 pipeline_depth로 제한
+        - 소비자 쪽 DB 호출은 execute_nonblocking 사용 (동기 클라이언트는 스레드에서
+          실행되므로 저장 중에도 다음 페이지 조회와 다른 쿼리가 계속 진행)
+        - 응답 캐시가 있으면 이전 수집에서 저장까지 끝난 레코드(원본 체크섬 일치)는
+          RAW 저장/정규화/Upsert 생략 (stats["unchanged"])
+
         Args:
             seed: 시드 데이터 (Must contain 'profile_name' or 'query_profile')
-            cursor: 시작 커서
-            max_pages: 최대 페이지 수
+            cursor: 시작 커서 (쿼리마다 복사해 사용)
+            max_pages: 쿼리당 최대 페이지 수
+            concurrency: 동시 실행 쿼리 수 (기본 query_concurrency)
 
         Returns:
             실행 결과 통계
         """
         start_time = time.time()
-        stats = {"fetched": 0, "new": 0, "updated": 0, "errors": 0, "raw_saved": 0}
+        stats = {
+            "fetched": 0,
+            "new": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "errors": 0,
+            "raw_saved": 0,
+        }
 
         profile_name = seed.get("profile_name") or seed.get("query_profile")
         dataset_version = seed.get("dataset_version", "v1")
+        concurrency = max(1, concurrency or self.query_concurrency)
 
         try:
             queries = await self.build_queries(seed)
-            self.logger.info("queries_built", count=len(queries), profile=profile_name)
+            self.logger.info(
+                "queries_built",
+                count=len(queries),
+                profile=profile_name,
+                concurrency=concurrency,
+            )
 
-            for query in queries:
-                page_count = 0
-                current_cursor = cursor or CursorState(cursor_id="", source=self.source)
+            pending = iter(queries)
+
+            async def query_worker():
+                for query in pending:
+                    await self._run_query(
+                        query, cursor, max_pages, stats, profile_name, dataset_version
+                    )
+
+            workers = [
+                asyncio.create_task(query_worker())
+                for _ in range(min(concurrency, len(queries)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # 한 쿼리라도 실패하면 나머지 중단 (순차 실행과 같은 실패 의미)
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+            duration_ms = int((time.time() - start_time) * 1000)
+            http_metrics = self.request_metrics.summary()
+            self.logger.info(
+                "run_completed", stats=stats, duration_ms=duration_ms, http=http_metrics
+            )
+
+            return {
+                "status": "completed",
+                "stats": stats,
+                "duration_ms": duration_ms,
+                "http": http_metrics,
+            }
+
+        except Exception as e:
+            self.logger.error("run_failed", error=str(e))
+            return {
+                "status": "failed",
+                "error": str(e),
+                "stats": stats,
+                "http": self.request_metrics.summary(),
+            }
+
+        finally:
+            await self.aclose()
+
+    async def _run_query(
+        self,
+        query: QuerySpec,
+        cursor: Optional[CursorState],
+        max_pages: int,
+        stats: Dict[str, int],
+        profile_name: Optional[str],
+        dataset_version: str,
+    ) -> None:
+        """쿼리 1개 수집 (페이지 N+1 조회와 페이지 N 처리를 겹쳐 실행)"""
+        if cursor is None:
+            current_cursor = CursorState(cursor_id="", source=self.source)
+        else:
+            current_cursor = CursorState(
+                cursor_id=cursor.cursor_id,
+                source=cursor.source,
+                position=dict(cursor.position),
+                stats=dict(cursor.stats),
+            )
+
+        # 조회 결과 페이지 / 조회 실패 예외 / None(종료)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_depth)
 
+        async def produce():
+            try:
+                page_count = 0
                 while page_count < max_pages:
-                    # 1. Fetch
                     result = await self.fetch_page(query, current_cursor)
                     stats["fetched"] += len(result.records)
 
                     if not result.records:
                         break
 
-                    # 2. Save RAW (Mandatory)
-                    if profile_name:
-                        try:
-                            raw_ids = await self.save_raw_data(
-                                result.records,
-                                profile_name,
-                                dataset_version,
-                                metadata={"query": query.query},
-                            )
-                            stats["raw_saved"] += len(raw_ids)
-                        except Exception as e:
-                            self.logger.error("raw_save_error", error=str(e))
-                            # RAW 저장 실패는 치명적이지 않게 처리할지 결정 (여기서는 진행)
-
-                    # 3. Normalize
-                    normalized = []
-                    for record in result.records:
-                        try:
-                            norm = self.normalize(record)
-                            if norm:
-                                normalized.append(norm)
-                        except Exception as e:
-                            stats["errors"] += 1
-                            self.logger.warning("normalize_failed", error=str(e))
-
-                    # 4. Upsert Candidates (Optional - if normalize implemented)
-                    if normalized:
-                        upsert_result = await self.upsert(normalized)
-                        stats["new"] += upsert_result.inserted
-                        stats["updated"] += upsert_result.updated
-                        stats["errors"] += upsert_result.errors
+                    await pages.put(result)
 
                     # Next page
                     if not result.has_more:
@@ -428,15 +852,143 @@ class BaseConnector(ABC):
 
                     current_cursor.position = result.next_cursor
                     page_count += 1
+            except Exception as e:
+                await pages.put(e)
+            else:
+                await pages.put(None)
 
-            duration_ms = int((time.time() - start_time) * 1000)
-            self.logger.info("run_completed", stats=stats, duration_ms=duration_ms)
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await pages.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                await self._process_page(
+                    query, item, stats, profile_name, dataset_version
+                )
+        finally:
+            # 처리 실패/취소 시 선행 조회 중단
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _process_page(
+        self,
+        query: QuerySpec,
+        result: FetchResult,
+        stats: Dict[str, int],
+        profile_name: Optional[str],
+        dataset_version: str,
+    ) -> None:
+        """페이지 1개 처리: 변경 없는 레코드 제외 → RAW 저장 → 정규화 → Upsert"""
+        # 1. Skip unchanged (이전 수집에서 처리 완료된 원본)
+        records, marks = await self._filter_unchanged(result.records)
+        stats["unchanged"] += len(result.records) - len(records)
+        if not records:
+            return
+        completed = True
+
+        # 2. Save RAW (Mandatory)
+        if profile_name:
+            try:
+                raw_ids = await self.save_raw_data(
+                    records,
+                    profile_name,
+                    dataset_version,
+                    metadata={"query": query.query},
+                )
+                stats["raw_saved"] += len(raw_ids)
+            except Exception as e:
+                completed = False
+                self.logger.error("raw_save_error", error=str(e))
+                # RAW 저장 실패는 치명적이지 않게 처리할지 결정 (여기서는 진행)
+
+        # 3. Normalize
+        normalized = []
+        for record in records:
+            try:
+                norm = self.normalize(record)
+                if norm:
+                    normalized.append(norm)
+            except Exception as e:
+                stats["errors"] += 1
+                self.logger.warning("normalize_failed", error=str(e))
+
+        # 4. Upsert Candidates (Optional - if normalize implemented)
+        #    변경 감지 후 신규/변경 레코드만 저장
+        if normalized:
+            changed, unchanged = await self.detect_changes(normalized)
+            upsert_result = await self.upsert(changed) if changed else UpsertResult()
+            upsert_result.unchanged += unchanged
+            stats["new"] += upsert_result.inserted
+            stats["updated"] += upsert_result.updated
+            stats["unchanged"] += upsert_result.unchanged
+            stats["errors"] += upsert_result.errors
+            completed = completed and not upsert_result.errors
+
+        # 5. 일부라도 실패한 페이지는 마크하지 않음 (다음 수집에서 재처리)
+        if completed:
+            await self._mark_processed(marks)
+
+    async def detect_changes(
+        self, records: List[NormalizedRecord]
+    ) -> Tuple[List[NormalizedRecord], int]:
+        """
+        저장된 체크섬과 비교해 신규/변경 레코드만 선별
 
-            return {"status": "completed", "stats": stats, "duration_ms": duration_ms}
+        checksum_table에서 페이지의 external_id 체크섬을 일괄 조회 (배치당 1회) 후 로컬 비교.
+        조회 실패 시 전체를 변경으로 간주 (기존 동작)
 
+        Returns:
+            (신규/변경 레코드, 변경 없는 레코드 수)
+        """
+        if not self.checksum_table or not self.db or not records:
+            return records, 0
+
+        ids = list(dict.fromkeys(record.external_id for record in records))
+        stored: Dict[str, str] = {}
+        try:
+            for i in range(0, len(ids), self.checksum_lookup_batch):
+                result = await execute_nonblocking(
+                    self.db.table(self.checksum_table)
+                    .select("external_id, checksum")
+                    .eq("source", self.source)
+                    .in_("external_id", ids[i : i + self.checksum_lookup_batch])
+                )
+                stored.update(
+                    (row["external_id"], row["checksum"]) for row in result.data or []
+                )
         except Exception as e:
-            self.logger.error("run_failed", error=str(e))
-            return {"status": "failed", "error": str(e), "stats": stats}
+            self.logger.warning("checksum_lookup_failed", error=str(e))
+            return records, 0
+
+        changed = [r for r in records if stored.get(r.external_id) != r.checksum]
+        return changed, len(records) - len(changed)
+
+    def record_mark(self, record: Dict[str, Any]) -> str:
+        """원본 레코드 체크섬 마크 키 (source 단위)"""
+        return f"{self.source}:{NormalizedRecord.compute_checksum(record)}"
+
+    async def _filter_unchanged(
+        self, records: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """처리 완료 마크가 있는 레코드 제외 → (처리할 레코드, 해당 마크 키)"""
+        if self.response_cache is None or not records:
+            return records, []
+        marks = [self.record_mark(record) for record in records]
+        try:
+            seen = await self.response_cache.seen(set(marks))
+        except Exception as e:
+            self.logger.warning("checksum_marks_read_failed", error=str(e))
+            return records, marks
+        kept = [(r, m) for r, m in zip(records, marks) if m not in seen]
+        return [r for r, _ in kept], [m for _, m in kept]
+
+    async def _mark_processed(self, marks: List[str]) -> None:
+        if self.response_cache is None or not marks:
+            return
+        try:
+            await self.response_cache.mark(marks, self.checksum_retention)
+        except Exception as e:
+            self.logger.warning("checksum_marks_write_failed", error=str(e))
 
 
 # ============================================================
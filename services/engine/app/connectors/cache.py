@@ -0,0 +1,470 @@
+"""
+Connector Response Cache
+외부 API 응답 캐시 (조건부 요청) + 처리 완료 레코드 체크섬 마크
+
+- 키: 메서드 + 정규화 URL (호스트 소문자, 쿼리 파라미터 정렬, 인증 파라미터 제외) + JSON body
+- 소스별 TTL(BaseConnector.cache_ttl) 이내: 요청 없이 캐시 응답 반환
+- TTL 경과: ETag/Last-Modified로 조건부 요청 → 304면 캐시 본문 재사용 (쿼터/전송량 절감)
+- 만료된 항목도 retention 동안 보관 (조건부 요청 검증자로 사용)
+- 체크섬 마크: 저장까지 끝난 원본 레코드의 체크섬 → 다음 수집에서 정규화/Upsert 생략
+
+백엔드 (CONNECTOR_CACHE_URL):
+- sqlite:///var/cache/connectors.db : 단일 파일 (stdlib sqlite3, 스레드에서 실행)
+- file:///var/cache/connectors : 콘텐츠 주소 디렉터리 (본문은 sha256 이름 파일로 중복 제거)
+- redis://host:6379/1 : Redis (여러 Worker가 공유)
+- redis : 커넥터에 주입된 Redis 클라이언트 사용
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlencode, urlsplit
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+CACHE_URL_ENV = "CONNECTOR_CACHE_URL"
+
+# 캐시 키에서 제외 (키 교체/연락처 변경으로 캐시가 무효화되지 않도록)
+IGNORED_PARAMS = frozenset({"api_key", "email", "tool"})
+
+# 캐시 응답에 보존하는 헤더 (본문은 디코딩된 상태로 저장하므로 인코딩/길이 헤더 제외)
+KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def cache_key(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    요청 캐시 키 (sha256)
+
+    URL 쿼리 문자열과 params를 병합 후 정렬하므로 파라미터 순서와 무관
+    """
+    request_url = httpx.URL(url).copy_merge_params(params or {})
+    items = sorted(
+        (key, value)
+        for key, value in request_url.params.multi_items()
+        if key not in IGNORED_PARAMS
+    )
+    normalized = (
+        f"{method.upper()} {request_url.scheme}://{request_url.netloc.decode()}"
+        f"{request_url.path}?{urlencode(items)}"
+    )
+    if json_data is not None:
+        normalized += "\n" + json.dumps(json_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답"""
+
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        return cls(
+            status_code=response.status_code,
+            content=response.content,
+            headers={
+                name: response.headers[name]
+                for name in KEPT_HEADERS
+                if name in response.headers
+            },
+        )
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """TTL 이내인지 (ttl <= 0이면 항상 재검증)"""
+        return (
+            ttl > 0 and (now if now is not None else time.time()) - self.stored_at < ttl
+        )
+
+    def to_response(self, method: str, url: str) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method.upper(), url),
+        )
+
+    def to_meta(self) -> Dict[str, Any]:
+        return {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any], content: bytes) -> "CachedResponse":
+        return cls(
+            status_code=meta["status_code"],
+            content=content,
+            headers=meta.get("headers") or {},
+            stored_at=meta["stored_at"],
+        )
+
+
+def is_cacheable(response: httpx.Response) -> bool:
+    """200 응답 중 no-store가 아닌 것만 저장"""
+    if response.status_code != 200:
+        return False
+    return "no-store" not in response.headers.get("cache-control", "").lower()
+
+
+class ResponseCache(ABC):
+    """
+    응답 캐시 백엔드 인터페이스
+
+    - get/set: 응답 항목 (retention 초 후 삭제)
+    - seen/mark: 레코드 체크섬 마크 (처리 완료 표시)
+    """
+
+    DEFAULT_RETENTION = 30 * 24 * 3600
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, entry: CachedResponse, retention: Optional[float] = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def seen(self, keys: Iterable[str]) -> Set[str]:
+        """keys 중 마크가 남아있는 키"""
+        pass
+
+    @abstractmethod
+    async def mark(
+        self, keys: Iterable[str], retention: Optional[float] = None
+    ) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def _expires_at(self, retention: Optional[float]) -> float:
+        return time.time() + (
+            self.DEFAULT_RETENTION if retention is None else retention
+        )
+
+
+class SQLiteResponseCache(ResponseCache):
+    """SQLite 파일 캐시 (프로세스 내 연결 1개 + 락, WAL 모드로 프로세스 간 공유)"""
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    meta TEXT NOT NULL,
+    content BLOB NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS marks (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+
+    # SQLite 바인딩 변수 수 제한 (구버전 999)
+    BATCH = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            # 열 때마다 만료 항목 정리
+            now = time.time()
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            conn.execute("DELETE FROM marks WHERE expires_at <= ?", (now,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        return await asyncio.to_thread(self._get, key)
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT meta, content FROM responses"
+                    " WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return CachedResponse.from_meta(json.loads(row[0]), bytes(row[1]))
+
+    async def set(
+        self, key: str, entry: CachedResponse, retention: Optional[float] = None
+    ) -> None:
+        await asyncio.to_thread(self._set, key, entry, self._expires_at(retention))
+
+    def _set(self, key: str, entry: CachedResponse, expires_at: float) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, meta, content, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry.to_meta()), entry.content, expires_at),
+            )
+            conn.commit()
+
+    async def seen(self, keys: Iterable[str]) -> Set[str]:
+        return await asyncio.to_thread(self._seen, list(keys))
+
+    def _seen(self, keys: List[str]) -> Set[str]:
+        found: Set[str] = set()
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(keys), self.BATCH):
+                batch = keys[i : i + self.BATCH]
+                rows = conn.execute(
+                    f"SELECT key FROM marks WHERE expires_at > ?"
+                    f" AND key IN ({', '.join('?' * len(batch))})",
+                    (now, *batch),
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    async def mark(
+        self, keys: Iterable[str], retention: Optional[float] = None
+    ) -> None:
+        expires_at = self._expires_at(retention)
+        await asyncio.to_thread(self._mark, [(key, expires_at) for key in keys])
+
+    def _mark(self, rows: List[tuple]) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO marks (key, expires_at) VALUES (?, ?)", rows
+            )
+            conn.commit()
+
+    async def aclose(self) -> None:
+        if self._conn is not None:
+            await asyncio.to_thread(self._conn.close)
+            self._conn = None
+
+
+class DirectoryResponseCache(ResponseCache):
+    """
+    콘텐츠 주소 디렉터리 캐시
+
+        {root}/objects/ab/abcd...   응답 본문 (sha256, 같은 본문은 1개 파일)
+        {root}/responses/ab/{key}   응답 메타 (JSON: 본문 해시, 헤더, 만료 시각)
+        {root}/marks/ab/{key}       체크섬 마크 (만료 시각)
+
+    파일은 임시 파일 작성 후 rename (동시 쓰기에도 깨진 파일을 읽지 않음)
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _path(self, kind: str, name: str) -> Path:
+        return self.root / kind / name[:2] / name
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        return await asyncio.to_thread(self._get, key)
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            meta = json.loads(self._path("responses", key).read_bytes())
+            if meta["expires_at"] <= time.time():
+                return None
+            content = self._path("objects", meta["object"]).read_bytes()
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        return CachedResponse.from_meta(meta, content)
+
+    async def set(
+        self, key: str, entry: CachedResponse, retention: Optional[float] = None
+    ) -> None:
+        await asyncio.to_thread(self._set, key, entry, self._expires_at(retention))
+
+    def _set(self, key: str, entry: CachedResponse, expires_at: float) -> None:
+        digest = hashlib.sha256(entry.content).hexdigest()
+        obj = self._path("objects", digest)
+        if not obj.exists():
+            self._write(obj, entry.content)
+        meta = {**entry.to_meta(), "object": digest, "expires_at": expires_at}
+        self._write(self._path("responses", key), json.dumps(meta).encode())
+
+    async def seen(self, keys: Iterable[str]) -> Set[str]:
+        return await asyncio.to_thread(self._seen, list(keys))
+
+    def _seen(self, keys: List[str]) -> Set[str]:
+        now = time.time()
+        found = set()
+        for key in keys:
+            try:
+                if float(self._path("marks", key).read_text()) > now:
+                    found.add(key)
+            except (FileNotFoundError, ValueError):
+                continue
+        return found
+
+    async def mark(
+        self, keys: Iterable[str], retention: Optional[float] = None
+    ) -> None:
+        expires_at = self._expires_at(retention)
+        await asyncio.to_thread(self._mark, list(keys), expires_at)
+
+    def _mark(self, keys: List[str], expires_at: float) -> None:
+        for key in keys:
+            self._write(self._path("marks", key), str(expires_at).encode())
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Redis 캐시 (여러 Worker 공유, 만료는 Redis TTL)
+
+    decode_responses 설정과 무관하도록 본문은 base64로 JSON에 포함
+    """
+
+    KEY_PREFIX = "connector_cache:"
+
+    def __init__(self, redis, owned: bool = False):
+        """
+        Args:
+            redis: redis.asyncio 클라이언트
+            owned: True면 aclose()에서 연결 종료
+        """
+        self.redis = redis
+        self.owned = owned
+
+    def _key(self, kind: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}{kind}:{key}"
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.redis.get(self._key("response", key))
+        if not raw:
+            return None
+        meta = json.loads(raw)
+        return CachedResponse.from_meta(meta, base64.b64decode(meta["content"]))
+
+    async def set(
+        self, key: str, entry: CachedResponse, retention: Optional[float] = None
+    ) -> None:
+        payload = {
+            **entry.to_meta(),
+            "content": base64.b64encode(entry.content).decode(),
+        }
+        await self.redis.set(
+            self._key("response", key),
+            json.dumps(payload),
+            ex=int(self.DEFAULT_RETENTION if retention is None else retention),
+        )
+
+    async def seen(self, keys: Iterable[str]) -> Set[str]:
+        keys = list(keys)
+        if not keys:
+            return set()
+        values = await self.redis.mget([self._key("mark", key) for key in keys])
+        return {key for key, value in zip(keys, values) if value}
+
+    async def mark(
+        self, keys: Iterable[str], retention: Optional[float] = None
+    ) -> None:
+        ex = int(self.DEFAULT_RETENTION if retention is None else retention)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(self._key("mark", key), "1", ex=ex)
+            await pipe.execute()
+
+    async def aclose(self) -> None:
+        if self.owned:
+            await self.redis.aclose()
+
+
+def create_response_cache(url: str, redis=None) -> Optional[ResponseCache]:
+    """
+    CONNECTOR_CACHE_URL 형식의 설정으로 캐시 생성 (빈 값이면 None = 캐시 미사용)
+
+    Args:
+        url: sqlite:///path | file:///dir | redis://... | redis
+        redis: "redis" 설정일 때 사용할 클라이언트
+    """
+    if not url:
+        return None
+    if url == "redis":
+        return RedisResponseCache(redis) if redis is not None else None
+
+    parts = urlsplit(url)
+    if parts.scheme == "sqlite":
+        return SQLiteResponseCache(parts.path)
+    if parts.scheme == "file":
+        return DirectoryResponseCache(parts.path)
+    if parts.scheme in ("redis", "rediss"):
+        from redis import asyncio as aioredis
+
+        return RedisResponseCache(aioredis.from_url(url), owned=True)
+    raise ValueError(f"Unsupported connector cache URL: {url}")
+
+
+_default_caches: Dict[str, ResponseCache] = {}
+
+
+def get_response_cache(redis=None) -> Optional[ResponseCache]:
+    """
+    환경 설정(CONNECTOR_CACHE_URL) 기본 캐시 (프로세스 내 커넥터 공유)
+
+    "redis" 설정은 주입된 클라이언트마다 캐시 객체를 만들고 공유하지 않음
+    """
+    url = os.getenv(CACHE_URL_ENV, "")
+    if not url or url == "redis":
+        return create_response_cache(url, redis=redis)
+    if url not in _default_caches:
+        _default_caches[url] = create_response_cache(url)
+    return _default_caches[url]
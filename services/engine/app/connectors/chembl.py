@@ -15,7 +15,6 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
 
 logger = structlog.get_logger()
@@ -36,12 +35,13 @@ class ChEMBLConnector(BaseConnector):
     source = "chembl"
     rate_limit_qps = 5.0
     max_retries = 3
+    cache_ttl = 24 * 3600  # 릴리스 단위 갱신
 
     # ChEMBL API endpoint
     BASE_URL = "https://www.ebi.ac.uk/chembl/api/data"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -129,9 +129,7 @@ class ChEMBLConnector(BaseConnector):
         self.logger.info("chembl_molecule_request", chembl_id=chembl_id)
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
 
@@ -155,11 +153,9 @@ class ChEMBLConnector(BaseConnector):
         params = {"molecule_chembl_id": chembl_id, "limit": limit}
 
         try:
-            response = await fetch_with_retry(
+            response = await self.fetch(
                 url,
-                rate_limiter=self.rate_limiter,
                 params=params,
-                max_retries=self.max_retries,
             )
 
             data = response.json()
@@ -214,11 +210,9 @@ class ChEMBLConnector(BaseConnector):
 
         self.logger.info("chembl_smiles_search", smiles=smiles[:30])
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             url,
-            rate_limiter=self.rate_limiter,
             params=params,
-            max_retries=self.max_retries,
         )
 
         data = response.json()
@@ -255,11 +249,9 @@ class ChEMBLConnector(BaseConnector):
             "chembl_similarity_search", smiles=smiles[:30], threshold=threshold
         )
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             url,
-            rate_limiter=self.rate_limiter,
             params=params,
-            max_retries=self.max_retries,
         )
 
         data = response.json()
@@ -281,11 +273,9 @@ class ChEMBLConnector(BaseConnector):
 
         self.logger.info("chembl_search", query=query, offset=offset)
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             url,
-            rate_limiter=self.rate_limiter,
             params=params,
-            max_retries=self.max_retries,
         )
 
         data = response.json()
@@ -16,8 +16,8 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -41,8 +41,8 @@ class ClinicalTrialsConnector(BaseConnector):
     # ClinicalTrials.gov API v2 endpoint
     BASE_URL = "https://clinicaltrials.gov/api/v2"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -157,11 +157,9 @@ class ClinicalTrialsConnector(BaseConnector):
         self.logger.info("clinicaltrials_request", query=query.query[:50])
 
         try:
-            response = await fetch_with_retry(
+            response = await self.fetch(
                 url,
-                rate_limiter=self.rate_limiter,
                 params=params,
-                max_retries=self.max_retries,
             )
 
             data = response.json()
@@ -199,16 +197,18 @@ class ClinicalTrialsConnector(BaseConnector):
     async def _save_raw(self, record: NormalizedRecord):
         """원본 데이터 저장"""
         try:
-            self.db.table("raw_source_records").upsert(
-                {
-                    "source": record.source,
-                    "external_id": record.external_id,
-                    "payload": record.data,
-                    "checksum": record.checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("raw_source_records").upsert(
+                    {
+                        "source": record.source,
+                        "external_id": record.external_id,
+                        "payload": record.data,
+                        "checksum": record.checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+            )
         except Exception as e:
             self.logger.warning("raw_save_failed", error=str(e))
 
@@ -239,11 +239,10 @@ class ClinicalTrialsConnector(BaseConnector):
         # 관련 target_profiles 찾기
         for keyword in target_keywords:
             # gene_symbol로 검색
-            profiles = (
+            profiles = await execute_nonblocking(
                 self.db.table("target_profiles")
                 .select("id, clinical")
                 .ilike("gene_symbol", f"%{keyword}%")
-                .execute()
             )
 
             if profiles.data:
@@ -267,9 +266,11 @@ class ClinicalTrialsConnector(BaseConnector):
                         current_clinical["trials"] = trials[:20]  # 최대 20개
                         current_clinical["updated_at"] = datetime.utcnow().isoformat()
 
-                        self.db.table("target_profiles").update(
-                            {"clinical": current_clinical}
-                        ).eq("id", profile["id"]).execute()
+                        await execute_nonblocking(
+                            self.db.table("target_profiles").update(
+                                {"clinical": current_clinical}
+                            ).eq("id", profile["id"])
+                        )
 
                 return "updated"
 
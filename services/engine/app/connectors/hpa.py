@@ -16,8 +16,8 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -37,12 +37,14 @@ class HPAConnector(BaseConnector):
     source = "hpa"
     rate_limit_qps = 5.0
     max_retries = 3
+    cache_ttl = 24 * 3600  # 릴리스 단위 갱신
+    checksum_table = "raw_source_records"  # 체크섬 같은 레코드는 Upsert 생략
 
     # HPA API endpoint
     BASE_URL = "https://www.proteinatlas.org"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -77,9 +79,7 @@ class HPAConnector(BaseConnector):
         self.logger.info("hpa_request", identifier=identifier)
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
 
@@ -176,8 +176,9 @@ class HPAConnector(BaseConnector):
 
         for record in records:
             try:
-                await self._save_raw(record)
                 upsert_status = await self._update_target_profile(record)
+                # 체크섬 기록은 프로필 저장 성공 후 (변경 감지 기준)
+                await self._save_raw(record)
 
                 if upsert_status == "inserted":
                     result.inserted += 1
@@ -197,16 +198,18 @@ class HPAConnector(BaseConnector):
     async def _save_raw(self, record: NormalizedRecord):
         """원본 데이터 저장"""
         try:
-            self.db.table("raw_source_records").upsert(
-                {
-                    "source": record.source,
-                    "external_id": record.external_id,
-                    "payload": record.data,
-                    "checksum": record.checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("raw_source_records").upsert(
+                    {
+                        "source": record.source,
+                        "external_id": record.external_id,
+                        "payload": record.data,
+                        "checksum": record.checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+            )
         except Exception as e:
             self.logger.warning("raw_save_failed", error=str(e))
 
@@ -219,20 +222,18 @@ class HPAConnector(BaseConnector):
         # 기존 프로필 찾기 (ensembl 또는 gene_symbol로)
         existing = None
         if ensembl_id:
-            existing = (
+            existing = await execute_nonblocking(
                 self.db.table("target_profiles")
                 .select("id, expression")
                 .eq("ensembl_id", ensembl_id)
-                .execute()
             )
 
         if not existing or not existing.data:
             if gene_symbol:
-                existing = (
+                existing = await execute_nonblocking(
                     self.db.table("target_profiles")
                     .select("id, expression")
                     .eq("gene_symbol", gene_symbol)
-                    .execute()
                 )
 
         expression_data = {
@@ -251,26 +252,32 @@ class HPAConnector(BaseConnector):
             current_expr = existing.data[0].get("expression", {})
             current_expr.update(expression_data)
 
-            self.db.table("target_profiles").update(
-                {
-                    "expression": current_expr,
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
-            ).eq("id", existing.data[0]["id"]).execute()
+            await execute_nonblocking(
+                self.db.table("target_profiles")
+                .update(
+                    {
+                        "expression": current_expr,
+                        "updated_at": datetime.utcnow().isoformat(),
+                    }
+                )
+                .eq("id", existing.data[0]["id"])
+            )
 
             return "updated"
         else:
             # 새 프로필 생성
             if gene_symbol:
-                self.db.table("target_profiles").insert(
-                    {
-                        "gene_symbol": gene_symbol,
-                        "ensembl_id": ensembl_id,
-                        "protein_name": data.get("protein_name"),
-                        "expression": expression_data,
-                        "created_at": datetime.utcnow().isoformat(),
-                    }
-                ).execute()
+                await execute_nonblocking(
+                    self.db.table("target_profiles").insert(
+                        {
+                            "gene_symbol": gene_symbol,
+                            "ensembl_id": ensembl_id,
+                            "protein_name": data.get("protein_name"),
+                            "expression": expression_data,
+                            "created_at": datetime.utcnow().isoformat(),
+                        }
+                    )
+                )
                 return "inserted"
 
             return "unchanged"
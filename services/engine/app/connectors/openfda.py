@@ -17,8 +17,8 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -37,13 +37,15 @@ class OpenFDAConnector(BaseConnector):
 
     source = "openfda"
     rate_limit_qps = 4.0  # openFDA: 240 req/min = 4 req/sec
+    rate_limit_burst = 4  # 분당 쿼터라 짧은 버스트 허용
     max_retries = 3
+    checksum_table = "raw_source_records"  # 체크섬 같은 레코드는 Upsert 생략
 
     # openFDA endpoint
     BASE_URL = "https://api.fda.gov/drug/event.json"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
         self.api_key = os.getenv("OPENFDA_API_KEY", "")
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
@@ -101,11 +103,9 @@ class OpenFDAConnector(BaseConnector):
         )
 
         try:
-            response = await fetch_with_retry(
+            response = await self.fetch(
                 self.BASE_URL,
-                rate_limiter=self.rate_limiter,
                 params=params,
-                max_retries=self.max_retries,
             )
 
             data = response.json()
@@ -248,16 +248,18 @@ class OpenFDAConnector(BaseConnector):
     async def _save_raw(self, record: NormalizedRecord):
         """원본 데이터 저장"""
         try:
-            self.db.table("raw_source_records").upsert(
-                {
-                    "source": record.source,
-                    "external_id": record.external_id,
-                    "payload": record.data,
-                    "checksum": record.checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("raw_source_records").upsert(
+                    {
+                        "source": record.source,
+                        "external_id": record.external_id,
+                        "payload": record.data,
+                        "checksum": record.checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+            )
         except Exception as e:
             self.logger.warning("raw_save_failed", error=str(e))
 
@@ -268,7 +270,9 @@ class OpenFDAConnector(BaseConnector):
         약물 이름으로 관련 타겟을 찾아 안전 신호 저장
         """
         # compound_registry에서 약물 검색
-        compounds = self.db.table("compound_registry").select("id, synonyms").execute()
+        compounds = await execute_nonblocking(
+            self.db.table("compound_registry").select("id, synonyms")
+        )
 
         related_compound_id = None
         for compound in compounds.data:
@@ -279,11 +283,10 @@ class OpenFDAConnector(BaseConnector):
 
         # 관련 component 찾기
         if related_compound_id:
-            components = (
+            components = await execute_nonblocking(
                 self.db.table("component_catalog")
                 .select("id, properties")
                 .eq("type", "payload")
-                .execute()
             )
 
             for comp in components.data:
@@ -320,11 +323,8 @@ async def aggregate_safety_signals(db, drug_name: str) -> Dict:
         집계된 안전 신호 데이터
     """
     # raw_source_records에서 해당 약물 데이터 조회
-    records = (
-        db.table("raw_source_records")
-        .select("payload")
-        .eq("source", "openfda")
-        .execute()
+    records = await execute_nonblocking(
+        db.table("raw_source_records").select("payload").eq("source", "openfda")
     )
 
     signals = {
@@ -17,6 +17,7 @@ from app.connectors.base import (
     NormalizedRecord,
     UpsertResult,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -35,13 +36,16 @@ class OpenTargetsConnector(BaseConnector):
 
     source = "opentargets"
     rate_limit_qps = 5.0  # Open Targets는 관대함
+    rate_limit_burst = 5
     max_retries = 3
+    cache_ttl = 24 * 3600  # 분기 릴리스 (GraphQL POST도 캐시)
+    checksum_table = "raw_source_records"  # 체크섬 같은 레코드는 Upsert 생략
 
     # Open Targets GraphQL endpoint
     API_URL = "https://api.platform.opentargets.org/api/v4/graphql"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -56,11 +60,10 @@ class OpenTargetsConnector(BaseConnector):
 
         if seed_set_id and self.db:
             # Seed Set에 연결된 타겟 조회 (Ensembl ID 필요)
-            targets_res = (
+            targets_res = await execute_nonblocking(
                 self.db.table("seed_set_targets")
                 .select("entity_targets(ensembl_gene_id)")
                 .eq("seed_set_id", seed_set_id)
-                .execute()
             )
 
             ensembl_ids = [
@@ -131,17 +134,13 @@ class OpenTargetsConnector(BaseConnector):
 
         self.logger.info("opentargets_request", ensembl_id=ensembl_id, page=page)
 
-        import httpx
-
-        await self.rate_limiter.acquire()
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                self.API_URL,
-                json={"query": graphql_query, "variables": variables},
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
+        response = await self.fetch(
+            self.API_URL,
+            method="POST",
+            json_data={"query": graphql_query, "variables": variables},
+            headers={"Content-Type": "application/json"},
+            cacheable=True,
+        )
 
         data = response.json()
 
@@ -234,8 +233,9 @@ class OpenTargetsConnector(BaseConnector):
 
         for record in records:
             try:
-                await self._save_raw(record)
                 upsert_status = await self._update_target_profile(record)
+                # 체크섬 기록은 프로필 저장 성공 후 (변경 감지 기준)
+                await self._save_raw(record)
 
                 if upsert_status == "inserted":
                     result.inserted += 1
@@ -255,16 +255,18 @@ class OpenTargetsConnector(BaseConnector):
     async def _save_raw(self, record: NormalizedRecord):
         """원본 데이터 저장"""
         try:
-            self.db.table("raw_source_records").upsert(
-                {
-                    "source": record.source,
-                    "external_id": record.external_id,
-                    "payload": record.data,
-                    "checksum": record.checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("raw_source_records").upsert(
+                    {
+                        "source": record.source,
+                        "external_id": record.external_id,
+                        "payload": record.data,
+                        "checksum": record.checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+            )
         except Exception as e:
             self.logger.warning("raw_save_failed", error=str(e))
 
@@ -274,11 +276,10 @@ class OpenTargetsConnector(BaseConnector):
         ensembl_id = data["ensembl_id"]
 
         # 기존 프로필 확인
-        existing = (
+        existing = await execute_nonblocking(
             self.db.table("target_profiles")
             .select("id, associations")
             .eq("ensembl_id", ensembl_id)
-            .execute()
         )
 
         associations_data = {
@@ -294,26 +295,32 @@ class OpenTargetsConnector(BaseConnector):
             current_assoc = existing.data[0].get("associations", {})
             current_assoc.update(associations_data)
 
-            self.db.table("target_profiles").update(
-                {
-                    "associations": current_assoc,
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
-            ).eq("ensembl_id", ensembl_id).execute()
+            await execute_nonblocking(
+                self.db.table("target_profiles")
+                .update(
+                    {
+                        "associations": current_assoc,
+                        "updated_at": datetime.utcnow().isoformat(),
+                    }
+                )
+                .eq("ensembl_id", ensembl_id)
+            )
 
             return "updated"
         else:
             # 새 프로필 생성 (gene_symbol이 있으면)
             if data.get("target_symbol"):
-                self.db.table("target_profiles").insert(
-                    {
-                        "ensembl_id": ensembl_id,
-                        "gene_symbol": data["target_symbol"],
-                        "protein_name": data.get("target_name"),
-                        "associations": associations_data,
-                        "created_at": datetime.utcnow().isoformat(),
-                    }
-                ).execute()
+                await execute_nonblocking(
+                    self.db.table("target_profiles").insert(
+                        {
+                            "ensembl_id": ensembl_id,
+                            "gene_symbol": data["target_symbol"],
+                            "protein_name": data.get("target_name"),
+                            "associations": associations_data,
+                            "created_at": datetime.utcnow().isoformat(),
+                        }
+                    )
+                )
                 return "inserted"
 
             return "unchanged"
@@ -15,7 +15,6 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
 
 logger = structlog.get_logger()
@@ -36,12 +35,13 @@ class PubChemConnector(BaseConnector):
     source = "pubchem"
     rate_limit_qps = 5.0  # PubChem: 5 req/sec
     max_retries = 3
+    cache_ttl = 24 * 3600
 
     # PubChem PUG REST endpoints
     BASE_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -129,9 +129,7 @@ class PubChemConnector(BaseConnector):
         self.logger.info("pubchem_cid_request", cids=cids[:50])
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
             properties = data.get("PropertyTable", {}).get("Properties", [])
@@ -150,9 +148,7 @@ class PubChemConnector(BaseConnector):
         self.logger.info("pubchem_inchikey_request", inchikey=inchikey)
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
             properties = data.get("PropertyTable", {}).get("Properties", [])
@@ -174,9 +170,7 @@ class PubChemConnector(BaseConnector):
         self.logger.info("pubchem_smiles_request", smiles=smiles[:30])
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
             properties = data.get("PropertyTable", {}).get("Properties", [])
@@ -198,9 +192,7 @@ class PubChemConnector(BaseConnector):
         self.logger.info("pubchem_name_request", name=name)
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=self.max_retries
-            )
+            response = await self.fetch(url)
 
             data = response.json()
             properties = data.get("PropertyTable", {}).get("Properties", [])
@@ -224,9 +216,7 @@ class PubChemConnector(BaseConnector):
         url = f"{self.BASE_URL}/compound/cid/{cid}/synonyms/JSON"
 
         try:
-            response = await fetch_with_retry(
-                url, rate_limiter=self.rate_limiter, max_retries=2
-            )
+            response = await self.fetch(url, max_retries=2)
 
             data = response.json()
             info = data.get("InformationList", {}).get("Information", [])
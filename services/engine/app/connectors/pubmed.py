@@ -18,8 +18,8 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -44,8 +44,8 @@ class PubMedConnector(BaseConnector):
     ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
     EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
         # 환경 변수에서 NCBI 설정 로드
         self.api_key = os.getenv("NCBI_API_KEY", "")
@@ -55,7 +55,7 @@ class PubMedConnector(BaseConnector):
         # API Key 있으면 rate limit 증가
         if self.api_key:
             self.rate_limit_qps = 10.0
-            self.rate_limiter.interval = 1.0 / 10.0
+            self.rate_limiter.set_rate(self.rate_limit_qps)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -171,11 +171,9 @@ class PubMedConnector(BaseConnector):
 
         self.logger.info("esearch_request", query=query.query, retstart=retstart)
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             self.ESEARCH_URL,
-            rate_limiter=self.rate_limiter,
             params=esearch_params,
-            max_retries=self.max_retries,
         )
 
         search_result = response.json()
@@ -214,11 +212,9 @@ class PubMedConnector(BaseConnector):
         else:
             efetch_params["id"] = ",".join(pmids)
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             self.EFETCH_URL,
-            rate_limiter=self.rate_limiter,
             params=efetch_params,
-            max_retries=self.max_retries,
         )
 
         # XML 파싱
@@ -407,12 +403,11 @@ class PubMedConnector(BaseConnector):
 
 async def get_pubmed_cursor(db, query_hash: str) -> Optional[Dict[str, Any]]:
     """저장된 커서 조회"""
-    result = (
+    result = await execute_nonblocking(
         db.table("ingestion_cursors")
         .select("*")
         .eq("source", "pubmed")
         .eq("query_hash", query_hash)
-        .execute()
     )
     if result.data:
         return result.data[0]
@@ -427,17 +422,19 @@ async def save_pubmed_cursor(
     status: str = "idle",
 ):
     """커서 저장/업데이트"""
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "pubmed",
-            "query_hash": query_hash,
-            "cursor": cursor,
-            "stats": stats,
-            "status": status,
-            "last_success_at": datetime.utcnow().isoformat()
-            if status == "idle"
-            else None,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await execute_nonblocking(
+        db.table("ingestion_cursors").upsert(
+            {
+                "source": "pubmed",
+                "query_hash": query_hash,
+                "cursor": cursor,
+                "stats": stats,
+                "status": status,
+                "last_success_at": datetime.utcnow().isoformat()
+                if status == "idle"
+                else None,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+    )
@@ -16,8 +16,8 @@ from app.connectors.base import (
     FetchResult,
     NormalizedRecord,
     UpsertResult,
-    fetch_with_retry,
 )
+from app.core.database import execute_nonblocking
 
 logger = structlog.get_logger()
 
@@ -36,13 +36,16 @@ class UniProtConnector(BaseConnector):
 
     source = "uniprot"
     rate_limit_qps = 5.0  # UniProt은 관대함
+    rate_limit_burst = 5
     max_retries = 3
+    cache_ttl = 24 * 3600  # 엔트리 변경 드묾, 만료 후 ETag 재검증
+    checksum_table = "raw_source_records"  # 체크섬 같은 레코드는 Upsert 생략
 
     # UniProt REST API endpoints
     BASE_URL = "https://rest.uniprot.org/uniprotkb"
 
-    def __init__(self, db_client=None):
-        super().__init__(db_client)
+    def __init__(self, db_client=None, redis=None, response_cache=None):
+        super().__init__(db_client, redis, response_cache)
 
     async def build_queries(self, seed: Dict[str, Any]) -> List[QuerySpec]:
         """
@@ -96,11 +99,9 @@ class UniProtConnector(BaseConnector):
         self.logger.info("uniprot_fetch_id", uniprot_id=uniprot_id)
 
         try:
-            response = await fetch_with_retry(
+            response = await self.fetch(
                 url,
-                rate_limiter=self.rate_limiter,
                 headers=headers,
-                max_retries=self.max_retries,
             )
 
             data = response.json()
@@ -132,12 +133,10 @@ class UniProtConnector(BaseConnector):
 
         self.logger.info("uniprot_search", query=query)
 
-        response = await fetch_with_retry(
+        response = await self.fetch(
             url,
-            rate_limiter=self.rate_limiter,
             headers=headers,
             params=params if not next_link else None,
-            max_retries=self.max_retries,
         )
 
         data = response.json()
@@ -255,12 +254,12 @@ class UniProtConnector(BaseConnector):
 
         for record in records:
             try:
-                # raw 저장
-                await self._save_raw(record)
-
                 # target_profiles 저장
                 upsert_result = await self._upsert_target_profile(record)
 
+                # raw 저장 (체크섬 기록 → 다음 수집의 변경 감지 기준, 프로필 저장 성공 후)
+                await self._save_raw(record)
+
                 if upsert_result == "inserted":
                     result.inserted += 1
                     result.ids.append(record.external_id)
@@ -280,16 +279,18 @@ class UniProtConnector(BaseConnector):
     async def _save_raw(self, record: NormalizedRecord):
         """원본 데이터를 raw_source_records에 저장"""
         try:
-            self.db.table("raw_source_records").upsert(
-                {
-                    "source": record.source,
-                    "external_id": record.external_id,
-                    "payload": record.data,
-                    "checksum": record.checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("raw_source_records").upsert(
+                    {
+                        "source": record.source,
+                        "external_id": record.external_id,
+                        "payload": record.data,
+                        "checksum": record.checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+            )
         except Exception as e:
             self.logger.warning("raw_save_failed", error=str(e))
 
@@ -298,11 +299,10 @@ class UniProtConnector(BaseConnector):
         data = record.data
 
         # 기존 프로필 확인
-        existing = (
+        existing = await execute_nonblocking(
             self.db.table("target_profiles")
             .select("id, checksum")
             .eq("uniprot_id", data["uniprot_id"])
-            .execute()
         )
 
         profile_data = {
@@ -324,14 +324,18 @@ class UniProtConnector(BaseConnector):
                 return "unchanged"
 
             # 업데이트
-            self.db.table("target_profiles").update(profile_data).eq(
-                "uniprot_id", data["uniprot_id"]
-            ).execute()
+            await execute_nonblocking(
+                self.db.table("target_profiles")
+                .update(profile_data)
+                .eq("uniprot_id", data["uniprot_id"])
+            )
             return "updated"
         else:
             # 삽입
             profile_data["created_at"] = datetime.utcnow().isoformat()
-            self.db.table("target_profiles").insert(profile_data).execute()
+            await execute_nonblocking(
+                self.db.table("target_profiles").insert(profile_data)
+            )
             return "inserted"
 
 
@@ -349,9 +353,13 @@ async def link_target_to_catalog(db, uniprot_id: str, component_id: str):
         uniprot_id: UniProt ID
         component_id: component_catalog의 ID
     """
-    db.table("target_profiles").update(
-        {"component_id": component_id, "updated_at": datetime.utcnow().isoformat()}
-    ).eq("uniprot_id", uniprot_id).execute()
+    await execute_nonblocking(
+        db.table("target_profiles")
+        .update(
+            {"component_id": component_id, "updated_at": datetime.utcnow().isoformat()}
+        )
+        .eq("uniprot_id", uniprot_id)
+    )
 
 
 async def enrich_targets_from_catalog(db, connector: UniProtConnector):
@@ -361,12 +369,11 @@ async def enrich_targets_from_catalog(db, connector: UniProtConnector):
     target의 properties.uniprot_id가 있으면 UniProt에서 정보 가져와 프로필 생성
     """
     # Target 타입 컴포넌트 중 uniprot_id가 있는 것 조회
-    result = (
+    result = await execute_nonblocking(
         db.table("component_catalog")
         .select("id, name, properties")
         .eq("type", "target")
         .eq("status", "active")
-        .execute()
     )
 
     uniprot_ids = []
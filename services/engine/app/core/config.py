@@ -28,20 +28,39 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: str = ""
     SUPABASE_SERVICE_ROLE_KEY: str = ""
 
+    # Async DB 클라이언트 (PostgREST, HTTP/2 keep-alive 풀)
+    DB_POOL_MAX_CONNECTIONS: int = 20
+    DB_POOL_MAX_KEEPALIVE: int = 10
+    DB_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    DB_REQUEST_TIMEOUT: float = 120.0
+
     # Redis (Arq)
     REDIS_URL: str = "redis://localhost:6379"
+    # 공유 Redis 클라이언트 타임아웃 (초): Redis 장애 시 진행률 조회가 빠르게 DB로 폴백
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    REDIS_CONNECT_TIMEOUT: float = 0.5
 
     # LLM
     GEMINI_API_KEY: str = ""
 
     # Embedding
     OPENAI_API_KEY: str = ""
+    EMBEDDING_PROVIDER: str = "openai"  # openai | local (결정적 해시 벡터, 오프라인)
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    EMBEDDING_BATCH_TOKENS: int = 50_000  # 요청 1건의 토큰 예산
+    EMBEDDING_CONCURRENCY: int = 4
+    EMBEDDING_TOKENS_PER_MINUTE: int = 1_000_000
+    # 임베딩 캐시: "" (미사용) | supabase (embedding_cache 테이블) | sqlite:///path | memory
+    EMBEDDING_CACHE_URL: str = ""
 
     # PubMed
     NCBI_API_KEY: str = ""
     NCBI_EMAIL: str = ""
     NCBI_TOOL: str = "adc_platform"
 
+    # Pareto 비지배 정렬 백엔드 (auto, python, numpy, parallel)
+    PARETO_BACKEND: str = "auto"
+
     # CORS - 쉼표로 구분된 문자열로 받음
     CORS_ORIGINS: str = "http://localhost:3000"
 
@@ -1,10 +1,32 @@
 """
 Supabase Database Client
+
+- 동기 Client 싱글톤 (get_db): 아직 동기 호출을 쓰는 서비스/스크립트용
+- 비동기 AsyncClient (create_async_db): HTTP/2 + keep-alive 커넥션 풀 공유
+  FastAPI lifespan에서 1회 생성해 app.state.db에 두고 app.api.deps.get_async_db로 주입,
+  Arq Worker는 startup에서 ctx["async_db"]에 두고 job_db(ctx)로 사용
 """
 
-from supabase import create_client, Client
+import asyncio
+import inspect
+from typing import Any, Dict
+
+import httpx
+from supabase import (
+    AsyncClient,
+    AsyncClientOptions,
+    Client,
+    acreate_client,
+    create_client,
+)
+import structlog
+
 from app.core.config import settings
 
+logger = structlog.get_logger()
+
+ASYNC_DB_CTX_KEY = "async_db"
+
 
 def get_supabase_client() -> Client:
     """Supabase 클라이언트 생성"""
@@ -21,3 +43,76 @@ def get_db() -> Client:
     if _supabase_client is None:
         _supabase_client = get_supabase_client()
     return _supabase_client
+
+
+# ============================================================
+# Async Client (pooled)
+# ============================================================
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """PostgREST용 공유 HTTP 클라이언트 (HTTP/2, keep-alive 풀)"""
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(settings.DB_REQUEST_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.DB_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.DB_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.DB_POOL_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+async def create_async_db(http_client: httpx.AsyncClient = None) -> AsyncClient:
+    """
+    비동기 Supabase 클라이언트 생성 (프로세스당 1회)
+
+    Args:
+        http_client: 공유 HTTP 클라이언트 (없으면 create_http_client())
+    """
+    client = await acreate_client(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_SERVICE_ROLE_KEY,
+        options=AsyncClientOptions(httpx_client=http_client or create_http_client()),
+    )
+    logger.info(
+        "async_db_created",
+        max_connections=settings.DB_POOL_MAX_CONNECTIONS,
+        http2=True,
+    )
+    return client
+
+
+async def close_async_db(client: AsyncClient) -> None:
+    """커넥션 풀 종료"""
+    if client is not None:
+        await client.postgrest.aclose()
+
+
+async def job_db(ctx: Dict[str, Any]) -> AsyncClient:
+    """
+    Arq Job용 AsyncClient (startup에서 생성한 클라이언트 재사용)
+
+    startup을 거치지 않은 호출(스크립트/수동 실행)은 1회 생성 후 ctx에 보관
+    """
+    client = ctx.get(ASYNC_DB_CTX_KEY)
+    if client is None:
+        client = ctx[ASYNC_DB_CTX_KEY] = await create_async_db()
+    return client
+
+
+def is_async_client(client: Any) -> bool:
+    """비동기 Supabase 클라이언트 여부 (동기/비동기 겸용 서비스 분기용)"""
+    return isinstance(client, AsyncClient)
+
+
+async def execute_nonblocking(query: Any) -> Any:
+    """
+    쿼리 실행 (이벤트 루프 비차단, 동기/비동기 클라이언트 겸용)
+
+    동기 클라이언트 쿼리는 스레드에서 실행 → asyncio.gather로 여러 쿼리 동시 실행 가능
+    """
+    if inspect.iscoroutinefunction(query.execute):
+        return await query.execute()
+    return await asyncio.to_thread(query.execute)
@@ -0,0 +1,229 @@
+"""
+Embedding Cache
+텍스트 임베딩 캐시 (키: 모델 + 정규화 텍스트 sha256)
+
+- 같은 텍스트 재청킹/재색인, 반복 시드 쿼리 → API 호출 없이 저장된 벡터 재사용
+- 정규화: 공백 축약 + 모델 입력 길이 절단 (EmbeddingClient가 실제 전송하는 텍스트와 동일)
+- 조회/저장 오류는 캐시 미스로 처리 (임베딩 자체는 계속 진행)
+
+백엔드 (EMBEDDING_CACHE_URL):
+- supabase : embedding_cache 테이블 (Migration 047, engine/worker 공유)
+- sqlite:///var/cache/embeddings.db : 로컬 파일 (stdlib sqlite3, 스레드에서 실행)
+- memory : 프로세스 내 LRU (테스트/단일 프로세스용)
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import structlog
+
+from app.core.database import execute_nonblocking, get_db
+
+logger = structlog.get_logger()
+
+# 입력당 최대 문자 수 (모델 입력 토큰 한도 8191 이내)
+MAX_INPUT_CHARS = 8000
+
+
+def normalize_text(text: str) -> str:
+    """임베딩 입력 정규화 (공백 축약 + 길이 절단)"""
+    return " ".join(text.split())[:MAX_INPUT_CHARS]
+
+
+def text_checksum(text: str) -> str:
+    """정규화 텍스트 체크섬 (캐시 키)"""
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+
+class EmbeddingCache(ABC):
+    """임베딩 캐시 백엔드 (model별 checksum → 벡터)"""
+
+    @abstractmethod
+    async def get_many(
+        self, model: str, checksums: List[str]
+    ) -> Dict[str, List[float]]:
+        """저장된 벡터 조회 (없는 키는 결과에서 제외)"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        """벡터 저장 (같은 키는 덮어씀)"""
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class MemoryEmbeddingCache(EmbeddingCache):
+    """프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, List[float]]" = OrderedDict()
+
+    async def get_many(
+        self, model: str, checksums: List[str]
+    ) -> Dict[str, List[float]]:
+        found = {}
+        for checksum in checksums:
+            vector = self._entries.get((model, checksum))
+            if vector is not None:
+                self._entries.move_to_end((model, checksum))
+                found[checksum] = vector
+        return found
+
+    async def set_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        for checksum, vector in vectors.items():
+            self._entries[(model, checksum)] = vector
+            self._entries.move_to_end((model, checksum))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """SQLite 파일 캐시 (벡터는 float32 BLOB, pgvector 저장 정밀도와 동일)"""
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, checksum)
+);
+"""
+
+    # SQLite 바인딩 변수 수 제한 (구버전 999)
+    BATCH = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def get_many(
+        self, model: str, checksums: List[str]
+    ) -> Dict[str, List[float]]:
+        return await asyncio.to_thread(self._get_many, model, checksums)
+
+    def _get_many(self, model: str, checksums: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(checksums), self.BATCH):
+                batch = checksums[i : i + self.BATCH]
+                rows = conn.execute(
+                    f"SELECT checksum, vector FROM embeddings WHERE model = ?"
+                    f" AND checksum IN ({', '.join('?' * len(batch))})",
+                    (model, *batch),
+                )
+                for checksum, blob in rows:
+                    found[checksum] = array("f", blob).tolist()
+        return found
+
+    async def set_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        rows = [
+            (model, checksum, array("f", vector).tobytes())
+            for checksum, vector in vectors.items()
+        ]
+        await asyncio.to_thread(self._set_many, rows)
+
+    def _set_many(self, rows: List[tuple]) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, checksum, vector)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SupabaseEmbeddingCache(EmbeddingCache):
+    """
+    embedding_cache 테이블 (Migration 047)
+
+    동기/비동기 Supabase 클라이언트 겸용 (동기 클라이언트는 스레드에서 실행)
+    """
+
+    TABLE = "embedding_cache"
+    # IN 목록 키 수 / upsert 행 수 (1536차원 벡터 ≈ 30KB/행)
+    LOAD_BATCH = 100
+    WRITE_BATCH = 100
+
+    def __init__(self, db_client: Any):
+        self.db = db_client
+
+    async def get_many(
+        self, model: str, checksums: List[str]
+    ) -> Dict[str, List[float]]:
+        found = {}
+        for i in range(0, len(checksums), self.LOAD_BATCH):
+            result = await execute_nonblocking(
+                self.db.table(self.TABLE)
+                .select("checksum, embedding")
+                .eq("model", model)
+                .in_("checksum", checksums[i : i + self.LOAD_BATCH])
+            )
+            for row in result.data or []:
+                vector = row["embedding"]
+                # PostgREST는 vector 컬럼을 "[0.1,0.2,...]" 문자열로 반환
+                found[row["checksum"]] = (
+                    json.loads(vector) if isinstance(vector, str) else vector
+                )
+        return found
+
+    async def set_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        rows = [
+            {"model": model, "checksum": checksum, "embedding": vector}
+            for checksum, vector in vectors.items()
+        ]
+        for i in range(0, len(rows), self.WRITE_BATCH):
+            await execute_nonblocking(
+                self.db.table(self.TABLE).upsert(
+                    rows[i : i + self.WRITE_BATCH], on_conflict="model,checksum"
+                )
+            )
+
+
+def create_embedding_cache(url: str, db_client: Any = None) -> Optional[EmbeddingCache]:
+    """
+    EMBEDDING_CACHE_URL 형식의 설정으로 캐시 생성 (빈 값이면 None = 캐시 미사용)
+
+    Args:
+        url: supabase | sqlite:///path | memory
+        db_client: "supabase" 설정일 때 사용할 클라이언트 (없으면 get_db())
+    """
+    if not url:
+        return None
+    if url == "memory":
+        return MemoryEmbeddingCache()
+    if url == "supabase":
+        return SupabaseEmbeddingCache(db_client or get_db())
+
+    parts = urlsplit(url)
+    if parts.scheme == "sqlite":
+        return SQLiteEmbeddingCache(parts.path)
+    raise ValueError(f"Unsupported embedding cache URL: {url}")
@@ -0,0 +1,453 @@
+"""
+Embedding Client
+배치 임베딩 (engine API / Worker Job 공용)
+
+- 입력을 토큰 예산(max_batch_tokens)과 입력 수(max_batch_inputs) 안에서 요청 1건으로 묶음
+  (같은 텍스트는 1번만 전송)
+- 임베딩 캐시(EMBEDDING_CACHE_URL) 적중 입력은 전송하지 않음 (app.core.embedding_cache)
+- 최대 concurrency개 요청 동시 실행, 분당 토큰(TPM) 리미터로 쿼터 준수
+- 429/5xx/타임아웃은 지수 백오프 재시도, 재시도 후에도 실패한 입력은 None
+- Provider 교체 가능 (EMBEDDING_PROVIDER):
+  - openai: OpenAI Embeddings API (OPENAI_API_KEY 필요)
+  - local: 결정적 해시 벡터 (API 호출 없음, 테스트/오프라인 실행용)
+"""
+
+import asyncio
+import hashlib
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import httpx
+import structlog
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.core.config import settings
+from app.core.embedding_cache import (
+    EmbeddingCache,
+    create_embedding_cache,
+    normalize_text,
+    text_checksum,
+)
+
+logger = structlog.get_logger()
+
+DEFAULT_MODEL = "text-embedding-3-small"
+DEFAULT_DIMENSIONS = 1536  # literature_chunks.embedding VECTOR(1536)
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (문자 4개 ≈ 1토큰)"""
+    return len(text) // 4 + 1
+
+
+class EmbeddingError(Exception):
+    """임베딩 요청 실패"""
+
+    def __init__(self, message: str, retryable: bool = False):
+        self.retryable = retryable
+        super().__init__(message)
+
+
+# ============================================================
+# Providers
+# ============================================================
+
+
+class EmbeddingProvider(ABC):
+    """임베딩 제공자 (요청 1건 = texts 전체)"""
+
+    model: str = ""
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> Tuple[List[List[float]], int]:
+        """
+        Returns:
+            (texts와 같은 순서의 벡터 목록, 사용 토큰 수)
+        """
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI Embeddings API (공유 HTTP 클라이언트, keep-alive)"""
+
+    URL = "https://api.openai.com/v1/embeddings"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        timeout: float = 60.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._http_client
+
+    async def embed(self, texts: List[str]) -> Tuple[List[List[float]], int]:
+        try:
+            response = await self.http_client.post(
+                self.URL,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                json={"model": self.model, "input": texts},
+            )
+        except httpx.TimeoutException as e:
+            raise EmbeddingError(f"timeout: {e}", retryable=True) from e
+
+        if response.status_code != 200:
+            raise EmbeddingError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                retryable=response.status_code == 429 or response.status_code >= 500,
+            )
+
+        result = response.json()
+        vectors: List[List[float]] = [None] * len(texts)
+        for item in result["data"]:
+            vectors[item["index"]] = item["embedding"]
+        used = result.get("usage", {}).get("total_tokens") or sum(
+            estimate_tokens(t) for t in texts
+        )
+        return vectors, used
+
+    async def aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    결정적 로컬 임베딩 (feature hashing)
+
+    단어별 해시 위치에 ±1을 더한 뒤 L2 정규화 → 같은 텍스트는 항상 같은 벡터,
+    단어를 공유하는 텍스트는 코사인 유사도가 양수. 검색 품질이 아닌 파이프라인 검증용
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS, model: str = "local-hash"):
+        self.dimensions = dimensions
+        self.model = model
+        self.calls = 0
+
+    def vector(self, text: str) -> List[float]:
+        values = [0.0] * self.dimensions
+        for word in re.findall(r"\w+", text.lower()):
+            digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+            index = int.from_bytes(digest[:4], "big") % self.dimensions
+            values[index] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(v * v for v in values))
+        return [v / norm for v in values] if norm else values
+
+    async def embed(self, texts: List[str]) -> Tuple[List[List[float]], int]:
+        self.calls += 1
+        return [self.vector(t) for t in texts], sum(estimate_tokens(t) for t in texts)
+
+
+# ============================================================
+# Token Rate Limiter
+# ============================================================
+
+
+class TokenRateLimiter:
+    """
+    분당 토큰(TPM) 버킷
+
+    acquire(n)은 토큰 n개를 예약하고 부족분이 채워질 때까지 대기 (예약 순서 = 호출 순서).
+    실제 사용량이 추정보다 많으면 debit()으로 차감
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self, tokens: int) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            self.tokens -= min(float(tokens), self.capacity)
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def debit(self, tokens: int) -> None:
+        if self.rate > 0 and tokens > 0:
+            self._refill()
+            self.tokens -= tokens
+
+
+# ============================================================
+# Client
+# ============================================================
+
+
+@dataclass
+class EmbeddingStats:
+    """누적 요청 통계"""
+
+    inputs: int = 0
+    requests: int = 0
+    tokens: int = 0
+    retries: int = 0
+    failed: int = 0
+    cache_hits: int = 0
+
+
+class EmbeddingClient:
+    """
+    배치 임베딩 클라이언트
+
+    사용:
+        client = get_embedding_client()
+        vectors = await client.embed(texts)  # texts와 같은 순서, 실패 입력은 None
+        vector = await client.embed_one(query)
+
+    cache가 있으면 (model, 정규화 텍스트 체크섬)으로 조회 후 미스만 요청하고 결과를 저장
+    """
+
+    DEFAULT_MAX_BATCH_TOKENS = 50_000
+    DEFAULT_MAX_BATCH_INPUTS = 512
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_TOKENS_PER_MINUTE = 1_000_000
+    DEFAULT_MAX_RETRIES = 5
+    RETRY_WAIT = wait_exponential(multiplier=1, min=1, max=30)
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_batch_tokens: int = None,
+        max_batch_inputs: int = None,
+        concurrency: int = None,
+        tokens_per_minute: int = None,
+        max_retries: int = None,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        """
+        Args:
+            provider: 임베딩 제공자
+            max_batch_tokens: 요청 1건의 추정 토큰 예산
+            max_batch_inputs: 요청 1건의 최대 입력 수
+            concurrency: 동시 요청 수
+            tokens_per_minute: 분당 토큰 한도 (0이면 제한 없음)
+            max_retries: 요청당 최대 시도 횟수
+            cache: 임베딩 캐시 (None이면 매번 요청)
+        """
+        self.provider = provider
+        self.cache = cache
+        self.max_batch_tokens = max(
+            1, max_batch_tokens or self.DEFAULT_MAX_BATCH_TOKENS
+        )
+        self.max_batch_inputs = max(
+            1, max_batch_inputs or self.DEFAULT_MAX_BATCH_INPUTS
+        )
+        self.concurrency = max(1, concurrency or self.DEFAULT_CONCURRENCY)
+        self.max_retries = max(1, max_retries or self.DEFAULT_MAX_RETRIES)
+        self.limiter = TokenRateLimiter(
+            self.DEFAULT_TOKENS_PER_MINUTE
+            if tokens_per_minute is None
+            else tokens_per_minute
+        )
+        self.stats = EmbeddingStats()
+        self.logger = logger.bind(service="embedding_client", model=provider.model)
+
+    @property
+    def model(self) -> str:
+        return self.provider.model
+
+    def pack(self, texts: List[str]) -> List[List[int]]:
+        """입력 순서대로 토큰 예산/입력 수 안에서 배치 분할 (인덱스 목록)"""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if current and (
+                current_tokens + tokens > self.max_batch_tokens
+                or len(current) >= self.max_batch_inputs
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        텍스트 목록 임베딩 (입력 순서 유지)
+
+        Returns:
+            벡터 목록 (재시도 후에도 실패한 배치의 입력은 None)
+        """
+        if not texts:
+            return []
+
+        # 같은 텍스트(정규화 기준)는 1번만 전송
+        unique: Dict[str, int] = {}
+        positions = [
+            unique.setdefault(normalize_text(text), len(unique)) for text in texts
+        ]
+        inputs = list(unique)
+        checksums = [text_checksum(text) for text in inputs]
+        vectors: List[Optional[List[float]]] = [None] * len(inputs)
+
+        cached = await self._cache_get(checksums)
+        for i, checksum in enumerate(checksums):
+            vectors[i] = cached.get(checksum)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        self.stats.cache_hits += len(inputs) - len(missing)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch: List[int]) -> None:
+            async with semaphore:
+                batch_vectors = await self._request([inputs[i] for i in batch])
+            for i, vector in zip(batch, batch_vectors):
+                vectors[i] = vector
+
+        batches = self.pack([inputs[i] for i in missing])
+        await asyncio.gather(*(run([missing[j] for j in batch]) for batch in batches))
+        await self._cache_set(
+            {checksums[i]: vectors[i] for i in missing if vectors[i] is not None}
+        )
+
+        self.stats.inputs += len(texts)
+        return [vectors[p] for p in positions]
+
+    async def embed_one(self, text: str) -> Optional[List[float]]:
+        """단일 텍스트 임베딩 (실패 시 None)"""
+        return (await self.embed([text]))[0]
+
+    async def _cache_get(self, checksums: List[str]) -> Dict[str, List[float]]:
+        if self.cache is None:
+            return {}
+        try:
+            return await self.cache.get_many(self.model, checksums)
+        except Exception as e:
+            self.logger.warning("embedding_cache_get_failed", error=str(e))
+            return {}
+
+    async def _cache_set(self, vectors: Dict[str, List[float]]) -> None:
+        if self.cache is None or not vectors:
+            return
+        try:
+            await self.cache.set_many(self.model, vectors)
+        except Exception as e:
+            self.logger.warning("embedding_cache_set_failed", error=str(e))
+
+    async def _request(self, texts: List[str]) -> List[Optional[List[float]]]:
+        estimated = sum(estimate_tokens(t) for t in texts)
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.max_retries),
+                wait=self.RETRY_WAIT,
+                retry=retry_if_exception(
+                    lambda e: isinstance(e, EmbeddingError) and e.retryable
+                ),
+                reraise=True,
+            ):
+                with attempt:
+                    if attempt.retry_state.attempt_number > 1:
+                        self.stats.retries += 1
+                    await self.limiter.acquire(estimated)
+                    self.stats.requests += 1
+                    vectors, used = await self.provider.embed(texts)
+        except Exception as e:
+            self.stats.failed += len(texts)
+            self.logger.error("embedding_batch_failed", inputs=len(texts), error=str(e))
+            return [None] * len(texts)
+
+        self.limiter.debit(used - estimated)
+        self.stats.tokens += used
+        return vectors
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+        if self.cache is not None:
+            await self.cache.aclose()
+
+
+# ============================================================
+# Factory
+# ============================================================
+
+
+def create_embedding_client(
+    provider: str = None,
+    model: str = None,
+    api_key: str = None,
+    cache: Optional[EmbeddingCache] = None,
+) -> Optional[EmbeddingClient]:
+    """
+    설정 기반 임베딩 클라이언트 생성
+
+    Args:
+        cache: 임베딩 캐시 (없으면 EMBEDDING_CACHE_URL 설정으로 생성)
+
+    Returns:
+        EmbeddingClient (openai인데 API Key가 없으면 None → 호출자가 임베딩 생략)
+    """
+    provider = (provider or settings.EMBEDDING_PROVIDER).lower()
+    if provider == "local":
+        backend = LocalEmbeddingProvider()
+    elif provider == "openai":
+        api_key = api_key or settings.OPENAI_API_KEY
+        if not api_key:
+            return None
+        backend = OpenAIEmbeddingProvider(api_key, model or settings.EMBEDDING_MODEL)
+    else:
+        raise ValueError(f"Unknown embedding provider: {provider}")
+
+    return EmbeddingClient(
+        backend,
+        max_batch_tokens=settings.EMBEDDING_BATCH_TOKENS,
+        concurrency=settings.EMBEDDING_CONCURRENCY,
+        tokens_per_minute=settings.EMBEDDING_TOKENS_PER_MINUTE,
+        cache=cache or create_embedding_cache(settings.EMBEDDING_CACHE_URL),
+    )
+
+
+_client: Optional[EmbeddingClient] = None
+
+
+def get_embedding_client() -> Optional[EmbeddingClient]:
+    """프로세스 공용 임베딩 클라이언트 (설정 미비 시 None)"""
+    global _client
+    if _client is None:
+        _client = create_embedding_client()
+    return _client
+
+
+async def close_embedding_client() -> None:
+    """공용 클라이언트 종료 (앱/Worker 종료 시)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -19,6 +19,25 @@ async def get_redis_pool():
     )
 
 
+_redis_client = None
+
+
+def get_redis_client():
+    """공유 Redis 클라이언트 (큐 외 용도: 진행률 캐시 조회 등, 연결은 첫 명령 시)"""
+    global _redis_client
+    if _redis_client is None:
+        from redis import asyncio as aioredis
+
+        # 짧은 타임아웃: Redis 장애 시 호출자가 곧바로 대체 경로(DB 조회 등)로 진행
+        _redis_client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        )
+    return _redis_client
+
+
 async def enqueue_compute_descriptors(component_id: str):
     """
     RDKit 디스크립터 계산 Job enqueue
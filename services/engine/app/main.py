@@ -36,14 +36,18 @@ from app.api import (
 async def lifespan(app: FastAPI):
     """애플리케이션 수명 주기 관리"""
     # Startup
-    from app.core.database import get_db
+    from app.core.database import close_async_db, create_async_db
+    from app.core.embeddings import close_embedding_client
     import structlog
 
     logger = structlog.get_logger()
+
+    # 1. 공유 AsyncClient (HTTP/2 커넥션 풀) → app.state.db
+    app.state.db = None
     try:
-        db = get_db()
+        app.state.db = await create_async_db()
         # Lightweight connection check (select 1 equivalent)
-        db.table("workspaces").select("id").limit(1).execute()
+        await app.state.db.table("workspaces").select("id").limit(1).execute()
         logger.info("database_connected", url=settings.SUPABASE_URL)
     except Exception as e:
         # Log but don't crash, as per recommendation
@@ -60,6 +64,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     # 3. 스케줄러 중지
     scheduler.stop()
+    await close_async_db(app.state.db)
+    await close_embedding_client()
     logger.info("application_shutdown")
 
 
@@ -20,6 +20,12 @@ from .evaluator import (
     EvaluatorError,
     get_evaluator,
 )
+from .columns import FeatureColumns
+from .compiler import (
+    CompiledRule,
+    CompiledRuleSet,
+    RuleBatchResult,
+)
 from .rule_engine import (
     RuleEngine,
     get_rule_engine,
@@ -47,6 +53,11 @@ __all__ = [
     "SafeExpressionEvaluator",
     "EvaluatorError",
     "get_evaluator",
+    # Compiler
+    "FeatureColumns",
+    "CompiledRule",
+    "CompiledRuleSet",
+    "RuleBatchResult",
     # Rule Engine
     "RuleEngine",
     "get_rule_engine",
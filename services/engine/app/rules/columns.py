@@ -0,0 +1,102 @@
+"""
+Feature Columns
+CandidateFeatures 목록의 컬럼형 표현 (룰 벡터 평가용)
+
+필드별로 원본 Python 값 목록과 타입별 NumPy 배열을 함께 보관:
+- bool: 모든 값이 bool
+- number: 모든 값이 int/float (bool 제외)
+- str: 모든 값이 str
+- object: 그 외 (None 포함 등) → 평가 시 원소별 Python 평가로 폴백
+"""
+
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from .models import CandidateFeatures
+
+FEATURE_FIELDS = tuple(f.name for f in fields(CandidateFeatures))
+
+
+class FeatureColumns:
+    """필드 → 컬럼 배열"""
+
+    def __init__(self, values: Dict[str, List[Any]], n: int):
+        """
+        Args:
+            values: 필드별 원본 값 목록 (모든 목록 길이 = n)
+            n: 후보 수
+        """
+        self.n = n
+        self._values = values
+        self._kinds: Dict[str, str] = {}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._lower: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    @classmethod
+    def from_features(cls, candidates: List[CandidateFeatures]) -> "FeatureColumns":
+        """CandidateFeatures 목록 → 컬럼"""
+        return cls(
+            {
+                name: [getattr(c, name) for c in candidates]
+                for name in FEATURE_FIELDS
+            },
+            len(candidates),
+        )
+
+    @classmethod
+    def from_dicts(cls, contexts: List[Dict[str, Any]]) -> "FeatureColumns":
+        """평가 컨텍스트 dict 목록 → 컬럼 (모든 dict에 있는 필드만)"""
+        names = set(contexts[0]) if contexts else set()
+        for context in contexts[1:]:
+            names &= set(context)
+        return cls(
+            {name: [c[name] for c in contexts] for name in names}, len(contexts)
+        )
+
+    def has(self, name: str) -> bool:
+        return name in self._values
+
+    def values(self, name: str) -> List[Any]:
+        """원본 값 목록"""
+        return self._values[name]
+
+    def kind(self, name: str) -> str:
+        """컬럼 타입: bool / number / str / object"""
+        if name not in self._kinds:
+            self._kinds[name] = _infer_kind(self._values[name])
+        return self._kinds[name]
+
+    def array(self, name: str) -> Optional[np.ndarray]:
+        """타입별 배열 (object 컬럼은 None)"""
+        if name not in self._arrays:
+            kind = self.kind(name)
+            values = self._values[name]
+            if kind == "bool":
+                self._arrays[name] = np.array(values, dtype=bool).reshape(self.n)
+            elif kind == "number":
+                self._arrays[name] = np.array(values, dtype=np.float64).reshape(self.n)
+            elif kind == "str":
+                self._arrays[name] = np.array(values, dtype=str).reshape(self.n)
+            else:
+                return None
+        return self._arrays[name]
+
+    def lower(self, name: str) -> np.ndarray:
+        """소문자 문자열 배열 (str 컬럼 전용)"""
+        if name not in self._lower:
+            self._lower[name] = np.char.lower(self.array(name))
+        return self._lower[name]
+
+
+def _infer_kind(values: List[Any]) -> str:
+    if all(isinstance(v, bool) for v in values):
+        return "bool"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return "number"
+    if all(isinstance(v, str) for v in values):
+        return "str"
+    return "object"
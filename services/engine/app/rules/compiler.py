@@ -0,0 +1,169 @@
+"""
+Rule Compiler
+RuleSet → 컴파일된 룰 목록 (1회 파싱, 다회 평가)
+
+- 단일 후보: 룰별 CompiledCondition.evaluate (정규식/값 파싱 없음)
+- 배치: 룰별 컬럼 마스크 (FeatureColumns) → (후보 수, 룰 수) 적중 행렬
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+import numpy as np
+
+from .columns import FeatureColumns
+from .evaluator import CompiledCondition, SafeExpressionEvaluator
+from .models import ActionType, Rule, RuleResult, RuleSet
+
+REJECT_ACTIONS = (ActionType.HARD_REJECT, ActionType.SOFT_REJECT)
+
+
+@dataclass
+class CompiledRule:
+    """컴파일된 단일 룰"""
+
+    rule: Rule
+    condition: CompiledCondition
+    snapshot_fields: List[str]  # inputs_snapshot 대상 필드 (평가 순서)
+
+    def result(self, context: Dict[str, Any], reason: str) -> RuleResult:
+        """적중 시 RuleResult 생성"""
+        action = self.rule.action
+        result = RuleResult(
+            rule_id=self.rule.id,
+            rule_name=self.rule.name,
+            matched=True,
+            action=action.type,
+            severity=action.severity,
+            message=action.message,
+            matched_reason=reason,
+            inputs_snapshot={
+                name: context[name] for name in self.snapshot_fields if name in context
+            },
+        )
+
+        if action.type == ActionType.PENALTY:
+            result.delta = action.value
+        elif action.type == ActionType.REQUIRE_PROTOCOL and action.template_id:
+            result.required_protocols = [action.template_id]
+
+        return result
+
+
+@dataclass
+class RuleBatchResult:
+    """
+    배치 룰 평가 결과 (컬럼형)
+
+    hits는 실제 적용된 적중만 포함 (stop_on_hard_reject 시 hard_reject 이후 룰 제외)
+    """
+
+    rule_ids: List[str]
+    hits: np.ndarray  # (n, R) bool, 컬럼 순서 = 평가 순서 (priority, id)
+    rejected: np.ndarray  # (n,) hard/soft reject 여부
+    reject_rule: np.ndarray  # (n,) 마지막 reject 룰 컬럼 (-1: 없음)
+    total_penalty: np.ndarray  # (n,)
+
+    def __len__(self) -> int:
+        return int(self.hits.shape[0])
+
+    def hit_counts(self) -> Dict[str, int]:
+        """룰별 적중 후보 수"""
+        return dict(zip(self.rule_ids, self.hits.sum(axis=0).tolist()))
+
+
+class CompiledRuleSet:
+    """컴파일된 룰셋 (평가 순서로 정렬된 CompiledRule 목록)"""
+
+    def __init__(self, ruleset: RuleSet, evaluator: SafeExpressionEvaluator):
+        self.ruleset = ruleset
+        self.rules = [
+            CompiledRule(
+                rule=rule,
+                condition=evaluator.compile_condition(
+                    {
+                        "expression": rule.condition.expression,
+                        "all": rule.condition.all_conditions,
+                        "any": rule.condition.any_conditions,
+                    }
+                ),
+                snapshot_fields=_snapshot_fields(rule),
+            )
+            for rule in ruleset.get_sorted_rules()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @property
+    def rule_ids(self) -> List[str]:
+        return [r.rule.id for r in self.rules]
+
+    def match_matrix(self, columns: FeatureColumns) -> np.ndarray:
+        """(n, R) 조건 충족 행렬 (액션 정책 적용 전)"""
+        matrix = np.zeros((len(columns), len(self.rules)), dtype=bool)
+        for j, compiled in enumerate(self.rules):
+            matrix[:, j] = compiled.condition.mask(columns)
+        return matrix
+
+    def evaluate_columns(
+        self, columns: FeatureColumns, stop_on_hard_reject: bool = True
+    ) -> RuleBatchResult:
+        """
+        배치 평가 (RuleEngine.evaluate_candidate와 동일한 정책)
+
+        - stop_on_hard_reject: 첫 hard_reject 이후 룰은 적중에서 제외
+        - reject 룰: 평가 순서상 마지막 적중 (결과 덮어쓰기와 동일)
+        - penalty: sum (순서대로 누적) / max
+        """
+        n, r = len(columns), len(self.rules)
+        hits = self.match_matrix(columns)
+        order = np.arange(r)
+
+        actions = [compiled.rule.action.type for compiled in self.rules]
+        hard_cols = np.array([a == ActionType.HARD_REJECT for a in actions], dtype=bool)
+        reject_cols = np.array([a in REJECT_ACTIONS for a in actions], dtype=bool)
+
+        if stop_on_hard_reject and hard_cols.any():
+            first_hard = np.where(hits & hard_cols, order, r).min(axis=1)
+            hits &= order[None, :] <= first_hard[:, None]
+
+        reject_hits = hits & reject_cols
+        rejected = reject_hits.any(axis=1)
+        reject_rule = np.where(
+            rejected, r - 1 - np.argmax(reject_hits[:, ::-1], axis=1), -1
+        ) if r else np.full(n, -1)
+
+        total_penalty = np.zeros(n)
+        for j, compiled in enumerate(self.rules):
+            if actions[j] != ActionType.PENALTY:
+                continue
+            hit = hits[:, j]
+            delta = compiled.rule.action.value
+            if self.ruleset.penalty_policy == "sum":
+                total_penalty[hit] += delta
+            else:  # "max"
+                total_penalty[hit] = np.maximum(total_penalty[hit], delta)
+
+        return RuleBatchResult(
+            rule_ids=self.rule_ids,
+            hits=hits,
+            rejected=rejected,
+            reject_rule=reject_rule,
+            total_penalty=total_penalty,
+        )
+
+
+def _snapshot_fields(rule: Rule) -> List[str]:
+    """inputs_snapshot 필드: 표현식 첫 단어 + all/any 구조화 조건 field"""
+    names: List[str] = []
+
+    expression = rule.condition.expression
+    if expression and expression.split():
+        names.append(expression.split()[0])
+
+    for cond_list in [rule.condition.all_conditions, rule.condition.any_conditions]:
+        for cond in cond_list:
+            if isinstance(cond, dict) and "field" in cond and cond["field"] not in names:
+                names.append(cond["field"])
+
+    return names
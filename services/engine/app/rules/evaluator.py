@@ -6,13 +6,17 @@ Safe Expression Evaluator
 - 토큰화: (필드, 연산자, 상수)만 허용
 - 허용 연산자: >, <, >=, <=, ==, !=, in, contains
 - 복합 조건: all (AND), any (OR)
+- 컴파일: 표현식은 1회만 파싱, 컬럼 단위 벡터 평가 (mask) 지원
 """
 
 import re
 import operator
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import structlog
 
+from .columns import FeatureColumns
+
 logger = structlog.get_logger()
 
 
@@ -53,6 +57,7 @@ class SafeExpressionEvaluator:
     def __init__(self, case_sensitive: bool = False):
         self.case_sensitive = case_sensitive
         self.logger = logger.bind(component="SafeExpressionEvaluator")
+        self._compiled: Dict[str, "CompiledExpression"] = {}
 
     def evaluate(self, expression: str, context: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -65,54 +70,36 @@ class SafeExpressionEvaluator:
         Returns:
             (결과, 매칭 이유)
         """
-        expression = expression.strip()
-
-        if not expression:
-            return False, "empty expression"
-
-        try:
-            match = self.EXPRESSION_PATTERN.match(expression)
-            if not match:
-                self.logger.warning("invalid_expression", expression=expression)
-                return False, f"invalid expression format: {expression}"
-
-            field_name = match.group(1)
-            op_str = match.group(2).lower()
-            value_str = match.group(3).strip()
-
-            # 필드 값 조회
-            if field_name not in context:
-                self.logger.debug("field_not_found", field=field_name)
-                return False, f"field '{field_name}' not found"
-
-            field_value = context[field_name]
-
-            # 특수 연산자 처리
-            if op_str in self.SPECIAL_OPERATORS:
-                return self._evaluate_special(
-                    field_name, field_value, op_str, value_str
-                )
-
-            # 일반 비교 연산자
-            if op_str not in self.OPERATORS:
-                return False, f"unknown operator: {op_str}"
-
-            # 값 파싱
-            target_value = self._parse_value(value_str)
+        return self.compile(expression).evaluate(context)
 
-            # 타입 변환 후 비교
-            result = self._compare(field_value, self.OPERATORS[op_str], target_value)
+    def compile(self, expression: str) -> "CompiledExpression":
+        """
+        표현식을 1회 파싱 (정규식 + 값/리스트 파싱)
 
-            if result:
-                reason = f"{field_name} ({field_value}) {op_str} {target_value}"
-            else:
-                reason = ""
+        같은 표현식은 캐시된 CompiledExpression 재사용
+        """
+        compiled = self._compiled.get(expression)
+        if compiled is None:
+            compiled = CompiledExpression(self, expression)
+            self._compiled[expression] = compiled
+        return compiled
+
+    def compile_condition(self, condition: Dict[str, Any]) -> "CompiledCondition":
+        """evaluate_condition과 동일한 규칙으로 복합 조건 컴파일"""
+        if "expression" in condition and condition["expression"]:
+            return CompiledCondition("expression", [self.compile(condition["expression"])])
 
-            return result, reason
+        for mode in ("all", "any"):
+            if mode in condition and condition[mode]:
+                children = [
+                    self.compile(f"{cond['field']} {cond['operator']} {cond['value']}")
+                    if isinstance(cond, dict) and "field" in cond
+                    else self.compile_condition(cond)
+                    for cond in condition[mode]
+                ]
+                return CompiledCondition(mode, children)
 
-        except Exception as e:
-            self.logger.error("evaluation_error", expression=expression, error=str(e))
-            return False, f"evaluation error: {str(e)}"
+        return CompiledCondition("none", [])
 
     def _evaluate_special(
         self, field_name: str, field_value: Any, op: str, value_str: str
@@ -289,6 +276,226 @@ class SafeExpressionEvaluator:
         return False, "no valid condition found"
 
 
+class CompiledExpression:
+    """
+    파싱된 단일 표현식 (필드, 연산자, 파싱된 값)
+
+    evaluate(): SafeExpressionEvaluator.evaluate와 동일한 결과/이유
+    mask(): FeatureColumns 전체에 대한 결과 bool 배열
+    """
+
+    def __init__(self, evaluator: SafeExpressionEvaluator, expression: str):
+        self.evaluator = evaluator
+        self.expression = expression.strip()
+        self.field: Optional[str] = None
+        self.op: Optional[str] = None
+        self.value: Any = None
+        self.error: Optional[str] = None
+
+        if not self.expression:
+            self.error = "empty expression"
+            return
+
+        match = evaluator.EXPRESSION_PATTERN.match(self.expression)
+        if not match:
+            evaluator.logger.warning("invalid_expression", expression=self.expression)
+            self.error = f"invalid expression format: {self.expression}"
+            return
+
+        self.field = match.group(1)
+        self.op = match.group(2).lower()
+        value_str = match.group(3).strip()
+
+        if self.op in ("in", "not_in"):
+            self.value = evaluator._parse_list(value_str)
+        elif self.op in ("is_null", "is_not_null"):
+            self.value = None
+        elif self.op in evaluator.OPERATORS or self.op == "contains":
+            self.value = evaluator._parse_value(value_str)
+        else:
+            self.error = f"unknown operator: {self.op}"
+
+    @property
+    def fields(self) -> List[str]:
+        return [self.field] if self.field else []
+
+    def evaluate(self, context: Dict[str, Any]) -> Tuple[bool, str]:
+        """단일 컨텍스트 평가"""
+        if self.error:
+            return False, self.error
+
+        if self.field not in context:
+            self.evaluator.logger.debug("field_not_found", field=self.field)
+            return False, f"field '{self.field}' not found"
+
+        try:
+            return self._evaluate_value(context[self.field])
+        except Exception as e:
+            self.evaluator.logger.error(
+                "evaluation_error", expression=self.expression, error=str(e)
+            )
+            return False, f"evaluation error: {str(e)}"
+
+    def _evaluate_value(self, field_value: Any) -> Tuple[bool, str]:
+        evaluator = self.evaluator
+        field_name, op, value = self.field, self.op, self.value
+
+        if op == "is_null":
+            result = field_value is None
+            return result, f"{field_name} is null" if result else ""
+
+        if op == "is_not_null":
+            result = field_value is not None
+            return result, f"{field_name} is not null" if result else ""
+
+        if op == "in":
+            result = field_value in value
+            return result, f"{field_name} ({field_value}) in {value}" if result else ""
+
+        if op == "not_in":
+            result = field_value not in value
+            return (
+                result,
+                f"{field_name} ({field_value}) not in {value}" if result else "",
+            )
+
+        if op == "contains":
+            result = evaluator._evaluate_contains(field_value, value)
+            return result, f"{field_name} contains '{value}'" if result else ""
+
+        result = evaluator._compare(field_value, evaluator.OPERATORS[op], value)
+        reason = f"{field_name} ({field_value}) {op} {value}" if result else ""
+        return result, reason
+
+    def mask(self, columns: FeatureColumns) -> np.ndarray:
+        """
+        컬럼 전체 평가 (결과만, 이유 없음)
+
+        타입이 명확한 컬럼은 배열 연산 1~2회, 그 외는 원소별 폴백
+        """
+        n = len(columns)
+        if self.error or not columns.has(self.field):
+            return np.zeros(n, dtype=bool)
+
+        kind = columns.kind(self.field)
+        fast = None if kind == "object" else self._vector_mask(columns, kind)
+        if fast is not None:
+            return fast
+
+        return np.fromiter(
+            (self._matches(v) for v in columns.values(self.field)),
+            dtype=bool,
+            count=n,
+        )
+
+    def _matches(self, field_value: Any) -> bool:
+        try:
+            return bool(self._evaluate_value(field_value)[0])
+        except Exception:
+            return False
+
+    def _vector_mask(self, columns: FeatureColumns, kind: str) -> Optional[np.ndarray]:
+        """타입별 벡터 평가 (지원하지 않는 조합은 None → 폴백)"""
+        n = len(columns)
+        op, value = self.op, self.value
+        array = columns.array(self.field)
+        numeric = kind in ("bool", "number")
+
+        # bool/number/str 컬럼에는 None이 없음
+        if op == "is_null":
+            return np.zeros(n, dtype=bool)
+        if op == "is_not_null":
+            return np.ones(n, dtype=bool)
+
+        if op in ("in", "not_in"):
+            hit = np.zeros(n, dtype=bool)
+            for item in value:
+                if numeric and isinstance(item, (int, float)):
+                    hit |= array.astype(np.float64) == float(item)
+                elif kind == "str" and isinstance(item, str):
+                    hit |= array == item
+            return hit if op == "in" else ~hit
+
+        if op == "contains":
+            if numeric:
+                return np.zeros(n, dtype=bool)
+            target = str(value)
+            if self.evaluator.case_sensitive:
+                return np.char.find(array, target) >= 0
+            return np.char.find(columns.lower(self.field), target.lower()) >= 0
+
+        compare = self.evaluator.OPERATORS[op]
+        if numeric and isinstance(value, (int, float)):
+            return compare(array.astype(np.float64), float(value))
+        if kind == "str" and isinstance(value, str):
+            if self.evaluator.case_sensitive:
+                return compare(array, value)
+            return compare(columns.lower(self.field), value.lower())
+
+        # 타입 불일치 → str() 비교 (원소별 폴백)
+        return None
+
+
+class CompiledCondition:
+    """
+    컴파일된 복합 조건 (expression / all / any)
+
+    evaluate_condition과 동일한 우선순위: expression > all > any
+    """
+
+    def __init__(self, mode: str, children: List[Any]):
+        self.mode = mode
+        self.children = children
+
+    @property
+    def fields(self) -> List[str]:
+        names: List[str] = []
+        for child in self.children:
+            for name in child.fields:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def evaluate(self, context: Dict[str, Any]) -> Tuple[bool, str]:
+        if self.mode == "expression":
+            return self.children[0].evaluate(context)
+
+        if self.mode == "all":
+            reasons = []
+            for child in self.children:
+                result, reason = child.evaluate(context)
+                if not result:
+                    return False, ""
+                if reason:
+                    reasons.append(reason)
+            return True, " AND ".join(reasons)
+
+        if self.mode == "any":
+            for child in self.children:
+                result, reason = child.evaluate(context)
+                if result:
+                    return True, reason
+            return False, ""
+
+        return False, "no valid condition found"
+
+    def mask(self, columns: FeatureColumns) -> np.ndarray:
+        n = len(columns)
+        if self.mode == "expression":
+            return self.children[0].mask(columns)
+        if self.mode == "all":
+            result = np.ones(n, dtype=bool)
+            for child in self.children:
+                result &= child.mask(columns)
+            return result
+        if self.mode == "any":
+            result = np.zeros(n, dtype=bool)
+            for child in self.children:
+                result |= child.mask(columns)
+            return result
+        return np.zeros(n, dtype=bool)
+
+
 def get_evaluator(case_sensitive: bool = False) -> SafeExpressionEvaluator:
     """평가기 인스턴스 반환"""
     return SafeExpressionEvaluator(case_sensitive=case_sensitive)
@@ -6,13 +6,13 @@ YAML 룰셋 기반 후보 평가
 - 결정론적 룰 평가 (priority ASC, id ASC)
 - 동시 적중 처리: hard_reject 즉시종료, penalty 누적, alert/protocol 누적
 - candidate_rule_hits 기록용 결과 생성
+- 룰셋은 1회 컴파일 후 재사용 (배치는 컬럼 벡터 평가)
 """
 
-from typing import Dict, Any, List
+from typing import List, Optional
 import structlog
 
 from .models import (
-    Rule,
     RuleSet,
     RuleResult,
     EvaluationResult,
@@ -20,6 +20,8 @@ from .models import (
     ActionType,
 )
 from .evaluator import SafeExpressionEvaluator
+from .columns import FeatureColumns
+from .compiler import CompiledRuleSet, RuleBatchResult
 
 logger = structlog.get_logger()
 
@@ -49,10 +51,12 @@ class RuleEngine:
         self.evaluator = evaluator or SafeExpressionEvaluator()
         self.stop_on_hard_reject = stop_on_hard_reject
         self.logger = logger.bind(service="rule_engine")
+        self._compiled: Optional[CompiledRuleSet] = None
 
     def set_ruleset(self, ruleset: RuleSet):
         """룰셋 설정"""
         self.ruleset = ruleset
+        self._compiled = None
         self.logger.info(
             "ruleset_loaded",
             version=ruleset.version,
@@ -84,54 +88,14 @@ class RuleEngine:
         # 결과 초기화
         result = EvaluationResult()
 
-        # 정렬된 룰 가져오기 (priority ASC, id ASC)
-        sorted_rules = ruleset.get_sorted_rules()
-
-        for rule in sorted_rules:
-            rule_result = self._evaluate_rule(rule, context)
-
-            if not rule_result.matched:
+        # 컴파일된 룰 (priority ASC, id ASC)
+        for compiled in self.compile(ruleset).rules:
+            matched, reason = compiled.condition.evaluate(context)
+            if not matched:
                 continue
 
-            # 적중 기록
-            result.hits.append(rule_result)
-
-            # 액션 처리
-            if rule_result.action == ActionType.HARD_REJECT:
-                result.hard_rejected = True
-                result.reject_reason = rule_result.message
-                result.reject_rule_id = rule_result.rule_id
-
-                if self.stop_on_hard_reject:
-                    self.logger.info(
-                        "hard_reject_triggered",
-                        rule_id=rule.id,
-                        reason=rule_result.matched_reason,
-                    )
-                    break
-
-            elif rule_result.action == ActionType.SOFT_REJECT:
-                result.hard_rejected = True  # soft_reject도 reject 취급
-                result.reject_reason = rule_result.message
-                result.reject_rule_id = rule_result.rule_id
-                # soft_reject는 계속 평가 (기록 목적)
-
-            elif rule_result.action == ActionType.PENALTY:
-                # 페널티 누적
-                if ruleset.penalty_policy == "sum":
-                    result.total_penalty += rule_result.delta
-                else:  # "max"
-                    result.total_penalty = max(result.total_penalty, rule_result.delta)
-                result.penalty_breakdown[rule.id] = rule_result.delta
-
-            elif rule_result.action == ActionType.ALERT:
-                result.alerts.append(rule_result)
-
-            elif rule_result.action == ActionType.REQUIRE_PROTOCOL:
-                # 중복 제거하면서 추가
-                for proto in rule_result.required_protocols:
-                    if proto not in result.required_protocols:
-                        result.required_protocols.append(proto)
+            if self._apply_hit(result, compiled.result(context, reason), ruleset):
+                break
 
         self.logger.debug(
             "evaluation_complete",
@@ -144,67 +108,67 @@ class RuleEngine:
 
         return result
 
-    def _evaluate_rule(self, rule: Rule, context: Dict[str, Any]) -> RuleResult:
-        """단일 룰 평가"""
-        # 조건 딕셔너리 구성
-        condition_dict = {
-            "expression": rule.condition.expression,
-            "all": rule.condition.all_conditions,
-            "any": rule.condition.any_conditions,
-        }
-
-        # 평가
-        matched, reason = self.evaluator.evaluate_condition(condition_dict, context)
-
-        # 필요한 입력 변수 스냅샷
-        inputs_snapshot = self._extract_inputs_snapshot(rule, context)
-
-        # 결과 생성
-        result = RuleResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            matched=matched,
-            action=rule.action.type,
-            severity=rule.action.severity,
-            message=rule.action.message if matched else "",
-            matched_reason=reason,
-            inputs_snapshot=inputs_snapshot,
-        )
-
-        # 액션별 추가 처리
-        if matched:
-            if rule.action.type == ActionType.PENALTY:
-                result.delta = rule.action.value
+    def compile(self, ruleset: RuleSet = None) -> CompiledRuleSet:
+        """
+        룰셋 컴파일 (표현식 1회 파싱, 룰셋 객체 단위 캐시)
 
-            elif rule.action.type == ActionType.REQUIRE_PROTOCOL:
-                if rule.action.template_id:
-                    result.required_protocols = [rule.action.template_id]
+        룰셋 내용을 변경한 경우 set_ruleset으로 다시 지정
+        """
+        ruleset = ruleset or self.ruleset
+        if self._compiled is None or self._compiled.ruleset is not ruleset:
+            self._compiled = CompiledRuleSet(ruleset, self.evaluator)
+        return self._compiled
 
-        return result
+    def _apply_hit(
+        self, result: EvaluationResult, rule_result: RuleResult, ruleset: RuleSet
+    ) -> bool:
+        """
+        적중 룰 액션 처리
 
-    def _extract_inputs_snapshot(
-        self, rule: Rule, context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """룰 평가에 사용된 변수 스냅샷 추출"""
-        snapshot = {}
-
-        # 표현식에서 필드명 추출
-        expression = rule.condition.expression
-        if expression:
-            # 간단한 필드명 추출 (첫 번째 단어)
-            field_match = expression.split()[0] if expression.split() else None
-            if field_match and field_match in context:
-                snapshot[field_match] = context[field_match]
-
-        # all/any 조건에서 필드명 추출
-        for cond_list in [rule.condition.all_conditions, rule.condition.any_conditions]:
-            for cond in cond_list:
-                if isinstance(cond, dict) and "field" in cond:
-                    field = cond["field"]
-                    if field in context:
-                        snapshot[field] = context[field]
-
-        return snapshot
+        Returns:
+            후속 룰 평가 중단 여부
+        """
+        # 적중 기록
+        result.hits.append(rule_result)
+
+        # 액션 처리
+        if rule_result.action == ActionType.HARD_REJECT:
+            result.hard_rejected = True
+            result.reject_reason = rule_result.message
+            result.reject_rule_id = rule_result.rule_id
+
+            if self.stop_on_hard_reject:
+                self.logger.info(
+                    "hard_reject_triggered",
+                    rule_id=rule_result.rule_id,
+                    reason=rule_result.matched_reason,
+                )
+                return True
+
+        elif rule_result.action == ActionType.SOFT_REJECT:
+            result.hard_rejected = True  # soft_reject도 reject 취급
+            result.reject_reason = rule_result.message
+            result.reject_rule_id = rule_result.rule_id
+            # soft_reject는 계속 평가 (기록 목적)
+
+        elif rule_result.action == ActionType.PENALTY:
+            # 페널티 누적
+            if ruleset.penalty_policy == "sum":
+                result.total_penalty += rule_result.delta
+            else:  # "max"
+                result.total_penalty = max(result.total_penalty, rule_result.delta)
+            result.penalty_breakdown[rule_result.rule_id] = rule_result.delta
+
+        elif rule_result.action == ActionType.ALERT:
+            result.alerts.append(rule_result)
+
+        elif rule_result.action == ActionType.REQUIRE_PROTOCOL:
+            # 중복 제거하면서 추가
+            for proto in rule_result.required_protocols:
+                if proto not in result.required_protocols:
+                    result.required_protocols.append(proto)
+
+        return False
 
     def evaluate_batch(
         self, candidates: List[CandidateFeatures], ruleset: RuleSet = None
@@ -217,9 +181,50 @@ class RuleEngine:
             ruleset: 사용할 룰셋
 
         Returns:
-            List[EvaluationResult]
+            List[EvaluationResult] (evaluate_candidate 결과와 동일)
+        """
+        ruleset = ruleset or self.ruleset
+        if not ruleset:
+            self.logger.warning("no_ruleset_configured")
+            return [EvaluationResult() for _ in candidates]
+
+        compiled = self.compile(ruleset)
+        batch = self.evaluate_columns(FeatureColumns.from_features(candidates), ruleset)
+
+        results = []
+        for i, features in enumerate(candidates):
+            result = EvaluationResult()
+            hit_cols = batch.hits[i].nonzero()[0]
+            if len(hit_cols):
+                # 적중 후보만 이유/스냅샷 포함 RuleResult 생성
+                context = features.to_dict()
+                for j in hit_cols:
+                    rule = compiled.rules[j]
+                    _, reason = rule.condition.evaluate(context)
+                    self._apply_hit(result, rule.result(context, reason), ruleset)
+            results.append(result)
+
+        self.logger.debug(
+            "batch_evaluation_complete",
+            candidates=len(candidates),
+            rejected=int(batch.rejected.sum()),
+            hit_count=int(batch.hits.sum()),
+        )
+        return results
+
+    def evaluate_columns(
+        self, columns: FeatureColumns, ruleset: RuleSet = None
+    ) -> RuleBatchResult:
+        """
+        컬럼형 배치 평가 (RuleResult 생성 없이 적중 행렬/리젝트/페널티만)
+
+        Args:
+            columns: FeatureColumns (CandidateFeatures 또는 컨텍스트 dict 목록)
+            ruleset: 사용할 룰셋
         """
-        return [self.evaluate_candidate(c, ruleset) for c in candidates]
+        return self.compile(ruleset).evaluate_columns(
+            columns, stop_on_hard_reject=self.stop_on_hard_reject
+        )
 
     def get_required_protocols(
         self, features: CandidateFeatures, ruleset: RuleSet = None
@@ -2,7 +2,9 @@
 from .engine import (
     ScoringEngine,
     BatchScoringEngine,
+    BatchScoreArrays,
     CandidateScores,
+    ComponentTerms,
     ScoreComponents,
     get_scoring_engine,
     get_batch_scoring_engine,
@@ -10,27 +12,55 @@ from .engine import (
 
 from .generator import (
     CandidateGenerator,
+    CandidateIndexBatch,
+    CombinationSpace,
     HardRejectFilter,
     GeneratorStats,
+    RULE_HIT_PREFIX,
+    acreate_generator_from_catalog,
     create_generator_from_catalog,
 )
 
-from .pareto import ParetoCalculator, ParetoFront, ParetoMember, calculate_pareto_fronts
+from .parallel import ShardBatch, ShardResult, ShardedScoringRunner
+
+from .rule_stage import RuleStage, RuleStageBatch
+
+from .pareto import (
+    ObjectiveStore,
+    ParetoCalculator,
+    ParetoFront,
+    ParetoMember,
+    calculate_pareto_fronts,
+)
 
 __all__ = [
     # Engine
     "ScoringEngine",
     "BatchScoringEngine",
+    "BatchScoreArrays",
     "CandidateScores",
+    "ComponentTerms",
     "ScoreComponents",
     "get_scoring_engine",
     "get_batch_scoring_engine",
     # Generator
     "CandidateGenerator",
+    "CandidateIndexBatch",
+    "CombinationSpace",
     "HardRejectFilter",
     "GeneratorStats",
+    "RULE_HIT_PREFIX",
     "create_generator_from_catalog",
+    "acreate_generator_from_catalog",
+    # Parallel
+    "ShardBatch",
+    "ShardResult",
+    "ShardedScoringRunner",
+    # Rule Stage
+    "RuleStage",
+    "RuleStageBatch",
     # Pareto
+    "ObjectiveStore",
     "ParetoCalculator",
     "ParetoFront",
     "ParetoMember",
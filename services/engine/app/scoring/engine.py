@@ -6,8 +6,10 @@ Eng-Fit / Bio-Fit / Safety-Fit 벡터화 산식 구현
 """
 
 import math
-from typing import Dict, Any, List
+import numbers
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
@@ -52,6 +54,187 @@ class CandidateScores:
         )
 
 
+# 컬럼형 배치 스코어의 Term 순서 (score_to_dict 출력 순서와 동일)
+ENG_TERMS = ("AggRisk", "ProcRisk", "AnalRisk", "UncPenalty")
+BIO_TERMS = ("DEA", "INT", "HET_pen", "ACC_pen", "BS_match")
+SAFETY_TERMS = ("OOT", "PH", "CLV", "SAR", "NEG")
+
+# UncPenalty 대상 payload 피처
+UNC_REQUIRED_FEATURES = ("logP", "solubility", "stability")
+
+
+@dataclass
+class BatchScoreArrays:
+    """
+    컬럼형 배치 스코어
+
+    Fit/Risk/Term을 후보 축 NumPy 배열로 보관하고,
+    후보별 설명(ScoreComponents)은 요청 시에만 생성
+    """
+
+    eng_fit: np.ndarray
+    bio_fit: np.ndarray
+    safety_fit: np.ndarray
+    evidence_fit: np.ndarray
+    eng_risk: np.ndarray
+    bio_risk: np.ndarray
+    safety_risk: np.ndarray
+    terms: Dict[str, np.ndarray]
+    missing: np.ndarray  # (n, len(UNC_REQUIRED_FEATURES)) bool
+    valid: np.ndarray  # 스코어 계산 실패 후보는 False
+
+    # 설명 생성용 파이썬 리스트 캐시 (NumPy 스칼라 인덱싱 회피)
+    _columns: Optional[Dict[str, list]] = field(default=None, init=False, repr=False)
+    _rounded: Optional[Dict[str, list]] = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.eng_fit.shape[0])
+
+    def objective_matrix(self) -> np.ndarray:
+        """(n, 4) 목적 함수 행렬 [eng, bio, safety, evidence]"""
+        return np.column_stack(
+            [self.eng_fit, self.bio_fit, self.safety_fit, self.evidence_fit]
+        )
+
+    def candidate_scores(self, i: int) -> CandidateScores:
+        """i번째 후보의 CandidateScores 생성 (설명 포함)"""
+        if not self.valid[i]:
+            return CandidateScores()
+
+        cols = self._column_lists()
+        eng = ScoreComponents(
+            terms={t: cols[t][i] for t in ENG_TERMS},
+            risk=cols["eng_risk"][i],
+            fit=cols["eng_fit"][i],
+            missing_features=self._missing_features(i),
+        )
+        bio = ScoreComponents(
+            terms={t: cols[t][i] for t in BIO_TERMS},
+            risk=cols["bio_risk"][i],
+            fit=cols["bio_fit"][i],
+        )
+        safety = ScoreComponents(
+            terms={t: cols[t][i] for t in SAFETY_TERMS},
+            risk=cols["safety_risk"][i],
+            fit=cols["safety_fit"][i],
+        )
+        return CandidateScores(
+            eng_fit=eng.fit,
+            bio_fit=bio.fit,
+            safety_fit=safety.fit,
+            evidence_fit=cols["evidence_fit"][i],
+            eng_components=eng,
+            bio_components=bio,
+            safety_components=safety,
+        )
+
+    def to_candidate_scores(self) -> List[CandidateScores]:
+        """전체 후보를 CandidateScores 리스트로 변환"""
+        return [self.candidate_scores(i) for i in range(len(self))]
+
+    def to_dict(self, i: int) -> Dict[str, Any]:
+        """
+        i번째 후보를 저장용 딕셔너리로 변환
+
+        ScoringEngine.score_to_dict와 동일한 포맷 (dataclass 생성 없이 배열에서 직접)
+        """
+        if not self.valid[i]:
+            return ScoringEngine.format_scores(CandidateScores())
+
+        cols = self._rounded_lists()
+
+        def section(names, risk, missing):
+            return {
+                "terms": {t: cols[t][i] for t in names},
+                "risk": cols[risk][i],
+                "missing_features": missing,
+            }
+
+        return {
+            "eng_fit": cols["eng_fit"][i],
+            "bio_fit": cols["bio_fit"][i],
+            "safety_fit": cols["safety_fit"][i],
+            "evidence_fit": cols["evidence_fit"][i],
+            "score_components": {
+                "eng_fit": section(ENG_TERMS, "eng_risk", self._missing_features(i)),
+                "bio_fit": section(BIO_TERMS, "bio_risk", []),
+                "safety_fit": section(SAFETY_TERMS, "safety_risk", []),
+            },
+        }
+
+    def _column_lists(self) -> Dict[str, list]:
+        if self._columns is None:
+            arrays = {
+                "eng_fit": self.eng_fit,
+                "bio_fit": self.bio_fit,
+                "safety_fit": self.safety_fit,
+                "evidence_fit": self.evidence_fit,
+                "eng_risk": self.eng_risk,
+                "bio_risk": self.bio_risk,
+                "safety_risk": self.safety_risk,
+                **self.terms,
+            }
+            self._columns = {k: v.tolist() for k, v in arrays.items()}
+            # 누락 피처 조합은 최대 2^k 가지 → 비트 코드로 보관
+            bits = 1 << np.arange(len(UNC_REQUIRED_FEATURES))
+            self._columns["missing_code"] = (self.missing @ bits).tolist()
+        return self._columns
+
+    def _rounded_lists(self) -> Dict[str, list]:
+        if self._rounded is None:
+            self._rounded = {
+                k: _round_column(v)
+                for k, v in {
+                    "eng_fit": self.eng_fit,
+                    "bio_fit": self.bio_fit,
+                    "safety_fit": self.safety_fit,
+                    "evidence_fit": self.evidence_fit,
+                    "eng_risk": self.eng_risk,
+                    "bio_risk": self.bio_risk,
+                    "safety_risk": self.safety_risk,
+                    **self.terms,
+                }.items()
+            }
+        return self._rounded
+
+    def _missing_features(self, i: int) -> List[str]:
+        code = self._column_lists()["missing_code"][i]
+        return [
+            f"payload.{f}"
+            for bit, f in enumerate(UNC_REQUIRED_FEATURES)
+            if code >> bit & 1
+        ]
+
+
+def _round_column(values: np.ndarray) -> list:
+    """
+    round(v, 2)를 고유값에만 적용 (파이썬 round와 동일한 결과 보장)
+
+    컴포넌트 단위 Term은 반복값이 많아 고유값 수가 후보 수보다 훨씬 작음
+    """
+    if values.size == 0:
+        return []
+    unique, inverse = np.unique(values, return_inverse=True)
+    rounded = [round(v, 2) for v in unique.tolist()]
+    return [rounded[j] for j in inverse.tolist()]
+
+
+@dataclass
+class ComponentTerms:
+    """
+    컴포넌트별 부분 Term
+
+    단일 컴포넌트에만 의존하는 Term(DEA/INT/HET/ACC/OOT/NEG, PH/SAR/UncPenalty 등)을
+    카탈로그 항목당 한 번만 계산해 두고, 조합 스코어링 시 인덱스로 모아 결합
+    """
+
+    target: Dict[str, np.ndarray]
+    linker: Dict[str, np.ndarray]
+    payload: Dict[str, np.ndarray]
+    conjugation: Dict[str, np.ndarray]
+    valid: Dict[str, np.ndarray]  # 역할별 피처 추출 성공 여부
+
+
 class ScoringEngine:
     """
     ADC 후보 스코어링 엔진 v0.2
@@ -337,6 +520,11 @@ class ScoringEngine:
 
     def score_to_dict(self, scores: CandidateScores) -> Dict[str, Any]:
         """CandidateScores를 저장용 딕셔너리로 변환"""
+        return self.format_scores(scores)
+
+    @staticmethod
+    def format_scores(scores: CandidateScores) -> Dict[str, Any]:
+        """CandidateScores 저장용 포맷 (인스턴스 불필요)"""
         return {
             "eng_fit": round(scores.eng_fit, 2),
             "bio_fit": round(scores.bio_fit, 2),
@@ -373,9 +561,32 @@ class BatchScoringEngine(ScoringEngine):
     """
     배치 스코어링 (벡터화)
 
-    여러 후보를 한 번에 처리하여 성능 최적화
+    컴포넌트 속성을 NumPy 컬럼으로 한 번만 평탄화한 뒤
+    모든 Term/Fit을 배열 연산으로 계산
     """
 
+    # 컴포넌트별 피처 컬럼 (순서 고정)
+    TARGET_FEATURES = (
+        "tumor_expr",
+        "normal_expr",
+        "internalization",
+        "heterogeneity",
+        "accessibility",
+        "bystander_need",
+        "critical_tissue",
+        "negative_signal",
+    )
+    LINKER_FEATURES = ("purification_high", "cleavage_risk")
+    PAYLOAD_FEATURES = (
+        "logP",
+        "hydrophobic_patch",
+        "aggregation_prone",
+        "bystander_cap",
+        "hazard",
+        "systemic_exposure",
+    ) + tuple(f"missing_{f}" for f in UNC_REQUIRED_FEATURES)
+    CONJUGATION_FEATURES = ("DAR", "site_specific")
+
     def score_batch(self, candidates: List[Dict[str, Any]]) -> List[CandidateScores]:
         """
         배치 스코어링
@@ -386,24 +597,369 @@ class BatchScoringEngine(ScoringEngine):
         Returns:
             List of CandidateScores
         """
-        results = []
+        return self.score_batch_columnar(candidates).to_candidate_scores()
 
-        for candidate in candidates:
+    def score_batch_columnar(
+        self, candidates: List[Dict[str, Any]]
+    ) -> BatchScoreArrays:
+        """
+        컬럼형 배치 스코어링
+
+        배치 내 고유 컴포넌트(객체 단위)만 평탄화/부분 Term 계산 후 인덱스로 결합.
+        후보별 설명은 BatchScoreArrays.candidate_scores()/to_dict()로 필요 시 생성
+
+        Args:
+            candidates: [{"target": {...}, "antibody": {...}, ...}, ...]
+
+        Returns:
+            BatchScoreArrays
+        """
+        n = len(candidates)
+        uniques: Tuple[list, ...] = ([], [], [], [])
+        positions: Tuple[Dict[int, int], ...] = ({}, {}, {}, {})
+        indices = np.empty((4, n), dtype=np.intp)
+
+        for i, candidate in enumerate(candidates):
             try:
-                score = self.score_candidate(
-                    target=candidate.get("target", {}),
-                    antibody=candidate.get("antibody", {}),
-                    linker=candidate.get("linker", {}),
-                    payload=candidate.get("payload", {}),
-                    conjugation=candidate.get("conjugation", {}),
-                )
-                results.append(score)
-            except Exception as e:
-                self.logger.warning("score_failed", error=str(e))
-                # 오류 시 기본 점수
-                results.append(CandidateScores())
-
-        return results
+                components = self._candidate_components(candidate)
+            except Exception:
+                # 후보 자체가 dict가 아니면 컴포넌트 추출 단계에서 실패 처리
+                components = (None, None, None, None)
+
+            for role, component in enumerate(components):
+                key = id(component)
+                position = positions[role].get(key)
+                if position is None:
+                    position = positions[role][key] = len(uniques[role])
+                    uniques[role].append(component)
+                indices[role, i] = position
+
+        terms = self.precompute_components(*uniques)
+        return self.score_indices(terms, *indices)
+
+    def precompute_components(
+        self,
+        targets: List[Dict[str, Any]],
+        linkers: List[Dict[str, Any]],
+        payloads: List[Dict[str, Any]],
+        conjugations: List[Dict[str, Any]],
+    ) -> ComponentTerms:
+        """
+        컴포넌트별 부분 Term 사전 계산 (카탈로그 항목당 1회)
+
+        Args:
+            targets/linkers/payloads/conjugations: 컴포넌트 목록 (조합 인덱스의 축)
+
+        Returns:
+            ComponentTerms
+        """
+        conjugations = [c or {} for c in conjugations]
+        features = {}
+        valid = {}
+
+        for role, components, extract, columns in (
+            ("target", targets, self._target_features, self.TARGET_FEATURES),
+            ("linker", linkers, self._linker_features, self.LINKER_FEATURES),
+            ("payload", payloads, self._payload_features, self.PAYLOAD_FEATURES),
+            (
+                "conjugation",
+                conjugations,
+                self._conjugation_features,
+                self.CONJUGATION_FEATURES,
+            ),
+        ):
+            rows = []
+            valid[role] = np.ones(len(components), dtype=bool)
+            for j, component in enumerate(components):
+                try:
+                    rows.append(extract(component))
+                except Exception as e:
+                    self.logger.warning("score_failed", component=role, error=str(e))
+                    valid[role][j] = False
+                    rows.append((0.0,) * len(columns))
+            features[role] = self._to_matrix(rows, columns)
+
+        return self._component_terms(
+            features["target"],
+            features["linker"],
+            features["payload"],
+            features["conjugation"],
+            valid,
+        )
+
+    def score_indices(
+        self,
+        terms: ComponentTerms,
+        target_idx: np.ndarray,
+        linker_idx: np.ndarray,
+        payload_idx: np.ndarray,
+        conjugation_idx: np.ndarray,
+    ) -> BatchScoreArrays:
+        """
+        조합 인덱스 배열로 부분 Term을 모아 최종 Fit 계산
+
+        Args:
+            terms: precompute_components() 결과
+            *_idx: 후보별 컴포넌트 인덱스 (길이 동일)
+
+        Returns:
+            BatchScoreArrays
+        """
+        return self._combine_terms(
+            terms,
+            np.asarray(target_idx, dtype=np.intp),
+            np.asarray(linker_idx, dtype=np.intp),
+            np.asarray(payload_idx, dtype=np.intp),
+            np.asarray(conjugation_idx, dtype=np.intp),
+        )
+
+    # ------------------------------------------------------------
+    # 피처 추출 (ScoringEngine._calculate_* 와 동일한 기본값/예외 규칙)
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _candidate_components(candidate: Dict[str, Any]) -> tuple:
+        return (
+            candidate.get("target", {}),
+            candidate.get("linker", {}),
+            candidate.get("payload", {}),
+            candidate.get("conjugation", {}) or {},
+        )
+
+    @staticmethod
+    def _target_features(target: Dict[str, Any]) -> tuple:
+        expression = target.get("expression", {})
+        tumor_expr = _as_number(expression.get("tumor", 10.0))
+        normal_expr = _as_number(expression.get("normal_max", 1.0))
+        if tumor_expr + 1 <= 0 or normal_expr + 1 <= 0:
+            raise ValueError("math domain error")
+
+        return (
+            tumor_expr,
+            normal_expr,
+            _as_number(target.get("internalization", 0.7)),
+            _as_number(target.get("heterogeneity", 0.3)),
+            _as_number(target.get("accessibility", 0.8)),
+            _as_number(target.get("bystander_need", 0.5)),
+            1.0 if target.get("critical_tissue_expression") else 0.0,
+            _as_number(target.get("negative_signal_score", 0)),
+        )
+
+    @staticmethod
+    def _linker_features(linker: Dict[str, Any]) -> tuple:
+        return (
+            1.0 if linker.get("purification_difficulty", "normal") == "high" else 0.0,
+            _as_number(linker.get("cleavage_risk", 0.3)),
+        )
+
+    @staticmethod
+    def _payload_features(payload: Dict[str, Any]) -> tuple:
+        logP_fallback = _as_number(payload.get("molecular_weight", 0)) / 100
+        return (
+            _as_number(payload.get("logP", logP_fallback)),
+            _as_number(payload.get("hydrophobic_patch", 0)),
+            1.0 if payload.get("aggregation_prone") else 0.0,
+            _as_number(payload.get("bystander_capability", 0.5)),
+            _as_number(payload.get("hazard_score", 0.5)),
+            _as_number(payload.get("systemic_exposure_proxy", 30)),
+        ) + tuple(0.0 if f in payload else 1.0 for f in UNC_REQUIRED_FEATURES)
+
+    @staticmethod
+    def _conjugation_features(conjugation: Dict[str, Any]) -> tuple:
+        return (
+            _as_number(conjugation.get("DAR", 4.0)),
+            1.0 if conjugation.get("site_specific") else 0.0,
+        )
+
+    @staticmethod
+    def _to_matrix(rows: List[tuple], columns: Tuple[str, ...]) -> np.ndarray:
+        if not rows:
+            return np.empty((0, len(columns)), dtype=np.float64)
+        return np.asarray(rows, dtype=np.float64)
+
+    # ------------------------------------------------------------
+    # 배열 산식
+    # ------------------------------------------------------------
+
+    @np.errstate(invalid="ignore", over="ignore")
+    def _component_terms(
+        self,
+        target: np.ndarray,
+        linker: np.ndarray,
+        payload: np.ndarray,
+        conjugation: np.ndarray,
+        valid: Dict[str, np.ndarray],
+    ) -> ComponentTerms:
+        """
+        컴포넌트 축별 부분 Term 계산
+
+        조합 의존 Term(AggRisk/ProcRisk/AnalRisk/BS_match)은 컴포넌트별 가산 항으로 분해하고,
+        결합 시 원 산식과 같은 순서로 더해 스칼라 경로와 동일한 값을 보장
+        """
+        c = self.coefficients
+        w = self.weights
+        clip = _clip_array
+
+        T = dict(zip(self.TARGET_FEATURES, target.T))
+        L = dict(zip(self.LINKER_FEATURES, linker.T))
+        P = dict(zip(self.PAYLOAD_FEATURES, payload.T))
+        C = dict(zip(self.CONJUGATION_FEATURES, conjugation.T))
+
+        # Target: DEA / INT / HET / ACC / OOT / NEG
+        dea = clip(
+            50
+            + c["k_dea"]
+            * (np.log2(T["tumor_expr"] + 1) - np.log2(T["normal_expr"] + 1))
+        )
+        int_score = T["internalization"] * 100
+        het_pen = T["heterogeneity"] * 100
+        acc_pen = (1 - T["accessibility"]) * 100
+        oot = clip(
+            c["k_oot"] * np.log2(T["normal_expr"] + 1)
+            + c["k_crit"] * T["critical_tissue"]
+        )
+
+        # Payload: UncPenalty / PH / SAR
+        missing = payload[:, len(self.PAYLOAD_FEATURES) - len(UNC_REQUIRED_FEATURES) :]
+
+        return ComponentTerms(
+            target={
+                "DEA": dea,
+                "INT": int_score,
+                "HET_pen": het_pen,
+                "ACC_pen": acc_pen,
+                # BioRisk 중 target 전용 항의 부분합 (BS 항 직전까지)
+                "bio_partial": w["w_dea"] * (100 - dea)
+                + w["w_int"] * np.fmax(0, 70 - int_score)
+                + w["w_het"] * het_pen
+                + w["w_acc"] * acc_pen,
+                "bystander_need": T["bystander_need"],
+                "OOT": oot,
+                "NEG": T["negative_signal"] * 100,
+            },
+            linker={
+                "proc": 25.0 * L["purification_high"],
+                "CLV": L["cleavage_risk"] * 100,
+            },
+            payload={
+                "agg_logP": c["omega_logP"] * np.fmax(0, P["logP"] - 2.0),
+                "agg_patch": c["omega_patch"] * P["hydrophobic_patch"],
+                "anal": 30.0 * P["aggregation_prone"],
+                "UncPenalty": clip(10.0 * missing.sum(axis=1)),
+                "missing": missing.astype(bool),
+                "bystander_cap": P["bystander_cap"],
+                "PH": P["hazard"] * 100,
+                "SAR": P["systemic_exposure"],
+            },
+            conjugation={
+                "agg_DAR": c["omega_DAR"] * np.fmax(0, C["DAR"] - 4.0),
+                "proc": 30.0 * C["site_specific"],
+                "anal": np.where(C["DAR"] > 4, 20.0, 0.0),
+            },
+            valid=valid,
+        )
+
+    @np.errstate(invalid="ignore", over="ignore")
+    def _combine_terms(
+        self,
+        terms: ComponentTerms,
+        target_idx: np.ndarray,
+        linker_idx: np.ndarray,
+        payload_idx: np.ndarray,
+        conjugation_idx: np.ndarray,
+    ) -> BatchScoreArrays:
+        """부분 Term 결합 (gather + 가산 + clip)"""
+        w = self.weights
+        clip = _clip_array
+        T, L, P, C = terms.target, terms.linker, terms.payload, terms.conjugation
+
+        # Eng-Fit
+        agg_risk = clip(
+            P["agg_logP"][payload_idx]
+            + C["agg_DAR"][conjugation_idx]
+            + P["agg_patch"][payload_idx]
+        )
+        proc_risk = clip(C["proc"][conjugation_idx] + L["proc"][linker_idx])
+        anal_risk = clip(C["anal"][conjugation_idx] + P["anal"][payload_idx])
+        unc_penalty = P["UncPenalty"][payload_idx]
+        eng_risk = clip(
+            w["w_agg"] * agg_risk
+            + w["w_proc"] * proc_risk
+            + w["w_anal"] * anal_risk
+            + w["w_unc"] * unc_penalty
+        )
+
+        # Bio-Fit
+        bystander_gap = (
+            T["bystander_need"][target_idx] - P["bystander_cap"][payload_idx]
+        )
+        bs_match = (1 - np.abs(bystander_gap)) * 100
+        bio_risk = clip(T["bio_partial"][target_idx] + w["w_bs"] * (100 - bs_match))
+
+        # Safety-Fit
+        oot = T["OOT"][target_idx]
+        ph = P["PH"][payload_idx]
+        clv = L["CLV"][linker_idx]
+        sar = P["SAR"][payload_idx]
+        neg = T["NEG"][target_idx]
+        safety_risk = clip(
+            w["w_oot"] * oot
+            + w["w_haz"] * ph
+            + w["w_clv"] * clv
+            + w["w_sar"] * sar
+            + w["w_neg"] * neg
+        )
+
+        valid = (
+            terms.valid["target"][target_idx]
+            & terms.valid["linker"][linker_idx]
+            & terms.valid["payload"][payload_idx]
+            & terms.valid["conjugation"][conjugation_idx]
+        )
+
+        def fit(risk: np.ndarray) -> np.ndarray:
+            # 실패 후보는 CandidateScores() 기본값(0점)
+            return np.where(valid, 100 - risk, 0.0)
+
+        return BatchScoreArrays(
+            eng_fit=fit(eng_risk),
+            bio_fit=fit(bio_risk),
+            safety_fit=fit(safety_risk),
+            evidence_fit=np.zeros(target_idx.shape[0]),  # RAG 단계에서 계산
+            eng_risk=eng_risk,
+            bio_risk=bio_risk,
+            safety_risk=safety_risk,
+            terms={
+                "AggRisk": agg_risk,
+                "ProcRisk": proc_risk,
+                "AnalRisk": anal_risk,
+                "UncPenalty": unc_penalty,
+                "DEA": T["DEA"][target_idx],
+                "INT": T["INT"][target_idx],
+                "HET_pen": T["HET_pen"][target_idx],
+                "ACC_pen": T["ACC_pen"][target_idx],
+                "BS_match": bs_match,
+                "OOT": oot,
+                "PH": ph,
+                "CLV": clv,
+                "SAR": sar,
+                "NEG": neg,
+            },
+            missing=P["missing"][payload_idx],
+            valid=valid,
+        )
+
+
+def _as_number(value: Any) -> float:
+    """스칼라 산식과 동일하게 숫자만 허용 (None/문자열은 스코어 실패)"""
+    if isinstance(value, (int, float)) or isinstance(value, numbers.Real):
+        return float(value)
+    raise TypeError(f"non-numeric feature value: {value!r}")
+
+
+def _clip_array(values: np.ndarray, min_val: float = 0, max_val: float = 100):
+    """ScoringEngine._clip의 배열 버전 (NaN 처리 동일: fmin/fmax)"""
+    return np.fmax(min_val, np.fmin(max_val, values))
 
 
 # 편의 함수
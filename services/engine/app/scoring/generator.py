@@ -5,13 +5,18 @@ Candidate Generator
 체크리스트 §4.1, §부록C 기반
 """
 
+import asyncio
 import hashlib
-from typing import Generator, Dict, Any, List, Optional, Tuple
+from typing import Callable, Generator, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
 
+# 룰셋 비리젝트 적중 건수의 candidate_reject_summaries reason_code 접두어
+RULE_HIT_PREFIX = "rule_hit:"
+
 
 @dataclass
 class RejectReason:
@@ -30,12 +35,228 @@ class GeneratorStats:
     hard_rejected: int = 0
     accepted: int = 0
     reject_reasons: Dict[str, RejectReason] = field(default_factory=dict)
+    # 룰셋 비리젝트 적중
+    rule_hits: Dict[str, RejectReason] = field(default_factory=dict)
 
-    def add_reject(self, code: str, text: str):
+    def add_reject(self, code: str, text: str, count: int = 1):
         if code not in self.reject_reasons:
             self.reject_reasons[code] = RejectReason(code=code, text=text, count=0)
-        self.reject_reasons[code].count += 1
-        self.hard_rejected += 1
+        self.reject_reasons[code].count += count
+        self.hard_rejected += count
+
+    def add_rule_hit(self, rule_id: str, text: str, count: int = 1):
+        if rule_id not in self.rule_hits:
+            self.rule_hits[rule_id] = RejectReason(code=rule_id, text=text, count=0)
+        self.rule_hits[rule_id].count += count
+
+    def merge(self, other: "GeneratorStats"):
+        """샤드 통계 합산 (total_combinations는 전체 기준이므로 제외)"""
+        self.accepted += other.accepted
+        for reason in other.reject_reasons.values():
+            self.add_reject(reason.code, reason.text, count=reason.count)
+        for hit in other.rule_hits.values():
+            self.add_rule_hit(hit.code, hit.text, count=hit.count)
+
+    def to_checkpoint(self) -> Dict[str, Any]:
+        """run_progress.checkpoint용 직렬화 (사유 등장 순서 유지)"""
+        return {
+            "accepted": self.accepted,
+            "reject_reasons": [
+                [r.code, r.text, r.count] for r in self.reject_reasons.values()
+            ],
+            "rule_hits": [[r.code, r.text, r.count] for r in self.rule_hits.values()],
+        }
+
+    @classmethod
+    def from_checkpoint(cls, data: Dict[str, Any]) -> "GeneratorStats":
+        """to_checkpoint() 역변환 (total_combinations는 제너레이터 기준이므로 제외)"""
+        stats = cls(accepted=int(data.get("accepted", 0)))
+        for code, text, count in data.get("reject_reasons", []):
+            stats.add_reject(code, text, count=count)
+        for code, text, count in data.get("rule_hits", []):
+            stats.add_rule_hit(code, text, count=count)
+        return stats
+
+
+@dataclass
+class CandidateIndexBatch:
+    """
+    조합 인덱스 배치
+
+    각 배열의 i번째 값은 i번째 후보가 사용하는 컴포넌트 목록 내 위치
+    (CandidateGenerator.targets/antibodies/linkers/payloads/conjugations 기준)
+    """
+
+    target_idx: np.ndarray
+    antibody_idx: np.ndarray
+    linker_idx: np.ndarray
+    payload_idx: np.ndarray
+    conjugation_idx: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.target_idx.shape[0])
+
+    def take(self, selector: np.ndarray) -> "CandidateIndexBatch":
+        """부분 배치 (bool 마스크 또는 위치 배열)"""
+        return CandidateIndexBatch(
+            target_idx=self.target_idx[selector],
+            antibody_idx=self.antibody_idx[selector],
+            linker_idx=self.linker_idx[selector],
+            payload_idx=self.payload_idx[selector],
+            conjugation_idx=self.conjugation_idx[selector],
+        )
+
+
+@dataclass(frozen=True)
+class CombinationSpace:
+    """
+    조합 공간의 혼합 기수(mixed-radix) 인덱스
+
+    index = (((t * A + a) * L + l) * P + p) * C + c
+    자릿수 순서가 generate() 순회 순서와 같으므로 (target 최외곽, conjugation 최내곽)
+    인덱스 구간 [start, stop) = 생성 순서상 연속 구간.
+    임의 후보를 정수 하나로 O(1) 복원 → 커서 체크포인트/재개, 워커별 범위 분할에 사용
+    """
+
+    radices: Tuple[int, int, int, int, int]  # (T, A, L, P, C)
+
+    def __len__(self) -> int:
+        size = 1
+        for radix in self.radices:
+            size *= radix
+        return size
+
+    @property
+    def strides(self) -> Tuple[int, int, int, int, int]:
+        """자릿수별 가중치 (strides[0] = 타겟 1개당 조합 수)"""
+        strides = [1] * len(self.radices)
+        for k in range(len(self.radices) - 2, -1, -1):
+            strides[k] = strides[k + 1] * self.radices[k + 1]
+        return tuple(strides)
+
+    def decode(self, index: int) -> Tuple[int, int, int, int, int]:
+        """조합 인덱스 → (ti, ai, li, pi, ci)"""
+        if not 0 <= index < len(self):
+            raise IndexError(f"combination index out of range: {index}")
+        digits = []
+        for radix in reversed(self.radices):
+            index, digit = divmod(index, radix)
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+    def encode(self, digits: Tuple[int, int, int, int, int]) -> int:
+        """(ti, ai, li, pi, ci) → 조합 인덱스"""
+        index = 0
+        for digit, radix in zip(digits, self.radices):
+            if not 0 <= digit < radix:
+                raise IndexError(f"component index out of range: {digits}")
+            index = index * radix + digit
+        return index
+
+    def decode_many(self, indices: np.ndarray) -> np.ndarray:
+        """조합 인덱스 배열 → (n, 5) 컴포넌트 인덱스 행"""
+        return np.stack(
+            np.unravel_index(np.asarray(indices, dtype=np.int64), self.radices), axis=1
+        ).astype(np.intp)
+
+    def encode_batch(self, index_batch: "CandidateIndexBatch") -> np.ndarray:
+        """인덱스 배치 → (n,) 조합 인덱스"""
+        return np.ravel_multi_index(
+            (
+                index_batch.target_idx,
+                index_batch.antibody_idx,
+                index_batch.linker_idx,
+                index_batch.payload_idx,
+                index_batch.conjugation_idx,
+            ),
+            self.radices,
+        ).astype(np.int64)
+
+    def clip(self, index_range: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """범위를 [0, len) 안으로 제한 (None이면 전체)"""
+        start, stop = index_range or (0, len(self))
+        return max(0, start), min(len(self), stop)
+
+    def split(self, size: int, start: int = 0) -> List[Tuple[int, int]]:
+        """[start, len)을 size 조합씩 연속 범위로 분할 (워커 간 조율 없이 분배 가능)"""
+        size = max(1, size)
+        total = len(self)
+        return [(s, min(s + size, total)) for s in range(max(0, start), total, size)]
+
+
+# RejectPlan 우선순위: 통과
+PASS = np.iinfo(np.int64).max
+
+
+@dataclass
+class RejectPlan:
+    """
+    컴포넌트 단위 하드 리젝트 사전 계산 (HardRejectFilter.plan)
+
+    우선순위 = check()의 검사 순서 * 2 (검사 중 예외는 +1), 통과는 PASS.
+    check()의 모든 규칙은 컴포넌트 하나 또는 linker×payload 쌍에만 의존하므로
+    (t, a, l, p) 조합의 리젝트 사유 = 네 우선순위 중 최솟값의 사유
+    """
+
+    target: np.ndarray  # (T,)
+    antibody: np.ndarray  # (A,)
+    linker_payload: np.ndarray  # (L, P) linker/payload/호환성 중 최솟값
+    # 타겟별 사유 (문구가 타겟마다 다름)
+    target_reasons: List[Optional[Tuple[str, str]]]
+    reasons: Dict[int, Tuple[str, str]]  # 우선순위 → (code, text)
+    errors: Dict[int, Exception]  # 예외 우선순위 → 예외
+
+    def __post_init__(self):
+        self._antibody_sorted = np.sort(self.antibody)
+        self._pair_sorted = np.sort(self.linker_payload, axis=None)
+        self._values = np.union1d(self.antibody, self.linker_payload)
+        self.alive_antibodies = np.flatnonzero(self.antibody == PASS).tolist()
+        self.alive_pairs = [
+            tuple(pair) for pair in np.argwhere(self.linker_payload == PASS).tolist()
+        ]
+
+    def reject_counts(self, ti: int) -> List[Tuple[int, int]]:
+        """
+        타겟 ti의 (antibody, linker, payload) 조합 리젝트 건수 (우선순위 오름차순)
+
+        N(min >= v) = [t >= v] * #(a >= v) * #(lp >= v) 차분으로 계산 (조합 순회 없음)
+        """
+        pt = self.target[ti]
+        values = np.union1d(self._values, [pt])
+        at_least = (
+            (pt >= values)
+            * (
+                len(self._antibody_sorted)
+                - np.searchsorted(self._antibody_sorted, values)
+            )
+            * (len(self._pair_sorted) - np.searchsorted(self._pair_sorted, values))
+        )
+        counts = at_least - np.append(at_least[1:], 0)
+        return [
+            (v, c) for v, c in zip(values.tolist(), counts.tolist()) if c and v != PASS
+        ]
+
+    def first_occurrence_order(
+        self, ti: int, rejects: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """조합 순회 순서상 처음 등장하는 순으로 정렬 (리젝트 요약 순서 보존용)"""
+        values, first = np.unique(self.grid(ti), return_index=True)
+        position = dict(zip(values.tolist(), first.tolist()))
+        return sorted(rejects, key=lambda r: position[r[0]])
+
+    def grid(self, ti: int) -> np.ndarray:
+        """타겟 ti의 (antibody, linker, payload) 조합별 우선순위 (A * L * P,), 순회 순서"""
+        return np.minimum(
+            np.minimum(self.target[ti], self.antibody[:, None]),
+            self.linker_payload.reshape(1, -1),
+        ).ravel()
+
+    def reason(self, ti: int, priority: int) -> Tuple[str, str]:
+        if priority in self.errors:
+            raise self.errors[priority]
+        if priority == self.target[ti]:
+            return self.target_reasons[ti]
+        return self.reasons[priority]
 
 
 class HardRejectFilter:
@@ -45,6 +266,15 @@ class HardRejectFilter:
     조합 생성 전에 빠르게 제외할 수 있는 규칙
     """
 
+    # check() 검사 순서 (RejectPlan 우선순위)
+    ORDER_MISSING_TARGET = 0
+    ORDER_MISSING_PAYLOAD = 1
+    ORDER_INACTIVE = {"target": 2, "antibody": 3, "linker": 4, "payload": 5}
+    ORDER_INCOMPATIBLE = 6
+    ORDER_LOW_EXPRESSION = 7
+    ORDER_ADC_EXCLUDED = 8
+    ORDER_CUSTOM = 9  # + 룰 인덱스
+
     def __init__(self, rules: List[Dict[str, Any]] = None):
         """
         Args:
@@ -172,6 +402,177 @@ class HardRejectFilter:
 
         return False
 
+    def plan(
+        self,
+        targets: List[Dict[str, Any]],
+        antibodies: List[Dict[str, Any]],
+        linkers: List[Dict[str, Any]],
+        payloads: List[Dict[str, Any]],
+    ) -> RejectPlan:
+        """
+        check()를 컴포넌트 단위로 분해해 사전 계산
+
+        컴포넌트별 첫 리젝트 검사 + linker×payload 호환성 비트맵
+        (조합 수와 무관하게 O(T + A + L + P + L×P))
+        """
+        reasons: Dict[int, Tuple[str, str]] = {}
+        errors: Dict[int, Exception] = {}
+
+        def priorities(role: str, components: List[Dict[str, Any]]):
+            values = np.full(len(components), PASS, dtype=np.int64)
+            component_reasons: List[Optional[Tuple[str, str]]] = [None] * len(
+                components
+            )
+            checks = self._component_checks(role)
+
+            for i, component in enumerate(components):
+                for order, check in checks:
+                    try:
+                        reason = check(component)
+                    except Exception as e:
+                        values[i] = order * 2 + 1
+                        errors.setdefault(order * 2 + 1, e)
+                        break
+                    if reason:
+                        values[i] = order * 2
+                        component_reasons[i] = reason
+                        reasons.setdefault(order * 2, reason)
+                        break
+
+            return values, component_reasons
+
+        target, target_reasons = priorities("target", targets)
+        antibody, _ = priorities("antibody", antibodies)
+        linker, _ = priorities("linker", linkers)
+        payload, _ = priorities("payload", payloads)
+
+        # 3. Linker-Payload 호환성 비트맵
+        cleavable = np.array(
+            [_linker_type(spec) == "cleavable" for spec in linkers], dtype=bool
+        )
+        non_cleavable_only = np.array(
+            [_payload_class(p) == "non_cleavable_only" for p in payloads], dtype=bool
+        )
+        incompatible = np.outer(cleavable, non_cleavable_only)
+        if incompatible.any():
+            reasons[self.ORDER_INCOMPATIBLE * 2] = (
+                "LINKER_PAYLOAD_INCOMPATIBLE",
+                "Cleavable linker with non-cleavable payload",
+            )
+
+        linker_payload = np.minimum(
+            np.minimum(linker[:, None], payload[None, :]),
+            np.where(incompatible, self.ORDER_INCOMPATIBLE * 2, PASS),
+        ).reshape(len(linkers), len(payloads))
+
+        return RejectPlan(
+            target=target,
+            antibody=antibody,
+            linker_payload=linker_payload,
+            target_reasons=target_reasons,
+            reasons=reasons,
+            errors=errors,
+        )
+
+    def _component_checks(
+        self, role: str
+    ) -> List[Tuple[int, Callable[[Dict[str, Any]], Optional[Tuple[str, str]]]]]:
+        """role 컴포넌트에만 의존하는 check() 규칙 (검사 순서, 판정 함수)"""
+        checks = []
+
+        if role == "target":
+            checks.append(
+                (
+                    self.ORDER_MISSING_TARGET,
+                    lambda t: (
+                        ("MISSING_TARGET", "Target component is required")
+                        if not t or not t.get("id")
+                        else None
+                    ),
+                )
+            )
+        if role == "payload":
+            checks.append(
+                (
+                    self.ORDER_MISSING_PAYLOAD,
+                    lambda p: (
+                        ("MISSING_PAYLOAD", "Payload component is required")
+                        if not p or not p.get("id")
+                        else None
+                    ),
+                )
+            )
+
+        checks.append(
+            (
+                self.ORDER_INACTIVE[role],
+                lambda c: (
+                    (f"INACTIVE_{role.upper()}", f"{role.title()} is not active")
+                    if c and c.get("status") not in ["active", None]
+                    else None
+                ),
+            )
+        )
+
+        if role == "target":
+            checks.append((self.ORDER_LOW_EXPRESSION, _low_expression))
+            checks.append(
+                (
+                    self.ORDER_ADC_EXCLUDED,
+                    lambda t: (
+                        (
+                            "ADC_EXCLUDED_TARGET",
+                            "Target is excluded from ADC development",
+                        )
+                        if t.get("adc_excluded")
+                        else None
+                    ),
+                )
+            )
+
+        for k, rule in enumerate(self.rules):
+            if rule.get("action") != "hard_reject":
+                continue
+            if rule.get("condition", {}).get("component", "target") != role:
+                continue
+            checks.append((self.ORDER_CUSTOM + k, self._custom_check(rule, role)))
+
+        return checks
+
+    def _custom_check(self, rule: Dict[str, Any], role: str):
+        def check(component: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+            components = {"target": {}, "antibody": {}, "linker": {}, "payload": {}}
+            components[role] = component
+            if self._evaluate_rule(rule, **components):
+                return (
+                    rule.get("id", "CUSTOM_RULE"),
+                    rule.get("reason", "Custom rule violation"),
+                )
+            return None
+
+        return check
+
+
+def _linker_type(linker: Dict[str, Any]) -> Optional[str]:
+    try:
+        return linker.get("linker_type") if linker else None
+    except AttributeError:
+        return None
+
+
+def _payload_class(payload: Dict[str, Any]) -> Optional[str]:
+    try:
+        return payload.get("payload_class") if payload else None
+    except AttributeError:
+        return None
+
+
+def _low_expression(target: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    tumor_expr = target.get("expression", {}).get("tumor", 0)
+    if tumor_expr < 1.0:  # 최소 발현량
+        return "LOW_TARGET_EXPRESSION", f"Target expression too low: {tumor_expr}"
+    return None
+
 
 class CandidateGenerator:
     """
@@ -235,42 +636,52 @@ class CandidateGenerator:
             payloads=len(self.payloads),
         )
 
-    def generate(self) -> Generator[Dict[str, Any], None, None]:
+    @property
+    def space(self) -> CombinationSpace:
+        """전체 조합 공간 (현재 컴포넌트 목록 기준)"""
+        return CombinationSpace(
+            (
+                len(self.targets),
+                len(self.antibodies),
+                len(self.linkers),
+                len(self.payloads),
+                len(self.conjugations),
+            )
+        )
+
+    def candidate_at(self, index: int) -> Dict[str, Any]:
+        """조합 인덱스의 후보 dict (O(1) 복원, 하드 리젝트 여부와 무관)"""
+        ti, ai, li, pi, ci = self.space.decode(index)
+        return self._build_candidate(
+            self.targets[ti],
+            self.antibodies[ai],
+            self.linkers[li],
+            self.payloads[pi],
+            self.conjugations[ci],
+        )
+
+    def generate(
+        self, index_range: Optional[Tuple[int, int]] = None
+    ) -> Generator[Dict[str, Any], None, None]:
         """
         후보 생성 제너레이터
 
+        Args:
+            index_range: (start, stop) 조합 인덱스 범위만 생성 (None이면 전체)
+
         Yields:
             {"target": {...}, "antibody": {...}, "linker": {...}, "payload": {...}, "hash": "..."}
         """
-        for target in self.targets:
-            for antibody in self.antibodies:
-                for linker in self.linkers:
-                    for payload in self.payloads:
-                        for conjugation in self.conjugations:
-                            # Hard Reject 체크
-                            is_rejected, code, reason = self.hard_reject_filter.check(
-                                target, antibody, linker, payload
-                            )
-
-                            if is_rejected:
-                                self.stats.add_reject(code, reason)
-                                continue
-
-                            # 후보 해시 생성
-                            candidate_hash = self._compute_hash(
-                                target, antibody, linker, payload, conjugation
-                            )
-
-                            self.stats.accepted += 1
-
-                            yield {
-                                "target": target,
-                                "antibody": antibody,
-                                "linker": linker,
-                                "payload": payload,
-                                "conjugation": conjugation,
-                                "candidate_hash": candidate_hash,
-                            }
+        for rows in self._accepted_rows(index_range):
+            for ti, ai, li, pi, ci in rows.tolist():
+                self.stats.accepted += 1
+                yield self._build_candidate(
+                    self.targets[ti],
+                    self.antibodies[ai],
+                    self.linkers[li],
+                    self.payloads[pi],
+                    self.conjugations[ci],
+                )
 
     def generate_batches(self) -> Generator[List[Dict[str, Any]], None, None]:
         """
@@ -292,6 +703,190 @@ class CandidateGenerator:
         if batch:
             yield batch
 
+    def generate_index_batches(
+        self, index_range: Optional[Tuple[int, int]] = None
+    ) -> Generator[CandidateIndexBatch, None, None]:
+        """
+        인덱스 배치 단위 생성 (팩터화 스코어링용)
+
+        generate_batches()와 같은 순서/배치 경계로 후보를 내보내되,
+        컴포넌트 dict 대신 목록 인덱스 배열만 생성.
+        BatchScoringEngine.score_indices()로 바로 스코어링하고,
+        저장이 필요한 시점에만 materialize()로 후보 dict를 만든다.
+
+        Args:
+            index_range: (start, stop) 조합 인덱스 범위만 생성 (샤드/재개용).
+                인덱스가 생성 순서이므로 연속 범위를 순서대로 이어붙이면 전체 순서와 동일
+
+        Yields:
+            CandidateIndexBatch (batch_size 개씩)
+        """
+        pending = np.empty((0, 5), dtype=np.intp)
+
+        for rows in self._accepted_rows(index_range):
+            self.stats.accepted += rows.shape[0]
+            pending = np.vstack([pending, rows]) if pending.shape[0] else rows
+            while pending.shape[0] >= self.batch_size:
+                yield self._index_batch(pending[: self.batch_size])
+                pending = pending[self.batch_size :]
+
+        if pending.shape[0]:
+            yield self._index_batch(pending)
+
+    def materialize(self, index_batch: CandidateIndexBatch) -> List[Dict[str, Any]]:
+        """인덱스 배치 → generate()와 동일한 후보 dict 목록"""
+        return [
+            self._build_candidate(
+                self.targets[ti],
+                self.antibodies[ai],
+                self.linkers[li],
+                self.payloads[pi],
+                self.conjugations[ci],
+            )
+            for ti, ai, li, pi, ci in zip(
+                index_batch.target_idx.tolist(),
+                index_batch.antibody_idx.tolist(),
+                index_batch.linker_idx.tolist(),
+                index_batch.payload_idx.tolist(),
+                index_batch.conjugation_idx.tolist(),
+            )
+        ]
+
+    def candidate_hashes(self, index_batch: CandidateIndexBatch) -> List[str]:
+        """인덱스 배치의 후보 해시 (materialize() 없이)"""
+        return [
+            self._compute_hash(
+                self.targets[ti],
+                self.antibodies[ai],
+                self.linkers[li],
+                self.payloads[pi],
+                self.conjugations[ci],
+            )
+            for ti, ai, li, pi, ci in zip(
+                index_batch.target_idx.tolist(),
+                index_batch.antibody_idx.tolist(),
+                index_batch.linker_idx.tolist(),
+                index_batch.payload_idx.tolist(),
+                index_batch.conjugation_idx.tolist(),
+            )
+        ]
+
+    def _accepted_rows(
+        self, index_range: Optional[Tuple[int, int]] = None
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        하드 리젝트를 통과한 조합의 (k, 5) 인덱스 행 (타겟 단위, 조합 인덱스 오름차순)
+
+        하드 리젝트는 컴포넌트/linker×payload 단위로 사전 계산(RejectPlan)하고
+        통과한 조합만 생성. 범위가 타겟 블록 전체를 덮으면 리젝트 건수를 산술 계산,
+        블록 일부만 덮는 경계 타겟은 범위 안의 조합만 벡터로 판정.
+        어느 쪽이든 조합별 check()와 동일한 통계(사유, 건수, 등장 순서)를 유지
+        """
+        space = self.space
+        start, stop = space.clip(index_range)
+        if start >= stop:
+            return
+
+        n_conj = len(self.conjugations)
+        block = space.strides[0]
+        plan = self.hard_reject_filter.plan(
+            self.targets, self.antibodies, self.linkers, self.payloads
+        )
+
+        # 타겟 블록 안의 통과 (antibody, linker, payload, conjugation) 행
+        alive = np.asarray(
+            [
+                (ai, li, pi)
+                for ai in plan.alive_antibodies
+                for li, pi in plan.alive_pairs
+            ],
+            dtype=np.intp,
+        ).reshape(-1, 3)
+        template = np.hstack(
+            [
+                np.repeat(alive, n_conj, axis=0),
+                np.tile(np.arange(n_conj, dtype=np.intp), len(alive))[:, None],
+            ]
+        )
+
+        for ti in range(start // block, (stop - 1) // block + 1):
+            lo = max(start - ti * block, 0)
+            hi = min(stop - ti * block, block)
+
+            if lo == 0 and hi == block:
+                rejects = plan.reject_counts(ti)
+                if rejects and any(
+                    plan.reason(ti, priority)[0] not in self.stats.reject_reasons
+                    for priority, _ in rejects
+                ):
+                    rejects = plan.first_occurrence_order(ti, rejects)
+                self._add_rejects(plan, ti, [(p, c * n_conj) for p, c in rejects])
+
+                if plan.target[ti] != PASS or not template.shape[0]:
+                    continue
+                rows = np.hstack(
+                    [np.full((template.shape[0], 1), ti, dtype=np.intp), template]
+                )
+            else:
+                # 경계 타겟: 블록 내 오프셋 [lo, hi)의 조합만 판정
+                offsets = np.arange(lo, hi, dtype=np.int64)
+                priorities = plan.grid(ti)[offsets // n_conj]
+                values, first, counts = np.unique(
+                    priorities, return_index=True, return_counts=True
+                )
+                self._add_rejects(
+                    plan,
+                    ti,
+                    [
+                        (v, c)
+                        for _, v, c in sorted(
+                            zip(first.tolist(), values.tolist(), counts.tolist())
+                        )
+                        if v != PASS
+                    ],
+                )
+                rows = space.decode_many(ti * block + offsets[priorities == PASS])
+
+            if rows.shape[0]:
+                yield rows
+
+    def _add_rejects(
+        self, plan: RejectPlan, ti: int, rejects: List[Tuple[int, int]]
+    ) -> None:
+        for priority, count in rejects:
+            code, reason = plan.reason(ti, priority)
+            self.stats.add_reject(code, reason, count=count)
+
+    def _build_candidate(
+        self,
+        target: Dict[str, Any],
+        antibody: Dict[str, Any],
+        linker: Dict[str, Any],
+        payload: Dict[str, Any],
+        conjugation: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        return {
+            "target": target,
+            "antibody": antibody,
+            "linker": linker,
+            "payload": payload,
+            "conjugation": conjugation,
+            # 후보 해시 생성
+            "candidate_hash": self._compute_hash(
+                target, antibody, linker, payload, conjugation
+            ),
+        }
+
+    @staticmethod
+    def _index_batch(rows: np.ndarray) -> CandidateIndexBatch:
+        return CandidateIndexBatch(
+            target_idx=rows[:, 0],
+            antibody_idx=rows[:, 1],
+            linker_idx=rows[:, 2],
+            payload_idx=rows[:, 3],
+            conjugation_idx=rows[:, 4],
+        )
+
     def _compute_hash(
         self,
         target: Dict[str, Any],
@@ -320,6 +915,21 @@ class CandidateGenerator:
             for r in self.stats.reject_reasons.values()
         ]
 
+    def get_rule_hit_summary(self) -> List[Dict[str, Any]]:
+        """
+        룰셋 비리젝트 룰(penalty/alert/require_protocol) 적중 건수
+
+        get_reject_summary와 같은 포맷, reason_code = rule_hit:{rule_id}
+        """
+        return [
+            {
+                "reason_code": f"{RULE_HIT_PREFIX}{r.code}",
+                "reason_text": r.text,
+                "rejected_count": r.count,
+            }
+            for r in self.stats.rule_hits.values()
+        ]
+
 
 def create_generator_from_catalog(
     db_client,
@@ -340,28 +950,61 @@ def create_generator_from_catalog(
         CandidateGenerator 인스턴스
     """
     constraints = constraints or {}
+    queries = _catalog_queries(db_client, target_ids, constraints)
+    components = {
+        comp_type: query.execute().data or [] for comp_type, query in queries.items()
+    }
+    return _generator_from_components(components, constraints, hard_reject_rules)
 
-    # 활성 컴포넌트만 로드
-    def load_components(comp_type: str, ids: List[str] = None) -> List[Dict[str, Any]]:
+
+async def acreate_generator_from_catalog(
+    db_client,
+    target_ids: List[str] = None,
+    constraints: Dict[str, Any] = None,
+    hard_reject_rules: List[Dict[str, Any]] = None,
+) -> CandidateGenerator:
+    """
+    create_generator_from_catalog 비동기 버전 (AsyncClient, 컴포넌트 유형별 동시 조회)
+    """
+    constraints = constraints or {}
+    queries = _catalog_queries(db_client, target_ids, constraints)
+    results = await asyncio.gather(*(query.execute() for query in queries.values()))
+    components = {
+        comp_type: result.data or [] for comp_type, result in zip(queries, results)
+    }
+    return _generator_from_components(components, constraints, hard_reject_rules)
+
+
+def _catalog_queries(
+    db_client, target_ids: Optional[List[str]], constraints: Dict[str, Any]
+) -> Dict[str, Any]:
+    """컴포넌트 유형별 활성 카탈로그 쿼리 (미실행)"""
+    selections = {
+        "target": target_ids,
+        "antibody": constraints.get("antibody_ids"),
+        "linker": constraints.get("linker_ids"),
+        "payload": constraints.get("payload_ids"),
+    }
+    queries = {}
+    for comp_type, ids in selections.items():
         query = (
             db_client.table("component_catalog")
             .select("*")
             .eq("type", comp_type)
             .eq("status", "active")
         )
-
         if ids:
             query = query.in_("id", ids)
+        queries[comp_type] = query
+    return queries
 
-        result = query.execute()
-        return result.data if result.data else []
-
-    # 컴포넌트 로드
-    targets = load_components("target", target_ids)
-    antibodies = load_components("antibody", constraints.get("antibody_ids"))
-    linkers = load_components("linker", constraints.get("linker_ids"))
-    payloads = load_components("payload", constraints.get("payload_ids"))
 
+def _generator_from_components(
+    components: Dict[str, List[Dict[str, Any]]],
+    constraints: Dict[str, Any],
+    hard_reject_rules: Optional[List[Dict[str, Any]]],
+) -> CandidateGenerator:
+    """로드된 컴포넌트 → 품질 등급 필터 → 제너레이터"""
     # 품질 등급 필터
     quality_threshold = constraints.get("min_quality_grade", "bronze")
     quality_order = {"gold": 3, "silver": 2, "bronze": 1}
@@ -371,13 +1014,13 @@ def create_generator_from_catalog(
         grade = comp.get("quality_grade", "bronze")
         return quality_order.get(grade, 1) >= threshold
 
-    targets = [t for t in targets if quality_filter(t)]
-    payloads = [p for p in payloads if quality_filter(p)]
+    targets = [t for t in components["target"] if quality_filter(t)]
+    payloads = [p for p in components["payload"] if quality_filter(p)]
 
     return CandidateGenerator(
         targets=targets,
-        antibodies=antibodies,
-        linkers=linkers,
+        antibodies=components["antibody"],
+        linkers=components["linker"],
         payloads=payloads,
         hard_reject_rules=hard_reject_rules,
         batch_size=constraints.get("batch_size", 500),
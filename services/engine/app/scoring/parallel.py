@@ -0,0 +1,261 @@
+"""
+Sharded Scoring
+대형 Design Run용 샤드 병렬 스코어링
+
+후보 공간을 조합 인덱스(CombinationSpace) 범위로 샤드 분할 → 하드 리젝트 + 스코어링 +
+저장 포맷 생성을 ProcessPoolExecutor에서 실행. 조합 인덱스가 생성 순서이므로 샤드 결과를
+샤드 순서대로 소비하면 단일 프로세스 실행과 후보 순서/점수가 동일 (재현 가능).
+샤드 경계는 범위 양끝만으로 정해지므로 start_index부터 다시 시작하면 중단된 Run 재개.
+룰셋이 주어지면 RuleStage도 샤드 안에서 적용 (스코어링 전 prescreen + 스코어링 후 룰 평가).
+
+이벤트 루프는 executor future만 기다리므로 계산 중에도 다른 Arq Job 처리 가능.
+"""
+
+import asyncio
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import numpy as np
+import structlog
+
+from app.rules import RuleSet
+
+from .engine import BatchScoringEngine
+from .generator import CandidateGenerator, CandidateIndexBatch, GeneratorStats
+from .rule_stage import RuleStage
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class ShardBatch:
+    """샤드에서 계산된 저장 단위 배치 (인덱스는 전체 컴포넌트 목록 기준)"""
+
+    index_batch: CandidateIndexBatch
+    objectives: np.ndarray  # (n, 4) eng, bio, safety, evidence (룰 penalty 반영)
+    score_components: List[Dict[str, Any]]  # 룰 적중 시 "rules" 포함
+    candidate_hashes: List[str]
+    combination_index: np.ndarray  # (n,) CombinationSpace 인덱스
+
+    def __len__(self) -> int:
+        return len(self.index_batch)
+
+
+@dataclass
+class ShardResult:
+    """샤드 실행 결과"""
+
+    shard_index: int
+    index_range: Tuple[int, int]  # 조합 인덱스 [start, stop)
+    batches: List[ShardBatch] = field(default_factory=list)
+    stats: GeneratorStats = field(default_factory=GeneratorStats)
+
+
+class _ShardScorer:
+    """샤드 실행기 (프로세스/스레드당 1개, 부분 Term/룰 컴파일은 생성 시 1회)"""
+
+    def __init__(
+        self,
+        catalog: Dict[str, Any],
+        scoring_params: Dict[str, Any],
+        ruleset: Optional[RuleSet] = None,
+    ):
+        self.generator = CandidateGenerator(**catalog)
+        self.engine = BatchScoringEngine(scoring_params)
+        self.terms = self.engine.precompute_components(
+            self.generator.targets,
+            self.generator.linkers,
+            self.generator.payloads,
+            self.generator.conjugations,
+        )
+        self.rule_stage = (
+            RuleStage(
+                ruleset,
+                self.generator.targets,
+                self.generator.linkers,
+                self.generator.payloads,
+                self.generator.conjugations,
+                self.terms,
+            )
+            if ruleset
+            else None
+        )
+
+    def score(self, shard_index: int, start: int, stop: int) -> ShardResult:
+        stats = self.generator.stats = GeneratorStats()
+        result = ShardResult(shard_index=shard_index, index_range=(start, stop))
+
+        for index_batch in self.generator.generate_index_batches((start, stop)):
+            if self.rule_stage:
+                # 컴포넌트 단위 hard_reject 후보는 스코어링하지 않음
+                index_batch = self.rule_stage.prescreen(index_batch, stats)
+                if len(index_batch) == 0:
+                    continue
+
+            scores = self.engine.score_indices(
+                self.terms,
+                index_batch.target_idx,
+                index_batch.linker_idx,
+                index_batch.payload_idx,
+                index_batch.conjugation_idx,
+            )
+            objectives = scores.objective_matrix()
+            keep = np.arange(len(index_batch))
+            rule_components = None
+
+            if self.rule_stage:
+                outcome = self.rule_stage.apply(index_batch, scores, stats)
+                keep = np.flatnonzero(outcome.keep)
+                if len(keep) == 0:
+                    continue
+                objectives = outcome.objectives
+                rule_components = outcome.rule_components
+                if len(keep) < len(index_batch):
+                    index_batch = index_batch.take(keep)
+
+            score_components = []
+            for i in keep.tolist():
+                components = scores.to_dict(i)["score_components"]
+                if rule_components and rule_components[i]:
+                    components["rules"] = rule_components[i]
+                score_components.append(components)
+
+            result.batches.append(
+                ShardBatch(
+                    index_batch=index_batch,
+                    objectives=objectives[keep],
+                    score_components=score_components,
+                    candidate_hashes=self.generator.candidate_hashes(index_batch),
+                    combination_index=self.generator.space.encode_batch(index_batch),
+                )
+            )
+
+        result.stats = self.generator.stats
+        return result
+
+
+# 프로세스 풀 워커 상태 (initializer에서 1회 생성)
+_process_scorer: Optional[_ShardScorer] = None
+
+
+def _init_process(
+    catalog: Dict[str, Any],
+    scoring_params: Dict[str, Any],
+    ruleset: Optional[RuleSet] = None,
+) -> None:
+    global _process_scorer
+    _process_scorer = _ShardScorer(catalog, scoring_params, ruleset)
+
+
+def _score_in_process(shard_index: int, start: int, stop: int) -> ShardResult:
+    return _process_scorer.score(shard_index, start, stop)
+
+
+class ShardedScoringRunner:
+    """
+    샤드 병렬 스코어링 실행기
+
+    사용:
+        runner = ShardedScoringRunner(generator, scoring_params, workers=4)
+        async for shard in runner.iter_shards():
+            for batch in shard.batches:
+                ...  # 저장 / 파레토 누적
+
+    - workers > 1: spawn 프로세스 풀 (카탈로그는 initializer로 1회 전달)
+    - workers <= 1: 단일 스레드 executor (같은 결과, 이벤트 루프만 비차단)
+    - 동시 실행 샤드는 workers * 2개로 제한 → 메모리는 샤드 크기에 비례
+    - 샤드 통계는 generator.stats에 합산 (get_reject_summary 그대로 사용)
+    - start_index: 체크포인트 커서부터 재개 (이전 구간 통계는 호출자가 복원)
+    - ruleset: 룰 리젝트는 저장/파레토에서 제외, penalty는 objectives에 반영
+    """
+
+    DEFAULT_SHARD_CANDIDATES = 20_000
+
+    def __init__(
+        self,
+        generator: CandidateGenerator,
+        scoring_params: Dict[str, Any] = None,
+        workers: int = 1,
+        shard_candidates: int = None,
+        ruleset: RuleSet = None,
+        start_index: int = 0,
+    ):
+        """
+        Args:
+            generator: 전체 카탈로그 제너레이터 (샤드는 이 조합 공간의 인덱스 범위)
+            scoring_params: BatchScoringEngine 파라미터
+            workers: 프로세스 수 (1 이하면 단일 스레드)
+            shard_candidates: 샤드당 조합 수 (리젝트 포함)
+            ruleset: 배치 룰 단계에 적용할 룰셋 (없으면 룰 단계 생략)
+            start_index: 시작 조합 인덱스 (재개 커서, 이전 조합은 건너뜀)
+        """
+        self.generator = generator
+        self.scoring_params = scoring_params or {}
+        self.workers = max(1, workers or 1)
+        self.shard_candidates = shard_candidates or self.DEFAULT_SHARD_CANDIDATES
+        self.ruleset = ruleset
+        self.start_index = max(0, start_index or 0)
+        self.logger = logger.bind(service="sharded_scoring")
+
+    def shards(self) -> List[Tuple[int, int]]:
+        """결정적 조합 인덱스 범위 목록 ([start_index, 전체 조합 수))"""
+        return self.generator.space.split(self.shard_candidates, self.start_index)
+
+    async def iter_shards(self) -> AsyncGenerator[ShardResult, None]:
+        """샤드 결과를 샤드 순서대로 반환"""
+        shards = self.shards()
+        self.logger.info(
+            "sharded_scoring_started",
+            shards=len(shards),
+            workers=self.workers,
+            start_index=self.start_index,
+            total_combinations=self.generator.stats.total_combinations,
+        )
+
+        loop = asyncio.get_running_loop()
+        executor, score = self._executor()
+        pending: deque = deque()
+        next_shard = 0
+
+        try:
+            while next_shard < len(shards) or pending:
+                while next_shard < len(shards) and len(pending) < self.workers * 2:
+                    start, stop = shards[next_shard]
+                    pending.append(
+                        loop.run_in_executor(executor, score, next_shard, start, stop)
+                    )
+                    next_shard += 1
+
+                result = await pending.popleft()
+                self.generator.stats.merge(result.stats)
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _executor(self) -> Tuple[Executor, Any]:
+        catalog = {
+            "targets": self.generator.targets,
+            "antibodies": self.generator.antibodies,
+            "linkers": self.generator.linkers,
+            "payloads": self.generator.payloads,
+            "conjugations": self.generator.conjugations,
+            "hard_reject_rules": self.generator.hard_reject_filter.rules,
+            "batch_size": self.generator.batch_size,
+        }
+
+        if self.workers <= 1:
+            scorer = _ShardScorer(catalog, self.scoring_params, self.ruleset)
+            return ThreadPoolExecutor(max_workers=1), scorer.score
+
+        # spawn: 부모의 이벤트 루프/DB 커넥션/스레드를 상속하지 않음
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process,
+            initargs=(catalog, self.scoring_params, self.ruleset),
+        )
+        return executor, _score_in_process
@@ -3,10 +3,21 @@ Pareto Front Calculator
 다중 목적 최적화를 위한 파레토 프론트 계산
 
 NSGA-II 기반 비지배 정렬 + 혼잡도 거리
+
+비지배 정렬 백엔드 (non_dominated_fronts의 backend 인자):
+- "python": 순수 Python 참조 구현 (Deb fast non-dominated sort)
+- "numpy": NumPy 블록 스윕 + kd-tree 지배 질의
+- "parallel": 청크별 프로세스 병렬 사전 축소 + NumPy 최종 정렬 (대규모 N)
+- "auto": N과 max_fronts에 따라 numpy / parallel 선택
 """
 
-from typing import List, Dict, Any, Tuple
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
@@ -48,12 +59,21 @@ class ParetoCalculator:
 
     DEFAULT_OBJECTIVES = ["eng_fit", "bio_fit", "safety_fit", "evidence_fit"]
 
-    def __init__(self, objectives: List[str] = None):
+    def __init__(
+        self,
+        objectives: List[str] = None,
+        backend: str = "auto",
+        workers: Optional[int] = None,
+    ):
         """
         Args:
             objectives: 목적 함수 목록 (기본: 4축)
+            backend: 비지배 정렬 백엔드 ("auto", "python", "numpy", "parallel")
+            workers: parallel 백엔드 프로세스 수 (None이면 CPU 수)
         """
         self.objectives = objectives or self.DEFAULT_OBJECTIVES
+        self.backend = backend
+        self.workers = workers
         self.logger = logger.bind(service="pareto_calculator")
 
     def calculate(
@@ -72,63 +92,69 @@ class ParetoCalculator:
         if not candidates:
             return []
 
-        n = len(candidates)
-        self.logger.info("pareto_calculating", candidates=n, objectives=self.objectives)
-
-        # 1. 지배 관계 계산
-        domination_count = [0] * n  # 각 후보가 지배당하는 횟수
-        dominated_by = [[] for _ in range(n)]  # 각 후보를 지배하는 후보 목록
+        # 목적 함수 행렬 (n, M)
+        matrix = np.array(
+            [[c.get(obj, 0) for obj in self.objectives] for c in candidates],
+            dtype=np.float64,
+        )
+        ids = [str(c.get("id", idx)) for idx, c in enumerate(candidates)]
+        return self.calculate_matrix(matrix, ids, max_fronts=max_fronts)
 
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    if self._dominates(candidates[i], candidates[j]):
-                        dominated_by[j].append(i)
-                        domination_count[j] += 1
+    def calculate_matrix(
+        self, matrix: np.ndarray, ids: Sequence[Any], max_fronts: int = 5
+    ) -> List[ParetoFront]:
+        """
+        목적 함수 행렬로 파레토 프론트 계산 (후보 dict 없이)
 
-        # 2. 프론트 분리
-        fronts: List[ParetoFront] = []
-        remaining = set(range(n))
-        front_idx = 0
+        Args:
+            matrix: (n, M) 목적 함수 행렬 (self.objectives 순서, np.memmap 가능)
+            ids: 행별 후보 ID (str 또는 bytes 배열)
+            max_fronts: 최대 프론트 수
 
-        while remaining and front_idx < max_fronts:
-            # 지배당하지 않는 후보들 = 현재 프론트
-            current_front_indices = [i for i in remaining if domination_count[i] == 0]
+        Returns:
+            List of ParetoFront
+        """
+        n = matrix.shape[0]
+        if n == 0:
+            return []
 
-            if not current_front_indices:
-                break
+        self.logger.info(
+            "pareto_calculating",
+            candidates=n,
+            objectives=self.objectives,
+            backend=resolve_backend(self.backend, n, max_fronts),
+        )
 
-            # 혼잡도 거리 계산
-            crowding = self._calculate_crowding_distance(
-                [candidates[i] for i in current_front_indices]
-            )
+        # 1. 비지배 정렬
+        front_indices = non_dominated_fronts(
+            matrix, max_fronts=max_fronts, backend=self.backend, workers=self.workers
+        )
 
-            # 프론트 생성
-            front = ParetoFront(
-                front_index=front_idx,
-                objectives=self.objectives,
-                members=[
-                    ParetoMember(
-                        candidate_id=str(candidates[idx].get("id", idx)),
-                        rank=front_idx,
-                        crowding_distance=crowding[i],
-                        objectives={
-                            obj: candidates[idx].get(obj, 0) for obj in self.objectives
-                        },
-                    )
-                    for i, idx in enumerate(current_front_indices)
-                ],
+        # 2. 프론트 생성
+        fronts: List[ParetoFront] = []
+        for front_idx, current_front_indices in enumerate(front_indices):
+            front_matrix = np.asarray(matrix[current_front_indices], dtype=np.float64)
+
+            # 혼잡도 거리 계산 (프론트 목적 행렬 슬라이스)
+            crowding = crowding_distance(front_matrix).tolist()
+
+            fronts.append(
+                ParetoFront(
+                    front_index=front_idx,
+                    objectives=self.objectives,
+                    members=[
+                        ParetoMember(
+                            candidate_id=_candidate_id(ids[idx]),
+                            rank=front_idx,
+                            crowding_distance=crowding[i],
+                            objectives=dict(zip(self.objectives, row)),
+                        )
+                        for i, (idx, row) in enumerate(
+                            zip(current_front_indices.tolist(), front_matrix.tolist())
+                        )
+                    ],
+                )
             )
-            fronts.append(front)
-
-            # 현재 프론트 제거 후 나머지 지배 횟수 업데이트
-            for i in current_front_indices:
-                remaining.remove(i)
-                for j in remaining:
-                    if i in dominated_by[j]:
-                        domination_count[j] -= 1
-
-            front_idx += 1
 
         self.logger.info(
             "pareto_calculated",
@@ -166,31 +192,11 @@ class ParetoCalculator:
 
         각 목적 함수별로 정렬 후 이웃과의 거리 합산
         """
-        n = len(candidates)
-        if n <= 2:
-            return [float("inf")] * n
-
-        distances = [0.0] * n
-
-        for obj in self.objectives:
-            # 목적 함수별 정렬
-            sorted_indices = sorted(range(n), key=lambda i: candidates[i].get(obj, 0))
-
-            # 경계값 (무한대할당)
-            distances[sorted_indices[0]] = float("inf")
-            distances[sorted_indices[-1]] = float("inf")
-
-            # 중간값 거리 계산
-            obj_min = candidates[sorted_indices[0]].get(obj, 0)
-            obj_max = candidates[sorted_indices[-1]].get(obj, 0)
-            obj_range = obj_max - obj_min if obj_max != obj_min else 1
-
-            for i in range(1, n - 1):
-                prev_val = candidates[sorted_indices[i - 1]].get(obj, 0)
-                next_val = candidates[sorted_indices[i + 1]].get(obj, 0)
-                distances[sorted_indices[i]] += (next_val - prev_val) / obj_range
-
-        return distances
+        matrix = np.array(
+            [[c.get(obj, 0) for obj in self.objectives] for c in candidates],
+            dtype=np.float64,
+        ).reshape(len(candidates), len(self.objectives))
+        return crowding_distance(matrix).tolist()
 
     def get_top_candidates(
         self, fronts: List[ParetoFront], top_n: int = 50
@@ -247,10 +253,551 @@ class ParetoCalculator:
         return front_records, member_records
 
 
+def _candidate_id(value: Any) -> str:
+    """후보 ID 정규화 (ObjectiveStore는 ASCII bytes로 보관)"""
+    if isinstance(value, bytes):
+        return value.decode("ascii")
+    return str(value)
+
+
+# ============================================================
+# 목적 함수 누적 저장소 (스트리밍 Run)
+# ============================================================
+
+
+class ObjectiveStore:
+    """
+    스트리밍 Run용 (후보 ID, 목적 함수 벡터) 누적 저장소
+
+    후보 전체 dict 대신 행당 ID(ASCII) + M개 float만 보관.
+    spill_threshold 행을 넘으면 임시 파일로 내려쓰고, matrix()/ids()는
+    np.memmap을 반환하므로 대형 Run도 상주 메모리는 배치 크기 수준.
+
+    사용:
+        with ObjectiveStore() as store:
+            store.append(ids, objective_matrix)
+            fronts = calculator.calculate_matrix(store.matrix(), store.ids())
+    """
+
+    DEFAULT_SPILL_THRESHOLD = 1_000_000
+    ID_DTYPE = np.dtype("S36")  # UUID 문자열 길이
+
+    def __init__(
+        self,
+        n_objectives: int = 4,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            n_objectives: 목적 함수 수 (열 수)
+            spill_threshold: 디스크로 내려쓰기 시작할 행 수 (0이면 즉시, None이면 기본값)
+            spill_dir: 임시 파일 디렉토리 (기본: 시스템 임시 디렉토리)
+        """
+        self.n_objectives = n_objectives
+        self.spill_threshold = (
+            self.DEFAULT_SPILL_THRESHOLD if spill_threshold is None else spill_threshold
+        )
+        self.spill_dir = spill_dir
+        self.count = 0
+
+        self._id_chunks: List[np.ndarray] = []
+        self._objective_chunks: List[np.ndarray] = []
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        self._id_file = None
+        self._objective_file = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "ObjectiveStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def spilled(self) -> bool:
+        return self._tmpdir is not None
+
+    def append(self, ids: Sequence[str], objectives: np.ndarray) -> None:
+        """배치 추가 (ids와 objectives 행 순서 동일)"""
+        objectives = np.asarray(objectives, dtype=np.float64).reshape(
+            -1, self.n_objectives
+        )
+        id_array = np.asarray(ids, dtype=self.ID_DTYPE)
+        if id_array.shape[0] != objectives.shape[0]:
+            raise ValueError("ids and objectives must have the same length")
+
+        self.count += objectives.shape[0]
+
+        if not self.spilled and self.count > self.spill_threshold:
+            self._spill()
+
+        if self.spilled:
+            self._id_file.write(id_array.tobytes())
+            self._objective_file.write(np.ascontiguousarray(objectives).tobytes())
+        else:
+            self._id_chunks.append(id_array)
+            self._objective_chunks.append(objectives)
+
+    def matrix(self) -> np.ndarray:
+        """(count, n_objectives) 목적 함수 행렬"""
+        if self.spilled:
+            return self._open("objectives", np.float64, (self.count, self.n_objectives))
+        if not self._objective_chunks:
+            return np.empty((0, self.n_objectives))
+        self._objective_chunks = [np.concatenate(self._objective_chunks)]
+        return self._objective_chunks[0]
+
+    def ids(self) -> np.ndarray:
+        """(count,) 후보 ID (ASCII bytes)"""
+        if self.spilled:
+            return self._open("ids", self.ID_DTYPE, (self.count,))
+        if not self._id_chunks:
+            return np.empty(0, dtype=self.ID_DTYPE)
+        self._id_chunks = [np.concatenate(self._id_chunks)]
+        return self._id_chunks[0]
+
+    def close(self) -> None:
+        """임시 파일 정리"""
+        for handle in (self._id_file, self._objective_file):
+            if handle is not None:
+                handle.close()
+        self._id_file = self._objective_file = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+        self._id_chunks = []
+        self._objective_chunks = []
+
+    def _spill(self) -> None:
+        """메모리 청크를 임시 파일로 이동, 이후 append는 파일에 직접 기록"""
+        self._tmpdir = tempfile.TemporaryDirectory(
+            prefix="pareto_", dir=self.spill_dir
+        )
+        self._id_file = open(os.path.join(self._tmpdir.name, "ids"), "wb")
+        self._objective_file = open(
+            os.path.join(self._tmpdir.name, "objectives"), "wb"
+        )
+        for id_array, objectives in zip(self._id_chunks, self._objective_chunks):
+            self._id_file.write(id_array.tobytes())
+            self._objective_file.write(objectives.tobytes())
+        self._id_chunks = []
+        self._objective_chunks = []
+
+        logger.info("objective_store_spilled", path=self._tmpdir.name, rows=self.count)
+
+    def _open(self, name: str, dtype, shape) -> np.ndarray:
+        handle = self._id_file if name == "ids" else self._objective_file
+        handle.flush()
+        if self.count == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(
+            os.path.join(self._tmpdir.name, name), dtype=dtype, mode="r", shape=shape
+        )
+
+
+# ============================================================
+# 비지배 정렬
+# ============================================================
+
+PARETO_BACKENDS = ("python", "numpy", "parallel")
+
+# 스윕 블록 크기 (블록 내부는 B x B 지배 행렬) / kd-tree 리프 크기
+_SORT_BLOCK = 512
+_TREE_LEAF = 16
+
+# auto 백엔드가 parallel을 선택하는 최소 후보 수 / 프로세스당 최소 청크 크기
+_PARALLEL_MIN_POINTS = 500_000
+_PARALLEL_MIN_CHUNK = 50_000
+
+
+def resolve_backend(backend: str, n: int, max_fronts: Optional[int] = None) -> str:
+    """
+    백엔드 이름 확인 및 "auto" 해석
+
+    parallel은 max_fronts가 있을 때만 청크 사전 축소가 가능하므로
+    auto는 대규모 N + max_fronts 지정 시에만 parallel 선택
+    """
+    if backend == "auto":
+        if max_fronts is not None and n >= _PARALLEL_MIN_POINTS:
+            return "parallel"
+        return "numpy"
+    if backend not in PARETO_BACKENDS:
+        raise ValueError(
+            f"Unknown pareto backend: {backend} (expected auto or one of {PARETO_BACKENDS})"
+        )
+    return backend
+
+
+def non_dominated_fronts(
+    objectives: np.ndarray,
+    max_fronts: Optional[int] = None,
+    backend: str = "auto",
+    workers: Optional[int] = None,
+) -> List[np.ndarray]:
+    """
+    비지배 정렬 (모든 목적 최대화)
+
+    모든 백엔드는 동일한 결과를 반환
+
+    Args:
+        objectives: (N, M) 목적 함수 행렬
+        max_fronts: 계산할 최대 프론트 수 (None이면 전체)
+        backend: "auto", "python", "numpy", "parallel"
+        workers: parallel 백엔드 프로세스 수 (None이면 CPU 수)
+
+    Returns:
+        프론트별 원본 행 인덱스 배열 (각 배열은 오름차순)
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    n = objectives.shape[0]
+    backend = resolve_backend(backend, n, max_fronts)
+    if n == 0 or (max_fronts is not None and max_fronts <= 0):
+        return []
+
+    if backend == "python":
+        return _python_fronts(objectives, max_fronts)
+    if backend == "parallel":
+        return _parallel_fronts(objectives, max_fronts, workers)
+    return _numpy_fronts(objectives, max_fronts)
+
+
+def _python_fronts(
+    objectives: np.ndarray, max_fronts: Optional[int]
+) -> List[np.ndarray]:
+    """순수 Python 참조 구현 (Deb fast non-dominated sort, O(M N^2))"""
+    points = [tuple(row) for row in objectives.tolist()]
+    n = len(points)
+    limit = n if max_fronts is None else max_fronts
+
+    dominates: List[List[int]] = [[] for _ in range(n)]
+    dominated_count = [0] * n
+    for p in range(n):
+        for q in range(p + 1, n):
+            if _dominates_point(points[p], points[q]):
+                dominates[p].append(q)
+                dominated_count[q] += 1
+            elif _dominates_point(points[q], points[p]):
+                dominates[q].append(p)
+                dominated_count[p] += 1
+
+    fronts = []
+    current = [p for p in range(n) if dominated_count[p] == 0]
+    while current and len(fronts) < limit:
+        fronts.append(np.array(sorted(current), dtype=np.intp))
+        next_front = []
+        for p in current:
+            for q in dominates[p]:
+                dominated_count[q] -= 1
+                if dominated_count[q] == 0:
+                    next_front.append(q)
+        current = next_front
+    return fronts
+
+
+def _dominates_point(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """a가 b를 지배: 모든 목적 a >= b, 적어도 하나 a > b"""
+    better = False
+    for a_val, b_val in zip(a, b):
+        if a_val < b_val:
+            return False
+        if a_val > b_val:
+            better = True
+    return better
+
+
+def _parallel_fronts(
+    objectives: np.ndarray, max_fronts: Optional[int], workers: Optional[int]
+) -> List[np.ndarray]:
+    """
+    청크 병렬 비지배 정렬
+
+    전역 rank < K인 점은 자기 청크 안에서도 rank < K (지배 사슬은 부분집합에서 짧아질 뿐)
+    이고 그 지배자들도 전역 rank < K 이므로, 청크별 상위 K 프론트의 합집합만
+    다시 정렬하면 전역 상위 K 프론트와 정확히 일치
+    """
+    n = objectives.shape[0]
+    workers = workers or os.cpu_count() or 1
+    chunk = max(_PARALLEL_MIN_CHUNK, -(-n // workers))
+
+    # 전체 프론트는 청크 축소가 불가능 (모든 점이 살아남음)
+    if max_fronts is None or workers <= 1 or chunk >= n:
+        return _numpy_fronts(objectives, max_fronts)
+
+    starts = list(range(0, n, chunk))
+    with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+        survivors = list(
+            pool.map(
+                _chunk_survivors,
+                [objectives[start : start + chunk] for start in starts],
+                repeat(max_fronts),
+            )
+        )
+
+    # 청크 순서대로 이어붙이므로 keep은 오름차순 → 프론트 인덱스도 오름차순 유지
+    keep = np.concatenate(
+        [local + start for local, start in zip(survivors, starts)]
+    )
+    logger.info(
+        "pareto_parallel_reduced",
+        candidates=n,
+        chunks=len(starts),
+        survivors=int(keep.size),
+    )
+    return [keep[front] for front in _numpy_fronts(objectives[keep], max_fronts)]
+
+
+def _chunk_survivors(chunk: np.ndarray, max_fronts: int) -> np.ndarray:
+    """청크 내 상위 max_fronts 프론트 멤버의 로컬 인덱스 (오름차순)"""
+    return np.sort(np.concatenate(_numpy_fronts(chunk, max_fronts)))
+
+
+def _numpy_fronts(
+    objectives: np.ndarray, max_fronts: Optional[int]
+) -> List[np.ndarray]:
+    """
+    NumPy 비지배 정렬
+
+    1. 동일 목적 벡터 병합 (np.unique) - 동일 벡터는 서로 지배하지 않으므로 같은 프론트
+    2. (합계, 사전식) 내림차순 정렬 - 지배하는 점은 항상 앞에 위치 (O(N log N))
+    3. 블록 단위 1회 스윕: rank(p) = 1 + max(rank(q) | q가 p를 지배)
+       - 이전 블록: kd-tree 지배 영역 질의 (프론트 크기와 무관하게 노드 가지치기)
+       - 블록 내부: 지배 행렬 위 rank 전파
+       - max_fronts 이상 rank는 즉시 제외 (조기 종료)
+    """
+    n = objectives.shape[0]
+    limit = n if max_fronts is None else max_fronts
+
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # lexsort는 마지막 키가 1순위: 합계 → 1번째 목적 → 2번째 목적 ...
+    sort_keys = tuple(unique[:, j] for j in reversed(range(unique.shape[1])))
+    order = np.lexsort(sort_keys + (unique.sum(axis=1),))[::-1]
+
+    # 목적별 연속 메모리 (M, U) - 비교를 열 단위로 수행
+    columns = np.ascontiguousarray(unique[order].T)
+    sorted_rank = _rank_sorted_points(columns, limit)
+
+    unique_rank = np.empty_like(sorted_rank)
+    unique_rank[order] = sorted_rank
+    rank = unique_rank[inverse]
+
+    fronts = []
+    for k in range(limit):
+        members = np.flatnonzero(rank == k)
+        if members.size == 0:
+            break
+        fronts.append(members)
+    return fronts
+
+
+def _rank_sorted_points(columns: np.ndarray, limit: int) -> np.ndarray:
+    """
+    정렬된 고유 점들의 프론트 rank 계산 (limit 이상은 limit)
+
+    Args:
+        columns: (M, U) 목적 행렬, 지배하는 점이 앞에 오도록 정렬된 고유 점
+        limit: rank 상한 (max_fronts)
+    """
+    n = columns.shape[1]
+    rank = np.full(n, limit, dtype=np.intp)
+    tree = _DominanceTree(columns)
+
+    for start in range(0, n, _SORT_BLOCK):
+        block = columns[:, start : start + _SORT_BLOCK]
+
+        # 이전 블록에 의한 하한: rank가 확정된 지배자 중 최대 rank + 1
+        base = np.minimum(tree.max_dominator_rank(block, limit) + 1, limit)
+
+        live = np.flatnonzero(base < limit)
+        if live.size == 0:
+            continue
+
+        # 블록 내부 지배 관계 (고유 점이므로 >= 전체 = 지배, 자기 자신 제외)
+        points = block[:, live]
+        dominates = _all_greater_equal(points, points)
+        np.fill_diagonal(dominates, False)
+
+        block_rank = base[live]
+        while True:
+            propagated = np.where(dominates, (block_rank + 1)[:, None], 0).max(axis=0)
+            updated = np.minimum(np.maximum(block_rank, propagated), limit)
+            if np.array_equal(updated, block_rank):
+                break
+            block_rank = updated
+
+        rank[start + live] = block_rank
+        kept = block_rank < limit
+        tree.insert(start + live[kept], block_rank[kept])
+
+    return rank
+
+
+class _DominanceTree:
+    """
+    정렬된 고유 점 전체에 대한 정적 kd-tree (rank가 확정된 점만 질의 대상)
+
+    노드별로 삽입된 점의 최대 rank와 경계 상자(삽입된 점 기준)를 유지하므로
+    질의는 p 이상 영역과 겹치면서 더 큰 rank를 가진 노드로만 내려감.
+    하나의 큰 프론트에서도 점마다 이전 멤버 전체와 비교하지 않음
+    """
+
+    def __init__(self, columns: np.ndarray):
+        m, n = columns.shape
+        self.depth = max(0, int(np.ceil(np.log2(max(1.0, n / _TREE_LEAF)))))
+        self.leaves = 1 << self.depth
+
+        # 레벨별로 각 노드 구간을 폭이 가장 넓은 목적 기준으로 반분
+        positions = np.empty((m, n), dtype=np.int64)
+        for j in range(m):
+            positions[j, np.argsort(columns[j], kind="stable")] = np.arange(n)
+        perm = np.arange(n)
+        for level in range(self.depth):
+            bounds = (np.arange((1 << level) + 1) * n) >> level
+            node = np.repeat(np.arange(1 << level, dtype=np.int64), np.diff(bounds))
+            points = columns[:, perm]
+            spread = np.maximum.reduceat(points, bounds[:-1], axis=1)
+            spread -= np.minimum.reduceat(points, bounds[:-1], axis=1)
+            axis = np.argmax(spread, axis=0)[node]
+            perm = perm[np.argsort(node * n + positions[axis, perm])]
+
+        # 리프별 점 (빈 칸은 -inf = 어떤 점도 지배하지 않음)
+        bounds = (np.arange(self.leaves + 1) * n) >> self.depth
+        sizes = np.diff(bounds)
+        width = int(sizes.max())
+        leaf = np.repeat(np.arange(self.leaves), sizes)
+        slot = np.arange(n) - bounds[:-1][leaf]
+        self.leaf_points = np.full((m, self.leaves, width), -np.inf)
+        self.leaf_points[:, leaf, slot] = columns[:, perm]
+        self.leaf_rank = np.full((self.leaves, width), -1, dtype=np.intp)
+        self.leaf_of = np.empty(n, dtype=np.intp)
+        self.slot_of = np.empty(n, dtype=np.intp)
+        self.leaf_of[perm] = leaf
+        self.slot_of[perm] = slot
+
+        # 힙 인덱스 노드 (루트 1, 리프 leaves ~ 2 * leaves - 1)
+        self.columns = columns
+        self.rank = np.full(2 * self.leaves, -1, dtype=np.intp)
+        self.lower = np.full((m, 2 * self.leaves), np.inf)
+        self.upper = np.full((m, 2 * self.leaves), -np.inf)
+
+    def insert(self, ids: np.ndarray, ranks: np.ndarray) -> None:
+        """rank 확정된 점 반영 (리프 → 루트 경로의 최대 rank / 경계 상자 갱신)"""
+        leaf = self.leaf_of[ids]
+        self.leaf_rank[leaf, self.slot_of[ids]] = ranks
+        points = self.columns[:, ids]
+        node = leaf + self.leaves
+        for _ in range(self.depth + 1):
+            np.maximum.at(self.rank, node, ranks)
+            for j in range(points.shape[0]):
+                np.minimum.at(self.lower[j], node, points[j])
+                np.maximum.at(self.upper[j], node, points[j])
+            node >>= 1
+
+    def max_dominator_rank(self, block: np.ndarray, limit: int) -> np.ndarray:
+        """
+        블록 점별 삽입된 지배자의 최대 rank (없으면 -1, limit - 1 발견 시 조기 종료)
+
+        Args:
+            block: (M, B) 아직 삽입되지 않은 점
+            limit: rank 상한 (max_fronts)
+        """
+        m, size = block.shape
+        best = np.full(size, -1, dtype=np.intp)
+        query = np.arange(size)
+        node = np.ones(size, dtype=np.intp)
+
+        for level in range(self.depth + 1):
+            # 더 큰 rank가 없거나 p 이상 영역과 겹치지 않는 노드 제외
+            keep = self.rank[node] > best[query]
+            for j in range(m):
+                keep &= self.upper[j][node] >= block[j][query]
+            query, node = query[keep], node[keep]
+            if query.size == 0:
+                break
+
+            if level == self.depth:
+                leaf = node - self.leaves
+                hit = self.leaf_points[0][leaf] >= block[0][query][:, None]
+                for j in range(1, m):
+                    hit &= self.leaf_points[j][leaf] >= block[j][query][:, None]
+                found = np.where(hit, self.leaf_rank[leaf], -1).max(axis=1)
+                np.maximum.at(best, query, found)
+                break
+
+            # 노드의 모든 점이 p를 지배하면 노드 최대 rank로 확정
+            inside = self.lower[0][node] >= block[0][query]
+            for j in range(1, m):
+                inside &= self.lower[j][node] >= block[j][query]
+            np.maximum.at(best, query[inside], self.rank[node[inside]])
+
+            keep = ~inside
+            keep[keep] = best[query[keep]] < limit - 1
+            query = np.repeat(query[keep], 2)
+            node = np.repeat(node[keep] * 2, 2)
+            node[1::2] += 1
+
+        return best
+
+
+def _all_greater_equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(M, A), (M, B) → (A, B): 모든 목적에서 a_i >= b_j"""
+    result = a[0][:, None] >= b[0][None, :]
+    for j in range(1, a.shape[0]):
+        result &= a[j][:, None] >= b[j][None, :]
+    return result
+
+
+# ============================================================
+# 혼잡도 거리 (NumPy)
+# ============================================================
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """
+    혼잡도 거리 (NSGA-II)
+
+    목적별 안정 argsort 후 양 끝은 무한대, 중간은 (다음 - 이전) / (max - min) 누적.
+    목적 순서대로 누적하므로 기존 dict 기반 구현과 동일한 값
+
+    Args:
+        points: (n, M) 한 프론트의 목적 함수 행렬
+
+    Returns:
+        (n,) 혼잡도 거리
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = points.shape[0]
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    distances = np.zeros(n)
+    obj_min = points.min(axis=0)
+    obj_max = points.max(axis=0)
+    obj_range = np.where(obj_max != obj_min, obj_max - obj_min, 1.0)
+
+    for j in range(points.shape[1]):
+        column = points[:, j]
+        order = np.argsort(column, kind="stable")
+        sorted_values = column[order]
+
+        distances[order[0]] = np.inf
+        distances[order[-1]] = np.inf
+        distances[order[1:-1]] += (sorted_values[2:] - sorted_values[:-2]) / obj_range[j]
+
+    return distances
+
+
 # 편의 함수
 def calculate_pareto_fronts(
-    candidates: List[Dict[str, Any]], objectives: List[str] = None, max_fronts: int = 5
+    candidates: List[Dict[str, Any]],
+    objectives: List[str] = None,
+    max_fronts: int = 5,
+    backend: str = "auto",
 ) -> List[ParetoFront]:
     """파레토 프론트 계산 편의 함수"""
-    calculator = ParetoCalculator(objectives)
+    calculator = ParetoCalculator(objectives, backend=backend)
     return calculator.calculate(candidates, max_fronts)
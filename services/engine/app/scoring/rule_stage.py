@@ -0,0 +1,308 @@
+"""
+Rule Stage
+Design Run 배치 룰 적용 단계 (스코어링 ↔ 저장/파레토 사이)
+
+RuleSet을 1회 컴파일해 인덱스 배치 단위로 벡터 평가:
+1. prescreen(): 컴포넌트 피처만 참조하는 hard_reject 룰을 스코어링 전에 적용
+   → 리젝트 후보는 스코어링/저장하지 않음
+2. apply(): 스코어 포함 전체 피처로 룰셋 평가
+   → reject 제외, penalty를 Fit에 반영, alert/require_protocol 기록
+
+리젝트/적중 건수는 GeneratorStats에 누적 (candidate_reject_summaries 저장용)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+import structlog
+
+from app.rules import ActionType, FeatureColumns, RuleEngine, RuleSet
+
+from .engine import BatchScoreArrays, ComponentTerms
+from .generator import CandidateIndexBatch, GeneratorStats
+
+logger = structlog.get_logger()
+
+# 스코어링 전에 컴포넌트 단위로 알 수 있는 피처
+COMPONENT_FIELDS = frozenset(
+    {
+        "DAR",
+        "LogP",
+        "H_patch",
+        "molecular_weight",
+        "OOT",
+        "CLV",
+        "INT",
+        "payload_class",
+        "linker_type",
+        "conjugation_site",
+        "critical_tissue_expression",
+        "clinical_failure_count",
+    }
+)
+
+# penalty action.target → objective 열 (eng, bio, safety, evidence)
+PENALTY_TARGETS = {"EngFit": 0, "BioFit": 1, "SafetyFit": 2, "EvidenceFit": 3}
+
+
+@dataclass
+class RuleStageBatch:
+    """룰 적용 결과 (apply 입력 배치 기준)"""
+
+    keep: np.ndarray  # (n,) 저장/파레토 대상 여부
+    objectives: np.ndarray  # (n, 4) penalty 반영 Fit
+    rule_components: List[Optional[Dict[str, Any]]]  # 적중 후보만 dict
+
+
+class RuleStage:
+    """
+    배치 룰 적용기 (샤드 실행기당 1개)
+
+    사용:
+        stage = RuleStage(ruleset, targets, linkers, payloads, conjugations, terms)
+        index_batch = stage.prescreen(index_batch, stats)
+        scores = engine.score_indices(terms, ...)
+        outcome = stage.apply(index_batch, scores, stats)
+    """
+
+    def __init__(
+        self,
+        ruleset: RuleSet,
+        targets: List[Dict[str, Any]],
+        linkers: List[Dict[str, Any]],
+        payloads: List[Dict[str, Any]],
+        conjugations: List[Dict[str, Any]],
+        terms: ComponentTerms,
+        stop_on_hard_reject: bool = True,
+    ):
+        """
+        Args:
+            ruleset: 적용할 룰셋
+            targets/linkers/payloads/conjugations: 제너레이터 컴포넌트 목록 (인덱스 축)
+            terms: BatchScoringEngine.precompute_components() 결과 (INT/OOT/CLV 재사용)
+            stop_on_hard_reject: RuleEngine과 동일한 hard_reject 중단 정책
+        """
+        self.ruleset = ruleset
+        self.engine = RuleEngine(ruleset=ruleset, stop_on_hard_reject=stop_on_hard_reject)
+        self.compiled = self.engine.compile()
+        self.logger = logger.bind(service="rule_stage", ruleset=ruleset.version)
+
+        # 컴포넌트 축별 피처 (카탈로그 항목당 1회)
+        self._component_features = {
+            "target": {
+                "INT": terms.target["INT"],
+                "OOT": terms.target["OOT"],
+                "critical_tissue_expression": _column(
+                    [bool(t.get("critical_tissue_expression")) for t in targets]
+                ),
+                "clinical_failure_count": _object_column(
+                    targets, "clinical_failure_count", 0
+                ),
+            },
+            "linker": {
+                "CLV": terms.linker["CLV"],
+                "linker_type": _object_column(linkers, "linker_type", ""),
+            },
+            "payload": {
+                "LogP": _column(
+                    [
+                        p.get("logP", _fallback_logp(p.get("molecular_weight", 0)))
+                        for p in payloads
+                    ]
+                ),
+                "H_patch": _object_column(payloads, "hydrophobic_patch", 0),
+                "molecular_weight": _object_column(payloads, "molecular_weight", 0),
+                "payload_class": _object_column(payloads, "payload_class", ""),
+            },
+            "conjugation": {
+                "DAR": _column([(c or {}).get("DAR", 4.0) for c in conjugations]),
+                "conjugation_site": _object_column(
+                    [c or {} for c in conjugations], "conjugation_site", ""
+                ),
+            },
+        }
+
+        # prescreen 대상: 컴포넌트 피처만 쓰는 hard_reject 중
+        # 스코어 의존 reject 룰보다 앞선 룰 (리젝트 사유가 전체 평가와 동일하도록)
+        self._prescreen: List[int] = []
+        if stop_on_hard_reject:
+            for j, compiled in enumerate(self.compiled.rules):
+                action = compiled.rule.action.type
+                if action not in (ActionType.HARD_REJECT, ActionType.SOFT_REJECT):
+                    continue
+                if not set(compiled.condition.fields) <= COMPONENT_FIELDS:
+                    break
+                if action == ActionType.HARD_REJECT:
+                    self._prescreen.append(j)
+
+        self._penalty_cols = [
+            (j, PENALTY_TARGETS.get(compiled.rule.action.target, 0))
+            for j, compiled in enumerate(self.compiled.rules)
+            if compiled.rule.action.type == ActionType.PENALTY
+        ]
+
+        self.logger.debug(
+            "rule_stage_compiled",
+            rules=len(self.compiled),
+            prescreen_rules=[self.compiled.rules[j].rule.id for j in self._prescreen],
+        )
+
+    def prescreen(
+        self, index_batch: CandidateIndexBatch, stats: GeneratorStats
+    ) -> CandidateIndexBatch:
+        """컴포넌트 단위 hard_reject 적용 (스코어링 전)"""
+        if not self._prescreen or len(index_batch) == 0:
+            return index_batch
+
+        columns = self._columns(index_batch)
+        masks = np.column_stack(
+            [self.compiled.rules[j].condition.mask(columns) for j in self._prescreen]
+        )
+        rejected = masks.any(axis=1)
+        if not rejected.any():
+            return index_batch
+
+        # 첫 적중 hard_reject가 리젝트 사유 (evaluate_candidate와 동일)
+        first = np.argmax(masks[rejected], axis=1)
+        self._record_rejects(
+            stats, np.asarray(self._prescreen)[first], int(rejected.sum())
+        )
+        return index_batch.take(~rejected)
+
+    def apply(
+        self,
+        index_batch: CandidateIndexBatch,
+        scores: BatchScoreArrays,
+        stats: GeneratorStats,
+    ) -> RuleStageBatch:
+        """스코어 포함 전체 룰 평가 → reject/penalty/alert/protocol"""
+        columns = self._columns(index_batch, scores)
+        batch = self.compiled.evaluate_columns(
+            columns, stop_on_hard_reject=self.engine.stop_on_hard_reject
+        )
+
+        keep = ~batch.rejected
+        if batch.rejected.any():
+            self._record_rejects(
+                stats, batch.reject_rule[batch.rejected], int(batch.rejected.sum())
+            )
+
+        objectives = scores.objective_matrix()
+        if self._penalty_cols:
+            penalties = np.zeros_like(objectives)
+            for j, col in self._penalty_cols:
+                hit = batch.hits[:, j]
+                delta = self.compiled.rules[j].rule.action.value
+                if self.ruleset.penalty_policy == "sum":
+                    penalties[hit, col] += delta
+                else:  # "max"
+                    penalties[hit, col] = np.maximum(penalties[hit, col], delta)
+            objectives = np.where(
+                penalties != 0, np.fmax(0.0, objectives - penalties), objectives
+            )
+
+        # 저장 후보의 룰별 적중 건수 (reject 룰은 리젝트 건수로 별도 집계)
+        kept_hits = batch.hits[keep].sum(axis=0).tolist()
+        for compiled, count in zip(self.compiled.rules, kept_hits):
+            if count and compiled.rule.action.type not in (
+                ActionType.HARD_REJECT,
+                ActionType.SOFT_REJECT,
+            ):
+                stats.add_rule_hit(compiled.rule.id, compiled.rule.action.message, count)
+
+        rule_components: List[Optional[Dict[str, Any]]] = [None] * len(index_batch)
+        for i in np.flatnonzero(keep & batch.hits.any(axis=1)).tolist():
+            rule_components[i] = self._describe(batch.hits[i])
+
+        return RuleStageBatch(
+            keep=keep, objectives=objectives, rule_components=rule_components
+        )
+
+    def _columns(
+        self, index_batch: CandidateIndexBatch, scores: BatchScoreArrays = None
+    ) -> FeatureColumns:
+        indices = {
+            "target": index_batch.target_idx,
+            "linker": index_batch.linker_idx,
+            "payload": index_batch.payload_idx,
+            "conjugation": index_batch.conjugation_idx,
+        }
+        values = {
+            name: column[indices[role]].tolist()
+            for role, features in self._component_features.items()
+            for name, column in features.items()
+        }
+
+        if scores is not None:
+            values.update(
+                {
+                    "AggRisk": scores.terms["AggRisk"].tolist(),
+                    "ProcRisk": scores.terms["ProcRisk"].tolist(),
+                    "AnalRisk": scores.terms["AnalRisk"].tolist(),
+                    "BioRisk": scores.bio_risk.tolist(),
+                    "SafetyRisk": scores.safety_risk.tolist(),
+                    "eng_fit": scores.eng_fit.tolist(),
+                    "bio_fit": scores.bio_fit.tolist(),
+                    "safety_fit": scores.safety_fit.tolist(),
+                }
+            )
+
+        return FeatureColumns(values, len(index_batch))
+
+    def _record_rejects(
+        self, stats: GeneratorStats, rule_cols: np.ndarray, total: int
+    ) -> None:
+        cols, counts = np.unique(rule_cols, return_counts=True)
+        for j, count in zip(cols.tolist(), counts.tolist()):
+            rule = self.compiled.rules[j].rule
+            stats.add_reject(rule.id, rule.action.message, count=count)
+        stats.accepted -= total
+
+    def _describe(self, hits: np.ndarray) -> Dict[str, Any]:
+        """적중 룰 요약 (score_components["rules"])"""
+        penalties: Dict[str, float] = {}
+        alerts: List[str] = []
+        protocols: List[str] = []
+
+        for j in np.flatnonzero(hits).tolist():
+            action = self.compiled.rules[j].rule.action
+            rule_id = self.compiled.rules[j].rule.id
+            if action.type == ActionType.PENALTY:
+                penalties[rule_id] = action.value
+            elif action.type == ActionType.ALERT:
+                alerts.append(rule_id)
+            elif action.type == ActionType.REQUIRE_PROTOCOL and action.template_id:
+                if action.template_id not in protocols:
+                    protocols.append(action.template_id)
+
+        return {
+            "ruleset_version": self.ruleset.version,
+            "penalties": penalties,
+            "alerts": alerts,
+            "required_protocols": protocols,
+        }
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """값 목록 → 1차원 object 배열 (리스트 값도 원소 그대로 보관)"""
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+def _object_column(
+    components: List[Dict[str, Any]], key: str, default: Any
+) -> np.ndarray:
+    """컴포넌트 목록의 필드 → object 배열 (None은 기본값)"""
+    return _column(
+        [default if c.get(key) is None else c.get(key) for c in components]
+    )
+
+
+def _fallback_logp(molecular_weight: Any) -> Any:
+    """스코어링과 동일한 logP 대체값 (molecular_weight / 100)"""
+    try:
+        return molecular_weight / 100
+    except TypeError:
+        return None
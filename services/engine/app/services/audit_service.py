@@ -13,6 +13,8 @@ from typing import Dict, Any
 from datetime import datetime
 import structlog
 
+from app.core.database import execute_nonblocking
+
 logger = structlog.get_logger()
 
 
@@ -160,9 +162,10 @@ class AuditService:
     async def _write_to_db(self, event_record: Dict[str, Any]):
         """DB에 이벤트 기록"""
         if hasattr(self.db, "table"):
-            # Supabase 클라이언트
-            result = self.db.table("audit_events").insert(event_record).execute()
-            return result
+            # Supabase 클라이언트 (동기/비동기 겸용)
+            return await execute_nonblocking(
+                self.db.table("audit_events").insert(event_record)
+            )
         # 다른 DB 클라이언트 지원 시 추가
 
     def log_event_sync(
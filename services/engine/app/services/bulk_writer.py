@@ -0,0 +1,335 @@
+"""
+Candidate Bulk Writer
+Design Run 후보(candidates) + 스코어(candidate_scores) 대량 저장
+
+- 청크 크기는 행 수가 아닌 직렬화 바이트 예산 기준 (snapshot_refs/score_components 크기 편차 흡수)
+- 청크 단위 동시 업로드 (최대 concurrency개) → 스코어링과 파이프라인
+  AsyncClient면 공유 커넥션 풀로 이벤트 루프에서 직접, 동기 Client면 스레드에서 업로드
+- 청크 단위 재시도: PK 기준 upsert라 부분 성공 후 재전송해도 중복 없음
+- DSN이 있으면 Postgres COPY 경로 (청크 = 트랜잭션 1개, 실패 시 롤백 후 재시도)
+  임시 테이블로 COPY 후 INSERT ... ON CONFLICT (id) DO NOTHING
+  → 커밋 응답 유실 후 재시도해도 PK 중복 없음
+  psycopg2 미설치/연결 실패 시 PostgREST 경로로 대체
+
+candidate_scores는 candidates FK를 참조하므로 같은 청크 안에서 후보 → 스코어 순서로 저장
+"""
+
+import asyncio
+import csv
+import io
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+import structlog
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
+
+from app.core.database import is_async_client
+
+logger = structlog.get_logger()
+
+CANDIDATE_TABLE = "candidates"
+SCORE_TABLE = "candidate_scores"
+
+# COPY CSV의 NULL 표기
+_COPY_NULL = "\\N"
+
+
+@dataclass
+class WriteChunk:
+    """업로드 단위 (candidates[i] ↔ scores[i] 대응)"""
+
+    index: int
+    candidates: List[Dict[str, Any]]
+    scores: List[Dict[str, Any]]
+    nbytes: int = 0
+
+
+@dataclass
+class WriteStats:
+    """누적 저장 통계"""
+
+    rows: int = 0
+    chunks: int = 0
+    bytes: int = 0
+    retries: int = 0
+    copy_chunks: int = 0
+
+
+class CandidateBulkWriter:
+    """
+    후보/스코어 대량 저장기 (Run당 1개)
+
+    사용:
+        async with CandidateBulkWriter(db, dsn=os.getenv("DATABASE_URL")) as writer:
+            await writer.write(candidate_records, score_records)  # 업로드 예약 (비차단)
+            await writer.flush()  # 체크포인트 전: 예약된 청크 저장 완료까지 대기
+
+    - write(): 바이트 예산으로 청크 분할 후 업로드 태스크 예약.
+      진행 중 청크가 concurrency * 2개 이상이면 빈자리가 날 때까지 대기 (메모리 상한)
+    - 청크가 재시도 후에도 실패하면 다음 write()/flush()에서 예외 전파
+    """
+
+    DEFAULT_CHUNK_BYTES = 1_000_000
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_WAIT = wait_exponential(multiplier=0.5, min=0.5, max=8)
+
+    def __init__(
+        self,
+        db_client,
+        dsn: Optional[str] = None,
+        chunk_bytes: int = None,
+        concurrency: int = None,
+        max_retries: int = None,
+    ):
+        """
+        Args:
+            db_client: Supabase 클라이언트 (PostgREST 경로, 동기/비동기)
+            dsn: Postgres 접속 문자열 (있으면 COPY 경로)
+            chunk_bytes: 청크당 직렬화 바이트 예산 (최소 1행)
+            concurrency: 동시 업로드 청크 수 (COPY 경로는 연결 1개로 순차)
+            max_retries: 청크당 최대 시도 횟수
+        """
+        self.db = db_client
+        self.dsn = dsn
+        self.chunk_bytes = max(1, chunk_bytes or self.DEFAULT_CHUNK_BYTES)
+        self.concurrency = max(1, concurrency or self.DEFAULT_CONCURRENCY)
+        self.max_retries = max(1, max_retries or self.DEFAULT_MAX_RETRIES)
+        self.stats = WriteStats()
+        self.logger = logger.bind(service="bulk_writer")
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._pending: Set[asyncio.Task] = set()
+        self._error: Optional[BaseException] = None
+        self._next_chunk = 0
+
+        self._copy_lock = threading.Lock()
+        self._copy_conn = None
+        self._copy_enabled = bool(dsn)
+
+    async def __aenter__(self) -> "CandidateBulkWriter":
+        return self
+
+    async def __aexit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            await self.flush()
+        await self.close()
+
+    async def write(
+        self, candidates: List[Dict[str, Any]], scores: List[Dict[str, Any]]
+    ) -> None:
+        """
+        후보/스코어 레코드 업로드 예약
+
+        Args:
+            candidates: candidates 레코드 (id 포함)
+            scores: candidate_scores 레코드 (id 포함, candidates와 같은 순서)
+        """
+        self._raise_error()
+        for chunk in self._chunks(candidates, scores):
+            while len(self._pending) >= self.concurrency * 2:
+                await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+                self._raise_error()
+
+            task = asyncio.create_task(self._upload(chunk))
+            self._pending.add(task)
+            task.add_done_callback(self._on_done)
+
+    async def flush(self) -> None:
+        """예약된 청크 저장 완료까지 대기 (실패 청크가 있으면 예외)"""
+        if self._pending:
+            await asyncio.wait(set(self._pending))
+        self._raise_error()
+
+    async def close(self) -> None:
+        """미완료 업로드 취소 + COPY 연결 종료"""
+        for task in list(self._pending):
+            task.cancel()
+        if self._pending:
+            await asyncio.wait(set(self._pending))
+        if self._copy_conn is not None:
+            await asyncio.to_thread(self._copy_conn.close)
+            self._copy_conn = None
+
+    def _chunks(
+        self, candidates: List[Dict[str, Any]], scores: List[Dict[str, Any]]
+    ) -> List[WriteChunk]:
+        """바이트 예산 기준 청크 분할 (후보-스코어 쌍은 같은 청크)"""
+        chunks: List[WriteChunk] = []
+        current = WriteChunk(index=self._next_chunk, candidates=[], scores=[])
+
+        for candidate, score in zip(candidates, scores):
+            size = _json_size(candidate) + _json_size(score)
+            if current.candidates and current.nbytes + size > self.chunk_bytes:
+                chunks.append(current)
+                self._next_chunk += 1
+                current = WriteChunk(index=self._next_chunk, candidates=[], scores=[])
+            current.candidates.append(candidate)
+            current.scores.append(score)
+            current.nbytes += size
+
+        if current.candidates:
+            chunks.append(current)
+            self._next_chunk += 1
+        return chunks
+
+    async def _upload(self, chunk: WriteChunk) -> None:
+        async with self._semaphore:
+            if is_async_client(self.db):
+                await self._aupload_with_retry(chunk)
+            else:
+                await asyncio.to_thread(self._upload_with_retry, chunk)
+
+    def _upload_with_retry(self, chunk: WriteChunk) -> None:
+        for attempt in Retrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=self.RETRY_WAIT,
+            reraise=True,
+        ):
+            with attempt:
+                self._on_attempt(chunk, attempt.retry_state.attempt_number)
+                if self._copy_enabled and self._copy_chunk(chunk):
+                    self.stats.copy_chunks += 1
+                else:
+                    self._rest_chunk(chunk)
+
+        self._on_saved(chunk)
+
+    async def _aupload_with_retry(self, chunk: WriteChunk) -> None:
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=self.RETRY_WAIT,
+            reraise=True,
+        ):
+            with attempt:
+                self._on_attempt(chunk, attempt.retry_state.attempt_number)
+                if self._copy_enabled and await asyncio.to_thread(
+                    self._copy_chunk, chunk
+                ):
+                    self.stats.copy_chunks += 1
+                else:
+                    await self._arest_chunk(chunk)
+
+        self._on_saved(chunk)
+
+    def _on_attempt(self, chunk: WriteChunk, attempt_number: int) -> None:
+        if attempt_number > 1:
+            self.stats.retries += 1
+            self.logger.warning(
+                "chunk_retry", chunk=chunk.index, attempt=attempt_number
+            )
+
+    def _on_saved(self, chunk: WriteChunk) -> None:
+        self.stats.rows += len(chunk.candidates)
+        self.stats.chunks += 1
+        self.stats.bytes += chunk.nbytes
+
+    def _rest_chunk(self, chunk: WriteChunk) -> None:
+        """PostgREST upsert (PK 기준, 재전송 안전)"""
+        self.db.table(CANDIDATE_TABLE).upsert(chunk.candidates).execute()
+        self.db.table(SCORE_TABLE).upsert(chunk.scores).execute()
+
+    async def _arest_chunk(self, chunk: WriteChunk) -> None:
+        """_rest_chunk 비동기 버전 (AsyncClient)"""
+        await self.db.table(CANDIDATE_TABLE).upsert(chunk.candidates).execute()
+        await self.db.table(SCORE_TABLE).upsert(chunk.scores).execute()
+
+    def _copy_chunk(self, chunk: WriteChunk) -> bool:
+        """
+        COPY 경로 (청크 = 트랜잭션, 기존 PK 행은 건너뜀)
+
+        Returns:
+            False면 COPY 사용 불가 → PostgREST 경로로 대체
+        """
+        with self._copy_lock:
+            conn = self._copy_connection()
+            if conn is None:
+                return False
+            try:
+                with conn.cursor() as cursor:
+                    _copy_rows(cursor, CANDIDATE_TABLE, chunk.candidates)
+                    _copy_rows(cursor, SCORE_TABLE, chunk.scores)
+                conn.commit()
+            except Exception:
+                # 끊긴 연결은 다음 시도에서 재연결
+                if conn.closed:
+                    self._copy_conn = None
+                else:
+                    conn.rollback()
+                raise
+        return True
+
+    def _copy_connection(self):
+        if self._copy_conn is not None:
+            return self._copy_conn
+        try:
+            import psycopg2
+
+            self._copy_conn = psycopg2.connect(self.dsn)
+        except ImportError:
+            self.logger.warning(
+                "copy_unavailable",
+                message="psycopg2 not installed, falling back to PostgREST",
+            )
+            self._copy_enabled = False
+        except Exception as e:
+            self.logger.warning("copy_connect_failed", error=str(e))
+            self._copy_enabled = False
+        return self._copy_conn
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self._error is None:
+            self._error = error
+            self.logger.error("chunk_failed", error=str(error))
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+def _json_size(record: Dict[str, Any]) -> int:
+    return len(json.dumps(record, separators=(",", ":"), default=str))
+
+
+def _copy_rows(cursor, table: str, rows: List[Dict[str, Any]]) -> None:
+    """레코드 목록 → 임시 테이블 COPY FROM STDIN (CSV, dict/list는 JSON) → 병합"""
+    if not rows:
+        return
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column)) for column in columns])
+    buffer.seek(0)
+
+    # 임시 테이블은 커밋 시 삭제, 롤백 시 생성 자체가 취소
+    staging = f"_bulk_{table}"
+    column_list = ", ".join(columns)
+    cursor.execute(
+        f"CREATE TEMP TABLE {staging} (LIKE public.{table} INCLUDING DEFAULTS) "
+        "ON COMMIT DROP"
+    )
+    cursor.copy_expert(
+        f"COPY {staging} ({column_list}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+        buffer,
+    )
+    cursor.execute(
+        f"INSERT INTO public.{table} ({column_list}) "
+        f"SELECT {column_list} FROM {staging} "
+        "ON CONFLICT (id) DO NOTHING"
+    )
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
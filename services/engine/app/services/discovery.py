@@ -14,6 +14,8 @@ from enum import Enum
 import structlog
 import re
 
+from app.core.database import execute_nonblocking
+
 logger = structlog.get_logger()
 
 
@@ -171,9 +173,9 @@ class SynonymResolver:
             return self._cache[normalized]
         
         try:
-            result = self.db.table("synonym_map").select(
+            result = await execute_nonblocking(self.db.table("synonym_map").select(
                 "canonical_drug_id"
-            ).eq("synonym_text_normalized", normalized).execute()
+            ).eq("synonym_text_normalized", normalized))
             
             if result.data:
                 canonical_id = result.data[0]["canonical_drug_id"]
@@ -187,9 +189,9 @@ class SynonymResolver:
     async def get_all_synonyms(self, canonical_drug_id: str) -> List[str]:
         """특정 약물의 모든 동의어 조회"""
         try:
-            result = self.db.table("synonym_map").select(
+            result = await execute_nonblocking(self.db.table("synonym_map").select(
                 "synonym_text"
-            ).eq("canonical_drug_id", canonical_drug_id).execute()
+            ).eq("canonical_drug_id", canonical_drug_id))
             
             return [r["synonym_text"] for r in result.data] if result.data else []
         except Exception as e:
@@ -208,14 +210,14 @@ class SynonymResolver:
         normalized = self.normalize_text(synonym_text)
         
         try:
-            self.db.table("synonym_map").upsert({
+            await execute_nonblocking(self.db.table("synonym_map").upsert({
                 "canonical_drug_id": canonical_drug_id,
                 "synonym_text": synonym_text,
                 "synonym_text_normalized": normalized,
                 "source_type": source_type,
                 "source_url": source_url,
                 "confidence": confidence
-            }, on_conflict="synonym_text_normalized").execute()
+            }, on_conflict="synonym_text_normalized"))
             
             # 캐시 업데이트
             self._cache[normalized] = canonical_drug_id
@@ -313,9 +315,11 @@ class DiscoveryService:
         """기존 Golden Seed에 있는지 확인 (동의어 포함)"""
         # 1. 직접 매칭
         try:
-            result = self.db.table("golden_seed_items").select(
-                "id"
-            ).ilike("drug_name_canonical", f"%{drug_name}%").execute()
+            result = await execute_nonblocking(
+                self.db.table("golden_seed_items")
+                .select("id")
+                .ilike("drug_name_canonical", f"%{drug_name}%")
+            )
             
             if result.data:
                 return result.data[0]["id"]
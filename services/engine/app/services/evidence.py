@@ -5,12 +5,17 @@ Forced Evidence 규격 기반 근거 생성
 체크리스트 §4.2, §8.2 기반:
 - Forced Evidence: 인용 없으면 "Assumption" 라벨링
 - Conflict Alert: 찬성/반대 근거 동시 존재 시
+- 하이브리드 검색: 키워드(tsvector) + 벡터(match_literature_chunks) 동시 실행 → RRF 융합
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 import structlog
 
+from app.core.database import execute_nonblocking
+from app.core.embeddings import EmbeddingClient, get_embedding_client
+
 logger = structlog.get_logger()
 
 
@@ -53,9 +58,34 @@ class EvidenceRAGService:
     MIN_CITATIONS = 2  # 최소 인용 수
     CONFLICT_THRESHOLD = 0.3  # Conflict 판단 임계값
 
-    def __init__(self, db_client=None, llm_client=None):
+    # 하이브리드 검색
+    KEYWORD_TOP_K = 20  # 키워드 검색 후보 수
+    VECTOR_TOP_K = 20  # 벡터 검색 후보 수
+    MATCH_THRESHOLD = 0.3  # 벡터 검색 최소 코사인 유사도
+    RRF_K = 60  # Reciprocal Rank Fusion 상수
+
+    # 배치 근거 생성
+    SEARCH_CONCURRENCY = 8  # 동시 검색 쿼리 수
+    SAVE_BATCH = 500  # evidence_signals insert 행 수
+
+    CHUNK_COLUMNS = (
+        "id, document_id, content, polarity, literature_documents(pmid, title)"
+    )
+
+    def __init__(
+        self,
+        db_client=None,
+        llm_client=None,
+        embedding_client: Optional[EmbeddingClient] = None,
+        keyword_top_k: int = None,
+        vector_top_k: int = None,
+    ):
         self.db = db_client
         self.llm = llm_client
+        # 쿼리 임베딩 (공용 클라이언트: 임베딩 캐시 적중 쿼리는 API 호출 없음)
+        self.embedding = embedding_client or get_embedding_client()
+        self.keyword_top_k = keyword_top_k or self.KEYWORD_TOP_K
+        self.vector_top_k = vector_top_k or self.VECTOR_TOP_K
         self.logger = logger.bind(service="evidence_rag")
 
     async def generate_evidence(
@@ -85,53 +115,147 @@ class EvidenceRAGService:
             # 2. 문헌 검색 (하이브리드: 벡터 + 키워드)
             relevant_chunks = await self._search_literature(query, top_k)
 
-            if not relevant_chunks:
-                result.evidence_text = "[Assumption] No literature evidence found."
-                result.is_assumption = True
-                return result
-
-            # 3. Risk-first retrieval: negative polarity 부스팅
-            risk_fields = self._get_high_risk_fields(score_components)
-            if risk_fields:
-                # Negative polarity 청크 우선
-                relevant_chunks = self._boost_negative_polarity(
-                    relevant_chunks, risk_fields
-                )
+            await self._compose_evidence(
+                result, candidate, score_components, relevant_chunks
+            )
 
-            # 4. 인용 추출
-            citations = self._extract_citations(relevant_chunks)
-            result.citations = citations
-            result.has_evidence = len(citations) >= 1
-            result.is_assumption = len(citations) < self.MIN_CITATIONS
+        except Exception as e:
+            self.logger.error("evidence_generation_failed", error=str(e))
+            result.evidence_text = f"[Assumption] Evidence generation failed: {str(e)}"
 
-            # 5. Conflict Alert 체크
-            conflict, reason = self._check_conflict(citations)
-            result.conflict_alert = conflict
-            result.conflict_reason = reason
+        return result
 
-            # 6. 근거 텍스트 생성 (LLM)
-            evidence_text = await self._generate_evidence_text(
-                candidate, citations, result.is_assumption
-            )
-            result.evidence_text = evidence_text
+    async def generate_evidence_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        score_components: Dict[str, Dict[str, Any]],
+        top_k: int = 10,
+    ) -> Dict[str, EvidenceResult]:
+        """
+        후보 배치 근거 생성
 
-            # 7. 신뢰도 점수
-            result.confidence_score = self._calculate_confidence(
-                len(citations), conflict, result.is_assumption
+        검색 쿼리가 같은 후보(같은 target/payload/고위험 항목)끼리 묶어 고유 쿼리당 1회만 검색.
+        쿼리 임베딩은 1회 배치 요청, 검색은 동시 실행 후 후보별 결과로 분배
+
+        Args:
+            candidates: 후보 목록 (id, target, payload, etc.)
+            score_components: 후보 ID → 스코어 컴포넌트
+            top_k: 쿼리당 검색할 문헌 수
+
+        Returns:
+            후보 ID → EvidenceResult
+        """
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            query = self._build_search_query(
+                candidate, score_components.get(candidate["id"]) or {}
             )
+            groups.setdefault(query, []).append(candidate)
+        queries = list(groups)
+
+        # 1. 고유 쿼리 임베딩 (1회 배치 요청, 실패 쿼리는 검색 시 개별 재시도)
+        embeddings: List[Optional[List[float]]] = [None] * len(queries)
+        if self.db and self.embedding is not None and queries:
+            try:
+                embeddings = await self.embedding.embed(queries)
+            except Exception as e:
+                self.logger.warning("query_embedding_batch_failed", error=str(e))
+
+        # 2. 고유 쿼리별 검색 (동시 실행)
+        semaphore = asyncio.Semaphore(self.SEARCH_CONCURRENCY)
+
+        async def search(query: str, embedding: Optional[List[float]]):
+            async with semaphore:
+                return await self._search_literature(query, top_k, embedding)
+
+        searches = await asyncio.gather(
+            *(search(query, emb) for query, emb in zip(queries, embeddings)),
+            return_exceptions=True,
+        )
+
+        # 3. 후보별 근거 구성
+        results: Dict[str, EvidenceResult] = {}
+
+        async def compose(candidate: Dict[str, Any], query: str, chunks) -> None:
+            result = EvidenceResult(claim=query, evidence_text="", is_assumption=True)
+            results[candidate["id"]] = result
+            try:
+                if isinstance(chunks, Exception):
+                    raise chunks
+                await self._compose_evidence(
+                    result,
+                    candidate,
+                    score_components.get(candidate["id"]) or {},
+                    chunks,
+                )
+            except Exception as e:
+                self.logger.error("evidence_generation_failed", error=str(e))
+                result.evidence_text = (
+                    f"[Assumption] Evidence generation failed: {str(e)}"
+                )
 
-            self.logger.info(
-                "evidence_generated",
-                citations=len(citations),
-                has_evidence=result.has_evidence,
-                conflict=result.conflict_alert,
+        await asyncio.gather(
+            *(
+                compose(candidate, query, chunks)
+                for query, chunks in zip(queries, searches)
+                for candidate in groups[query]
             )
+        )
 
-        except Exception as e:
-            self.logger.error("evidence_generation_failed", error=str(e))
-            result.evidence_text = f"[Assumption] Evidence generation failed: {str(e)}"
+        self.logger.info(
+            "evidence_batch_generated", candidates=len(results), queries=len(queries)
+        )
+        return results
 
-        return result
+    async def _compose_evidence(
+        self,
+        result: EvidenceResult,
+        candidate: Dict[str, Any],
+        score_components: Dict[str, Any],
+        relevant_chunks: List[Dict[str, Any]],
+    ) -> None:
+        """검색 결과 → 인용/Conflict/근거 텍스트/신뢰도 (result in-place)"""
+        if not relevant_chunks:
+            result.evidence_text = "[Assumption] No literature evidence found."
+            result.is_assumption = True
+            return
+
+        # 3. Risk-first retrieval: negative polarity 부스팅
+        risk_fields = self._get_high_risk_fields(score_components)
+        if risk_fields:
+            # Negative polarity 청크 우선
+            relevant_chunks = self._boost_negative_polarity(
+                relevant_chunks, risk_fields
+            )
+
+        # 4. 인용 추출
+        citations = self._extract_citations(relevant_chunks)
+        result.citations = citations
+        result.has_evidence = len(citations) >= 1
+        result.is_assumption = len(citations) < self.MIN_CITATIONS
+
+        # 5. Conflict Alert 체크
+        conflict, reason = self._check_conflict(citations)
+        result.conflict_alert = conflict
+        result.conflict_reason = reason
+
+        # 6. 근거 텍스트 생성 (LLM)
+        evidence_text = await self._generate_evidence_text(
+            candidate, citations, result.is_assumption
+        )
+        result.evidence_text = evidence_text
+
+        # 7. 신뢰도 점수
+        result.confidence_score = self._calculate_confidence(
+            len(citations), conflict, result.is_assumption
+        )
+
+        self.logger.info(
+            "evidence_generated",
+            citations=len(citations),
+            has_evidence=result.has_evidence,
+            conflict=result.conflict_alert,
+        )
 
     def _build_search_query(
         self, candidate: Dict[str, Any], score_components: Dict[str, Any]
@@ -164,30 +288,120 @@ class EvidenceRAGService:
 
         return " ".join(parts)
 
-    async def _search_literature(self, query: str, top_k: int) -> List[Dict[str, Any]]:
-        """문헌 검색 (하이브리드)"""
+    async def _search_literature(
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        문헌 검색 (하이브리드)
+
+        키워드/벡터 검색을 동시에 실행하고 RRF로 융합 → 문서당 최상위 청크 1개, 상위 top_k
+        (query_embedding이 없으면 벡터 검색 전에 쿼리 임베딩)
+        """
         if not self.db:
             return []
 
+        keyword_chunks, vector_chunks = await asyncio.gather(
+            self._keyword_search(query, self.keyword_top_k),
+            self._vector_search(query, self.vector_top_k, query_embedding),
+        )
+        return self._fuse_rankings([keyword_chunks, vector_chunks], top_k)
+
+    async def _keyword_search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """키워드 검색 (tsvector)"""
         try:
-            # 키워드 검색 (tsvector)
-            keyword_result = (
+            result = await execute_nonblocking(
                 self.db.table("literature_chunks")
-                .select("*, literature_documents(pmid, title)")
-                .text_search("tsvector_content", query)
-                .limit(top_k // 2)
-                .execute()
+                .select(self.CHUNK_COLUMNS)
+                .limit(limit)
+                .text_search("tsvector_content", query, {"type": "web_search"})
             )
+            return result.data or []
+        except Exception as e:
+            self.logger.warning("keyword_search_failed", error=str(e))
+            return []
 
-            # 벡터 검색 (embedding) - TODO: 임베딩 쿼리
-            # 현재는 키워드 검색만 사용
-
-            return keyword_result.data if keyword_result.data else []
-
+    async def _vector_search(
+        self, query: str, limit: int, embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """벡터 검색 (match_literature_chunks RPC, 결과를 키워드 검색 행 형식으로 변환)"""
+        try:
+            if embedding is None:
+                embedding = await self._embed_query(query)
+            if embedding is None:
+                return []
+            result = await execute_nonblocking(
+                self.db.rpc(
+                    "match_literature_chunks",
+                    {
+                        "query_embedding": embedding,
+                        "match_threshold": self.MATCH_THRESHOLD,
+                        "match_count": limit,
+                    },
+                )
+            )
         except Exception as e:
-            self.logger.warning("literature_search_failed", error=str(e))
+            self.logger.warning("vector_search_failed", error=str(e))
             return []
 
+        return [
+            {
+                "id": row["id"],
+                "document_id": row["document_id"],
+                "content": row.get("content", ""),
+                "polarity": row.get("polarity") or "neutral",
+                "similarity": row.get("similarity"),
+                "literature_documents": {
+                    "pmid": row.get("document_pmid"),
+                    "title": row.get("document_title", ""),
+                },
+            }
+            for row in result.data or []
+        ]
+
+    def _fuse_rankings(
+        self, rankings: List[List[Dict[str, Any]]], top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Reciprocal Rank Fusion + 문서 단위 중복 제거
+
+        청크 점수 = Σ 1 / (RRF_K + 순위), 문서마다 점수가 가장 높은 청크만 유지.
+        relevance_score = 최상위 대비 점수 비율 (0~1)
+        """
+        scores: Dict[str, float] = {}
+        chunks: Dict[str, Dict[str, Any]] = {}
+        for ranking in rankings:
+            for rank, chunk in enumerate(ranking, 1):
+                scores[chunk["id"]] = scores.get(chunk["id"], 0.0) + 1.0 / (
+                    self.RRF_K + rank
+                )
+                chunks.setdefault(chunk["id"], chunk)
+
+        fused = []
+        seen_documents = set()
+        for chunk_id in sorted(scores, key=scores.get, reverse=True):
+            chunk = chunks[chunk_id]
+            if chunk.get("document_id") in seen_documents:
+                continue
+            seen_documents.add(chunk.get("document_id"))
+            fused.append({**chunk, "relevance_score": scores[chunk_id]})
+            if len(fused) >= top_k:
+                break
+
+        if fused:
+            best = fused[0]["relevance_score"]
+            for chunk in fused:
+                chunk["relevance_score"] /= best
+        return fused
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """검색 쿼리 임베딩 (임베딩 미설정/실패 시 None)"""
+        if self.embedding is None:
+            return None
+        return await self.embedding.embed_one(query)
+
     def _get_high_risk_fields(self, score_components: Dict[str, Any]) -> List[str]:
         """고위험 필드 추출"""
         high_risk = []
@@ -321,6 +535,26 @@ class EvidenceRAGService:
 
         return max(0.0, min(1.0, score))
 
+    async def save_evidence(self, results: Dict[str, EvidenceResult]) -> int:
+        """
+        근거 일괄 저장 (evidence_signals bulk insert)
+
+        Args:
+            results: 후보 ID → EvidenceResult (generate_evidence_batch 결과)
+
+        Returns:
+            저장 행 수
+        """
+        if not self.db or not results:
+            return 0
+
+        rows = [self.to_db_format(cid, result) for cid, result in results.items()]
+        for i in range(0, len(rows), self.SAVE_BATCH):
+            await execute_nonblocking(
+                self.db.table("evidence_signals").insert(rows[i : i + self.SAVE_BATCH])
+            )
+        return len(rows)
+
     def to_db_format(self, candidate_id: str, result: EvidenceResult) -> Dict[str, Any]:
         """DB 저장 형식 변환"""
         return {
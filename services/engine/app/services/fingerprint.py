@@ -9,6 +9,8 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 import structlog
 
+from app.core.database import execute_nonblocking
+
 logger = structlog.get_logger()
 
 
@@ -232,7 +234,7 @@ class FingerprintService:
             if component_type:
                 query = query.eq("type", component_type)
 
-            result = query.limit(1000).execute()  # 최대 1000개로 제한
+            result = await execute_nonblocking(query.limit(1000))  # 최대 1000개로 제한
 
             if not result.data:
                 return []
@@ -7,11 +7,18 @@ Literature Chunking and Embedding Service
 
 import os
 import re
-import hashlib
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import structlog
 
+from app.core.database import execute_nonblocking
+from app.core.embedding_cache import text_checksum
+from app.core.embeddings import (
+    DEFAULT_MODEL as DEFAULT_EMBEDDING_MODEL,
+    create_embedding_client,
+    get_embedding_client,
+)
+
 logger = structlog.get_logger()
 
 
@@ -28,6 +35,29 @@ class Chunk:
     polarity: Optional[str] = None  # positive, negative, neutral
 
 
+@dataclass
+class ChunkPlan:
+    """
+    기존 청크 → 새 청크 목록 재조정 계획 (ChunkingService.reconcile)
+
+    기존 행은 체크섬(내용)이 같으면 id/임베딩을 유지한 채 재사용
+    """
+
+    inserts: List[Chunk] = field(default_factory=list)  # 새 내용
+    moves: List[Dict[str, Any]] = field(default_factory=list)  # chunk_index만 변경
+    deletes: List[str] = field(default_factory=list)  # 더 이상 없는 내용 (행 ID)
+    unchanged: List[Dict[str, Any]] = field(default_factory=list)  # 그대로 유지
+
+    @property
+    def reused(self) -> List[Dict[str, Any]]:
+        """재사용 기존 행 (moves는 새 chunk_index 반영)"""
+        return self.unchanged + self.moves
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserts or self.moves or self.deletes)
+
+
 class ChunkingService:
     """
     문헌 청킹 서비스
@@ -130,6 +160,8 @@ class ChunkingService:
                     end = current_start + len(chunk_text.split())
 
             chunks.append(chunk_text)
+            if end >= len(words):
+                break
 
             # 오버랩 적용
             current_start = end - self.overlap_tokens
@@ -178,7 +210,8 @@ class ChunkingService:
     ) -> Chunk:
         """청크 객체 생성"""
         token_count = len(content.split())
-        checksum = hashlib.md5(content.encode()).hexdigest()[:16]
+        # 임베딩 캐시 키와 동일 (정규화 텍스트 sha256)
+        checksum = text_checksum(content)
 
         return Chunk(
             document_id=document_id,
@@ -190,6 +223,48 @@ class ChunkingService:
             polarity=None,  # 나중에 분류
         )
 
+    def reconcile(
+        self, existing: List[Dict[str, Any]], chunks: List[Chunk]
+    ) -> ChunkPlan:
+        """
+        저장된 청크 행과 새 청크 목록을 체크섬으로 매칭
+
+        1) 같은 체크섬 + 같은 chunk_index → 유지
+        2) 같은 체크섬, 다른 위치 → chunk_index만 이동 (기존 인덱스 순서로 배정)
+        3) 매칭 안 된 새 청크 → 삽입, 매칭 안 된 기존 행 → 삭제
+
+        Args:
+            existing: 한 문서의 literature_chunks 행 (id, chunk_index, content 필수)
+            chunks: chunk_document() 결과
+
+        Returns:
+            ChunkPlan
+        """
+        plan = ChunkPlan()
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        for row in sorted(existing, key=lambda r: r["chunk_index"]):
+            pending.setdefault(text_checksum(row["content"]), []).append(row)
+
+        unmatched: List[Chunk] = []
+        for chunk in chunks:
+            rows = pending.get(chunk.checksum, [])
+            row = next((r for r in rows if r["chunk_index"] == chunk.chunk_index), None)
+            if row is None:
+                unmatched.append(chunk)
+            else:
+                rows.remove(row)
+                plan.unchanged.append(row)
+
+        for chunk in unmatched:
+            rows = pending.get(chunk.checksum)
+            if rows:
+                plan.moves.append({**rows.pop(0), "chunk_index": chunk.chunk_index})
+            else:
+                plan.inserts.append(chunk)
+
+        plan.deletes = [row["id"] for rows in pending.values() for row in rows]
+        return plan
+
     def detect_polarity(self, chunk: Chunk) -> str:
         """
         청크의 극성 감지 (positive/negative/neutral)
@@ -240,20 +315,24 @@ class ChunkingService:
 
 class EmbeddingService:
     """
-    OpenAI 임베딩 서비스
+    임베딩 서비스 (app.core.embeddings 배치 클라이언트 사용)
 
     기본 모델: text-embedding-3-small
     """
 
-    DEFAULT_MODEL = "text-embedding-3-small"
-    BATCH_SIZE = 100  # OpenAI 배치 제한
+    DEFAULT_MODEL = DEFAULT_EMBEDDING_MODEL
 
     def __init__(self, model: str = None, api_key: str = None):
         self.model = model or self.DEFAULT_MODEL
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.logger = logger.bind(service="embedding")
 
-        if not self.api_key:
+        if model is None and api_key is None:
+            self.client = get_embedding_client()
+        else:
+            self.client = create_embedding_client(model=self.model, api_key=api_key)
+
+        if self.client is None:
             self.logger.warning("openai_api_key_not_set")
 
     async def embed_text(self, text: str) -> List[float]:
@@ -262,37 +341,15 @@ class EmbeddingService:
         return embeddings[0] if embeddings else []
 
     async def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """배치 임베딩"""
-        if not self.api_key:
+        """배치 임베딩 (토큰 예산 단위 요청, 실패 입력은 빈 리스트)"""
+        if self.client is None:
             self.logger.warning("skipping_embed_no_api_key")
             return [[] for _ in texts]
 
-        try:
-            import openai
-
-            client = openai.OpenAI(api_key=self.api_key)
-
-            all_embeddings = []
-
-            for i in range(0, len(texts), self.BATCH_SIZE):
-                batch = texts[i : i + self.BATCH_SIZE]
+        embeddings = await self.client.embed(texts)
+        self.logger.info("batch_embedded", count=len(texts), model=self.client.model)
 
-                response = client.embeddings.create(model=self.model, input=batch)
-
-                # 정렬된 순서로 반환
-                batch_embeddings = [None] * len(batch)
-                for item in response.data:
-                    batch_embeddings[item.index] = item.embedding
-
-                all_embeddings.extend(batch_embeddings)
-
-            self.logger.info("batch_embedded", count=len(texts), model=self.model)
-
-            return all_embeddings
-
-        except Exception as e:
-            self.logger.error("embedding_failed", error=str(e))
-            return [[] for _ in texts]
+        return [embedding or [] for embedding in embeddings]
 
     async def embed_chunks(self, chunks: List[Chunk]) -> List[Dict[str, Any]]:
         """
@@ -372,19 +429,21 @@ class LiteraturePipeline:
             if self.db:
                 for chunk_data in embedded_chunks:
                     try:
-                        self.db.table("literature_chunks").upsert(
-                            {
-                                "document_id": chunk_data["document_id"],
-                                "chunk_index": chunk_data["chunk_index"],
-                                "content": chunk_data["content"],
-                                "token_count": chunk_data["token_count"],
-                                "section": chunk_data["section"],
-                                "polarity": chunk_data.get("polarity"),
-                                "embedding": chunk_data.get("embedding"),
-                                "checksum": chunk_data["checksum"],
-                            },
-                            on_conflict="document_id,chunk_index",
-                        ).execute()
+                        await execute_nonblocking(
+                            self.db.table("literature_chunks").upsert(
+                                {
+                                    "document_id": chunk_data["document_id"],
+                                    "chunk_index": chunk_data["chunk_index"],
+                                    "content": chunk_data["content"],
+                                    "token_count": chunk_data["token_count"],
+                                    "section": chunk_data["section"],
+                                    "polarity": chunk_data.get("polarity"),
+                                    "embedding": chunk_data.get("embedding"),
+                                    "checksum": chunk_data["checksum"],
+                                },
+                                on_conflict="document_id,chunk_index",
+                            )
+                        )
                     except Exception as e:
                         self.logger.warning("chunk_save_failed", error=str(e))
                         stats["errors"] += 1
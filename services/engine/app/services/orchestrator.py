@@ -26,6 +26,7 @@ from app.services.evidence import get_evidence_service
 from app.services.protocol import get_protocol_service
 from app.services.report_service import get_report_service
 from app.services.audit_service import get_audit_service
+from app.services.progress_reporter import ProgressReporter
 
 logger = structlog.get_logger()
 
@@ -33,8 +34,12 @@ logger = structlog.get_logger()
 class Orchestrator:
     """ADC 설계 오케스트레이터"""
 
-    def __init__(self, db_client):
+    FINAL_STEP = 9
+
+    def __init__(self, db_client, redis=None):
         self.db = db_client
+        self.redis = redis
+        self._progress: Dict[str, ProgressReporter] = {}
         self.resolver = ResolverService(db_client)
         self.calc_engine = get_calc_engine()
         self.scoring_service = get_scoring_service(db_client)
@@ -102,23 +107,21 @@ class Orchestrator:
 
             # 6. Evidence RAG
             await self._update_progress(run_id, 6, "Evidence", "running")
-            # Top N 후보에 대해 근거 생성 (예: Front 0 멤버들)
+            # Front 0 전체 근거 생성 (같은 검색 쿼리 후보는 검색 1회, 일괄 저장)
             top_candidate_ids = fronts[0] if fronts else []
-            for cand_id in top_candidate_ids[:5]:  # MVP: 상위 5개만
-                cand_data = next(c for c in candidates if c["id"] == cand_id)
-                score_comp = next(
-                    s for s in score_results if s.candidate_id == cand_id
-                ).components
-                evidence = await self.evidence_service.generate_evidence(
-                    cand_data, score_comp
-                )
-                # DB 저장
-                await (
-                    self.db.table("evidence_signals")
-                    .insert(self.evidence_service.to_db_format(cand_id, evidence))
-                    .execute()
-                )
-            await self._update_progress(run_id, 6, "Evidence", "completed")
+            front_ids = set(top_candidate_ids)
+            evidence = await self.evidence_service.generate_evidence_batch(
+                [c for c in candidates if c["id"] in front_ids],
+                {
+                    s.candidate_id: s.components
+                    for s in score_results
+                    if s.candidate_id in front_ids
+                },
+            )
+            saved = await self.evidence_service.save_evidence(evidence)
+            await self._update_progress(
+                run_id, 6, "Evidence", "completed", f"Evidence for {saved} candidates"
+            )
 
             # 7. Protocol Generation
             await self._update_progress(run_id, 7, "Protocol", "running")
@@ -171,9 +174,13 @@ class Orchestrator:
     async def _update_progress(
         self, run_id: UUID, step: int, phase: str, status: str, message: str = None
     ):
-        """런 진행률 업데이트"""
+        """
+        런 진행률 업데이트 (ProgressReporter로 병합)
+
+        phase 변경(다음 단계 시작)과 최종 완료/실패만 즉시 기록,
+        같은 단계의 running → completed는 간격 내에 다음 단계 기록에 합쳐짐
+        """
         data = {
-            "run_id": str(run_id),
             "step_number": step,
             "phase": phase,
             "status": status,
@@ -185,7 +192,16 @@ class Orchestrator:
         elif status == "completed":
             data["completed_at"] = datetime.utcnow().isoformat()
 
-        await self.db.table("run_progress").upsert(data).execute()
+        reporter = self._progress.get(str(run_id))
+        if reporter is None:
+            reporter = ProgressReporter(self.db, str(run_id), redis=self.redis)
+            self._progress[str(run_id)] = reporter
+
+        if status == "failed" or (status == "completed" and step == self.FINAL_STEP):
+            await reporter.complete(**data)
+            self._progress.pop(str(run_id), None)
+        else:
+            await reporter.update(**data)
 
     async def _generate_candidates(self, run_id: UUID) -> List[Dict[str, Any]]:
         """후보 조합 생성 (MVP: DB에 등록된 Target/Payload/Linker 조합)"""
@@ -239,5 +255,5 @@ class Orchestrator:
             pass
 
 
-def get_orchestrator(db_client) -> Orchestrator:
-    return Orchestrator(db_client)
+def get_orchestrator(db_client, redis=None) -> Orchestrator:
+    return Orchestrator(db_client, redis=redis)
@@ -13,8 +13,9 @@ class PipelineService:
     Seed Set 기반 전체 수집 파이프라인 관리 서비스
     """
 
-    def __init__(self, db_client=None):
+    def __init__(self, db_client=None, redis=None):
         self.db = db_client
+        self.redis = redis  # 커넥터 Rate limit 전역 공유 (Worker와 같은 버킷)
         self.resolver = ResolverService(db_client)
         self.logger = logger.bind(service="pipeline")
 
@@ -43,8 +44,8 @@ class PipelineService:
         # 커넥터 인스턴스 맵
         # TODO: 커넥터 팩토리 또는 레지스트리 패턴으로 확장 가능
         connector_map = {
-            "pubmed": PubMedConnector(self.db),
-            "opentargets": OpenTargetsConnector(self.db),
+            "pubmed": PubMedConnector(self.db, self.redis),
+            "opentargets": OpenTargetsConnector(self.db, self.redis),
         }
 
         # 실행할 커넥터 결정 (지정되지 않으면 전체 실행)
@@ -0,0 +1,212 @@
+"""
+Progress Reporter
+run_progress 쓰기 병합 (Design Run Worker / Orchestrator 공용)
+
+배치마다 run_progress를 UPDATE하면 쓰기 수가 배치 수에 비례하고 실제 후보 저장과 경쟁하므로
+메모리에 상태를 병합하고 아래 조건에서만 기록:
+- phase 변경, flush(), complete(): 즉시
+- 그 외: 마지막 기록 후 min_interval 초 경과 + 진행률 min_percent_delta 이상 변화
+  (진행률 변화가 작아도 max_interval 초가 지나면 기록 → updated_at heartbeat)
+
+Redis 클라이언트가 있으면 같은 상태를 run_progress:{run_id} 키(JSON)에도 기록
+→ GET /runs/{run_id}/progress가 Postgres 조회 없이 응답
+"""
+
+import inspect
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+import structlog
+
+from app.core.database import execute_nonblocking
+
+logger = structlog.get_logger()
+
+PROGRESS_TABLE = "run_progress"
+PROGRESS_KEY_PREFIX = "run_progress:"
+PROGRESS_KEY_TTL = 7 * 24 * 3600
+
+
+def progress_key(run_id: str) -> str:
+    """진행률 Redis 키"""
+    return f"{PROGRESS_KEY_PREFIX}{run_id}"
+
+
+class ProgressReporter:
+    """
+    Run 진행률 기록기 (Run당 1개)
+
+    사용:
+        progress = ProgressReporter(db, run_id, redis=ctx.get("redis"), total=total)
+        await progress.set_phase("generating")
+        await progress.update(processed_candidates=n)  # 병합, 조건 충족 시만 기록
+        await progress.flush(cursor=c)  # 체크포인트 등 즉시 기록
+        await progress.complete(phase="completed")
+
+    db/redis는 동기/비동기 클라이언트 모두 허용
+    (동기 db 쿼리는 스레드에서 실행, redis set()/get() 결과가 awaitable이면 await)
+    """
+
+    DEFAULT_MIN_INTERVAL = 1.0
+    DEFAULT_MAX_INTERVAL = 30.0
+    DEFAULT_MIN_PERCENT_DELTA = 1.0
+
+    def __init__(
+        self,
+        db_client,
+        run_id: str,
+        redis=None,
+        total: int = 0,
+        progress_field: str = "processed_candidates",
+        min_interval: float = None,
+        max_interval: float = None,
+        min_percent_delta: float = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            db_client: Supabase 클라이언트 (동기/비동기)
+            run_id: design_runs.id
+            redis: Redis 클라이언트 (optional, redis.Redis / redis.asyncio / ArqRedis)
+            total: 진행률 분모 (0이면 시간 조건만 적용)
+            progress_field: 진행률 분자 필드
+            min_interval: 기록 최소 간격 (초)
+            max_interval: 진행률 변화 없이도 기록하는 간격 (초)
+            min_percent_delta: 기록 최소 진행률 변화 (%p)
+            clock: 단조 시계 (테스트용)
+        """
+        self.db = db_client
+        self.run_id = str(run_id)
+        self.redis = redis
+        self.total = total
+        self.progress_field = progress_field
+        self.min_interval = (
+            self.DEFAULT_MIN_INTERVAL if min_interval is None else min_interval
+        )
+        self.max_interval = (
+            self.DEFAULT_MAX_INTERVAL if max_interval is None else max_interval
+        )
+        self.min_percent_delta = (
+            self.DEFAULT_MIN_PERCENT_DELTA
+            if min_percent_delta is None
+            else min_percent_delta
+        )
+        self.clock = clock
+        self.logger = logger.bind(service="progress_reporter", run_id=self.run_id)
+
+        self.state: Dict[str, Any] = {}  # 누적 상태 (Redis 스냅샷)
+        self._dirty: Dict[str, Any] = {}  # 마지막 기록 이후 변경 필드
+        self._written_phase: Optional[str] = None
+        self._written_percent: Optional[float] = None
+        self._written_at: Optional[float] = None
+        self.writes = 0
+
+    @property
+    def percent(self) -> Optional[float]:
+        """현재 진행률 (%), 분모가 없으면 None"""
+        if not self.total:
+            return None
+        return min(
+            100.0, 100.0 * (self.state.get(self.progress_field) or 0) / self.total
+        )
+
+    async def update(self, **fields: Any) -> bool:
+        """
+        상태 병합 후 기록 조건 충족 시 기록
+
+        Returns:
+            이번 호출에서 기록했는지 여부
+        """
+        self._merge(fields)
+        if not self._should_write():
+            return False
+        await self._write()
+        return True
+
+    async def set_phase(self, phase: str, **fields: Any) -> None:
+        """phase 변경 (즉시 기록)"""
+        await self.flush(phase=phase, **fields)
+
+    async def flush(self, **fields: Any) -> None:
+        """병합된 변경분 즉시 기록 (변경이 없으면 생략)"""
+        self._merge(fields)
+        if self._dirty:
+            await self._write()
+
+    async def complete(self, **fields: Any) -> None:
+        """종료 상태 기록 (completed/failed)"""
+        await self.flush(**fields)
+
+    def _merge(self, fields: Dict[str, Any]) -> None:
+        for key, value in fields.items():
+            if self.state.get(key) != value or key not in self.state:
+                self.state[key] = value
+                self._dirty[key] = value
+
+    def _should_write(self) -> bool:
+        if not self._dirty:
+            return False
+        if "phase" in self._dirty and self._dirty["phase"] != self._written_phase:
+            return True
+        if self._written_at is None:
+            return True
+
+        elapsed = self.clock() - self._written_at
+        if elapsed < self.min_interval:
+            return False
+        if elapsed >= self.max_interval:
+            return True
+
+        percent = self.percent
+        if percent is None or self._written_percent is None:
+            return True
+        return percent - self._written_percent >= self.min_percent_delta
+
+    async def _write(self) -> None:
+        now = datetime.utcnow().isoformat()
+        self.state["updated_at"] = now
+        record = {"run_id": self.run_id, **self._dirty, "updated_at": now}
+
+        await execute_nonblocking(
+            self.db.table(PROGRESS_TABLE).upsert(record, on_conflict="run_id")
+        )
+        self.writes += 1
+
+        self._written_phase = self.state.get("phase")
+        self._written_percent = self.percent
+        self._written_at = self.clock()
+        self._dirty = {}
+
+        if self.redis is not None:
+            try:
+                await _resolve(
+                    self.redis.set(
+                        progress_key(self.run_id),
+                        json.dumps(self.state, default=str),
+                        ex=PROGRESS_KEY_TTL,
+                    )
+                )
+            except Exception as e:
+                # Redis는 조회 캐시일 뿐이므로 실패해도 진행
+                self.logger.warning("progress_cache_write_failed", error=str(e))
+
+
+async def read_cached_progress(redis, run_id: str) -> Optional[Dict[str, Any]]:
+    """Redis 진행률 조회 (없거나 실패 시 None → 호출자가 DB 조회)"""
+    if redis is None:
+        return None
+    try:
+        raw = await _resolve(redis.get(progress_key(run_id)))
+    except Exception as e:
+        logger.warning("progress_cache_read_failed", run_id=run_id, error=str(e))
+        return None
+    if not raw:
+        return None
+    return json.loads(raw)
+
+
+async def _resolve(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
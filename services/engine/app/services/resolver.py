@@ -2,6 +2,8 @@ import httpx
 import structlog
 from typing import Any, Optional, Dict
 
+from app.core.database import execute_nonblocking
+
 logger = structlog.get_logger()
 
 
@@ -108,20 +110,21 @@ class ResolverService:
 
         # 1. 타겟 정규화
         try:
-            targets_res = (
+            targets_res = await execute_nonblocking(
                 self.db.table("seed_set_targets")
                 .select("entity_targets(*)")
                 .eq("seed_set_id", seed_set_id)
-                .execute()
             )
             for row in targets_res.data:
                 target = row.get("entity_targets")
                 if target and not target.get("ensembl_gene_id"):
                     resolved = await self.resolve_target(target["gene_symbol"])
                     if resolved:
-                        self.db.table("entity_targets").update(
-                            {"ensembl_gene_id": resolved["ensembl_gene_id"]}
-                        ).eq("id", target["id"]).execute()
+                        await execute_nonblocking(
+                            self.db.table("entity_targets")
+                            .update({"ensembl_gene_id": resolved["ensembl_gene_id"]})
+                            .eq("id", target["id"])
+                        )
                         stats["targets_resolved"] += 1
                         self.logger.info(
                             "target_resolved",
@@ -134,23 +137,26 @@ class ResolverService:
 
         # 2. 질환 정규화
         try:
-            diseases_res = (
+            diseases_res = await execute_nonblocking(
                 self.db.table("seed_set_diseases")
                 .select("entity_diseases(*)")
                 .eq("seed_set_id", seed_set_id)
-                .execute()
             )
             for row in diseases_res.data:
                 disease = row.get("entity_diseases")
                 if disease and not disease.get("ontology_id"):
                     resolved = await self.resolve_disease(disease["disease_name"])
                     if resolved:
-                        self.db.table("entity_diseases").update(
-                            {
-                                "ontology_id": resolved["ontology_id"],
-                                "ontology_source": resolved["ontology_source"],
-                            }
-                        ).eq("id", disease["id"]).execute()
+                        await execute_nonblocking(
+                            self.db.table("entity_diseases")
+                            .update(
+                                {
+                                    "ontology_id": resolved["ontology_id"],
+                                    "ontology_source": resolved["ontology_source"],
+                                }
+                            )
+                            .eq("id", disease["id"])
+                        )
                         stats["diseases_resolved"] += 1
                         self.logger.info(
                             "disease_resolved",
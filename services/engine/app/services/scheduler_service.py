@@ -7,7 +7,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import structlog
 from app.services.dataset_sync_service import get_dataset_sync_service
-from app.core.database import get_supabase_client
+from app.core.database import close_async_db, create_async_db
 
 logger = structlog.get_logger()
 
@@ -47,14 +47,17 @@ class SchedulerService:
     async def _run_sync_job(self):
         """동기화 작업 실행 래퍼"""
         self.logger.info("sync_job_triggered")
+        db = None
         try:
-            # 의존성 주입을 위한 클라이언트 생성
-            db = get_supabase_client()
+            # 작업 실행 루프에 묶인 AsyncClient (실행마다 생성/종료)
+            db = await create_async_db()
             sync_service = get_dataset_sync_service(db)
             updated_count = await sync_service.sync_clinical_statuses()
             self.logger.info("sync_job_completed", updated_count=updated_count)
         except Exception as e:
             self.logger.error("sync_job_failed", error=str(e))
+        finally:
+            await close_async_db(db)
 
     def get_jobs(self):
         """등록된 작업 목록 조회"""
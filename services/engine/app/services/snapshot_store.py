@@ -0,0 +1,161 @@
+"""
+Run Component Snapshot Store
+Run 단위 컴포넌트 스냅샷 (content-addressed)
+
+후보마다 target/antibody/linker/payload 전체 dict를 복제 저장하는 대신
+run_component_snapshots에 (run_id, content_hash) 단위로 1회만 저장하고
+candidates.snapshot_refs = {"target": hash, ...} 로 참조
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import structlog
+
+from app.core.database import execute_nonblocking
+
+logger = structlog.get_logger()
+
+SNAPSHOT_ROLES = ("target", "antibody", "linker", "payload")
+
+# 스냅샷은 불변이므로 (run_id, content_hash) 기준 프로세스 캐시 공유
+_CACHE_SIZE = 4096
+_snapshot_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+
+def snapshot_hash(component: Dict[str, Any]) -> str:
+    """컴포넌트 dict 내용 해시 (키 순서 무관)"""
+    payload = json.dumps(
+        component, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+class SnapshotStore:
+    """Run 컴포넌트 스냅샷 저장/조회 (동기/비동기 Supabase 클라이언트 겸용)"""
+
+    INSERT_CHUNK = 500
+
+    def __init__(self, db_client):
+        self.db = db_client
+        self.logger = logger.bind(service="snapshot_store")
+
+    async def register_run(
+        self, run_id: str, components: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[str]]:
+        """
+        Run에 사용되는 카탈로그 컴포넌트 스냅샷 저장
+
+        Args:
+            run_id: design_runs.id
+            components: {"target": [...], "antibody": [...], ...} (제너레이터 컴포넌트 목록)
+
+        Returns:
+            역할별 content_hash 목록 (components와 같은 인덱스)
+        """
+        hashes: Dict[str, List[str]] = {}
+        records: Dict[str, Dict[str, Any]] = {}
+
+        for role, items in components.items():
+            hashes[role] = []
+            for component in items:
+                content_hash = snapshot_hash(component)
+                hashes[role].append(content_hash)
+                records.setdefault(
+                    content_hash,
+                    {
+                        "run_id": run_id,
+                        "component_type": role,
+                        "component_id": component.get("id"),
+                        "content_hash": content_hash,
+                        "snapshot": component,
+                    },
+                )
+
+        rows = list(records.values())
+        for i in range(0, len(rows), self.INSERT_CHUNK):
+            await execute_nonblocking(
+                self.db.table("run_component_snapshots").upsert(
+                    rows[i : i + self.INSERT_CHUNK], on_conflict="run_id,content_hash"
+                )
+            )
+
+        for row in rows:
+            _cache_put((run_id, row["content_hash"]), row["snapshot"])
+
+        self.logger.info("snapshots_registered", run_id=run_id, snapshots=len(rows))
+        return hashes
+
+    async def resolve(
+        self, run_id: str, candidates: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        candidates의 snapshot_refs를 스냅샷으로 치환 (in-place, 조회 1회)
+
+        snapshot_refs가 없는 기존 후보는 저장된 snapshot을 그대로 사용
+        """
+        candidates = list(candidates)
+        snapshots = await self.fetch(
+            run_id,
+            {
+                content_hash
+                for c in candidates
+                for content_hash in (c.get("snapshot_refs") or {}).values()
+                if content_hash
+            },
+        )
+
+        for c in candidates:
+            refs = c.get("snapshot_refs")
+            if refs:
+                c["snapshot"] = {
+                    role: snapshots.get(content_hash, {})
+                    for role, content_hash in refs.items()
+                }
+
+        return candidates
+
+    async def fetch(
+        self, run_id: str, hashes: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """content_hash → snapshot (캐시 miss만 DB 조회)"""
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for content_hash in hashes:
+            cached = _cache_get((run_id, content_hash))
+            if cached is None:
+                missing.append(content_hash)
+            else:
+                found[content_hash] = cached
+
+        if missing:
+            result = await execute_nonblocking(
+                self.db.table("run_component_snapshots")
+                .select("content_hash, snapshot")
+                .eq("run_id", run_id)
+                .in_("content_hash", missing)
+            )
+            for row in result.data or []:
+                found[row["content_hash"]] = row["snapshot"]
+                _cache_put((run_id, row["content_hash"]), row["snapshot"])
+
+        return found
+
+
+def _cache_get(key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    value = _snapshot_cache.get(key)
+    if value is not None:
+        _snapshot_cache.move_to_end(key)
+    return value
+
+
+def _cache_put(key: Tuple[str, str], value: Dict[str, Any]) -> None:
+    _snapshot_cache[key] = value
+    _snapshot_cache.move_to_end(key)
+    while len(_snapshot_cache) > _CACHE_SIZE:
+        _snapshot_cache.popitem(last=False)
+
+
+def get_snapshot_store(db_client) -> SnapshotStore:
+    return SnapshotStore(db_client)
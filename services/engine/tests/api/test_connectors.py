@@ -11,6 +11,8 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+from app.api.deps import get_async_db  # noqa: E402
+
 
 class TestConnectorsAPI:
     """Connectors API 테스트"""
@@ -18,23 +20,23 @@ class TestConnectorsAPI:
     @pytest.fixture
     def client(self):
         """Test client with mocked dependencies"""
-        with patch("app.api.connectors.get_db") as mock_get_db:
-            mock_db = MagicMock()
-            mock_table = MagicMock()
+        mock_db = MagicMock()
+        mock_table = MagicMock()
 
-            mock_table.select.return_value = mock_table
-            mock_table.eq.return_value = mock_table
-            mock_table.order.return_value = mock_table
-            mock_table.limit.return_value = mock_table
-            mock_table.range.return_value = mock_table
-            mock_table.execute.return_value = MagicMock(data=[], count=0)
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.limit.return_value = mock_table
+        mock_table.range.return_value = mock_table
+        mock_table.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
 
-            mock_db.table.return_value = mock_table
-            mock_get_db.return_value = mock_db
+        mock_db.table.return_value = mock_table
 
-            from app.main import app
+        from app.main import app
 
-            yield TestClient(app)
+        app.dependency_overrides[get_async_db] = lambda: mock_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_list_connectors(self, client):
         """전체 커넥터 목록"""
@@ -108,28 +110,28 @@ class TestConnectorRun:
 
     @pytest.fixture
     def client(self):
-        with patch("app.api.connectors.get_db") as mock_get_db:
-            with patch("app.api.connectors.get_redis_pool") as mock_redis:
-                mock_db = MagicMock()
-                mock_table = MagicMock()
+        with patch("app.api.connectors.get_redis_pool") as mock_redis:
+            mock_db = MagicMock()
+            mock_table = MagicMock()
 
-                mock_table.select.return_value = mock_table
-                mock_table.eq.return_value = mock_table
-                mock_table.execute.return_value = MagicMock(data=[])
+            mock_table.select.return_value = mock_table
+            mock_table.eq.return_value = mock_table
+            mock_table.execute = AsyncMock(return_value=MagicMock(data=[]))
 
-                mock_db.table.return_value = mock_table
-                mock_get_db.return_value = mock_db
+            mock_db.table.return_value = mock_table
 
-                # Mock Redis pool
-                mock_pool = AsyncMock()
-                mock_job = MagicMock()
-                mock_job.job_id = "test-job-id"
-                mock_pool.enqueue_job.return_value = mock_job
-                mock_redis.return_value = mock_pool
+            # Mock Redis pool
+            mock_pool = AsyncMock()
+            mock_job = MagicMock()
+            mock_job.job_id = "test-job-id"
+            mock_pool.enqueue_job.return_value = mock_job
+            mock_redis.return_value = mock_pool
 
-                from app.main import app
+            from app.main import app
 
-                yield TestClient(app)
+            app.dependency_overrides[get_async_db] = lambda: mock_db
+            yield TestClient(app)
+            app.dependency_overrides.clear()
 
     def test_run_connector(self, client):
         """커넥터 실행"""
@@ -152,27 +154,27 @@ class TestIngestionAPI:
 
     @pytest.fixture
     def client(self):
-        with patch("app.core.database.get_db") as mock_get_db:
-            mock_db = MagicMock()
-            mock_table = MagicMock()
-
-            mock_table.select.return_value = mock_table
-            mock_table.eq.return_value = mock_table
-            mock_table.gte.return_value = mock_table
-            mock_table.order.return_value = mock_table
-            mock_table.range.return_value = mock_table
-            mock_table.execute.return_value = MagicMock(data=[], count=0)
-
-            mock_db.table.return_value = mock_table
-            mock_get_db.return_value = mock_db
-
-            # Also mock in db.supabase path if needed, but we switched to core.database
-            with patch.dict(
-                "sys.modules", {"app.db": MagicMock(), "app.db.supabase": MagicMock()}
-            ):
-                from app.main import app
+        mock_db = MagicMock()
+        mock_table = MagicMock()
+
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.gte.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.range.return_value = mock_table
+        mock_table.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
+
+        mock_db.table.return_value = mock_table
+
+        # Also mock in db.supabase path if needed, but we switched to core.database
+        with patch.dict(
+            "sys.modules", {"app.db": MagicMock(), "app.db.supabase": MagicMock()}
+        ):
+            from app.main import app
 
-                yield TestClient(app)
+            app.dependency_overrides[get_async_db] = lambda: mock_db
+            yield TestClient(app)
+            app.dependency_overrides.clear()
 
     def test_get_ingestion_logs(self, client):
         """Ingestion 로그 조회"""
@@ -5,12 +5,14 @@ Staging API 엔드포인트 테스트
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+from app.api.deps import get_async_db  # noqa: E402
+
 
 class TestStagingAPI:
     """Staging API 테스트"""
@@ -18,27 +20,27 @@ class TestStagingAPI:
     @pytest.fixture
     def client(self):
         """Test client with mocked dependencies"""
-        with patch("app.api.staging.get_db") as mock_get_db:
-            mock_db = MagicMock()
-            mock_table = MagicMock()
+        mock_db = MagicMock()
+        mock_table = MagicMock()
 
-            # Default response
-            mock_table.select.return_value = mock_table
-            mock_table.insert.return_value = mock_table
-            mock_table.update.return_value = mock_table
-            mock_table.delete.return_value = mock_table
-            mock_table.eq.return_value = mock_table
-            mock_table.order.return_value = mock_table
-            mock_table.limit.return_value = mock_table
-            mock_table.range.return_value = mock_table
-            mock_table.execute.return_value = MagicMock(data=[], count=0)
+        # Default response
+        mock_table.select.return_value = mock_table
+        mock_table.insert.return_value = mock_table
+        mock_table.update.return_value = mock_table
+        mock_table.delete.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.limit.return_value = mock_table
+        mock_table.range.return_value = mock_table
+        mock_table.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
 
-            mock_db.table.return_value = mock_table
-            mock_get_db.return_value = mock_db
+        mock_db.table.return_value = mock_table
 
-            from app.main import app
+        from app.main import app
 
-            yield TestClient(app)
+        app.dependency_overrides[get_async_db] = lambda: mock_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_list_staging_components(self, client):
         """스테이징 컴포넌트 목록"""
@@ -79,24 +81,24 @@ class TestStagingApproval:
     @pytest.fixture
     def client(self, mock_staging_component):
         """Test client with staging component data"""
-        with patch("app.api.staging.get_db") as mock_get_db:
-            mock_db = MagicMock()
-            mock_table = MagicMock()
-
-            mock_table.select.return_value = mock_table
-            mock_table.insert.return_value = mock_table
-            mock_table.update.return_value = mock_table
-            mock_table.eq.return_value = mock_table
-            mock_table.execute.return_value = MagicMock(
-                data=[mock_staging_component], count=1
-            )
+        mock_db = MagicMock()
+        mock_table = MagicMock()
+
+        mock_table.select.return_value = mock_table
+        mock_table.insert.return_value = mock_table
+        mock_table.update.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.execute = AsyncMock(
+            return_value=MagicMock(data=[mock_staging_component], count=1)
+        )
 
-            mock_db.table.return_value = mock_table
-            mock_get_db.return_value = mock_db
+        mock_db.table.return_value = mock_table
 
-            from app.main import app
+        from app.main import app
 
-            yield TestClient(app)
+        app.dependency_overrides[get_async_db] = lambda: mock_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_approve_component(self, client):
         """컴포넌트 승인"""
@@ -122,21 +124,21 @@ class TestDuplicateCheck:
 
     @pytest.fixture
     def client(self):
-        with patch("app.api.staging.get_db") as mock_get_db:
-            mock_db = MagicMock()
-            mock_table = MagicMock()
+        mock_db = MagicMock()
+        mock_table = MagicMock()
 
-            mock_table.select.return_value = mock_table
-            mock_table.eq.return_value = mock_table
-            mock_table.or_.return_value = mock_table
-            mock_table.execute.return_value = MagicMock(data=[], count=0)
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.or_.return_value = mock_table
+        mock_table.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
 
-            mock_db.table.return_value = mock_table
-            mock_get_db.return_value = mock_db
+        mock_db.table.return_value = mock_table
 
-            from app.main import app
+        from app.main import app
 
-            yield TestClient(app)
+        app.dependency_overrides[get_async_db] = lambda: mock_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_get_duplicate_groups(self, client):
         """중복 그룹 조회"""
@@ -3,6 +3,11 @@ Tests for Base Connector Framework
 BaseConnector, RateLimiter, common utilities 테스트
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
 import pytest
 from datetime import datetime
 
@@ -19,6 +24,9 @@ from app.connectors.base import (
     NormalizedRecord,
     UpsertResult,
     RateLimiter,
+    RedisRateLimiter,
+    RequestMetrics,
+    fetch_with_retry,
     generate_query_hash,
 )
 
@@ -134,6 +142,94 @@ class TestRateLimiter:
         # 높은 QPS에서는 거의 즉시
         assert elapsed < 0.5
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_burst(self):
+        """버킷 용량만큼은 즉시, 이후는 qps 간격"""
+        limiter = RateLimiter(qps=20.0, burst=5)
+
+        start = datetime.now()
+        for _ in range(5):
+            await limiter.acquire()
+        burst_elapsed = (datetime.now() - start).total_seconds()
+
+        for _ in range(2):
+            await limiter.acquire()
+        total_elapsed = (datetime.now() - start).total_seconds()
+
+        assert burst_elapsed < 0.04
+        assert total_elapsed >= 0.09  # 초과 2회 * 0.05초
+
+    @pytest.mark.asyncio
+    async def test_set_rate_raises_throughput(self):
+        limiter = RateLimiter(qps=1.0)
+        limiter.set_rate(1000.0)
+
+        start = datetime.now()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert (datetime.now() - start).total_seconds() < 0.1
+        assert limiter.interval == pytest.approx(0.001)
+
+
+class FakeScriptRedis:
+    """register_script만 흉내 내는 Redis 대역 (버킷 1개를 프로세스 간 공유한다고 가정)"""
+
+    def __init__(self, waits=None, error=None):
+        self.calls = []
+        self.waits = list(waits or [])
+        self.error = error
+
+    def register_script(self, script):
+        async def run(keys, args):
+            if self.error:
+                raise self.error
+            self.calls.append((tuple(keys), tuple(args)))
+            return self.waits.pop(0) if self.waits else 0
+
+        return run
+
+
+class TestRedisRateLimiter:
+    """Redis 공유 토큰 버킷 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_connectors_share_source_bucket(self, mock_db):
+        redis = FakeScriptRedis()
+
+        class PubMedLike(_EchoConnector):
+            source = "pubmed"
+            rate_limit_qps = 3.0
+            rate_limit_burst = 3
+
+        first, second = PubMedLike(mock_db, redis), PubMedLike(mock_db, redis)
+        assert isinstance(first.rate_limiter, RedisRateLimiter)
+
+        await first.rate_limiter.acquire()
+        await second.rate_limiter.acquire()
+
+        assert redis.calls == [(("rate_limit:pubmed",), (3.0, 3))] * 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reserved_token(self):
+        limiter = RedisRateLimiter(FakeScriptRedis(waits=[80]), "ncbi", qps=3.0)
+
+        start = datetime.now()
+        await limiter.acquire()
+
+        assert (datetime.now() - start).total_seconds() >= 0.07
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_bucket(self):
+        redis = FakeScriptRedis(error=ConnectionError("redis down"))
+        limiter = RedisRateLimiter(redis, "ncbi", qps=10.0)
+
+        start = datetime.now()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert (datetime.now() - start).total_seconds() >= 0.15
+
 
 class TestGenerateQueryHash:
     """generate_query_hash 테스트"""
@@ -231,3 +327,323 @@ class TestBaseConnector:
         assert "stats" in result
         assert "duration_ms" in result
         assert result["stats"]["fetched"] == 2
+
+
+class _EchoConnector(BaseConnector):
+    """공유 HTTP 클라이언트 테스트용 커넥터 (페이지마다 1회 요청)"""
+
+    source = "echo"
+    rate_limit_qps = 1000.0
+
+    async def build_queries(self, seed):
+        return [QuerySpec(query="q")]
+
+    async def fetch_page(self, query, cursor):
+        page = cursor.position.get("page", 0)
+        response = await self.fetch(
+            "https://api.example.org/items", params={"page": page}
+        )
+        return FetchResult(
+            records=response.json()["items"],
+            has_more=page < 2,
+            next_cursor={"page": page + 1},
+        )
+
+    def normalize(self, record):
+        return None
+
+    async def upsert(self, records):
+        return UpsertResult()
+
+
+class TestSharedHTTPClient:
+    """커넥터 공유 HTTP 클라이언트 / 요청 타이밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_reuses_one_client_and_closes_it(self, mock_db):
+        clients = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={"items": [{"id": f"p{page}"}]})
+
+        connector = _EchoConnector(mock_db)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        connector._http_client = client
+        original_fetch = connector.fetch
+
+        async def tracking_fetch(url, **kwargs):
+            clients.append(connector.http_client)
+            return await original_fetch(url, **kwargs)
+
+        connector.fetch = tracking_fetch
+
+        result = await connector.run(seed={}, max_pages=10)
+
+        assert result["status"] == "completed"
+        assert result["stats"]["fetched"] == 3
+        assert len(clients) == 3 and all(c is client for c in clients)
+        assert client.is_closed
+        assert result["http"]["requests"] == 3
+        assert result["http"]["hosts"]["api.example.org"]["requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_http_client_recreated_after_close(self):
+        connector = _EchoConnector()
+        first = connector.http_client
+        assert connector.http_client is first
+
+        await connector.aclose()
+        assert first.is_closed
+        assert connector.http_client is not first
+        await connector.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_records_timing(self):
+        metrics = RequestMetrics()
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json={}))
+        ) as client:
+            for _ in range(2):
+                await fetch_with_retry(
+                    "https://rest.example.org/x", client=client, metrics=metrics
+                )
+
+        host = metrics.hosts["rest.example.org"]
+        assert host.requests == 2
+        assert host.retries == 0 and host.errors == 0
+        assert host.max_ms >= host.avg_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_counts_retries_on_shared_client(self, monkeypatch):
+        from tenacity import wait_none
+
+        monkeypatch.setattr(
+            "app.connectors.base.wait_exponential", lambda **_: wait_none()
+        )
+        metrics = RequestMetrics()
+        statuses = iter([503, 200])
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(next(statuses)))
+        ) as client:
+            response = await fetch_with_retry(
+                "https://rest.example.org/x", client=client, metrics=metrics
+            )
+
+        assert response.status_code == 200
+        assert metrics.hosts["rest.example.org"].requests == 2
+        assert metrics.hosts["rest.example.org"].retries == 1
+
+
+class _SlowConnector(BaseConnector):
+    """동시 실행 테스트용 커넥터 (쿼리당 3페이지, 조회/Upsert 지연)"""
+
+    source = "slow"
+    rate_limit_qps = 0  # Rate limit 없음
+
+    def __init__(self, queries=4, fail_query=None):
+        super().__init__()
+        self.queries = queries
+        self.fail_query = fail_query
+        self.events = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def build_queries(self, seed):
+        return [QuerySpec(query=f"q{i}") for i in range(self.queries)]
+
+    async def fetch_page(self, query, cursor):
+        page = cursor.position.get("page", 0)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.events.append(("fetch_start", query.query, page))
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        if query.query == self.fail_query:
+            raise RuntimeError("fetch failed")
+        return FetchResult(
+            records=[{"id": f"{query.query}-{page}"}],
+            has_more=page < 2,
+            next_cursor={"page": page + 1},
+        )
+
+    def normalize(self, record):
+        return NormalizedRecord(
+            external_id=record["id"],
+            record_type="test",
+            data=record,
+            checksum=record["id"],
+            source="slow",
+        )
+
+    async def upsert(self, records):
+        self.events.append(("upsert_start", records[0].external_id))
+        await asyncio.sleep(0.02)
+        self.events.append(("upsert_end", records[0].external_id))
+        return UpsertResult(inserted=len(records))
+
+
+class _BlockingDB:
+    """동기 Supabase 클라이언트 대역 (execute()가 스레드를 블로킹)"""
+
+    def __init__(self, events, delay=0.1):
+        self.events = events
+        self.delay = delay
+
+    def table(self, name):
+        return self
+
+    def upsert(self, rows, **kwargs):
+        return SimpleNamespace(execute=lambda: self._execute(rows))
+
+    def _execute(self, rows):
+        self.events.append(("db_start", rows[0]["source_id"]))
+        time.sleep(self.delay)
+        self.events.append(("db_end", rows[0]["source_id"]))
+        return SimpleNamespace(data=[{"id": row["source_id"]} for row in rows])
+
+
+class _BlockingWriteConnector(_SlowConnector):
+    """RAW 저장이 동기 클라이언트로 블로킹되는 커넥터 (조회 완료 시점 기록)"""
+
+    def __init__(self):
+        super().__init__(queries=1)
+        self.db = _BlockingDB(self.events)
+
+    async def fetch_page(self, query, cursor):
+        result = await super().fetch_page(query, cursor)
+        self.events.append(("fetch_end", query.query, cursor.position.get("page", 0)))
+        return result
+
+
+class TestConcurrentRun:
+    """run() 쿼리 동시 실행 / 페이지 파이프라인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_matches_sequential_stats(self):
+        sequential = await _SlowConnector().run(seed={}, concurrency=1)
+        concurrent = _SlowConnector()
+        result = await concurrent.run(seed={}, concurrency=3)
+
+        assert result["status"] == "completed"
+        assert result["stats"] == sequential["stats"]
+        assert result["stats"]["fetched"] == 12
+        assert result["stats"]["new"] == 12
+        assert 1 < concurrent.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_next_page_fetch_overlaps_upsert(self):
+        connector = _SlowConnector(queries=1)
+        await connector.run(seed={})
+
+        events = connector.events
+        upsert_first = events.index(("upsert_start", "q0-0"))
+        upsert_first_end = events.index(("upsert_end", "q0-0"))
+        second_fetch = events.index(("fetch_start", "q0", 1))
+        assert second_fetch < upsert_first_end
+        assert events.index(("fetch_start", "q0", 0)) < upsert_first
+
+    @pytest.mark.asyncio
+    async def test_blocking_db_write_overlaps_next_fetch(self):
+        """동기 클라이언트 저장이 루프를 막지 않음 - 저장 중 다음 페이지 조회 완료"""
+        connector = _BlockingWriteConnector()
+        result = await connector.run(seed={"profile_name": "p"})
+
+        events = connector.events
+        assert result["stats"]["raw_saved"] == 3
+        assert events.index(("db_start", "q0-0")) < events.index(("fetch_end", "q0", 1))
+        assert events.index(("fetch_end", "q0", 1)) < events.index(("db_end", "q0-0"))
+
+    @pytest.mark.asyncio
+    async def test_failed_query_fails_run(self):
+        connector = _SlowConnector(queries=4, fail_query="q1")
+        result = await connector.run(seed={}, concurrency=2)
+
+        assert result["status"] == "failed"
+        assert result["error"] == "fetch failed"
+
+
+class _ChecksumConnector(_SlowConnector):
+    """변경 감지 테스트용 커넥터 (1쿼리 1페이지, 레코드 3건)"""
+
+    checksum_table = "raw_source_records"
+
+    def __init__(self, db_client):
+        super().__init__(queries=1)
+        self.db = db_client
+        self.upserted = []
+
+    async def fetch_page(self, query, cursor):
+        return FetchResult(
+            records=[{"id": f"T{i}", "v": i} for i in range(3)], has_more=False
+        )
+
+    def normalize(self, record):
+        return NormalizedRecord(
+            external_id=record["id"],
+            record_type="test",
+            data=record,
+            checksum=NormalizedRecord.compute_checksum(record),
+            source=self.source,
+        )
+
+    async def upsert(self, records):
+        self.upserted.extend(r.external_id for r in records)
+        return UpsertResult(updated=len(records))
+
+
+class TestChangeDetection:
+    """체크섬 일괄 조회 후 변경분만 Upsert"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_records_upserted(self, mock_db):
+        table = mock_db.table.return_value
+        table.in_.return_value = table
+        table.execute.return_value.data = [
+            {
+                "external_id": "T0",
+                "checksum": NormalizedRecord.compute_checksum({"id": "T0", "v": 0}),
+            },
+            {"external_id": "T1", "checksum": "stale"},
+        ]
+        connector = _ChecksumConnector(mock_db)
+
+        result = await connector.run(seed={})
+
+        assert connector.upserted == ["T1", "T2"]
+        assert result["stats"]["unchanged"] == 1
+        assert result["stats"]["updated"] == 2
+        # 페이지당 조회 1회
+        table.in_.assert_called_once_with("external_id", ["T0", "T1", "T2"])
+        table.eq.assert_any_call("source", "slow")
+
+    @pytest.mark.asyncio
+    async def test_all_unchanged_skips_upsert(self, mock_db):
+        table = mock_db.table.return_value
+        table.in_.return_value = table
+        table.execute.return_value.data = [
+            {
+                "external_id": f"T{i}",
+                "checksum": NormalizedRecord.compute_checksum({"id": f"T{i}", "v": i}),
+            }
+            for i in range(3)
+        ]
+        connector = _ChecksumConnector(mock_db)
+
+        result = await connector.run(seed={})
+
+        assert connector.upserted == []
+        assert result["stats"]["unchanged"] == 3
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_upserts_everything(self, mock_db):
+        table = mock_db.table.return_value
+        table.in_.side_effect = RuntimeError("postgrest down")
+        connector = _ChecksumConnector(mock_db)
+
+        result = await connector.run(seed={})
+
+        assert result["status"] == "completed"
+        assert connector.upserted == ["T0", "T1", "T2"]
@@ -0,0 +1,324 @@
+"""
+Tests for Connector Response Cache
+캐시 키 정규화, 백엔드(SQLite/디렉터리/Redis), 조건부 요청, 변경 없는 레코드 생략 테스트
+"""
+
+import time
+
+import httpx
+import pytest
+
+from app.connectors.base import (
+    BaseConnector,
+    FetchResult,
+    NormalizedRecord,
+    QuerySpec,
+    RequestMetrics,
+    UpsertResult,
+    fetch_with_retry,
+)
+from app.connectors.cache import (
+    CachedResponse,
+    DirectoryResponseCache,
+    RedisResponseCache,
+    SQLiteResponseCache,
+    cache_key,
+    create_response_cache,
+)
+
+
+class FakeRedis:
+    """RedisResponseCache가 쓰는 명령만 구현 (get/set/mget/pipeline)"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.ops.append((key, value, ex))
+
+    async def execute(self):
+        for key, value, ex in self.ops:
+            await self.redis.set(key, value, ex=ex)
+
+
+@pytest.fixture(params=["sqlite", "directory", "redis"])
+async def cache(request, tmp_path):
+    if request.param == "sqlite":
+        backend = SQLiteResponseCache(str(tmp_path / "cache.db"))
+    elif request.param == "directory":
+        backend = DirectoryResponseCache(str(tmp_path / "cache"))
+    else:
+        backend = RedisResponseCache(FakeRedis())
+    yield backend
+    await backend.aclose()
+
+
+class TestCacheKey:
+    """캐시 키 정규화 테스트"""
+
+    def test_param_order_and_host_case_ignored(self):
+        a = cache_key("get", "https://REST.example.org/x?b=2", {"a": 1})
+        b = cache_key("GET", "https://rest.example.org/x", {"a": "1", "b": "2"})
+        assert a == b
+
+    def test_credentials_excluded(self):
+        a = cache_key("GET", "https://eutils.example.org/esearch", {"term": "ADC"})
+        b = cache_key(
+            "GET",
+            "https://eutils.example.org/esearch",
+            {"term": "ADC", "api_key": "secret", "email": "me@example.org"},
+        )
+        assert a == b
+
+    def test_body_and_method_distinguish(self):
+        url = "https://api.example.org/graphql"
+        assert cache_key("POST", url, json_data={"q": 1}) != cache_key(
+            "POST", url, json_data={"q": 2}
+        )
+        assert cache_key("GET", url) != cache_key("POST", url)
+
+
+class TestBackends:
+    """백엔드 공통 동작"""
+
+    @pytest.mark.asyncio
+    async def test_response_roundtrip(self, cache):
+        entry = CachedResponse(
+            status_code=200,
+            content=b'{"id": 1}',
+            headers={"etag": '"v1"', "content-type": "application/json"},
+        )
+        await cache.set("k1", entry)
+
+        loaded = await cache.get("k1")
+        assert loaded.content == entry.content
+        assert loaded.headers == entry.headers
+        assert loaded.stored_at == pytest.approx(entry.stored_at)
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_marks(self, cache):
+        await cache.mark(["a", "b"])
+        assert await cache.seen(["a", "b", "c"]) == {"a", "b"}
+        assert await cache.seen([]) == set()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_dropped(self, tmp_path):
+        for backend in (
+            SQLiteResponseCache(str(tmp_path / "cache.db")),
+            DirectoryResponseCache(str(tmp_path / "cache")),
+        ):
+            await backend.set("k", CachedResponse(200, b"x"), retention=-1)
+            await backend.mark(["m"], retention=-1)
+            assert await backend.get("k") is None
+            assert await backend.seen(["m"]) == set()
+            await backend.aclose()
+
+    def test_create_from_url(self, tmp_path):
+        assert create_response_cache("") is None
+        assert isinstance(
+            create_response_cache(f"sqlite://{tmp_path}/c.db"), SQLiteResponseCache
+        )
+        directory = create_response_cache(f"file://{tmp_path}/c")
+        assert directory.root == tmp_path / "c"
+        assert create_response_cache("redis") is None
+        assert isinstance(
+            create_response_cache("redis", redis=FakeRedis()), RedisResponseCache
+        )
+        with pytest.raises(ValueError):
+            create_response_cache("ftp://cache")
+
+
+class TestConditionalFetch:
+    """fetch_with_retry 캐시 경로"""
+
+    URL = "https://rest.example.org/entry/P04626"
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_request(self, tmp_path):
+        cache = DirectoryResponseCache(str(tmp_path))
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'})
+
+        metrics = RequestMetrics()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            for _ in range(2):
+                response = await fetch_with_retry(
+                    self.URL, client=c, metrics=metrics, cache=cache, cache_ttl=60
+                )
+                assert response.json() == {"v": 1}
+
+        assert len(requests) == 1
+        host = metrics.hosts["rest.example.org"]
+        assert host.requests == 1 and host.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidates_with_validators(self, tmp_path):
+        cache = DirectoryResponseCache(str(tmp_path))
+        key = cache_key("GET", self.URL)
+        await cache.set(
+            key,
+            CachedResponse(
+                status_code=200,
+                content=b'{"v": 1}',
+                headers={
+                    "etag": '"v1"',
+                    "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+                stored_at=time.time() - 3600,
+            ),
+        )
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers)
+            return httpx.Response(304)
+
+        metrics = RequestMetrics()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            response = await fetch_with_retry(
+                self.URL, client=c, metrics=metrics, cache=cache, cache_ttl=60
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"v": 1}
+        assert seen_headers[0]["if-none-match"] == '"v1"'
+        assert seen_headers[0]["if-modified-since"].startswith("Wed, 01 Jan 2025")
+        assert metrics.hosts["rest.example.org"].not_modified == 1
+        # 재검증 후 다시 TTL 동안 신선
+        assert (await cache.get(key)).is_fresh(60)
+
+    @pytest.mark.asyncio
+    async def test_changed_entry_replaced(self, tmp_path):
+        cache = DirectoryResponseCache(str(tmp_path))
+        key = cache_key("GET", self.URL)
+        await cache.set(
+            key, CachedResponse(200, b'{"v": 1}', {"etag": '"v1"'}, time.time() - 10)
+        )
+
+        def handler(request):
+            return httpx.Response(200, json={"v": 2}, headers={"ETag": '"v2"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            response = await fetch_with_retry(self.URL, client=c, cache=cache)
+
+        assert response.json() == {"v": 2}
+        assert (await cache.get(key)).headers["etag"] == '"v2"'
+
+
+class _EntryConnector(BaseConnector):
+    """엔트리 목록 1페이지 조회 커넥터 (Upsert 호출 기록)"""
+
+    source = "entries"
+    rate_limit_qps = 1000.0
+    cache_ttl = 3600
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.normalized = []
+        self.upserted = []
+
+    async def build_queries(self, seed):
+        return [QuerySpec(query="entries")]
+
+    async def fetch_page(self, query, cursor):
+        response = await self.fetch("https://rest.example.org/entries")
+        return FetchResult(records=response.json()["results"], has_more=False)
+
+    def normalize(self, record):
+        self.normalized.append(record["id"])
+        return NormalizedRecord(
+            external_id=record["id"],
+            record_type="target",
+            data=record,
+            checksum=NormalizedRecord.compute_checksum(record),
+            source=self.source,
+        )
+
+    async def upsert(self, records):
+        self.upserted.extend(r.external_id for r in records)
+        return UpsertResult(inserted=len(records))
+
+
+class TestUnchangedRecords:
+    """체크섬 마크로 변경 없는 레코드 정규화/Upsert 생략"""
+
+    @pytest.mark.asyncio
+    async def test_second_run_skips_processed_records(self, tmp_path):
+        cache = SQLiteResponseCache(str(tmp_path / "cache.db"))
+        entries = [{"id": "E1", "v": 1}, {"id": "E2", "v": 1}]
+
+        def handler(request):
+            return httpx.Response(200, json={"results": entries})
+
+        def connector():
+            c = _EntryConnector(response_cache=cache)
+            c._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            return c
+
+        first = connector()
+        result = await first.run(seed={})
+        assert result["stats"]["new"] == 2
+        assert first.upserted == ["E1", "E2"]
+
+        # 한 건 변경 → 변경분만 처리 (cache_ttl=0: 캐시 응답 대신 재요청)
+        await cache.aclose()
+        cache = SQLiteResponseCache(str(tmp_path / "cache.db"))
+        entries = [{"id": "E1", "v": 1}, {"id": "E2", "v": 2}]
+        second = connector()
+        second.cache_ttl = 0
+        result = await second.run(seed={})
+
+        assert result["status"] == "completed"
+        assert result["stats"]["unchanged"] == 1
+        assert second.normalized == ["E2"]
+        assert second.upserted == ["E2"]
+        await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_upsert_not_marked(self, tmp_path):
+        cache = DirectoryResponseCache(str(tmp_path))
+
+        def handler(request):
+            return httpx.Response(200, json={"results": [{"id": "E1"}]})
+
+        class FailingConnector(_EntryConnector):
+            async def upsert(self, records):
+                return UpsertResult(errors=len(records))
+
+        for connector_cls, expected_unchanged in (
+            (FailingConnector, 0),
+            (_EntryConnector, 0),
+            (_EntryConnector, 1),
+        ):
+            c = connector_cls(response_cache=cache)
+            c._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await c.run(seed={})
+            assert result["stats"]["unchanged"] == expected_unchanged
@@ -64,7 +64,7 @@ class TestPubMedConnector:
         _mock_response.text = mock_pubmed_response["esearch"]
 
         with patch(
-            "app.connectors.pubmed.fetch_with_retry", new_callable=AsyncMock
+            "app.connectors.base.fetch_with_retry", new_callable=AsyncMock
         ) as mock_fetch:
             mock_fetch.return_value = _mock_response
 
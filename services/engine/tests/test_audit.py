@@ -5,6 +5,7 @@ Audit Service Tests
 """
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 from app.services.audit_service import (
     AuditService,
@@ -147,3 +148,15 @@ class TestAuditServiceIntegration:
             resource_type="design_run",
             resource_id="test-id",
         )
+
+    async def test_log_event_awaits_async_client(self):
+        """AsyncClient의 execute()는 await하여 실제 기록"""
+        db = MagicMock()
+        query = db.table.return_value.insert.return_value
+        query.execute = AsyncMock(return_value=MagicMock(data=[{"id": "evt"}]))
+        service = AuditService(db_client=db)
+
+        await service.log_event(event_type="run.completed", resource_id="test-id")
+
+        db.table.assert_called_with("audit_events")
+        query.execute.assert_awaited_once()
@@ -0,0 +1,168 @@
+"""
+Bulk Writer Tests
+- 바이트 예산 청크 분할 (후보-스코어 쌍 유지)
+- 청크 동시 업로드 상한 / FK 순서 (후보 → 스코어)
+- 청크 단위 재시도, 재시도 초과 시 예외 전파
+- COPY 불가 시 PostgREST 경로 대체
+- COPY는 임시 테이블 경유 ON CONFLICT DO NOTHING (재시도 멱등)
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from tenacity import wait_none
+
+from app.services.bulk_writer import CandidateBulkWriter, _copy_rows
+
+
+class RecordingDB:
+    """upsert 호출 기록용 Supabase 대역 (스레드 안전)"""
+
+    def __init__(self, fail_times=0, delay=0.0):
+        self.calls = []
+        self.fail_times = fail_times
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def table(self, name):
+        db = self
+
+        class Query:
+            def upsert(self, rows):
+                self.rows = rows
+                return self
+
+            def execute(self):
+                with db._lock:
+                    db.active += 1
+                    db.max_active = max(db.max_active, db.active)
+                try:
+                    time.sleep(db.delay)
+                    with db._lock:
+                        if db.fail_times:
+                            db.fail_times -= 1
+                            raise ConnectionError("transient")
+                        db.calls.append((name, [r["id"] for r in self.rows]))
+                    return SimpleNamespace(data=self.rows)
+                finally:
+                    with db._lock:
+                        db.active -= 1
+
+        return Query()
+
+
+def _records(n, start=0):
+    candidates = [
+        {"id": f"c{i}", "run_id": "run-1", "snapshot_refs": {"target": "x" * 40}}
+        for i in range(start, start + n)
+    ]
+    scores = [
+        {"id": f"s{i}", "candidate_id": f"c{i}", "score_components": {"k": i}}
+        for i in range(start, start + n)
+    ]
+    return candidates, scores
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(CandidateBulkWriter, "RETRY_WAIT", wait_none())
+
+
+class TestCandidateBulkWriter:
+    """후보/스코어 대량 저장 테스트"""
+
+    async def test_chunks_by_byte_budget(self):
+        db = RecordingDB()
+        writer = CandidateBulkWriter(db, chunk_bytes=1000)
+        candidates, scores = _records(40)
+        chunks = writer._chunks(candidates, scores)
+
+        assert len(chunks) > 1
+        assert all(c.nbytes <= 1000 for c in chunks)
+        assert [c["id"] for chunk in chunks for c in chunk.candidates] == [
+            c["id"] for c in candidates
+        ]
+        assert all(
+            [s["candidate_id"] for s in chunk.scores]
+            == [c["id"] for c in chunk.candidates]
+            for chunk in chunks
+        )
+
+    async def test_oversized_row_gets_own_chunk(self):
+        writer = CandidateBulkWriter(RecordingDB(), chunk_bytes=1)
+        chunks = writer._chunks(*_records(3))
+        assert [len(c.candidates) for c in chunks] == [1, 1, 1]
+
+    async def test_writes_all_rows_with_bounded_concurrency(self):
+        db = RecordingDB(delay=0.01)
+        async with CandidateBulkWriter(db, chunk_bytes=500, concurrency=2) as writer:
+            for start in range(0, 60, 20):
+                await writer.write(*_records(20, start))
+
+        written = [i for name, ids in db.calls if name == "candidates" for i in ids]
+        assert sorted(written) == sorted(f"c{i}" for i in range(60))
+        assert writer.stats.rows == 60
+        assert 1 < db.max_active <= 2
+
+        # FK: 스코어는 같은 청크의 후보 저장 이후
+        seen = set()
+        for name, ids in db.calls:
+            if name == "candidates":
+                seen.update(ids)
+            else:
+                assert {f"c{i[1:]}" for i in ids} <= seen
+
+    async def test_retries_failed_chunk(self):
+        db = RecordingDB(fail_times=2)
+        async with CandidateBulkWriter(db, max_retries=3) as writer:
+            await writer.write(*_records(5))
+
+        assert writer.stats.retries == 2
+        assert writer.stats.rows == 5
+        assert [name for name, _ in db.calls] == ["candidates", "candidate_scores"]
+
+    async def test_raises_after_retries_exhausted(self):
+        db = RecordingDB(fail_times=10)
+        writer = CandidateBulkWriter(db, max_retries=2)
+        await writer.write(*_records(5))
+
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+        await writer.close()
+
+    async def test_copy_unavailable_falls_back_to_rest(self):
+        db = RecordingDB()
+        async with CandidateBulkWriter(
+            db, dsn="postgresql://127.0.0.1:1/none"
+        ) as writer:
+            await writer.write(*_records(5))
+
+        assert writer.stats.copy_chunks == 0
+        assert writer.stats.rows == 5
+        assert not writer._copy_enabled
+
+    async def test_copy_merges_through_temp_table(self):
+        class Cursor:
+            def __init__(self):
+                self.sql = []
+
+            def execute(self, sql):
+                self.sql.append(sql)
+
+            def copy_expert(self, sql, buffer):
+                self.sql.append(sql)
+                self.data = buffer.read()
+
+        cursor = Cursor()
+        _copy_rows(cursor, "candidates", _records(2)[0])
+
+        create, copy, insert = cursor.sql
+        assert create.startswith("CREATE TEMP TABLE _bulk_candidates")
+        assert "ON COMMIT DROP" in create
+        assert copy.startswith("COPY _bulk_candidates (id, run_id, snapshot_refs)")
+        assert insert.endswith("ON CONFLICT (id) DO NOTHING")
+        assert cursor.data.splitlines()[0].startswith("c0,run-1,")
@@ -0,0 +1,134 @@
+"""
+Database Layer Tests
+- AsyncClient가 주입한 공유 HTTP 클라이언트(커넥션 풀)로 PostgREST 호출
+- execute_nonblocking(): 동기/비동기 클라이언트 겸용
+- job_db(): Worker ctx 클라이언트 재사용
+- AsyncClient 경로 대량 저장 (스레드 없이 이벤트 루프에서 업로드)
+"""
+
+import json
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import (
+    close_async_db,
+    create_async_db,
+    execute_nonblocking,
+    is_async_client,
+    job_db,
+)
+from app.services.bulk_writer import CandidateBulkWriter
+
+SUPABASE_URL = "http://supabase.test"
+
+
+class PostgRESTRecorder:
+    """PostgREST 요청 기록용 MockTransport 핸들러"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        self.requests.append((request.method, request.url.path, body, request))
+        return httpx.Response(200, json=body if body is not None else [{"id": "w1"}])
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr(settings, "SUPABASE_URL", SUPABASE_URL)
+    monkeypatch.setattr(settings, "SUPABASE_SERVICE_ROLE_KEY", "service-role-key")
+
+
+@pytest.fixture
+async def recorder(configured):
+    handler = PostgRESTRecorder()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    handler.db = await create_async_db(http_client)
+    handler.http_client = http_client
+    yield handler
+    await close_async_db(handler.db)
+
+
+class TestAsyncDatabase:
+    """비동기 DB 레이어 테스트"""
+
+    async def test_queries_share_injected_http_client(self, recorder):
+        db = recorder.db
+        assert is_async_client(db)
+        assert db.postgrest.session is recorder.http_client
+
+        result = await db.table("workspaces").select("id").limit(1).execute()
+        await db.table("run_progress").select("*").eq("run_id", "r1").execute()
+
+        assert result.data == [{"id": "w1"}]
+        assert [path for _, path, _, _ in recorder.requests] == [
+            "/rest/v1/workspaces",
+            "/rest/v1/run_progress",
+        ]
+        request = recorder.requests[0][3]
+        assert request.headers["apikey"] == "service-role-key"
+
+    async def test_close_releases_pool(self, recorder):
+        await close_async_db(recorder.db)
+        assert recorder.http_client.is_closed
+
+    async def test_execute_nonblocking_accepts_both_clients(self, recorder, mock_db):
+        mock_db.table.return_value.execute.return_value.data = [{"id": "sync"}]
+
+        sync_result = await execute_nonblocking(
+            mock_db.table("workspaces").select("id")
+        )
+        async_result = await execute_nonblocking(
+            recorder.db.table("workspaces").select("id")
+        )
+
+        assert sync_result.data == [{"id": "sync"}]
+        assert async_result.data == [{"id": "w1"}]
+        assert not is_async_client(mock_db)
+
+    async def test_job_db_reuses_startup_client(self, monkeypatch, recorder):
+        async def fail():
+            raise AssertionError("startup client should be reused")
+
+        monkeypatch.setattr(database, "create_async_db", fail)
+        ctx = {"async_db": recorder.db}
+        assert await job_db(ctx) is recorder.db
+
+    async def test_bulk_writer_uploads_on_event_loop(self, monkeypatch, recorder):
+        """AsyncClient면 스레드 없이 공유 풀로 청크 업로드 (후보 → 스코어 순서)"""
+        monkeypatch.setattr(CandidateBulkWriter, "RETRY_WAIT", wait_none())
+
+        async def no_thread(*args, **kwargs):
+            raise AssertionError("async client must not use worker threads")
+
+        monkeypatch.setattr("asyncio.to_thread", no_thread)
+
+        candidates = [{"id": f"c{i}", "run_id": "run-1"} for i in range(30)]
+        scores = [{"id": f"s{i}", "candidate_id": f"c{i}"} for i in range(30)]
+        async with CandidateBulkWriter(recorder.db, chunk_bytes=300) as writer:
+            await writer.write(candidates, scores)
+
+        assert writer.stats.rows == 30
+        assert writer.stats.chunks > 1
+
+        uploaded = {
+            path: [
+                row["id"]
+                for _, p, body, _ in recorder.requests
+                if p == path
+                for row in body
+            ]
+            for path in ("/rest/v1/candidates", "/rest/v1/candidate_scores")
+        }
+        assert sorted(uploaded["/rest/v1/candidates"]) == sorted(
+            c["id"] for c in candidates
+        )
+        assert sorted(uploaded["/rest/v1/candidate_scores"]) == sorted(
+            s["id"] for s in scores
+        )
+        assert all(method == "POST" for method, _, _, _ in recorder.requests)
@@ -0,0 +1,261 @@
+"""
+Embedding Client Tests
+- 토큰 예산/입력 수 기준 배치 분할, 입력 순서 유지, 중복 텍스트 1회 전송
+- 재시도 가능한 오류 재시도, 실패 배치는 None
+- OpenAI provider 요청 형식 (MockTransport)
+- TPM 리미터 대기
+- 임베딩 캐시: 정규화 체크섬 키, 반복 임베딩은 요청 없음
+"""
+
+import time
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from app.core.config import settings
+from app.core.embedding_cache import (
+    MemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+    SupabaseEmbeddingCache,
+    create_embedding_cache,
+    text_checksum,
+)
+from app.core.embeddings import (
+    EmbeddingClient,
+    EmbeddingError,
+    EmbeddingProvider,
+    LocalEmbeddingProvider,
+    OpenAIEmbeddingProvider,
+    TokenRateLimiter,
+    create_embedding_client,
+    estimate_tokens,
+)
+
+
+class RecordingProvider(LocalEmbeddingProvider):
+    """요청별 입력 기록 + 지정 횟수만큼 실패"""
+
+    def __init__(self, failures=0, retryable=True):
+        super().__init__(dimensions=8)
+        self.requests = []
+        self.failures = failures
+        self.retryable = retryable
+
+    async def embed(self, texts):
+        self.requests.append(list(texts))
+        if self.failures:
+            self.failures -= 1
+            raise EmbeddingError("HTTP 429", retryable=self.retryable)
+        return await super().embed(texts)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(EmbeddingClient, "RETRY_WAIT", wait_none())
+
+
+class TestEmbeddingClient:
+    """배치 임베딩 클라이언트 테스트"""
+
+    def test_pack_respects_token_budget_and_input_count(self):
+        client = EmbeddingClient(
+            LocalEmbeddingProvider(), max_batch_tokens=30, max_batch_inputs=3
+        )
+        texts = ["x" * 40] * 5 + ["y" * 100]  # 11 토큰 x5, 26 토큰
+
+        batches = client.pack(texts)
+
+        assert batches == [[0, 1], [2, 3], [4], [5]]
+        for batch in batches:
+            assert (
+                len(batch) == 1 or sum(estimate_tokens(texts[i]) for i in batch) <= 30
+            )
+
+    async def test_embed_preserves_order_and_dedupes(self):
+        provider = RecordingProvider()
+        client = EmbeddingClient(provider, max_batch_inputs=2, tokens_per_minute=0)
+        texts = ["alpha", "beta", "alpha", "gamma"]
+
+        vectors = await client.embed(texts)
+
+        assert vectors[0] == vectors[2] == provider.vector("alpha")
+        assert vectors[1] == provider.vector("beta")
+        assert vectors[3] == provider.vector("gamma")
+        sent = [text for request in provider.requests for text in request]
+        assert sorted(sent) == ["alpha", "beta", "gamma"]
+        assert client.stats.requests == 2
+
+    async def test_retryable_error_retried(self):
+        provider = RecordingProvider(failures=2)
+        client = EmbeddingClient(provider, tokens_per_minute=0)
+
+        vector = await client.embed_one("payload linker")
+
+        assert vector == provider.vector("payload linker")
+        assert client.stats.retries == 2
+        assert len(provider.requests) == 3
+
+    async def test_failed_batch_returns_none(self):
+        provider = RecordingProvider(failures=1, retryable=False)
+        client = EmbeddingClient(provider, max_batch_inputs=1, tokens_per_minute=0)
+
+        vectors = await client.embed(["a", "b"])
+
+        assert vectors.count(None) == 1
+        assert client.stats.failed == 1
+
+    async def test_local_provider_is_deterministic(self):
+        provider = LocalEmbeddingProvider()
+        first, _ = await provider.embed(["HER2 ADC toxicity"])
+        second, _ = await LocalEmbeddingProvider().embed(["HER2 ADC toxicity"])
+
+        assert first == second
+        assert len(first[0]) == 1536
+        assert sum(v * v for v in first[0]) == pytest.approx(1.0)
+
+    def test_create_local_client(self, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "local")
+        client = create_embedding_client()
+        assert isinstance(client.provider, LocalEmbeddingProvider)
+
+        monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "openai")
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "")
+        assert create_embedding_client() is None
+
+
+class TestOpenAIProvider:
+    """OpenAI Embeddings API 요청 형식"""
+
+    async def test_batch_request_reordered_by_index(self):
+        bodies = []
+
+        def handler(request):
+            import json
+
+            body = json.loads(request.content)
+            bodies.append(body)
+            data = [
+                {"index": i, "embedding": [float(i)]}
+                for i in reversed(range(len(body["input"])))
+            ]
+            return httpx.Response(
+                200, json={"data": data, "usage": {"total_tokens": 7}}
+            )
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        provider = OpenAIEmbeddingProvider("sk-test", http_client=http_client)
+
+        vectors, used = await provider.embed(["a", "b", "c"])
+
+        assert vectors == [[0.0], [1.0], [2.0]]
+        assert used == 7
+        assert bodies == [{"model": "text-embedding-3-small", "input": ["a", "b", "c"]}]
+        await provider.aclose()
+
+    async def test_rate_limited_response_is_retryable(self):
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(429, text="slow"))
+        )
+        provider = OpenAIEmbeddingProvider("sk-test", http_client=http_client)
+
+        with pytest.raises(EmbeddingError) as exc:
+            await provider.embed(["a"])
+        assert exc.value.retryable
+        await provider.aclose()
+
+
+class TestTokenRateLimiter:
+    """분당 토큰 리미터"""
+
+    async def test_waits_when_budget_exhausted(self):
+        limiter = TokenRateLimiter(tokens_per_minute=6000)  # 초당 100 토큰
+
+        started = time.monotonic()
+        await limiter.acquire(6000)
+        await limiter.acquire(10)
+
+        assert time.monotonic() - started >= 0.08
+
+    async def test_unlimited(self):
+        limiter = TokenRateLimiter(tokens_per_minute=0)
+        await limiter.acquire(10**9)
+
+
+def test_provider_interface():
+    with pytest.raises(TypeError):
+        EmbeddingProvider()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def cache(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryEmbeddingCache()
+    else:
+        backend = SQLiteEmbeddingCache(str(tmp_path / "embeddings.db"))
+    yield backend
+    await backend.aclose()
+
+
+class TestEmbeddingCache:
+    """임베딩 캐시 (model + 정규화 텍스트 체크섬)"""
+
+    def test_checksum_normalizes_whitespace(self):
+        assert text_checksum("HER2  ADC\n toxicity ") == text_checksum(
+            "HER2 ADC toxicity"
+        )
+        assert text_checksum("HER2 ADC") != text_checksum("her2 adc")
+
+    async def test_backend_roundtrip(self, cache):
+        await cache.set_many("m1", {"a": [0.5, -0.25], "b": [1.0, 0.0]})
+
+        assert await cache.get_many("m1", ["a", "b", "c"]) == {
+            "a": [0.5, -0.25],
+            "b": [1.0, 0.0],
+        }
+        assert await cache.get_many("m2", ["a"]) == {}
+
+    async def test_repeated_embedding_costs_no_requests(self, cache):
+        provider = RecordingProvider()
+        texts = ["alpha beta", "gamma", "alpha  beta\n"]
+
+        first = await EmbeddingClient(provider, cache=cache).embed(texts)
+        client = EmbeddingClient(provider, cache=cache)
+        second = await client.embed(texts + ["delta"])
+
+        assert len(provider.requests) == 2
+        assert provider.requests[1] == ["delta"]
+        assert client.stats.cache_hits == 2
+        for cached, original in zip(second[:3], first):
+            assert cached == pytest.approx(original, abs=1e-6)
+
+    async def test_failed_inputs_not_cached(self, cache):
+        provider = RecordingProvider(failures=1, retryable=False)
+        client = EmbeddingClient(provider, cache=cache)
+
+        assert await client.embed_one("alpha") is None
+        assert await client.embed_one("alpha") is not None
+        assert len(provider.requests) == 2
+
+    async def test_cache_errors_fall_back_to_provider(self):
+        class BrokenCache(MemoryEmbeddingCache):
+            async def get_many(self, model, checksums):
+                raise RuntimeError("down")
+
+        provider = RecordingProvider()
+        client = EmbeddingClient(provider, cache=BrokenCache())
+
+        assert await client.embed_one("alpha") == provider.vector("alpha")
+
+    def test_create_from_url(self, tmp_path):
+        assert create_embedding_cache("") is None
+        assert isinstance(create_embedding_cache("memory"), MemoryEmbeddingCache)
+        assert isinstance(
+            create_embedding_cache(f"sqlite://{tmp_path}/e.db"), SQLiteEmbeddingCache
+        )
+        assert isinstance(
+            create_embedding_cache("supabase", db_client=object()),
+            SupabaseEmbeddingCache,
+        )
+        with pytest.raises(ValueError):
+            create_embedding_cache("redis://cache")
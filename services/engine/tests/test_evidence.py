@@ -0,0 +1,256 @@
+"""
+Evidence RAG Tests
+- 하이브리드 검색: 키워드/벡터 동시 실행, RRF 융합, 문서 단위 중복 제거
+- 벡터 RPC 행 → 인용 형식 변환, negative polarity 부스팅
+- 배치 근거 생성: 고유 검색 쿼리당 검색 1회, evidence_signals 일괄 저장
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.embeddings import EmbeddingClient, LocalEmbeddingProvider
+from app.services.evidence import EvidenceRAGService
+
+
+def _chunk(chunk_id, document_id, pmid, polarity="neutral", content="ADC"):
+    return {
+        "id": chunk_id,
+        "document_id": document_id,
+        "content": content,
+        "polarity": polarity,
+        "literature_documents": {"pmid": pmid, "title": f"Paper {pmid}"},
+    }
+
+
+def _rpc_row(chunk_id, document_id, pmid, similarity, polarity="neutral"):
+    return {
+        "id": chunk_id,
+        "document_id": document_id,
+        "content": "ADC",
+        "similarity": similarity,
+        "document_title": f"Paper {pmid}",
+        "polarity": polarity,
+        "document_pmid": pmid,
+    }
+
+
+class _FakeQuery:
+    def __init__(self, db, kind, data):
+        self.db = db
+        self.kind = kind
+        self.data = data
+
+    def __getattr__(self, name):
+        # select/limit/text_search 등 체인 메서드는 자기 자신 반환
+        return lambda *args, **kwargs: self
+
+    async def execute(self):
+        self.db.calls.append(self.kind)
+        await asyncio.sleep(self.db.latency)
+        if isinstance(self.data, Exception):
+            raise self.data
+        return SimpleNamespace(data=self.data)
+
+
+class FakeDB:
+    """literature_chunks 키워드 검색 + match_literature_chunks RPC 응답 고정"""
+
+    def __init__(self, keyword=None, vector=None, latency=0.0):
+        self.keyword = [] if keyword is None else keyword
+        self.vector = [] if vector is None else vector
+        self.latency = latency
+        self.calls = []
+        self.rpc_params = None
+        self.inserts = []
+
+    def table(self, name):
+        if name == "evidence_signals":
+            return SimpleNamespace(insert=self._insert)
+        assert name == "literature_chunks"
+        return _FakeQuery(self, "keyword", self.keyword)
+
+    def _insert(self, rows):
+        self.inserts.append(rows)
+        return _FakeQuery(self, "insert", rows)
+
+    def rpc(self, name, params):
+        assert name == "match_literature_chunks"
+        self.rpc_params = params
+        return _FakeQuery(self, "vector", self.vector)
+
+
+def _service(db, **kwargs):
+    client = EmbeddingClient(LocalEmbeddingProvider(dimensions=8), tokens_per_minute=0)
+    return EvidenceRAGService(db, embedding_client=client, **kwargs)
+
+
+class TestHybridSearch:
+    """EvidenceRAGService._search_literature 테스트"""
+
+    async def test_rrf_fuses_and_dedupes_by_document(self):
+        db = FakeDB(
+            keyword=[
+                _chunk("c1", "d1", "1"),
+                _chunk("c2", "d2", "2"),
+                _chunk("c3", "d1", "1"),
+            ],
+            vector=[_rpc_row("c2", "d2", "2", 0.9), _rpc_row("c4", "d3", "3", 0.8)],
+        )
+
+        chunks = await _service(db)._search_literature("HER2 ADC", top_k=10)
+
+        # c2는 두 검색 모두 상위 → 1위, d1은 최상위 청크(c1)만 유지
+        assert [c["id"] for c in chunks] == ["c2", "c1", "c4"]
+        assert chunks[0]["relevance_score"] == 1.0
+        assert all(0 < c["relevance_score"] <= 1.0 for c in chunks)
+        assert db.rpc_params["match_count"] == EvidenceRAGService.VECTOR_TOP_K
+
+    async def test_top_k_limits_fused_results(self):
+        db = FakeDB(keyword=[_chunk(f"c{i}", f"d{i}", str(i)) for i in range(8)])
+
+        chunks = await _service(db)._search_literature("ADC", top_k=3)
+
+        assert [c["id"] for c in chunks] == ["c0", "c1", "c2"]
+
+    async def test_legs_run_concurrently(self):
+        db = FakeDB(
+            keyword=[_chunk("c1", "d1", "1")],
+            vector=[_rpc_row("c2", "d2", "2", 0.9)],
+            latency=0.2,
+        )
+
+        started = time.monotonic()
+        chunks = await _service(db)._search_literature("ADC", top_k=10)
+
+        assert time.monotonic() - started < 0.35
+        assert sorted(db.calls) == ["keyword", "vector"]
+        assert len(chunks) == 2
+
+    async def test_failed_leg_falls_back_to_other(self):
+        db = FakeDB(
+            keyword=RuntimeError("tsquery syntax error"),
+            vector=[_rpc_row("c2", "d2", "2", 0.9)],
+        )
+
+        chunks = await _service(db)._search_literature("ADC", top_k=10)
+
+        assert [c["id"] for c in chunks] == ["c2"]
+
+    async def test_no_embedding_client_skips_vector_leg(self, monkeypatch):
+        monkeypatch.setattr("app.services.evidence.get_embedding_client", lambda: None)
+        db = FakeDB(keyword=[_chunk("c1", "d1", "1")])
+
+        chunks = await EvidenceRAGService(db)._search_literature("ADC", top_k=10)
+
+        assert db.calls == ["keyword"]
+        assert [c["id"] for c in chunks] == ["c1"]
+
+    def test_per_leg_top_k_configurable(self):
+        service = _service(FakeDB(), keyword_top_k=5, vector_top_k=7)
+        assert (service.keyword_top_k, service.vector_top_k) == (5, 7)
+
+
+class TestGenerateEvidence:
+    """검색 → 부스팅 → 인용 흐름"""
+
+    async def test_vector_rows_become_citations_with_negative_first(self):
+        db = FakeDB(
+            keyword=[_chunk("c1", "d1", "101", polarity="positive")],
+            vector=[
+                _rpc_row("c1", "d1", "101", 0.9, polarity="positive"),
+                _rpc_row("c2", "d2", "102", 0.8, polarity="negative"),
+            ],
+        )
+        candidate = {"target": {"name": "HER2"}, "payload": {"payload_class": "MMAE"}}
+        score_components = {"safety_fit": {"terms": {"toxicity": 50}}}
+
+        result = await _service(db).generate_evidence(candidate, score_components)
+
+        assert [c.pmid for c in result.citations] == ["102", "101"]
+        assert result.citations[0].polarity == "negative"
+        assert result.has_evidence and not result.is_assumption
+        assert result.conflict_alert
+
+    @pytest.mark.parametrize("db", [None, FakeDB()])
+    async def test_no_results_is_assumption(self, db):
+        result = await _service(db).generate_evidence({"target": {}}, {})
+
+        assert result.is_assumption
+        assert result.citations == []
+
+
+class TestEvidenceBatch:
+    """generate_evidence_batch / save_evidence 테스트"""
+
+    @staticmethod
+    def _candidate(candidate_id, target, payload_class="MMAE"):
+        return {
+            "id": candidate_id,
+            "target": {"name": target},
+            "payload": {"payload_class": payload_class},
+        }
+
+    async def test_one_search_per_unique_query(self):
+        db = FakeDB(
+            keyword=[_chunk("c1", "d1", "101"), _chunk("c2", "d2", "102")],
+            vector=[_rpc_row("c3", "d3", "103", 0.9)],
+        )
+        service = _service(db)
+        candidates = [
+            self._candidate("a", "HER2"),
+            self._candidate("b", "HER2"),
+            self._candidate("c", "TROP2"),
+            self._candidate("d", "HER2"),
+        ]
+
+        results = await service.generate_evidence_batch(candidates, {})
+
+        assert sorted(results) == ["a", "b", "c", "d"]
+        assert db.calls.count("keyword") == 2
+        assert db.calls.count("vector") == 2
+        # 고유 쿼리 2개를 임베딩 요청 1회로
+        assert service.embedding.stats.requests == 1
+        assert results["a"].claim == results["b"].claim != results["c"].claim
+        assert [c.pmid for c in results["d"].citations] == ["101", "103", "102"]
+
+    async def test_risk_terms_split_groups_and_boost(self):
+        db = FakeDB(
+            keyword=[
+                _chunk("c1", "d1", "101", polarity="positive"),
+                _chunk("c2", "d2", "102", polarity="negative"),
+            ]
+        )
+        components = {"b": {"safety_fit": {"terms": {"toxicity": 50}}}}
+
+        results = await _service(db).generate_evidence_batch(
+            [self._candidate("a", "HER2"), self._candidate("b", "HER2")], components
+        )
+
+        assert db.calls.count("keyword") == 2
+        assert [c.pmid for c in results["a"].citations] == ["101", "102"]
+        assert [c.pmid for c in results["b"].citations] == ["102", "101"]
+
+    async def test_matches_single_candidate_path(self):
+        db = FakeDB(keyword=[_chunk("c1", "d1", "101"), _chunk("c2", "d2", "102")])
+        service = _service(db)
+        candidate = self._candidate("a", "HER2")
+
+        single = await service.generate_evidence(candidate, {})
+        batch = await service.generate_evidence_batch([candidate], {})
+
+        assert batch["a"] == single
+
+    async def test_save_evidence_single_bulk_insert(self):
+        db = FakeDB(keyword=[_chunk("c1", "d1", "101")])
+        service = _service(db)
+        results = await service.generate_evidence_batch(
+            [self._candidate(str(i), "HER2") for i in range(5)], {}
+        )
+
+        assert await service.save_evidence(results) == 5
+        assert len(db.inserts) == 1
+        assert sorted(row["candidate_id"] for row in db.inserts[0]) == list("01234")
+        assert await service.save_evidence({}) == 0
@@ -0,0 +1,98 @@
+"""
+Literature Chunking Tests
+- 청크 체크섬 = 임베딩 캐시 키
+- 증분 재조정: 같은 내용은 행 유지, 위치만 바뀌면 이동, 나머지 삽입/삭제
+"""
+
+from app.core.embedding_cache import text_checksum
+from app.services.literature import ChunkingService
+
+
+def _rows(document_id, contents, status="completed"):
+    """저장된 literature_chunks 행 (chunk_index = 목록 순서)"""
+    return [
+        {
+            "id": f"row-{i}",
+            "document_id": document_id,
+            "chunk_index": i,
+            "content": content,
+            "embedding_status": status,
+        }
+        for i, content in enumerate(contents)
+    ]
+
+
+def _chunks(service, document_id, contents):
+    return [
+        service._create_chunk(document_id, i, content, "abstract")
+        for i, content in enumerate(contents)
+    ]
+
+
+class TestChunkReconcile:
+    """ChunkingService.reconcile 테스트"""
+
+    def setup_method(self):
+        self.service = ChunkingService(max_tokens=20, overlap_tokens=5)
+
+    def test_checksum_matches_embedding_cache_key(self):
+        chunk = self.service._create_chunk("d1", 0, "HER2  ADC\ntoxicity", "abstract")
+        assert chunk.checksum == text_checksum("HER2 ADC toxicity")
+
+    def test_identical_document_is_noop(self):
+        chunks = self.service.chunk_document("d1", "Trastuzumab", "HER2 ADC " * 30)
+        existing = _rows("d1", [c.content for c in chunks])
+
+        plan = self.service.reconcile(existing, chunks)
+
+        assert not plan.changed
+        assert [r["id"] for r in plan.unchanged] == [r["id"] for r in existing]
+
+    def test_edit_only_touches_changed_chunks(self):
+        existing = _rows("d1", ["alpha", "beta", "gamma"])
+        chunks = _chunks(self.service, "d1", ["alpha", "beta v2", "gamma"])
+
+        plan = self.service.reconcile(existing, chunks)
+
+        assert [r["id"] for r in plan.unchanged] == ["row-0", "row-2"]
+        assert [c.content for c in plan.inserts] == ["beta v2"]
+        assert plan.deletes == ["row-1"]
+        assert plan.moves == []
+
+    def test_inserted_chunk_shifts_followers_without_reembedding(self):
+        existing = _rows("d1", ["alpha", "beta"])
+        chunks = _chunks(self.service, "d1", ["intro", "alpha", "beta"])
+
+        plan = self.service.reconcile(existing, chunks)
+
+        assert [(r["id"], r["chunk_index"]) for r in plan.moves] == [
+            ("row-0", 1),
+            ("row-1", 2),
+        ]
+        assert [(c.chunk_index, c.content) for c in plan.inserts] == [(0, "intro")]
+        assert plan.deletes == []
+
+    def test_duplicate_contents_matched_once_each(self):
+        existing = _rows("d1", ["same", "same", "other"])
+        chunks = _chunks(self.service, "d1", ["same", "other"])
+
+        plan = self.service.reconcile(existing, chunks)
+
+        assert [r["id"] for r in plan.unchanged] == ["row-0"]
+        assert [(r["id"], r["chunk_index"]) for r in plan.moves] == [("row-2", 1)]
+        assert plan.deletes == ["row-1"]
+
+    def test_reused_rows_keep_embedding_status(self):
+        existing = _rows("d1", ["alpha"], status="pending")
+        chunks = _chunks(self.service, "d1", ["beta", "alpha"])
+
+        plan = self.service.reconcile(existing, chunks)
+
+        assert [r["embedding_status"] for r in plan.reused] == ["pending"]
+        assert [c.content for c in plan.inserts] == ["beta"]
+
+    def test_long_text_split_terminates(self):
+        chunks = self.service.chunk_document("d1", "T", " ".join(["word"] * 50))
+
+        assert 2 <= len(chunks) <= 5
+        assert chunks[-1].content.endswith("word")
@@ -0,0 +1,346 @@
+"""
+Pareto Calculator Tests
+- NumPy 비지배 정렬 = 기존 전쌍 비교 구현, 큰 단일 프론트 시간 상한
+- 동일 벡터 / max_fronts 조기 종료
+- 벡터화 혼잡도 거리 = 기존 dict 기반 구현
+- 백엔드 (python / numpy / parallel) 결과 동일성
+- ParetoService 코어 위임
+- ObjectiveStore (스트리밍 누적 / 디스크 spill)
+"""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from app.scoring import ObjectiveStore, ParetoCalculator
+from app.scoring.pareto import (
+    crowding_distance,
+    non_dominated_fronts,
+    resolve_backend,
+)
+from app.services.pareto import ParetoService
+
+
+# ============================================
+# Reference (기존 O(N^2) 구현)
+# ============================================
+
+
+def _reference_fronts(candidates, objectives, max_fronts):
+    """기존 ParetoCalculator.calculate의 전쌍 비교 + 프론트 분리"""
+    calc = ParetoCalculator(objectives)
+    n = len(candidates)
+    domination_count = [0] * n
+    dominated_by = [[] for _ in range(n)]
+
+    for i in range(n):
+        for j in range(n):
+            if i != j and calc._dominates(candidates[i], candidates[j]):
+                dominated_by[j].append(i)
+                domination_count[j] += 1
+
+    fronts = []
+    remaining = set(range(n))
+    while remaining and len(fronts) < max_fronts:
+        current = sorted(i for i in remaining if domination_count[i] == 0)
+        if not current:
+            break
+        fronts.append(current)
+        for i in current:
+            remaining.remove(i)
+            for j in remaining:
+                if i in dominated_by[j]:
+                    domination_count[j] -= 1
+
+    return fronts
+
+
+def _reference_crowding(candidates, objectives):
+    """기존 _calculate_crowding_distance (목적별 lambda 정렬)"""
+    n = len(candidates)
+    if n <= 2:
+        return [float("inf")] * n
+
+    distances = [0.0] * n
+    for obj in objectives:
+        sorted_indices = sorted(range(n), key=lambda i: candidates[i].get(obj, 0))
+        distances[sorted_indices[0]] = float("inf")
+        distances[sorted_indices[-1]] = float("inf")
+
+        obj_min = candidates[sorted_indices[0]].get(obj, 0)
+        obj_max = candidates[sorted_indices[-1]].get(obj, 0)
+        obj_range = obj_max - obj_min if obj_max != obj_min else 1
+
+        for i in range(1, n - 1):
+            prev_val = candidates[sorted_indices[i - 1]].get(obj, 0)
+            next_val = candidates[sorted_indices[i + 1]].get(obj, 0)
+            distances[sorted_indices[i]] += (next_val - prev_val) / obj_range
+
+    return distances
+
+
+def _random_candidates(n, objectives, levels, seed):
+    rng = random.Random(seed)
+    return [
+        {"id": f"c{i}", **{obj: float(rng.randrange(levels)) for obj in objectives}}
+        for i in range(n)
+    ]
+
+
+# ============================================
+# Non-dominated Sorting Tests
+# ============================================
+
+
+class TestNonDominatedSort:
+    """비지배 정렬 테스트"""
+
+    @pytest.mark.parametrize("seed", range(8))
+    @pytest.mark.parametrize("n_objectives", [1, 2, 3, 4])
+    def test_matches_reference(self, seed, n_objectives):
+        """기존 구현과 프론트 구성/순서 동일 (동일 벡터 다수 포함)"""
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES[:n_objectives]
+        candidates = _random_candidates(150, objectives, levels=5, seed=seed)
+
+        expected = _reference_fronts(candidates, objectives, max_fronts=6)
+        fronts = ParetoCalculator(objectives).calculate(candidates, max_fronts=6)
+
+        assert [[m.candidate_id for m in f.members] for f in fronts] == [
+            [f"c{i}" for i in front] for front in expected
+        ]
+        assert all(m.rank == f.front_index for f in fronts for m in f.members)
+
+    def test_continuous_values_match_reference(self):
+        """연속값 (동일 벡터 없음)"""
+        rng = np.random.default_rng(7)
+        matrix = rng.random((400, 4)) * 100
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES
+        candidates = [
+            {"id": i, **dict(zip(objectives, row.tolist()))}
+            for i, row in enumerate(matrix)
+        ]
+
+        expected = _reference_fronts(candidates, objectives, max_fronts=5)
+        actual = non_dominated_fronts(matrix, max_fronts=5)
+
+        assert [f.tolist() for f in actual] == expected
+
+    def test_spans_multiple_blocks(self, monkeypatch):
+        """블록 경계를 넘는 지배 관계 (kd-tree 여러 레벨)"""
+        import app.scoring.pareto as pareto
+
+        monkeypatch.setattr(pareto, "_SORT_BLOCK", 16)
+        monkeypatch.setattr(pareto, "_TREE_LEAF", 2)
+
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES[:3]
+        candidates = _random_candidates(300, objectives, levels=8, seed=3)
+        matrix = np.array([[c[o] for o in objectives] for c in candidates])
+
+        expected = _reference_fronts(candidates, objectives, max_fronts=10)
+        assert [f.tolist() for f in non_dominated_fronts(matrix, 10)] == expected
+
+    def test_large_single_front_is_not_quadratic(self):
+        """반상관 4목적 점 (전부 1프론트) - 이전 멤버 전체 비교 없이 수 초 내"""
+        rng = np.random.default_rng(11)
+        matrix = rng.random((50_000, 4))
+        matrix /= matrix.sum(axis=1, keepdims=True)
+
+        started = time.monotonic()
+        fronts = non_dominated_fronts(matrix, max_fronts=5, backend="numpy")
+
+        assert time.monotonic() - started < 5.0
+        assert [f.size for f in fronts] == [50_000]
+
+    def test_max_fronts_early_exit(self):
+        """max_fronts 이후 프론트는 계산/반환하지 않음"""
+        matrix = np.array([[float(i), float(i)] for i in range(10)])
+
+        fronts = non_dominated_fronts(matrix, max_fronts=3)
+        assert [f.tolist() for f in fronts] == [[9], [8], [7]]
+        assert len(non_dominated_fronts(matrix)) == 10
+
+    def test_identical_vectors_share_front(self):
+        """동일 목적 벡터는 서로 지배하지 않음"""
+        matrix = np.array([[1.0, 1.0], [2.0, 2.0], [1.0, 1.0], [2.0, 2.0]])
+        assert [f.tolist() for f in non_dominated_fronts(matrix)] == [[1, 3], [0, 2]]
+
+    def test_empty(self):
+        assert non_dominated_fronts(np.empty((0, 4))) == []
+        assert ParetoCalculator().calculate([]) == []
+
+
+# ============================================
+# Crowding Distance Tests
+# ============================================
+
+
+class TestCrowdingDistance:
+    """혼잡도 거리 테스트"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("levels", [3, 1000])
+    def test_matches_reference(self, seed, levels):
+        """기존 구현과 값 동일 (동점 정렬 순서 포함)"""
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES
+        candidates = _random_candidates(60, objectives, levels=levels, seed=seed)
+        matrix = np.array([[c[o] for o in objectives] for c in candidates])
+
+        assert crowding_distance(matrix).tolist() == _reference_crowding(
+            candidates, objectives
+        )
+
+    def test_constant_objective(self):
+        """범위 0인 목적은 1로 정규화"""
+        matrix = np.array([[1.0, 5.0], [2.0, 5.0], [3.0, 5.0], [4.0, 5.0]])
+        distances = crowding_distance(matrix)
+
+        assert np.isinf(distances).tolist() == [True, False, False, True]
+        assert distances[1:3].tolist() == [2 / 3, 2 / 3]
+
+    def test_small_fronts(self):
+        assert crowding_distance(np.empty((0, 4))).tolist() == []
+        assert crowding_distance(np.ones((2, 4))).tolist() == [np.inf, np.inf]
+
+    def test_calculator_members(self):
+        """ParetoCalculator 멤버 혼잡도 = 프론트별 기존 구현"""
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES
+        candidates = _random_candidates(200, objectives, levels=6, seed=9)
+        by_id = {c["id"]: c for c in candidates}
+
+        for front in ParetoCalculator().calculate(candidates):
+            expected = _reference_crowding(
+                [by_id[m.candidate_id] for m in front.members], objectives
+            )
+            assert [m.crowding_distance for m in front.members] == expected
+
+
+# ============================================
+# Backend Tests
+# ============================================
+
+
+class TestBackends:
+    """비지배 정렬 백엔드 테스트"""
+
+    @pytest.mark.parametrize("backend", ["python", "numpy", "parallel"])
+    @pytest.mark.parametrize("max_fronts", [None, 1, 4])
+    def test_backends_match_reference(self, backend, max_fronts, monkeypatch):
+        """모든 백엔드 = 기존 구현"""
+        import app.scoring.pareto as pareto
+
+        monkeypatch.setattr(pareto, "_PARALLEL_MIN_CHUNK", 40)
+
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES[:3]
+        candidates = _random_candidates(200, objectives, levels=6, seed=11)
+        matrix = np.array([[c[o] for o in objectives] for c in candidates])
+
+        expected = _reference_fronts(candidates, objectives, max_fronts or 200)
+        fronts = non_dominated_fronts(
+            matrix, max_fronts=max_fronts, backend=backend, workers=3
+        )
+
+        assert [f.tolist() for f in fronts] == expected
+
+    def test_calculator_backend(self):
+        """ParetoCalculator 백엔드 선택"""
+        candidates = _random_candidates(80, ParetoCalculator.DEFAULT_OBJECTIVES, 4, 5)
+
+        python_fronts = ParetoCalculator(backend="python").calculate(candidates)
+        numpy_fronts = ParetoCalculator(backend="numpy").calculate(candidates)
+
+        assert python_fronts == numpy_fronts
+
+    def test_resolve_backend(self, monkeypatch):
+        """auto 해석 및 잘못된 이름"""
+        import app.scoring.pareto as pareto
+
+        monkeypatch.setattr(pareto, "_PARALLEL_MIN_POINTS", 100)
+
+        assert resolve_backend("auto", 99, 5) == "numpy"
+        assert resolve_backend("auto", 100, 5) == "parallel"
+        assert resolve_backend("auto", 100, None) == "numpy"
+        assert resolve_backend("python", 100, 5) == "python"
+        with pytest.raises(ValueError):
+            resolve_backend("gpu", 10)
+
+
+# ============================================
+# ParetoService Tests
+# ============================================
+
+
+class TestParetoService:
+    """ParetoService → 코어 위임 테스트"""
+
+    def test_all_fronts_as_ids(self):
+        """전체 프론트를 candidate id 목록으로 반환"""
+        dimensions = ["bio_fit", "safety_fit", "eng_fit", "clin_fit"]
+        candidates = _random_candidates(120, dimensions, levels=4, seed=2)
+        del candidates[0]["clin_fit"]  # 누락 차원 = 0.0
+
+        fronts = ParetoService(db_client=None).calculate_pareto_fronts(
+            candidates, dimensions
+        )
+        expected = _reference_fronts(
+            [{**c, "clin_fit": c.get("clin_fit", 0.0)} for c in candidates],
+            dimensions,
+            max_fronts=len(candidates),
+        )
+
+        assert fronts == [[f"c{i}" for i in front] for front in expected]
+        assert sum(map(len, fronts)) == len(candidates)
+
+    def test_empty(self):
+        assert ParetoService(db_client=None).calculate_pareto_fronts([], ["a"]) == []
+
+
+# ============================================
+# ObjectiveStore Tests
+# ============================================
+
+
+class TestObjectiveStore:
+    """스트리밍 Run용 목적 함수 저장소 테스트"""
+
+    def _batches(self):
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES
+        candidates = _random_candidates(250, objectives, levels=7, seed=4)
+        for start in range(0, len(candidates), 60):
+            batch = candidates[start : start + 60]
+            yield (
+                [c["id"] for c in batch],
+                np.array([[c[o] for o in objectives] for c in batch]),
+            )
+
+    @pytest.mark.parametrize("spill_threshold", [None, 0, 100])
+    def test_calculate_matrix_matches_calculate(self, spill_threshold, tmp_path):
+        """배치 누적 결과 = 전체 dict 계산 결과 (메모리 / spill 무관)"""
+        objectives = ParetoCalculator.DEFAULT_OBJECTIVES
+        candidates = _random_candidates(250, objectives, levels=7, seed=4)
+        calculator = ParetoCalculator()
+
+        with ObjectiveStore(
+            spill_threshold=spill_threshold, spill_dir=str(tmp_path)
+        ) as store:
+            for ids, matrix in self._batches():
+                store.append(ids, matrix)
+
+            assert len(store) == 250
+            assert store.spilled == (spill_threshold is not None)
+            if store.spilled:
+                assert isinstance(store.matrix(), np.memmap)
+
+            fronts = calculator.calculate_matrix(store.matrix(), store.ids())
+
+        assert fronts == calculator.calculate(candidates)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_empty(self):
+        with ObjectiveStore() as store:
+            assert ParetoCalculator().calculate_matrix(store.matrix(), store.ids()) == []
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            ObjectiveStore().append(["a"], np.zeros((2, 4)))
@@ -0,0 +1,161 @@
+"""
+Progress Reporter Tests
+- 시간 간격 + 진행률 변화 기준 병합
+- phase 변경 / flush / complete 즉시 기록
+- Redis 캐시 기록/조회 (동기/비동기 클라이언트)
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.progress_reporter import (
+    ProgressReporter,
+    progress_key,
+    read_cached_progress,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+
+def _reporter(db=None, redis=None, total=1000):
+    clock = FakeClock()
+    reporter = ProgressReporter(
+        db or MagicMock(),
+        "run-1",
+        redis=redis,
+        total=total,
+        min_interval=1.0,
+        max_interval=30.0,
+        min_percent_delta=5.0,
+        clock=clock,
+    )
+    return reporter, clock
+
+
+def _upserts(db):
+    return [c.args[0] for c in db.table.return_value.upsert.call_args_list]
+
+
+class TestProgressReporter:
+    """run_progress 병합 기록 테스트"""
+
+    async def test_coalesces_by_interval_and_percent(self):
+        db = MagicMock()
+        reporter, clock = _reporter(db)
+
+        await reporter.set_phase("generating")
+        for n in range(1, 40):  # 간격 내 배치 진행률은 기록하지 않음
+            assert not await reporter.update(processed_candidates=n)
+
+        clock.now = 2.0
+        assert not await reporter.update(processed_candidates=40)  # 4%p < 5%p
+        assert await reporter.update(processed_candidates=60)  # 6%p
+
+        clock.now = 2.5
+        assert not await reporter.update(processed_candidates=500)  # 간격 미달
+
+        clock.now = 40.0
+        assert await reporter.update(processed_candidates=501)  # heartbeat
+
+        rows = _upserts(db)
+        assert [r.get("processed_candidates") for r in rows] == [None, 60, 501]
+        assert all(r["run_id"] == "run-1" for r in rows)
+
+    async def test_phase_change_and_flush_write_immediately(self):
+        db = MagicMock()
+        reporter, _ = _reporter(db)
+
+        await reporter.set_phase("loading", processed_candidates=0)
+        await reporter.update(processed_candidates=10)
+        await reporter.set_phase("pareto")
+        await reporter.flush()  # 변경 없음 → 생략
+        await reporter.flush(cursor=20)
+        await reporter.complete(phase="completed")
+
+        rows = _upserts(db)
+        assert [r.get("phase") for r in rows] == [
+            "loading",
+            "pareto",
+            None,
+            "completed",
+        ]
+        # 병합된 변경분이 다음 기록에 포함
+        assert rows[1]["processed_candidates"] == 10
+        assert rows[2] == {
+            "run_id": "run-1",
+            "cursor": 20,
+            "updated_at": rows[2]["updated_at"],
+        }
+        assert reporter.writes == 4
+
+    async def test_redis_mirrors_full_state(self):
+        redis = FakeRedis()
+        reporter, _ = _reporter(redis=redis)
+
+        await reporter.set_phase("generating", processed_candidates=5)
+        await reporter.flush(cursor=7)
+
+        cached = await read_cached_progress(redis, "run-1")
+        assert cached["phase"] == "generating"
+        assert cached["processed_candidates"] == 5
+        assert cached["cursor"] == 7
+        assert json.loads(redis.values[progress_key("run-1")]) == cached
+        assert await read_cached_progress(redis, "other") is None
+
+    async def test_async_clients(self):
+        db = MagicMock()
+        db.table.return_value.upsert.return_value.execute = AsyncMock()
+        redis = MagicMock()
+        redis.set = AsyncMock()
+        redis.get = AsyncMock(return_value=json.dumps({"phase": "pareto"}))
+
+        reporter, _ = _reporter(db, redis)
+        await reporter.set_phase("pareto")
+
+        db.table.return_value.upsert.return_value.execute.assert_awaited_once()
+        redis.set.assert_awaited_once()
+        assert await read_cached_progress(redis, "run-1") == {"phase": "pareto"}
+
+    async def test_cache_failure_is_ignored(self):
+        redis = MagicMock()
+        redis.set.side_effect = ConnectionError("down")
+        redis.get.side_effect = ConnectionError("down")
+
+        reporter, _ = _reporter(redis=redis)
+        await reporter.set_phase("loading")
+
+        assert reporter.writes == 1
+        assert await read_cached_progress(redis, "run-1") is None
+
+    async def test_unreachable_shared_redis_falls_back_quickly(self, monkeypatch):
+        from app.core import queue
+
+        monkeypatch.setattr(queue, "_redis_client", None)
+        monkeypatch.setattr(queue.settings, "REDIS_URL", "redis://10.255.255.1:6379")
+        redis = queue.get_redis_client()
+        kwargs = redis.connection_pool.connection_kwargs
+        assert kwargs["socket_timeout"] == queue.settings.REDIS_SOCKET_TIMEOUT
+        assert kwargs["socket_connect_timeout"] == queue.settings.REDIS_CONNECT_TIMEOUT
+
+        started = time.monotonic()
+        assert await read_cached_progress(redis, "run-1") is None
+        assert time.monotonic() - started < 3
+        await redis.aclose()
@@ -4,8 +4,13 @@ Rule Engine Tests
 - 룰 평가 테스트
 - 결정론 테스트
 - YAML 스키마 검증 테스트
+- 컴파일/배치 평가 동등성 테스트
 """
 
+import random
+from pathlib import Path
+
+import numpy as np
 import pytest
 from typing import Dict, Any
 
@@ -15,6 +20,7 @@ from app.rules import (
     RuleLoader,
     RuleSet,
     CandidateFeatures,
+    FeatureColumns,
 )
 
 
@@ -459,3 +465,132 @@ class TestYAMLSchemaValidation:
         with pytest.raises(Exception) as exc:
             loader.validate_schema(data)
         assert "template_id" in str(exc.value).lower()
+
+
+# ============================================
+# Compiled / Batch Evaluation Tests
+# ============================================
+
+RULESET_PATH = Path(__file__).resolve().parents[3] / "config" / "rulesets" / "ruleset_v0.1.yaml"
+
+
+def _random_features(rng: random.Random) -> CandidateFeatures:
+    return CandidateFeatures(
+        DAR=rng.choice([2.0, 4.0, 8.0, 9.5]),
+        LogP=rng.uniform(0, 6),
+        H_patch=rng.uniform(0, 1),
+        AggRisk=rng.choice([10.0, 30.0, 45.0]),
+        SafetyRisk=rng.uniform(0, 100),
+        payload_class=rng.choice(["MMAE", "mmae", "DXd", "withdrawn", ""]),
+        linker_type=rng.choice(["cleavable", "non-cleavable", "Cleavable-VC"]),
+        conjugation_site=rng.choice(["cysteine", "lysine", "site_specific"]),
+        critical_tissue_expression=rng.random() < 0.3,
+        clinical_failure_count=rng.randint(0, 4),
+    )
+
+
+class TestCompiledEvaluation:
+    """컴파일된 표현식 벡터 평가 = 스칼라 평가"""
+
+    EXPRESSIONS = [
+        "DAR > 8",
+        "DAR >= 8.0",
+        "LogP <= 3",
+        "AggRisk == 30",
+        "AggRisk != 30",
+        "payload_class == 'mmae'",
+        "payload_class != MMAE",
+        "payload_class > 'dxd'",
+        "payload_class in ['MMAE', 'DXd', 3]",
+        "payload_class not_in ['withdrawn']",
+        "DAR in [4, 8]",
+        "clinical_failure_count not_in [0, 1]",
+        "linker_type contains 'cleav'",
+        "linker_type contains VC",
+        "DAR contains 4",
+        "critical_tissue_expression == true",
+        "critical_tissue_expression != false",
+        "critical_tissue_expression > 0",
+        "DAR == 'high'",
+        "payload_class > 3",
+        "payload_class is_null",
+        "DAR is_not_null",
+        "unknown_field > 1",
+        "DAR >",
+        "not an expression",
+    ]
+
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_mask_matches_scalar(self, case_sensitive):
+        evaluator = SafeExpressionEvaluator(case_sensitive=case_sensitive)
+        rng = random.Random(7)
+        contexts = [_random_features(rng).to_dict() for _ in range(200)]
+        columns = FeatureColumns.from_dicts(contexts)
+
+        for expression in self.EXPRESSIONS:
+            compiled = evaluator.compile(expression)
+            expected = [evaluator.evaluate(expression, c)[0] for c in contexts]
+            assert compiled.mask(columns).tolist() == expected, expression
+
+    def test_object_column_falls_back(self):
+        """None이 섞인 컬럼은 원소별 평가"""
+        evaluator = SafeExpressionEvaluator()
+        contexts = [{"x": 1}, {"x": None}, {"x": "3"}, {"x": 5.5}]
+        columns = FeatureColumns.from_dicts(contexts)
+
+        for expression in ["x > 2", "x is_null", "x in [1, '3']", "x == 3"]:
+            expected = [evaluator.evaluate(expression, c)[0] for c in contexts]
+            assert evaluator.compile(expression).mask(columns).tolist() == expected
+
+    def test_compile_is_cached(self):
+        evaluator = SafeExpressionEvaluator()
+        assert evaluator.compile("DAR > 8") is evaluator.compile("DAR > 8")
+
+        engine = RuleEngine(ruleset=RuleLoader().load_from_file(str(RULESET_PATH)))
+        assert engine.compile() is engine.compile()
+
+
+class TestBatchEvaluation:
+    """evaluate_batch / evaluate_columns = evaluate_candidate 반복"""
+
+    @pytest.fixture
+    def ruleset(self) -> RuleSet:
+        return RuleLoader().load_from_file(str(RULESET_PATH))
+
+    @pytest.fixture
+    def candidates(self):
+        rng = random.Random(11)
+        return [_random_features(rng) for _ in range(300)]
+
+    @pytest.mark.parametrize("stop_on_hard_reject", [True, False])
+    def test_batch_matches_single(self, ruleset, candidates, stop_on_hard_reject):
+        engine = RuleEngine(ruleset=ruleset, stop_on_hard_reject=stop_on_hard_reject)
+
+        batch = engine.evaluate_batch(candidates)
+        single = [engine.evaluate_candidate(c) for c in candidates]
+
+        assert [r.to_dict() for r in batch] == [r.to_dict() for r in single]
+        assert any(r.hard_rejected for r in single)
+        assert any(r.total_penalty for r in single)
+
+    @pytest.mark.parametrize("policy", ["sum", "max"])
+    def test_columns_summary(self, ruleset, candidates, policy):
+        ruleset.penalty_policy = policy
+        engine = RuleEngine(ruleset=ruleset)
+
+        columns = engine.evaluate_columns(FeatureColumns.from_features(candidates))
+        single = [engine.evaluate_candidate(c) for c in candidates]
+
+        assert columns.rejected.tolist() == [r.hard_rejected for r in single]
+        np.testing.assert_array_equal(
+            columns.total_penalty, [r.total_penalty for r in single]
+        )
+        assert [
+            columns.rule_ids[j] if j >= 0 else "" for j in columns.reject_rule
+        ] == [r.reject_rule_id for r in single]
+
+        counts = columns.hit_counts()
+        for rule_id in columns.rule_ids:
+            assert counts[rule_id] == sum(
+                h.rule_id == rule_id for r in single for h in r.hits
+            )
@@ -0,0 +1,802 @@
+"""
+Scoring Engine Tests
+- 컬럼형 배치 스코어링 = 단일 후보 산식 동치성
+- 실패 후보 처리
+- 컴포넌트 단위 팩터화 스코어링
+- 조합 인덱스 범위 샤드 병렬 스코어링 + 커서 재개
+- 혼합 기수 조합 인덱스 (CombinationSpace)
+- 배치 룰 단계 (prescreen / penalty / reject) = RuleEngine 단건 평가
+- 컴포넌트 단위 하드 리젝트 사전 계산 = 조합별 check()
+"""
+
+import itertools
+import json
+import random
+
+import numpy as np
+import pytest
+
+from app.rules import CandidateFeatures, RuleEngine, RuleSet
+from app.scoring import (
+    BatchScoringEngine,
+    BatchScoreArrays,
+    CandidateGenerator,
+    CandidateScores,
+    CombinationSpace,
+    GeneratorStats,
+    RULE_HIT_PREFIX,
+    ShardedScoringRunner,
+)
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+
+def _candidates():
+    targets = [
+        {"id": "t1", "expression": {"tumor": 50.0, "normal_max": 2.0}},
+        {
+            "id": "t2",
+            "expression": {"tumor": 5.0, "normal_max": 12.0},
+            "internalization": 0.4,
+            "heterogeneity": 0.6,
+            "accessibility": 0.5,
+            "bystander_need": 0.9,
+            "critical_tissue_expression": True,
+            "negative_signal_score": 0.2,
+        },
+    ]
+    linkers = [
+        {"id": "l1"},
+        {"id": "l2", "purification_difficulty": "high", "cleavage_risk": 0.7},
+    ]
+    payloads = [
+        {"id": "p1", "logP": 4.2, "solubility": 0.3, "stability": 0.9},
+        {
+            "id": "p2",
+            "molecular_weight": 750.0,
+            "hydrophobic_patch": 2,
+            "aggregation_prone": True,
+            "bystander_capability": 0.1,
+            "hazard_score": 0.8,
+            "systemic_exposure_proxy": 55,
+        },
+    ]
+    conjugations = [None, {"DAR": 8.0, "site_specific": True}, {"DAR": 3.5}]
+
+    return [
+        {
+            "target": t,
+            "antibody": {},
+            "linker": linker,
+            "payload": p,
+            "conjugation": c,
+        }
+        for t in targets
+        for linker in linkers
+        for p in payloads
+        for c in conjugations
+    ]
+
+
+def _generator(batch_size=7):
+    candidates = _candidates()
+    unique = lambda key: list(  # noqa: E731
+        {id(c[key]): c[key] for c in candidates}.values()
+    )
+    targets = unique("target") + [
+        {"id": "t_low", "expression": {"tumor": 0.5}},  # LOW_TARGET_EXPRESSION
+    ]
+    return CandidateGenerator(
+        targets=targets,
+        antibodies=[{"id": "a1"}, {"id": "a2"}],
+        linkers=unique("linker"),
+        payloads=unique("payload") + [{"id": "p_bad", "logP": "n/a"}],
+        conjugations=[c or {} for c in unique("conjugation")],
+        batch_size=batch_size,
+    )
+
+
+@pytest.fixture
+def engine():
+    return BatchScoringEngine()
+
+
+# ============================================
+# Columnar Scoring Tests
+# ============================================
+
+
+class TestColumnarScoring:
+    """컬럼형 배치 스코어링 테스트"""
+
+    def test_matches_scalar_scores(self, engine):
+        """컬럼형 결과 = score_candidate 결과"""
+        candidates = _candidates()
+        arrays = engine.score_batch_columnar(candidates)
+
+        assert isinstance(arrays, BatchScoreArrays)
+        assert len(arrays) == len(candidates)
+
+        for i, c in enumerate(candidates):
+            expected = engine.score_candidate(
+                c["target"], c["antibody"], c["linker"], c["payload"], c["conjugation"]
+            )
+            actual = arrays.candidate_scores(i)
+
+            assert actual.eng_fit == pytest.approx(expected.eng_fit)
+            assert actual.bio_fit == pytest.approx(expected.bio_fit)
+            assert actual.safety_fit == pytest.approx(expected.safety_fit)
+            assert actual.eng_components.terms == pytest.approx(
+                expected.eng_components.terms
+            )
+            assert actual.bio_components.terms == pytest.approx(
+                expected.bio_components.terms
+            )
+            assert actual.safety_components.terms == pytest.approx(
+                expected.safety_components.terms
+            )
+            assert (
+                actual.eng_components.missing_features
+                == expected.eng_components.missing_features
+            )
+
+    def test_to_dict_matches_score_to_dict(self, engine):
+        """저장 포맷 동일성"""
+        candidates = _candidates()
+        arrays = engine.score_batch_columnar(candidates)
+
+        for i, c in enumerate(candidates):
+            expected = engine.score_to_dict(
+                engine.score_candidate(
+                    c["target"],
+                    c["antibody"],
+                    c["linker"],
+                    c["payload"],
+                    c["conjugation"],
+                )
+            )
+            assert arrays.to_dict(i) == expected
+
+    def test_score_batch_returns_candidate_scores(self, engine):
+        """score_batch 하위 호환"""
+        results = engine.score_batch(_candidates())
+        assert all(isinstance(r, CandidateScores) for r in results)
+
+    def test_objective_matrix(self, engine):
+        """목적 함수 행렬 (n, 4)"""
+        arrays = engine.score_batch_columnar(_candidates())
+        matrix = arrays.objective_matrix()
+
+        assert matrix.shape == (len(arrays), 4)
+        assert list(matrix[:, 0]) == list(arrays.eng_fit)
+
+    def test_invalid_candidate_gets_default_scores(self, engine):
+        """계산 실패 후보 → 기본 점수 (배치 전체는 계속)"""
+        candidates = _candidates()[:2]
+        candidates.append(
+            {
+                "target": {"id": "t", "expression": {"tumor": None}},
+                "linker": {},
+                "payload": {"id": "p"},
+            }
+        )
+        arrays = engine.score_batch_columnar(candidates)
+
+        assert arrays.valid.tolist() == [True, True, False]
+        assert arrays.candidate_scores(2) == CandidateScores()
+        assert arrays.to_dict(2) == engine.score_to_dict(CandidateScores())
+
+    def test_empty_batch(self, engine):
+        """빈 배치"""
+        arrays = engine.score_batch_columnar([])
+        assert len(arrays) == 0
+        assert engine.score_batch([]) == []
+
+
+# ============================================
+# Factorized Scoring Tests
+# ============================================
+
+
+class TestFactorizedScoring:
+    """컴포넌트 부분 Term + 인덱스 결합 테스트"""
+
+    @pytest.fixture
+    def generator(self):
+        return _generator()
+
+    def test_index_batches_match_generate_batches(self, generator):
+        """인덱스 배치 = 기존 배치 (순서, 경계, 통계)"""
+        expected = list(generator.generate_batches())
+        expected_stats = (generator.stats.accepted, generator.stats.hard_rejected)
+
+        generator.stats = GeneratorStats()
+        index_batches = list(generator.generate_index_batches())
+
+        assert [len(b) for b in index_batches] == [len(b) for b in expected]
+        for index_batch, batch in zip(index_batches, expected):
+            assert generator.materialize(index_batch) == batch
+        assert (
+            generator.stats.accepted,
+            generator.stats.hard_rejected,
+        ) == expected_stats
+
+    def test_score_indices_matches_scalar(self, generator, engine):
+        """팩터화 스코어 = score_candidate 결과"""
+        terms = engine.precompute_components(
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+        )
+
+        for index_batch in generator.generate_index_batches():
+            arrays = engine.score_indices(
+                terms,
+                index_batch.target_idx,
+                index_batch.linker_idx,
+                index_batch.payload_idx,
+                index_batch.conjugation_idx,
+            )
+            for i, c in enumerate(generator.materialize(index_batch)):
+                try:
+                    expected = engine.score_candidate(
+                        c["target"],
+                        c["antibody"],
+                        c["linker"],
+                        c["payload"],
+                        c["conjugation"],
+                    )
+                except TypeError:
+                    expected = CandidateScores()
+                assert arrays.to_dict(i) == engine.score_to_dict(expected)
+
+    def test_component_terms_computed_once(self, generator, engine):
+        """부분 Term은 컴포넌트 축 길이"""
+        terms = engine.precompute_components(
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+        )
+
+        assert terms.target["DEA"].shape == (len(generator.targets),)
+        assert terms.payload["PH"].shape == (len(generator.payloads),)
+        assert terms.valid["payload"].tolist()[-1] is False
+
+
+# ============================================
+# Sharded Scoring Tests
+# ============================================
+
+
+class TestShardedScoring:
+    """조합 인덱스 범위 샤드 스코어링 테스트"""
+
+    def _expected(self, engine):
+        generator = _generator()
+        terms = engine.precompute_components(
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+        )
+        rows = []
+        for index_batch in generator.generate_index_batches():
+            arrays = engine.score_indices(
+                terms,
+                index_batch.target_idx,
+                index_batch.linker_idx,
+                index_batch.payload_idx,
+                index_batch.conjugation_idx,
+            )
+            hashes = generator.candidate_hashes(index_batch)
+            rows.extend(
+                (hashes[i], arrays.objective_matrix()[i].tolist(), arrays.to_dict(i))
+                for i in range(len(index_batch))
+            )
+        return rows, generator.get_reject_summary()
+
+    async def _collect(self, runner):
+        rows = []
+        async for shard in runner.iter_shards():
+            for batch in shard.batches:
+                rows.extend(
+                    (
+                        batch.candidate_hashes[i],
+                        batch.objectives[i].tolist(),
+                        batch.score_components[i],
+                    )
+                    for i in range(len(batch))
+                )
+        return rows
+
+    def test_shards_cover_space_in_order(self):
+        generator = _generator()
+        runner = ShardedScoringRunner(generator, shard_candidates=30)
+        shards = runner.shards()
+
+        assert shards[0][0] == 0 and shards[-1][1] == len(generator.space)
+        assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+        assert shards == ShardedScoringRunner(_generator(), shard_candidates=30).shards()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    async def test_matches_single_pass(self, engine, workers):
+        """샤드 결과 = 단일 패스 결과 (순서, 점수, 리젝트 통계)"""
+        expected_rows, expected_rejects = self._expected(engine)
+
+        generator = _generator()
+        runner = ShardedScoringRunner(generator, workers=workers, shard_candidates=30)
+        rows = await self._collect(runner)
+
+        assert len(runner.shards()) > 1
+        assert [r[0] for r in rows] == [r[0] for r in expected_rows]
+        assert [r[1] for r in rows] == [r[1] for r in expected_rows]
+        assert [r[2] for r in rows] == [
+            r[2]["score_components"] for r in expected_rows
+        ]
+        assert generator.get_reject_summary() == expected_rejects
+        assert generator.stats.accepted == len(expected_rows)
+
+    async def test_resume_from_cursor(self, engine):
+        """샤드 완료 시점 커서 + 통계 체크포인트로 재개 = 중단 없는 실행"""
+        expected_rows, expected_rejects = self._expected(engine)
+
+        first = _generator()
+        rows, cursor, checkpoint = [], None, None
+        async for shard in ShardedScoringRunner(first, shard_candidates=30).iter_shards():
+            if cursor is not None:
+                continue
+            rows.extend(h for batch in shard.batches for h in batch.candidate_hashes)
+            if shard.shard_index == 1:
+                cursor = shard.index_range[1]
+                checkpoint = json.loads(json.dumps(first.stats.to_checkpoint()))
+
+        resumed = _generator()
+        resumed.stats.merge(GeneratorStats.from_checkpoint(checkpoint))
+        runner = ShardedScoringRunner(resumed, shard_candidates=30, start_index=cursor)
+        assert runner.shards()[0][0] == cursor
+        rows.extend(r[0] for r in await self._collect(runner))
+
+        assert rows == [r[0] for r in expected_rows]
+        assert resumed.get_reject_summary() == expected_rejects
+        assert resumed.stats.accepted == len(expected_rows)
+
+    async def test_combination_index_decodes_to_candidate(self):
+        generator = _generator()
+        runner = ShardedScoringRunner(generator, shard_candidates=30)
+        async for shard in runner.iter_shards():
+            for batch in shard.batches:
+                start, stop = shard.index_range
+                assert all(start <= i < stop for i in batch.combination_index.tolist())
+                assert [
+                    generator.candidate_at(i)["candidate_hash"]
+                    for i in batch.combination_index.tolist()
+                ] == batch.candidate_hashes
+
+    async def test_empty_catalog(self):
+        runner = ShardedScoringRunner(
+            CandidateGenerator(targets=[], antibodies=[], linkers=[], payloads=[])
+        )
+        assert await self._collect(runner) == []
+
+
+# ============================================
+# Pre-pruned Enumeration Tests
+# ============================================
+
+
+def _random_catalog(seed):
+    rng = random.Random(seed)
+
+    def status():
+        return rng.choice(["active", "active", "active", None, "retired"])
+
+    targets = [
+        {
+            "id": None if rng.random() < 0.1 else f"t{i}",
+            "status": status(),
+            "expression": {"tumor": rng.choice([0.2, 5.0, 20.0])},
+            "adc_excluded": rng.random() < 0.15,
+            "family": rng.choice(["kinase", "gpcr"]),
+        }
+        for i in range(12)
+    ]
+    antibodies = [{"id": f"a{i}", "status": status()} for i in range(3)]
+    linkers = [
+        {
+            "id": f"l{i}",
+            "status": status(),
+            "linker_type": rng.choice(["cleavable", "non_cleavable"]),
+        }
+        for i in range(4)
+    ]
+    payloads = [
+        {
+            "id": None if rng.random() < 0.1 else f"p{i}",
+            "status": status(),
+            "payload_class": rng.choice(["mmae", "non_cleavable_only"]),
+            "mw": rng.choice([500, 900, 1300]),
+        }
+        for i in range(6)
+    ]
+    rules = [
+        {
+            "id": "no_gpcr",
+            "action": "hard_reject",
+            "reason": "GPCR excluded",
+            "condition": {"component": "target", "field": "family", "value": "gpcr"},
+        },
+        {
+            "id": "heavy_payload",
+            "action": "hard_reject",
+            "condition": {"component": "payload", "field": "mw", "op": "gt", "value": 1000},
+        },
+        {
+            "action": "hard_reject",
+            "condition": {"component": "antibody", "field": "id", "op": "in", "value": ["a2"]},
+        },
+        {"id": "alert_only", "action": "alert", "condition": {"field": "id", "value": "t1"}},
+    ]
+    return CandidateGenerator(
+        targets=targets,
+        antibodies=antibodies,
+        linkers=linkers,
+        payloads=payloads,
+        conjugations=[{"id": "c1"}, {"id": "c2"}],
+        hard_reject_rules=rules,
+        batch_size=5,
+    )
+
+
+def _accepted_tuples(generator):
+    """통과 조합의 (target, antibody, linker, payload) 인덱스 (conjugation 축 제외)"""
+    return [
+        tuple(row[:4])
+        for rows in generator._accepted_rows()
+        for row in rows.tolist()
+        if row[4] == 0
+    ]
+
+
+class TestPrePrunedEnumeration:
+    """RejectPlan 기반 열거 = 조합별 HardRejectFilter.check"""
+
+    @staticmethod
+    def _brute_force(generator):
+        stats = GeneratorStats()
+        accepted = []
+        for ti, t in enumerate(generator.targets):
+            for ai, a in enumerate(generator.antibodies):
+                for li, linker in enumerate(generator.linkers):
+                    for pi, p in enumerate(generator.payloads):
+                        rejected, code, reason = generator.hard_reject_filter.check(
+                            t, a, linker, p
+                        )
+                        if rejected:
+                            stats.add_reject(
+                                code, reason, count=len(generator.conjugations)
+                            )
+                        else:
+                            accepted.append((ti, ai, li, pi))
+        return accepted, stats
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_per_tuple_check(self, seed):
+        generator = _random_catalog(seed)
+        expected_tuples, expected_stats = self._brute_force(_random_catalog(seed))
+
+        assert _accepted_tuples(generator) == expected_tuples
+        assert generator.get_reject_summary() == [
+            {"reason_code": r.code, "reason_text": r.text, "rejected_count": r.count}
+            for r in expected_stats.reject_reasons.values()
+        ]
+        assert generator.stats.hard_rejected == expected_stats.hard_rejected
+
+    @pytest.mark.parametrize("size", [7, 48, 1000])
+    def test_sharded_ranges_match(self, size):
+        """조합 인덱스 범위별 열거(타겟 경계 무관)를 합치면 전체 열거와 동일"""
+        generator = _random_catalog(3)
+        full = np.vstack(list(generator._accepted_rows()))
+
+        sharded = _random_catalog(3)
+        parts = [
+            rows
+            for index_range in sharded.space.split(size)
+            for rows in sharded._accepted_rows(index_range)
+        ]
+
+        assert np.array_equal(np.vstack(parts), full)
+        assert sharded.get_reject_summary() == generator.get_reject_summary()
+        assert sharded.stats.hard_rejected == generator.stats.hard_rejected
+
+    def test_error_in_check_is_raised(self):
+        """check()에서 예외가 나는 조합이 있으면 동일하게 예외"""
+        generator = CandidateGenerator(
+            targets=[{"id": "t1", "expression": None}],
+            antibodies=[{}],
+            linkers=[{}],
+            payloads=[{"id": "p1"}],
+        )
+        with pytest.raises(AttributeError):
+            list(generator._accepted_rows())
+
+
+class TestCombinationSpace:
+    """혼합 기수 조합 인덱스 = 생성 순회 순서"""
+
+    def test_decode_matches_nested_loop_order(self):
+        space = CombinationSpace((3, 2, 4, 1, 3))
+        expected = list(itertools.product(*(range(r) for r in space.radices)))
+
+        assert len(space) == len(expected)
+        assert space.strides[0] == 2 * 4 * 1 * 3
+        for index, digits in enumerate(expected):
+            assert space.decode(index) == digits
+            assert space.encode(digits) == index
+        assert space.decode_many(np.arange(len(space))).tolist() == [
+            list(d) for d in expected
+        ]
+
+    def test_out_of_range(self):
+        space = CombinationSpace((2, 1, 1, 2, 1))
+        with pytest.raises(IndexError):
+            space.decode(len(space))
+        with pytest.raises(IndexError):
+            space.encode((0, 0, 0, 2, 0))
+
+    def test_split(self):
+        space = CombinationSpace((5, 1, 1, 3, 1))
+        assert space.split(4) == [(0, 4), (4, 8), (8, 12), (12, 15)]
+        assert space.split(4, start=10) == [(10, 14), (14, 15)]
+        assert CombinationSpace((0, 1, 1, 1, 1)).split(4) == []
+
+    def test_candidate_at_matches_materialize(self):
+        generator = _random_catalog(5)
+        for index_batch in generator.generate_index_batches():
+            indices = generator.space.encode_batch(index_batch).tolist()
+            assert [generator.candidate_at(i) for i in indices] == generator.materialize(
+                index_batch
+            )
+
+
+# ============================================
+# Rule Stage Tests
+# ============================================
+
+RULESET = {
+    "version": "stage_test",
+    "penalty_policy": "sum",
+    "rules": [
+        {
+            "id": "hr_dar",
+            "priority": 1,
+            "condition": {"expression": "DAR > 6"},
+            "action": {"type": "hard_reject", "message": "DAR too high"},
+        },
+        {
+            "id": "hr_class",
+            "priority": 1,
+            "condition": {"expression": "payload_class == 'withdrawn'"},
+            "action": {"type": "hard_reject", "message": "withdrawn"},
+        },
+        {
+            "id": "hr_safety",
+            "priority": 2,
+            "condition": {"expression": "SafetyRisk > 45"},
+            "action": {"type": "hard_reject", "message": "unsafe"},
+        },
+        {
+            "id": "sr_int",
+            "priority": 3,
+            "condition": {
+                "all": [
+                    {"field": "INT", "operator": "<", "value": 50},
+                    {"field": "linker_type", "operator": "==", "value": "cleavable"},
+                ]
+            },
+            "action": {"type": "soft_reject", "message": "low INT"},
+        },
+        {
+            "id": "pn_logp",
+            "priority": 10,
+            "condition": {"expression": "LogP > 4.0"},
+            "action": {"type": "penalty", "value": 10, "message": "LogP"},
+        },
+        {
+            "id": "pn_clv",
+            "priority": 11,
+            "condition": {"expression": "CLV > 50"},
+            "action": {
+                "type": "penalty",
+                "value": 5,
+                "target": "SafetyFit",
+                "message": "CLV",
+            },
+        },
+        {
+            "id": "al_tissue",
+            "priority": 20,
+            "condition": {"expression": "critical_tissue_expression == true"},
+            "action": {"type": "alert", "message": "tissue"},
+        },
+        {
+            "id": "pr_agg",
+            "priority": 30,
+            "condition": {"expression": "AggRisk > 30"},
+            "action": {"type": "require_protocol", "template_id": "sec_v1"},
+        },
+    ],
+}
+
+PENALTY_COLUMNS = {"EngFit": 0, "SafetyFit": 2}
+
+
+def _rule_generator():
+    generator = _generator()
+    generator.payloads.append(
+        {"id": "p_wd", "logP": 3.0, "payload_class": "withdrawn"}
+    )
+    generator.linkers[1]["linker_type"] = "cleavable"
+    generator.stats.total_combinations = (
+        len(generator.targets)
+        * len(generator.antibodies)
+        * len(generator.linkers)
+        * len(generator.payloads)
+        * len(generator.conjugations)
+    )
+    return generator
+
+
+class TestRuleStage:
+    """샤드 룰 단계 = 후보별 RuleEngine.evaluate_candidate"""
+
+    def _expected(self, engine, ruleset):
+        """단일 패스 스코어링 + 후보별 RuleEngine 평가 (참조 구현)"""
+        generator = _rule_generator()
+        rule_engine = RuleEngine(ruleset=ruleset)
+        terms = engine.precompute_components(
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+        )
+        rows, rejects, hits = [], {}, {}
+
+        for index_batch in generator.generate_index_batches():
+            arrays = engine.score_indices(
+                terms,
+                index_batch.target_idx,
+                index_batch.linker_idx,
+                index_batch.payload_idx,
+                index_batch.conjugation_idx,
+            )
+            hashes = generator.candidate_hashes(index_batch)
+            for i, candidate in enumerate(generator.materialize(index_batch)):
+                payload, linker = candidate["payload"], candidate["linker"]
+                conjugation = candidate["conjugation"]
+                features = CandidateFeatures(
+                    DAR=conjugation.get("DAR", 4.0),
+                    LogP=payload.get(
+                        "logP", payload.get("molecular_weight", 0) / 100
+                    ),
+                    H_patch=payload.get("hydrophobic_patch", 0),
+                    molecular_weight=payload.get("molecular_weight", 0),
+                    AggRisk=float(arrays.terms["AggRisk"][i]),
+                    ProcRisk=float(arrays.terms["ProcRisk"][i]),
+                    AnalRisk=float(arrays.terms["AnalRisk"][i]),
+                    BioRisk=float(arrays.bio_risk[i]),
+                    SafetyRisk=float(arrays.safety_risk[i]),
+                    OOT=float(arrays.terms["OOT"][i]),
+                    CLV=float(arrays.terms["CLV"][i]),
+                    INT=float(arrays.terms["INT"][i]),
+                    payload_class=payload.get("payload_class") or "",
+                    linker_type=linker.get("linker_type") or "",
+                    critical_tissue_expression=bool(
+                        candidate["target"].get("critical_tissue_expression")
+                    ),
+                    eng_fit=float(arrays.eng_fit[i]),
+                    bio_fit=float(arrays.bio_fit[i]),
+                    safety_fit=float(arrays.safety_fit[i]),
+                )
+                result = rule_engine.evaluate_candidate(features)
+
+                if result.hard_rejected:
+                    rejects[result.reject_rule_id] = (
+                        rejects.get(result.reject_rule_id, 0) + 1
+                    )
+                    continue
+
+                objectives = arrays.objective_matrix()[i].tolist()
+                for hit in result.hits:
+                    hits[hit.rule_id] = hits.get(hit.rule_id, 0) + 1
+                    rule = next(r for r in ruleset.rules if r.id == hit.rule_id)
+                    if hit.delta:
+                        col = PENALTY_COLUMNS[rule.action.target]
+                        objectives[col] = max(0.0, objectives[col] - hit.delta)
+                rows.append((hashes[i], objectives, result))
+
+        return rows, rejects, hits, generator
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    async def test_matches_rule_engine(self, engine, workers):
+        ruleset = RuleSet.from_dict(RULESET)
+        expected_rows, expected_rejects, expected_hits, reference = self._expected(
+            engine, ruleset
+        )
+
+        generator = _rule_generator()
+        runner = ShardedScoringRunner(
+            generator, workers=workers, shard_candidates=30, ruleset=ruleset
+        )
+        batches = [b async for shard in runner.iter_shards() for b in shard.batches]
+        rows = [
+            (b.candidate_hashes[i], b.objectives[i].tolist(), b.score_components[i])
+            for b in batches
+            for i in range(len(b))
+        ]
+
+        assert [r[0] for r in rows] == [r[0] for r in expected_rows]
+        assert [r[1] for r in rows] == [r[1] for r in expected_rows]
+        for (_, _, components), (_, _, result) in zip(rows, expected_rows):
+            if result.hits:
+                assert components["rules"]["required_protocols"] == (
+                    result.required_protocols
+                )
+                assert components["rules"]["penalties"] == result.penalty_breakdown
+            else:
+                assert "rules" not in components
+
+        # 모든 룰 리젝트 유형 발생 + 리젝트 건수/사유 동일
+        assert set(expected_rejects) == {"hr_dar", "hr_class", "hr_safety", "sr_int"}
+        summary = {r["reason_code"]: r["rejected_count"] for r in generator.get_reject_summary()}
+        reference_summary = {
+            r["reason_code"]: r["rejected_count"] for r in reference.get_reject_summary()
+        }
+        assert summary == {**reference_summary, **expected_rejects}
+        assert generator.stats.accepted == len(expected_rows)
+        assert (
+            generator.stats.accepted + generator.stats.hard_rejected
+            == generator.stats.total_combinations
+        )
+
+        rule_hits = {
+            r["reason_code"]: r["rejected_count"]
+            for r in generator.get_rule_hit_summary()
+        }
+        assert rule_hits == {f"{RULE_HIT_PREFIX}{k}": v for k, v in expected_hits.items()}
+
+    def test_prescreen_skips_scoring(self, engine):
+        """컴포넌트 hard_reject 후보는 스코어링 전에 제외"""
+        from app.scoring import RuleStage
+
+        generator = _rule_generator()
+        terms = engine.precompute_components(
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+        )
+        stage = RuleStage(
+            RuleSet.from_dict(RULESET),
+            generator.targets,
+            generator.linkers,
+            generator.payloads,
+            generator.conjugations,
+            terms,
+        )
+        assert [stage.compiled.rules[j].rule.id for j in stage._prescreen] == [
+            "hr_class",
+            "hr_dar",
+        ]
+
+        stats = GeneratorStats()
+        for index_batch in generator.generate_index_batches():
+            kept = stage.prescreen(index_batch, stats)
+            dar = [generator.conjugations[c].get("DAR", 4.0) for c in kept.conjugation_idx]
+            assert all(d <= 6 for d in dar)
+        assert stats.reject_reasons["hr_dar"].count > 0
+        assert stats.reject_reasons["hr_class"].count > 0
@@ -0,0 +1,101 @@
+"""
+Snapshot Store Tests
+- Run 단위 스냅샷 등록 (content hash 중복 제거)
+- snapshot_refs 해석 (일괄 조회 + 캐시)
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import snapshot_store
+from app.services.snapshot_store import SnapshotStore, snapshot_hash
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    snapshot_store._snapshot_cache.clear()
+    yield
+    snapshot_store._snapshot_cache.clear()
+
+
+def _components():
+    return {
+        "target": [{"id": "t1", "name": "HER2"}, {"id": "t2", "name": "TROP2"}],
+        "antibody": [{}],
+        "linker": [{"id": "l1", "name": "VC"}],
+        "payload": [{"id": "p1", "name": "MMAE"}, {"name": "MMAE", "id": "p1"}],
+    }
+
+
+class TestSnapshotStore:
+    """스냅샷 저장소 테스트"""
+
+    def test_snapshot_hash_ignores_key_order(self):
+        assert snapshot_hash({"a": 1, "b": [1, 2]}) == snapshot_hash(
+            {"b": [1, 2], "a": 1}
+        )
+        assert snapshot_hash({"a": 1}) != snapshot_hash({"a": 2})
+
+    async def test_register_run_dedupes_by_content(self, mock_db):
+        """동일 내용 컴포넌트는 한 번만 저장, 해시는 입력 인덱스와 정렬"""
+        components = _components()
+        hashes = await SnapshotStore(mock_db).register_run("run-1", components)
+
+        assert {role: len(h) for role, h in hashes.items()} == {
+            role: len(items) for role, items in components.items()
+        }
+        assert hashes["payload"][0] == hashes["payload"][1]
+
+        rows = mock_db.table.return_value.upsert.call_args.args[0]
+        assert len(rows) == 5
+        assert {r["content_hash"] for r in rows} == {
+            h for role_hashes in hashes.values() for h in role_hashes
+        }
+        assert all(r["run_id"] == "run-1" for r in rows)
+
+    async def test_resolve_fetches_missing_once(self, mock_db):
+        """캐시 miss만 단일 쿼리로 조회"""
+        target = {"id": "t1", "name": "HER2"}
+        payload = {"id": "p1", "name": "MMAE"}
+        refs = {"target": snapshot_hash(target), "payload": snapshot_hash(payload)}
+
+        table = mock_db.table.return_value
+        table.in_.return_value = table
+        table.execute.return_value = MagicMock(
+            data=[
+                {"content_hash": refs["target"], "snapshot": target},
+                {"content_hash": refs["payload"], "snapshot": payload},
+            ]
+        )
+
+        store = SnapshotStore(mock_db)
+        candidates = [
+            {"id": "c1", "snapshot": {}, "snapshot_refs": refs},
+            {"id": "c2", "snapshot": {}, "snapshot_refs": refs},
+            {"id": "legacy", "snapshot": {"target": {"name": "old"}}},
+        ]
+        resolved = await store.resolve("run-1", candidates)
+
+        assert table.execute.call_count == 1
+        assert sorted(table.in_.call_args.args[1]) == sorted(refs.values())
+        assert resolved[0]["snapshot"] == {"target": target, "payload": payload}
+        assert resolved[1]["snapshot"]["payload"]["name"] == "MMAE"
+        assert resolved[2]["snapshot"] == {"target": {"name": "old"}}
+
+        # 두 번째 조회는 캐시에서 해석
+        await store.resolve("run-1", [{"id": "c3", "snapshot_refs": refs}])
+        assert table.execute.call_count == 1
+
+    async def test_registered_snapshots_are_cached(self, mock_db):
+        store = SnapshotStore(mock_db)
+        hashes = await store.register_run("run-1", _components())
+        upserts = mock_db.table.return_value.execute.call_count
+
+        [candidate] = await store.resolve(
+            "run-1",
+            [{"snapshot_refs": {"target": hashes["target"][1]}}],
+        )
+
+        assert candidate["snapshot"] == {"target": {"id": "t2", "name": "TROP2"}}
+        assert mock_db.table.return_value.execute.call_count == upserts
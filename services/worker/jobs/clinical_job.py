@@ -6,11 +6,11 @@ ClinicalTrials.gov, openFDA 동기화 Jobs
 from datetime import datetime
 from typing import Dict, Any
 import structlog
-from supabase import create_client, Client
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from app.core.database import job_db
+
 
 # .env 파일 로드
 def find_env():
@@ -28,13 +28,6 @@ load_dotenv(find_env())
 logger = structlog.get_logger()
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 # ============================================================
 # ClinicalTrials.gov Jobs
 # ============================================================
@@ -50,12 +43,12 @@ async def clinicaltrials_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("clinicaltrials_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 로그 생성을 가장 먼저 수행
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "clinicaltrials",
@@ -65,8 +58,7 @@ async def clinicaltrials_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     from app.connectors.base import generate_query_hash
 
@@ -80,50 +72,70 @@ async def clinicaltrials_fetch_job(ctx, seed: Dict[str, Any]):
         # T-DM1 관련 임상시험 (NCT04064359: KATE-3)
         seed["nct_ids"] = ["NCT04064359"]
 
-        db.table("ingestion_logs").update(
-            {"meta": {"seed": seed, "note": "Using default ClinicalTrials target"}}
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {"meta": {"seed": seed, "note": "Using default ClinicalTrials target"}}
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
     query_hash = generate_query_hash("clinicaltrials", str(seed), seed)
 
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "clinicaltrials",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "clinicaltrials",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     try:
         from app.connectors.clinicaltrials import ClinicalTrialsConnector
 
-        connector = ClinicalTrialsConnector(db)
+        connector = ClinicalTrialsConnector(db, redis=ctx.get("redis"))
         result = await connector.run(seed, max_pages=10)
 
         stats = result.get("stats", {})
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "clinicaltrials").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "clinicaltrials")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": result.get("duration_ms", 0),
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": result.get("duration_ms", 0),
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("clinicaltrials_fetch_job_completed", stats=stats)
         return result
@@ -131,23 +143,34 @@ async def clinicaltrials_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("clinicaltrials_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "clinicaltrials").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "clinicaltrials")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -167,12 +190,12 @@ async def openfda_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("openfda_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 로그 생성을 가장 먼저 수행
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "openfda",
@@ -182,8 +205,7 @@ async def openfda_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     from app.connectors.base import generate_query_hash
 
@@ -197,50 +219,68 @@ async def openfda_fetch_job(ctx, seed: Dict[str, Any]):
         # T-DM1 (Trastuzumab emtansine)
         seed["generic_names"] = ["Trastuzumab emtansine"]
 
-        db.table("ingestion_logs").update(
-            {"meta": {"seed": seed, "note": "Using default openFDA target"}}
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update({"meta": {"seed": seed, "note": "Using default openFDA target"}})
+            .eq("id", log_id)
+            .execute()
+        )
 
     query_hash = generate_query_hash("openfda", str(seed), seed)
 
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "openfda",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "openfda",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     try:
         from app.connectors.openfda import OpenFDAConnector
 
-        connector = OpenFDAConnector(db)
+        connector = OpenFDAConnector(db, redis=ctx.get("redis"))
         result = await connector.run(seed, max_pages=10)
 
         stats = result.get("stats", {})
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "openfda").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "openfda")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": result.get("duration_ms", 0),
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": result.get("duration_ms", 0),
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("openfda_fetch_job_completed", stats=stats)
         return result
@@ -248,22 +288,33 @@ async def openfda_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("openfda_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "openfda").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "openfda")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
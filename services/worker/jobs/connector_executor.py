@@ -1,7 +1,8 @@
 import structlog
 from datetime import datetime
 from typing import Dict, Any
-from supabase import Client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -15,14 +16,14 @@ async def execute_connector_run(ctx: Dict[str, Any], run_id: str):
     3. 커넥터 타입에 따른 실제 수집 로직 실행
     4. 결과에 따라 'succeeded' 또는 'failed'로 업데이트
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
 
     logger.info("connector_run_execution_started", run_id=run_id)
 
     try:
         # 1. 작업 정보 및 커넥터 정보 조회
         result = (
-            db.table("connector_runs")
+            await db.table("connector_runs")
             .select("*, connectors(*)")
             .eq("id", run_id)
             .execute()
@@ -40,16 +41,19 @@ async def execute_connector_run(ctx: Dict[str, Any], run_id: str):
 
         # 2. 상태 확인 (이미 poll_db_jobs에서 running으로 변경됨)
         # attempt는 여기서 증가시킴
-        db.table("connector_runs").update(
-            {"attempt": run_data.get("attempt", 0) + 1}
-        ).eq("id", run_id).execute()
+        await (
+            db.table("connector_runs")
+            .update({"attempt": run_data.get("attempt", 0) + 1})
+            .eq("id", run_id)
+            .execute()
+        )
 
         # Circuit Breaker Check
         # Check last 5 runs for this connector
         connector_id = run_data.get("connector_id")
         if connector_id:
             last_runs = (
-                db.table("connector_runs")
+                await db.table("connector_runs")
                 .select("status")
                 .eq("connector_id", connector_id)
                 .order("created_at", desc=True)
@@ -62,17 +66,22 @@ async def execute_connector_run(ctx: Dict[str, Any], run_id: str):
                 if len(failures) >= 5:
                     logger.error("circuit_breaker_open", connector_id=connector_id)
                     # Fail immediately without retry
-                    db.table("connector_runs").update(
-                        {
-                            "status": "failed",
-                            "ended_at": datetime.utcnow().isoformat(),
-                            "error_json": {
-                                "error": "Circuit Breaker Open: Too many consecutive failures"
-                            },
-                            "locked_by": None,
-                            "locked_at": None,
-                        }
-                    ).eq("id", run_id).execute()
+                    await (
+                        db.table("connector_runs")
+                        .update(
+                            {
+                                "status": "failed",
+                                "ended_at": datetime.utcnow().isoformat(),
+                                "error_json": {
+                                    "error": "Circuit Breaker Open: Too many consecutive failures"
+                                },
+                                "locked_by": None,
+                                "locked_at": None,
+                            }
+                        )
+                        .eq("id", run_id)
+                        .execute()
+                    )
                     return
 
         # 3. 커넥터 타입 및 시드 정보 확인
@@ -234,15 +243,20 @@ async def execute_connector_run(ctx: Dict[str, Any], run_id: str):
                 raise ValueError(f"Unsupported connector type: {connector_type}")
 
         # 4. 성공 업데이트
-        db.table("connector_runs").update(
-            {
-                "status": "succeeded",
-                "ended_at": datetime.utcnow().isoformat(),
-                "result_summary": result_summary,
-                "locked_by": None,
-                "locked_at": None,
-            }
-        ).eq("id", run_id).execute()
+        await (
+            db.table("connector_runs")
+            .update(
+                {
+                    "status": "succeeded",
+                    "ended_at": datetime.utcnow().isoformat(),
+                    "result_summary": result_summary,
+                    "locked_by": None,
+                    "locked_at": None,
+                }
+            )
+            .eq("id", run_id)
+            .execute()
+        )
 
         logger.info("connector_run_execution_succeeded", run_id=run_id)
 
@@ -258,26 +272,35 @@ async def execute_connector_run(ctx: Dict[str, Any], run_id: str):
         next_retry = (datetime.utcnow() + timedelta(seconds=delay)).isoformat()
 
         # 실패 업데이트 및 Lock 해제
-        db.table("connector_runs").update(
-            {
-                "status": "failed",
-                "ended_at": datetime.utcnow().isoformat(),
-                "error_json": {"error": str(e)},
-                "next_retry_at": next_retry,
-                "locked_by": None,
-                "locked_at": None,
-            }
-        ).eq("id", run_id).execute()
+        await (
+            db.table("connector_runs")
+            .update(
+                {
+                    "status": "failed",
+                    "ended_at": datetime.utcnow().isoformat(),
+                    "error_json": {"error": str(e)},
+                    "next_retry_at": next_retry,
+                    "locked_by": None,
+                    "locked_at": None,
+                }
+            )
+            .eq("id", run_id)
+            .execute()
+        )
 
         # 알림 생성
         try:
-            db.table("alerts").insert(
-                {
-                    "type": "error",
-                    "source": f"connector:{connector.get('name', 'unknown')}",
-                    "message": f"Connector run failed: {str(e)}",
-                    "details": {"run_id": run_id, "attempt": attempt},
-                }
-            ).execute()
+            await (
+                db.table("alerts")
+                .insert(
+                    {
+                        "type": "error",
+                        "source": f"connector:{connector.get('name', 'unknown')}",
+                        "message": f"Connector run failed: {str(e)}",
+                        "details": {"run_id": run_id, "attempt": attempt},
+                    }
+                )
+                .execute()
+            )
         except Exception as alert_err:
             logger.error("failed_to_create_alert", error=str(alert_err))
@@ -1,6 +1,7 @@
 import structlog
 from datetime import datetime
-from supabase import Client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -12,7 +13,7 @@ async def data_quality_check_job(ctx, run_id: str = None):
     1. Component Catalog Completeness (SMILES, Synonyms)
     2. Golden Candidate Quality (Evidence, Confidence)
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     logger.info("data_quality_check_started")
 
     reports = []
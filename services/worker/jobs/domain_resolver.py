@@ -1,8 +1,9 @@
 import structlog
 from typing import Dict, Any, List
-from supabase import Client
 from datetime import datetime
 
+from app.core.database import job_db
+
 logger = structlog.get_logger()
 
 
@@ -13,14 +14,14 @@ async def resolve_entities(ctx: Dict[str, Any], seed_set_id: str):
     - Targets: gene_symbol -> Ensembl ID, UniProt Accession
     - Drugs: drug_name -> ChEMBL ID, PubChem CID
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     log = logger.bind(seed_set_id=seed_set_id)
 
     log.info("entity_resolution_started")
 
     # 1. Targets Resolution
     target_results = (
-        db.table("seed_set_targets")
+        await db.table("seed_set_targets")
         .select("target_id, entity_targets(*)")
         .eq("seed_set_id", seed_set_id)
         .execute()
@@ -36,7 +37,7 @@ async def resolve_entities(ctx: Dict[str, Any], seed_set_id: str):
 
     # 2. Diseases Resolution
     disease_results = (
-        db.table("seed_set_diseases")
+        await db.table("seed_set_diseases")
         .select("disease_id, entity_diseases(*)")
         .eq("seed_set_id", seed_set_id)
         .execute()
@@ -56,24 +57,22 @@ async def generate_queries(
     """
     시드 세트와 커넥터 타입에 따라 실제 실행할 쿼리 목록을 생성합니다.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     queries = []
 
     # 시드 데이터 로드
     targets = (
-        db.table("seed_set_targets")
+        await db.table("seed_set_targets")
         .select("entity_targets(gene_symbol, ensembl_gene_id)")
         .eq("seed_set_id", seed_set_id)
         .execute()
-        .data
-    )
+    ).data
     diseases = (
-        db.table("seed_set_diseases")
+        await db.table("seed_set_diseases")
         .select("entity_diseases(disease_name, search_term, ontology_id)")
         .eq("seed_set_id", seed_set_id)
         .execute()
-        .data
-    )
+    ).data
 
     if connector_name == "pubmed":
         # PubMed용 쿼리: (Target) AND (Disease)
@@ -109,11 +108,11 @@ async def ingest_to_staging(
     수집된 데이터를 스테이징 테이블(staging_components)에 저장합니다.
     관리자의 승인을 거쳐 카탈로그에 반영됩니다.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
 
     # 중복 확인 (이름 기준)
     existing = (
-        db.table("staging_components")
+        await db.table("staging_components")
         .select("id")
         .eq("name", name)
         .eq("type", component_type)
@@ -123,17 +122,21 @@ async def ingest_to_staging(
         logger.info("staging_item_exists", name=name, type=component_type)
         return
 
-    db.table("staging_components").insert(
-        {
-            "type": component_type,
-            "name": name,
-            "normalized": data,
-            "source_info": {
-                "source": source,
-                "fetched_at": datetime.utcnow().isoformat(),
-            },
-            "status": "pending_review",
-        }
-    ).execute()
+    await (
+        db.table("staging_components")
+        .insert(
+            {
+                "type": component_type,
+                "name": name,
+                "normalized": data,
+                "source_info": {
+                    "source": source,
+                    "fetched_at": datetime.utcnow().isoformat(),
+                },
+                "status": "pending_review",
+            }
+        )
+        .execute()
+    )
 
     logger.info("ingested_to_staging", name=name, type=component_type)
@@ -3,7 +3,7 @@ import json
 import re
 import requests
 from datetime import datetime
-from supabase import Client
+from app.core.database import job_db
 from .dictionaries import (
     PAYLOAD_DICTIONARY,
     TARGET_LIST_SOLID,
@@ -44,7 +44,7 @@ async def execute_golden_seed(ctx, run_id: str, config: dict):
     4. 품질 게이트 및 승격 (Quality Gate & Promotion)
     5. DB 적재 (Upsert)
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
 
     # Config Parsing
     target_count = config.get("target_count", 100)
@@ -66,7 +66,9 @@ async def execute_golden_seed(ctx, run_id: str, config: dict):
     }
 
     # 1. Ensure Golden Set Version
-    golden_set_id = _ensure_golden_set_version(db, "Golden Set A", seed_version, config)
+    golden_set_id = await _ensure_golden_set_version(
+        db, "Golden Set A", seed_version, config
+    )
     if not golden_set_id:
         return {"status": "failed", "error": "Failed to ensure Golden Set version"}
 
@@ -184,7 +186,7 @@ async def execute_golden_seed(ctx, run_id: str, config: dict):
                     }
 
                     # Upsert
-                    db.table("golden_candidates").upsert(
+                    await db.table("golden_candidates").upsert(
                         data, on_conflict="golden_set_id,program_key"
                     ).execute()
 
@@ -224,7 +226,7 @@ async def _save_raw_data(db, raw_item, profile_name, parser_version, dataset_ver
     # For lineage, we might want to insert every time or only if hash changes.
     # Use Upsert to handle duplicates (Phase 2)
     res = (
-        db.table("golden_seed_raw")
+        await db.table("golden_seed_raw")
         .upsert(data, on_conflict="source, source_hash")
         .execute()
     )
@@ -339,10 +341,10 @@ def _calculate_confidence_score(cand, min_evidence):
     return min(score, 100), reasons
 
 
-def _ensure_golden_set_version(db, name, version, config):
+async def _ensure_golden_set_version(db, name, version, config):
     try:
         res = (
-            db.table("golden_sets")
+            await db.table("golden_sets")
             .upsert(
                 {"name": name, "version": version, "config": config},
                 on_conflict="name,version",
@@ -6,11 +6,11 @@ Open Targets, HPA, ChEMBL, PubChem 동기화 Jobs
 from datetime import datetime
 from typing import Dict, Any
 import structlog
-from supabase import create_client, Client
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from app.core.database import job_db
+
 
 # .env 파일 로드
 def find_env():
@@ -28,13 +28,6 @@ load_dotenv(find_env())
 logger = structlog.get_logger()
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 # ============================================================
 # Open Targets Jobs
 # ============================================================
@@ -50,12 +43,12 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("opentargets_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 로그 생성을 가장 먼저 수행
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "opentargets",
@@ -65,8 +58,7 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     # 커서 해시 생성 (inline)
     import hashlib
@@ -86,7 +78,7 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
         logger.info("opentargets_batch_mode_enabled")
         # Fetch targets with ensembl_gene_id
         targets = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("ensembl_gene_id")
             .eq("type", "target")
             .not_.is_("ensembl_gene_id", "null")
@@ -122,9 +114,12 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
         ensembl_ids.extend(default_targets)
 
         # 로그 업데이트: 기본 타겟 사용 알림
-        db.table("ingestion_logs").update(
-            {"meta": {"seed": seed, "note": "Using default ADC targets"}}
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update({"meta": {"seed": seed, "note": "Using default ADC targets"}})
+            .eq("id", log_id)
+            .execute()
+        )
 
     query_key = ",".join(ensembl_ids[:5])
     query_hash = hashlib.md5(
@@ -132,16 +127,20 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
     ).hexdigest()[:16]
 
     # 커서 상태: running
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "opentargets",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "opentargets",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     try:
         # Open Targets GraphQL API 호출 (inline)
@@ -210,80 +209,105 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
                         json.dumps(payload, sort_keys=True).encode()
                     ).hexdigest()
 
-                    db.table("raw_source_records").upsert(
-                        {
-                            "source": "opentargets",
-                            "external_id": ensembl_id,
-                            "payload": payload,
-                            "checksum": checksum,
-                            "fetched_at": datetime.utcnow().isoformat(),
-                        },
-                        on_conflict="source,external_id",
-                    ).execute()
+                    await (
+                        db.table("raw_source_records")
+                        .upsert(
+                            {
+                                "source": "opentargets",
+                                "external_id": ensembl_id,
+                                "payload": payload,
+                                "checksum": checksum,
+                                "fetched_at": datetime.utcnow().isoformat(),
+                            },
+                            on_conflict="source,external_id",
+                        )
+                        .execute()
+                    )
 
                     # Target Profile 업데이트 (associations)
                     # Ensembl ID로 매칭하거나, 없으면 Uniprot ID 매핑이 필요함.
                     # 여기서는 Ensembl ID가 있는 경우에만 업데이트
 
                     existing = (
-                        db.table("target_profiles")
+                        await db.table("target_profiles")
                         .select("id")
                         .eq("ensembl_id", ensembl_id)
                         .execute()
                     )
 
                     if existing.data:
-                        db.table("target_profiles").update(
-                            {
-                                "associations": associations[
-                                    :50
-                                ],  # 상위 50개만 저장 (JSON 크기 제한 고려)
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                        ).eq("ensembl_id", ensembl_id).execute()
+                        await (
+                            db.table("target_profiles")
+                            .update(
+                                {
+                                    "associations": associations[
+                                        :50
+                                    ],  # 상위 50개만 저장 (JSON 크기 제한 고려)
+                                    "updated_at": datetime.utcnow().isoformat(),
+                                }
+                            )
+                            .eq("ensembl_id", ensembl_id)
+                            .execute()
+                        )
                         updated_count += 1
                     else:
                         # Ensembl ID로 찾지 못했으면, gene_symbol로 시도 (fallback)
                         symbol = target_data.get("approvedSymbol")
                         if symbol:
                             existing_symbol = (
-                                db.table("target_profiles")
+                                await db.table("target_profiles")
                                 .select("id")
                                 .eq("gene_symbol", symbol)
                                 .execute()
                             )
                             if existing_symbol.data:
-                                db.table("target_profiles").update(
-                                    {
-                                        "ensembl_id": ensembl_id,  # Ensembl ID 업데이트
-                                        "associations": associations[:50],
-                                        "updated_at": datetime.utcnow().isoformat(),
-                                    }
-                                ).eq("gene_symbol", symbol).execute()
+                                await (
+                                    db.table("target_profiles")
+                                    .update(
+                                        {
+                                            "ensembl_id": ensembl_id,  # Ensembl ID 업데이트
+                                            "associations": associations[:50],
+                                            "updated_at": datetime.utcnow().isoformat(),
+                                        }
+                                    )
+                                    .eq("gene_symbol", symbol)
+                                    .execute()
+                                )
                                 updated_count += 1
 
         stats = {"fetched": fetched_count, "new": 0, "updated": updated_count}
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "opentargets").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "opentargets")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("opentargets_fetch_job_completed", stats=stats)
         return {"status": "completed", "stats": stats, "duration_ms": duration_ms}
@@ -291,23 +315,34 @@ async def opentargets_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("opentargets_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "opentargets").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "opentargets")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -327,7 +362,7 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("hpa_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 커서 해시 생성 (inline)
@@ -335,19 +370,23 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
 
     query_hash = hashlib.md5(f"hpa:{str(seed)}".encode()).hexdigest()[:16]
 
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "hpa",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "hpa",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "hpa",
@@ -357,8 +396,7 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     try:
         # HPA API 호출 (inline)
@@ -372,7 +410,7 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
             logger.info("hpa_batch_mode_enabled")
             # Fetch targets with ensembl_gene_id or gene_symbol
             targets = (
-                db.table("component_catalog")
+                await db.table("component_catalog")
                 .select("ensembl_gene_id, gene_symbol")
                 .eq("type", "target")
                 .execute()
@@ -414,9 +452,12 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
             # HER2(ERBB2), TROP2(TACSTD2), CD20(MS4A1), CD19, TP53
             seed["gene_symbols"] = ["ERBB2", "TACSTD2", "MS4A1", "CD19", "TP53"]
 
-            db.table("ingestion_logs").update(
-                {"meta": {"seed": seed, "note": "Using default HPA targets"}}
-            ).eq("id", log_id).execute()
+            await (
+                db.table("ingestion_logs")
+                .update({"meta": {"seed": seed, "note": "Using default HPA targets"}})
+                .eq("id", log_id)
+                .execute()
+            )
 
         identifiers = []
         identifiers.extend(seed.get("ensembl_ids", []))
@@ -497,16 +538,20 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
                         json.dumps(payload, sort_keys=True).encode()
                     ).hexdigest()
 
-                    db.table("raw_source_records").upsert(
-                        {
-                            "source": "hpa",
-                            "external_id": ensembl or gene,
-                            "payload": payload,
-                            "checksum": checksum,
-                            "fetched_at": datetime.utcnow().isoformat(),
-                        },
-                        on_conflict="source,external_id",
-                    ).execute()
+                    await (
+                        db.table("raw_source_records")
+                        .upsert(
+                            {
+                                "source": "hpa",
+                                "external_id": ensembl or gene,
+                                "payload": payload,
+                                "checksum": checksum,
+                                "fetched_at": datetime.utcnow().isoformat(),
+                            },
+                            on_conflict="source,external_id",
+                        )
+                        .execute()
+                    )
 
                     # Target Profile 업데이트 (expression)
                     expression_data = {
@@ -524,7 +569,7 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
                     existing = None
                     if ensembl:
                         existing = (
-                            db.table("target_profiles")
+                            await db.table("target_profiles")
                             .select("id, expression")
                             .eq("ensembl_id", ensembl)
                             .execute()
@@ -533,7 +578,7 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
                     if not existing or not existing.data:
                         if gene:
                             existing = (
-                                db.table("target_profiles")
+                                await db.table("target_profiles")
                                 .select("id, expression")
                                 .eq("gene_symbol", gene)
                                 .execute()
@@ -543,25 +588,34 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
                         current_expr = existing.data[0].get("expression", {}) or {}
                         current_expr.update(expression_data)
 
-                        db.table("target_profiles").update(
-                            {
-                                "expression": current_expr,
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                        ).eq("id", existing.data[0]["id"]).execute()
+                        await (
+                            db.table("target_profiles")
+                            .update(
+                                {
+                                    "expression": current_expr,
+                                    "updated_at": datetime.utcnow().isoformat(),
+                                }
+                            )
+                            .eq("id", existing.data[0]["id"])
+                            .execute()
+                        )
                         updated_count += 1
                     else:
                         # 새 프로필 생성 (gene_symbol이 있는 경우만)
                         if gene:
-                            db.table("target_profiles").insert(
-                                {
-                                    "gene_symbol": gene,
-                                    "ensembl_id": ensembl,
-                                    "protein_name": data.get("Protein name", ""),
-                                    "expression": expression_data,
-                                    "created_at": datetime.utcnow().isoformat(),
-                                }
-                            ).execute()
+                            await (
+                                db.table("target_profiles")
+                                .insert(
+                                    {
+                                        "gene_symbol": gene,
+                                        "ensembl_id": ensembl,
+                                        "protein_name": data.get("Protein name", ""),
+                                        "expression": expression_data,
+                                        "created_at": datetime.utcnow().isoformat(),
+                                    }
+                                )
+                                .execute()
+                            )
                             updated_count += 1
 
                 except Exception as e:
@@ -572,25 +626,36 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
         stats = {"fetched": fetched_count, "new": 0, "updated": updated_count}
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "hpa").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "hpa")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("hpa_fetch_job_completed", stats=stats)
         return {"status": "completed", "stats": stats, "duration_ms": duration_ms}
@@ -598,23 +663,34 @@ async def hpa_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("hpa_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "hpa").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "hpa")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -634,12 +710,12 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("chembl_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 로그 생성을 가장 먼저 수행
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "chembl",
@@ -649,8 +725,7 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     # 커서 해시 생성 (inline)
     import hashlib
@@ -660,7 +735,7 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
         logger.info("chembl_batch_mode_enabled")
         # Fetch payloads/linkers with chembl_id
         compounds = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("chembl_id")
             .in_("type", ["payload", "linker"])
             .not_.is_("chembl_id", "null")
@@ -689,22 +764,29 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
         # T-DM1 (Trastuzumab emtansine)
         seed["chembl_ids"] = ["CHEMBL1201583"]
 
-        db.table("ingestion_logs").update(
-            {"meta": {"seed": seed, "note": "Using default ChEMBL target"}}
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update({"meta": {"seed": seed, "note": "Using default ChEMBL target"}})
+            .eq("id", log_id)
+            .execute()
+        )
 
     query_hash = hashlib.md5(f"chembl:{str(seed)}".encode()).hexdigest()[:16]
 
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "chembl",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "chembl",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     try:
         # ChEMBL API 호출 (inline)
@@ -813,25 +895,36 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
         stats = {"fetched": fetched_count, "new": 0, "updated": updated_count}
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "chembl").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "chembl")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("chembl_fetch_job_completed", stats=stats)
         return {"status": "completed", "stats": stats, "duration_ms": duration_ms}
@@ -839,23 +932,34 @@ async def chembl_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("chembl_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "chembl").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "chembl")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -873,16 +977,20 @@ async def save_chembl_data(db, data):
     payload = data
     checksum = hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()
 
-    db.table("raw_source_records").upsert(
-        {
-            "source": "chembl",
-            "external_id": chembl_id,
-            "payload": payload,
-            "checksum": checksum,
-            "fetched_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,external_id",
-    ).execute()
+    await (
+        db.table("raw_source_records")
+        .upsert(
+            {
+                "source": "chembl",
+                "external_id": chembl_id,
+                "payload": payload,
+                "checksum": checksum,
+                "fetched_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,external_id",
+        )
+        .execute()
+    )
 
     # Compound Registry 저장
     structures = data.get("molecule_structures", {}) or {}
@@ -916,7 +1024,7 @@ async def save_chembl_data(db, data):
     inchi_key = structures.get("standard_inchi_key")
     if inchi_key:
         existing = (
-            db.table("compound_registry")
+            await db.table("compound_registry")
             .select("id")
             .eq("inchi_key", inchi_key)
             .execute()
@@ -924,20 +1032,23 @@ async def save_chembl_data(db, data):
 
     if not existing or not existing.data:
         existing = (
-            db.table("compound_registry")
+            await db.table("compound_registry")
             .select("id")
             .eq("chembl_id", chembl_id)
             .execute()
         )
 
     if existing and existing.data:
-        db.table("compound_registry").update(compound_data).eq(
-            "id", existing.data[0]["id"]
-        ).execute()
+        await (
+            db.table("compound_registry")
+            .update(compound_data)
+            .eq("id", existing.data[0]["id"])
+            .execute()
+        )
         return True
     else:
         compound_data["created_at"] = datetime.utcnow().isoformat()
-        db.table("compound_registry").insert(compound_data).execute()
+        await db.table("compound_registry").insert(compound_data).execute()
         return True
 
 
@@ -956,12 +1067,12 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("pubchem_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 로그 생성을 가장 먼저 수행
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "pubchem",
@@ -971,8 +1082,7 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     # 커서 해시 생성 (inline)
     import hashlib
@@ -982,7 +1092,7 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
         logger.info("pubchem_batch_mode_enabled")
         # Fetch payloads/linkers with pubchem_cid or inchikey
         compounds = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("pubchem_cid, inchikey")
             .in_("type", ["payload", "linker"])
             .or_("pubchem_cid.neq.null,inchikey.neq.null")
@@ -1025,22 +1135,29 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
         # Aspirin (CID 2244)
         seed["cids"] = [2244]
 
-        db.table("ingestion_logs").update(
-            {"meta": {"seed": seed, "note": "Using default PubChem target"}}
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update({"meta": {"seed": seed, "note": "Using default PubChem target"}})
+            .eq("id", log_id)
+            .execute()
+        )
 
     query_hash = hashlib.md5(f"pubchem:{str(seed)}".encode()).hexdigest()[:16]
 
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "pubchem",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "pubchem",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     try:
         # PubChem API 호출 (inline)
@@ -1153,25 +1270,36 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
         stats = {"fetched": fetched_count, "new": 0, "updated": updated_count}
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "pubchem").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "pubchem")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("pubchem_fetch_job_completed", stats=stats)
         return {"status": "completed", "stats": stats, "duration_ms": duration_ms}
@@ -1179,23 +1307,34 @@ async def pubchem_fetch_job(ctx, seed: Dict[str, Any]):
     except Exception as e:
         logger.error("pubchem_fetch_job_failed", error=str(e))
 
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "pubchem").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "pubchem")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -1213,16 +1352,20 @@ async def save_pubchem_data(db, data):
     payload = data
     checksum = hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()
 
-    db.table("raw_source_records").upsert(
-        {
-            "source": "pubchem",
-            "external_id": str(cid),
-            "payload": payload,
-            "checksum": checksum,
-            "fetched_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,external_id",
-    ).execute()
+    await (
+        db.table("raw_source_records")
+        .upsert(
+            {
+                "source": "pubchem",
+                "external_id": str(cid),
+                "payload": payload,
+                "checksum": checksum,
+                "fetched_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,external_id",
+        )
+        .execute()
+    )
 
     # Compound Registry 저장
     compound_data = {
@@ -1248,7 +1391,7 @@ async def save_pubchem_data(db, data):
     inchi_key = data.get("InChIKey")
     if inchi_key:
         existing = (
-            db.table("compound_registry")
+            await db.table("compound_registry")
             .select("id, checksum, pubchem_cid")
             .eq("inchi_key", inchi_key)
             .execute()
@@ -1256,7 +1399,7 @@ async def save_pubchem_data(db, data):
 
     if not existing or not existing.data:
         existing = (
-            db.table("compound_registry")
+            await db.table("compound_registry")
             .select("id, checksum, pubchem_cid")
             .eq("pubchem_cid", str(cid))
             .execute()
@@ -1267,13 +1410,16 @@ async def save_pubchem_data(db, data):
         if not existing.data[0].get("pubchem_cid"):
             compound_data["pubchem_cid"] = str(cid)
 
-        db.table("compound_registry").update(compound_data).eq(
-            "id", existing.data[0]["id"]
-        ).execute()
+        await (
+            db.table("compound_registry")
+            .update(compound_data)
+            .eq("id", existing.data[0]["id"])
+            .execute()
+        )
         return True
     else:
         compound_data["created_at"] = datetime.utcnow().isoformat()
-        db.table("compound_registry").insert(compound_data).execute()
+        await db.table("compound_registry").insert(compound_data).execute()
         return True
 
 
@@ -1,9 +1,10 @@
 import structlog
 from datetime import datetime
 from typing import Dict, Any
-from supabase import Client
 import httpx
 
+from app.core.database import job_db
+
 logger = structlog.get_logger()
 
 
@@ -11,7 +12,7 @@ async def opentargets_fetch_job(ctx: Dict[str, Any], seed: Dict[str, Any]):
     """
     Open Targets API를 통해 타겟-질병 연관성 데이터를 수집합니다.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     log = logger.bind(seed=seed)
     log.info("opentargets_fetch_started")
 
@@ -59,16 +60,20 @@ async def opentargets_fetch_job(ctx: Dict[str, Any], seed: Dict[str, Any]):
                 json.dumps(payload, sort_keys=True).encode()
             ).hexdigest()
 
-            db.table("raw_source_records").upsert(
-                {
-                    "source": "opentargets",
-                    "external_id": f"{target_id}_{disease_id}",
-                    "payload": payload,
-                    "checksum": checksum,
-                    "fetched_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="source,external_id",
-            ).execute()
+            await (
+                db.table("raw_source_records")
+                .upsert(
+                    {
+                        "source": "opentargets",
+                        "external_id": f"{target_id}_{disease_id}",
+                        "payload": payload,
+                        "checksum": checksum,
+                        "fetched_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="source,external_id",
+                )
+                .execute()
+            )
 
             # Target Profile 업데이트 (jsonb 필드에 연관성 정보 추가)
             # 실제로는 target_profiles 테이블의 구조에 맞춰 업데이트 로직 필요
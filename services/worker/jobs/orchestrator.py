@@ -1,9 +1,16 @@
 import structlog
 from datetime import datetime
-from supabase import Client
+from typing import Any, Dict, List, Optional
+from supabase import AsyncClient
+
+from app.services.evidence import EvidenceRAGService
+from app.services.snapshot_store import SnapshotStore
 
 logger = structlog.get_logger()
 
+# 프론트 후보 조회 IN 목록 크기
+CANDIDATE_LOAD_BATCH = 200
+
 
 class ReportOrchestrator:
     """
@@ -14,9 +21,21 @@ class ReportOrchestrator:
     Round 3: Composition & QA (Writer, QA)
     """
 
-    def __init__(self, db: Client, run_id: str):
+    def __init__(
+        self,
+        db: AsyncClient,
+        run_id: str,
+        front_candidate_ids: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            db: Supabase AsyncClient
+            run_id: Design Run ID
+            front_candidate_ids: 첫 번째 파레토 프론트 후보 ID (근거 수집 대상)
+        """
         self.db = db
         self.run_id = run_id
+        self.front_candidate_ids = list(front_candidate_ids or [])
         self.log = logger.bind(run_id=run_id)
         self.report_data = {
             "meta": {
@@ -60,21 +79,89 @@ class ReportOrchestrator:
     async def _round1_harvest(self):
         """Round 1: Evidence Harvest (A1. Evidence Retriever)"""
         self.log.info("round1_harvest_started")
-        # TODO: 실제 RAG 엔진 또는 검색 API 연동
-        # MVP용 더미 데이터 생성
-        self.report_data["evidence"] = [
-            {
-                "evidence_id": "EV-001",
-                "source_type": "literature",
-                "citation": "Nature Reviews Drug Discovery (2023)",
-                "excerpt": "HER2-targeted ADCs show significant efficacy in solid tumors...",
-                "confidence": 0.95,
-            }
-        ]
+        if self.front_candidate_ids:
+            self.report_data["evidence"] = await self._harvest_front_evidence()
+        else:
+            # 파레토 프론트 정보 없음: MVP용 더미 데이터
+            self.report_data["evidence"] = [
+                {
+                    "evidence_id": "EV-001",
+                    "source_type": "literature",
+                    "citation": "Nature Reviews Drug Discovery (2023)",
+                    "excerpt": "HER2-targeted ADCs show significant efficacy in solid tumors...",
+                    "confidence": 0.95,
+                }
+            ]
         self.log.info(
             "round1_harvest_completed", evidence_count=len(self.report_data["evidence"])
         )
 
+    async def _harvest_front_evidence(self) -> List[Dict[str, Any]]:
+        """
+        첫 번째 파레토 프론트 전체 근거 수집
+
+        EvidenceRAGService 배치 API (고유 검색 쿼리당 검색 1회, 동시 실행)
+        → evidence_signals 일괄 저장 → 보고서용 근거 목록 (PMID 기준 중복 제거)
+        """
+        candidates = await self._load_front_candidates()
+        service = EvidenceRAGService(self.db)
+        results = await service.generate_evidence_batch(
+            candidates, {c["id"]: c["score_components"] for c in candidates}
+        )
+        await service.save_evidence(results)
+
+        evidence: Dict[str, Dict[str, Any]] = {}
+        for candidate_id, result in results.items():
+            for citation in result.citations:
+                entry = evidence.get(citation.pmid)
+                if entry is None:
+                    entry = evidence[citation.pmid] = {
+                        "evidence_id": f"EV-{len(evidence) + 1:03d}",
+                        "source_type": "literature",
+                        "citation": citation.title or f"PMID {citation.pmid}",
+                        "pmid": citation.pmid,
+                        "excerpt": citation.text_span,
+                        "polarity": citation.polarity,
+                        "confidence": round(citation.relevance_score, 2),
+                        "candidate_ids": [],
+                    }
+                entry["candidate_ids"].append(candidate_id)
+
+        return list(evidence.values())
+
+    async def _load_front_candidates(self) -> List[Dict[str, Any]]:
+        """프론트 후보 일괄 조회 + 스냅샷 복원 (target/payload/score_components)"""
+        rows = []
+        ids = self.front_candidate_ids
+        for i in range(0, len(ids), CANDIDATE_LOAD_BATCH):
+            result = await (
+                self.db.table("candidates")
+                .select("id, snapshot_refs, candidate_scores(score_components)")
+                .in_("id", ids[i : i + CANDIDATE_LOAD_BATCH])
+                .execute()
+            )
+            rows.extend(result.data or [])
+        await SnapshotStore(self.db).resolve(self.run_id, rows)
+
+        candidates = []
+        for row in rows:
+            snapshot = row.get("snapshot") or {}
+            scores = row.get("candidate_scores") or []
+            if isinstance(scores, dict):
+                scores = [scores]
+            candidates.append(
+                {
+                    "id": row["id"],
+                    "target": snapshot.get("target") or {},
+                    "payload": snapshot.get("payload") or {},
+                    "score_components": (
+                        scores[0].get("score_components") if scores else None
+                    )
+                    or {},
+                }
+            )
+        return candidates
+
     async def _round2_structure_and_score(self):
         """Round 2: Structuring & Scoring (A2. Structurer, A3. Analyst)"""
         self.log.info("round2_structure_started")
@@ -111,14 +198,18 @@ class ReportOrchestrator:
 
     async def _save_report(self):
         """최종 Report JSON 저장"""
-        self.db.table("reports").insert(
-            {
-                "run_id": self.run_id,
-                "report_json": self.report_data,
-                "claim_evidence_rate": 1.0,  # MVP
-                "assumption_count": 0,
-            }
-        ).execute()
+        await (
+            self.db.table("reports")
+            .insert(
+                {
+                    "run_id": self.run_id,
+                    "report_json": self.report_data,
+                    "claim_evidence_rate": 1.0,  # MVP
+                    "assumption_count": 0,
+                }
+            )
+            .execute()
+        )
 
     async def _generate_pdf_artifact(self):
         """보고서 PDF 아티팩트 생성 (시뮬레이션)"""
@@ -128,14 +219,18 @@ class ReportOrchestrator:
         # Supabase Storage 등에 업로드한 후 경로를 저장합니다.
         storage_path = f"reports/{self.run_id}/report.pdf"
 
-        self.db.table("report_artifacts").insert(
-            {
-                "run_id": self.run_id,
-                "artifact_type": "pdf",
-                "storage_path": storage_path,
-                "content_type": "application/pdf",
-                "size_bytes": 1024 * 500,  # 500KB (dummy)
-            }
-        ).execute()
+        await (
+            self.db.table("report_artifacts")
+            .insert(
+                {
+                    "run_id": self.run_id,
+                    "artifact_type": "pdf",
+                    "storage_path": storage_path,
+                    "content_type": "application/pdf",
+                    "size_bytes": 1024 * 500,  # 500KB (dummy)
+                }
+            )
+            .execute()
+        )
 
         self.log.info("pdf_artifact_created", path=storage_path)
@@ -4,12 +4,12 @@ CSV Candidate Parsing Job
 업로드된 CSV 파일을 파싱하여 후보 데이터로 변환
 """
 
-import os
 import io
 import csv
 from typing import Dict, Any, Optional
 import structlog
-from supabase import create_client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -18,17 +18,6 @@ REQUIRED_COLUMNS = ["name"]
 FEATURE_COLUMNS = ["DAR", "LogP", "AggRisk", "H_patch", "CLV", "INT"]
 
 
-def get_db():
-    """Supabase 클라이언트"""
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        raise ValueError("Database not configured")
-
-    return create_client(supabase_url, supabase_key)
-
-
 async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id: str):
     """
     CSV 파싱 Job
@@ -40,14 +29,14 @@ async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id:
     5. uploads.status 업데이트
     """
     log = logger.bind(upload_id=upload_id, user_id=user_id)
-    db = get_db()
+    db = await job_db(ctx)
 
     try:
         log.info("parse_job_started")
 
         # 1. 업로드 레코드 조회
         result = (
-            db.table("uploads")
+            await db.table("uploads")
             .select("*")
             .eq("id", upload_id)
             .eq("owner_user_id", user_id)
@@ -62,7 +51,7 @@ async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id:
 
         # 2. Storage에서 파일 다운로드
         try:
-            file_data = db.storage.from_(upload["storage_bucket"]).download(
+            file_data = await db.storage.from_(upload["storage_bucket"]).download(
                 upload["storage_key"]
             )
         except Exception as e:
@@ -120,7 +109,7 @@ async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id:
 
                 # Candidate 생성
                 candidate_result = (
-                    db.table("user_candidates")
+                    await db.table("user_candidates")
                     .insert(
                         {
                             "owner_user_id": user_id,
@@ -141,14 +130,18 @@ async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id:
                     candidate_id = candidate_result.data[0]["id"]
 
                     # Candidate Input (원본 행) 저장
-                    db.table("candidate_inputs").insert(
-                        {
-                            "candidate_id": candidate_id,
-                            "owner_user_id": user_id,
-                            "raw_row": row,
-                            "row_index": idx,
-                        }
-                    ).execute()
+                    await (
+                        db.table("candidate_inputs")
+                        .insert(
+                            {
+                                "candidate_id": candidate_id,
+                                "owner_user_id": user_id,
+                                "raw_row": row,
+                                "row_index": idx,
+                            }
+                        )
+                        .execute()
+                    )
 
                     # Assay Results 저장 (Features)
                     assay_inserts = []
@@ -168,7 +161,7 @@ async def parse_candidate_csv_job(ctx: Dict[str, Any], upload_id: str, user_id:
                             )
 
                     if assay_inserts:
-                        db.table("assay_results").insert(assay_inserts).execute()
+                        await db.table("assay_results").insert(assay_inserts).execute()
 
                     created_count += 1
 
@@ -211,4 +204,4 @@ async def update_upload_status(
     if error_message:
         update_data["error_message"] = error_message
 
-    db.table("uploads").update(update_data).eq("id", upload_id).execute()
+    await db.table("uploads").update(update_data).eq("id", upload_id).execute()
@@ -3,15 +3,17 @@ PubMed Worker Jobs
 문헌 수집, 청킹, 임베딩 Job 정의
 """
 
-import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional
 import structlog
-from supabase import create_client, Client
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from app.core.database import job_db
+from app.core.embeddings import get_embedding_client
+from app.services.literature import ChunkingService
+
 
 # .env 파일 로드
 def find_env():
@@ -28,12 +30,14 @@ load_dotenv(find_env())
 
 logger = structlog.get_logger()
 
+# 청킹 Job: 문서 배치 크기 / 청크 쓰기 행 수 / 기존 청크 조회 페이지 (PostgREST max-rows)
+CHUNK_DOC_BATCH = 100
+CHUNK_WRITE_BATCH = 500
+CHUNK_FETCH_PAGE = 1000
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
+# 임베딩 Job: 청크 조회 IN 목록 크기 / 벡터 저장 RPC당 행 수 (1536차원 벡터 ≈ 30KB/행)
+EMBED_LOAD_BATCH = 200
+EMBED_WRITE_BATCH = 100
 
 
 async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = None):
@@ -50,7 +54,7 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
     """
     logger.info("pubmed_fetch_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 커서 ID 생성 (inline implementation instead of app.connectors)
@@ -64,20 +68,24 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
     query_hash = hashlib.md5(f"pubmed:{query}:{str(seed)}".encode()).hexdigest()[:16]
 
     # 커서 상태 업데이트: running
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "pubmed",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "pubmed",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     # 로그 시작
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "pubmed",
@@ -87,8 +95,7 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     try:
         # PubMed E-utilities API 호출 (inline implementation)
@@ -145,7 +152,7 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
                 for pmid in pmids:
                     # 이미 존재하는지 확인 (pmid 컬럼 사용)
                     existing = (
-                        db.table("literature_documents")
+                        await db.table("literature_documents")
                         .select("id")
                         .eq("pmid", pmid)
                         .execute()
@@ -184,27 +191,35 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
                             json.dumps(payload_data, sort_keys=True).encode()
                         ).hexdigest()
 
-                        db.table("raw_source_records").insert(
-                            {
-                                "source": "pubmed",
-                                "external_id": pmid,
-                                "payload": payload_data,
-                                "checksum": checksum,
-                            }
-                        ).execute()
+                        await (
+                            db.table("raw_source_records")
+                            .insert(
+                                {
+                                    "source": "pubmed",
+                                    "external_id": pmid,
+                                    "payload": payload_data,
+                                    "checksum": checksum,
+                                }
+                            )
+                            .execute()
+                        )
 
                         # literature_documents에 저장 (schema에 맞춤)
-                        db.table("literature_documents").insert(
-                            {
-                                "pmid": pmid,
-                                "title": title[:500],
-                                "abstract": abstract[:5000] if abstract else None,
-                                "meta": {
-                                    "source": "pubmed",
-                                    "fetched_at": datetime.utcnow().isoformat(),
-                                },
-                            }
-                        ).execute()
+                        await (
+                            db.table("literature_documents")
+                            .insert(
+                                {
+                                    "pmid": pmid,
+                                    "title": title[:500],
+                                    "abstract": abstract[:5000] if abstract else None,
+                                    "meta": {
+                                        "source": "pubmed",
+                                        "fetched_at": datetime.utcnow().isoformat(),
+                                    },
+                                }
+                            )
+                            .execute()
+                        )
 
                         new_count += 1
 
@@ -213,26 +228,37 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
         # 커서 상태 업데이트: idle
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "pubmed").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "pubmed")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
         # 로그 완료
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("pubmed_fetch_job_completed", stats=stats)
 
@@ -240,7 +266,7 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
         if stats.get("new", 0) > 0:
             # 최근 추가된 문헌 조회
             new_docs = (
-                db.table("literature_documents")
+                await db.table("literature_documents")
                 .select("id")
                 .order("created_at", desc=True)
                 .limit(stats["new"])
@@ -266,31 +292,45 @@ async def pubmed_fetch_job(ctx, seed: Dict[str, Any], cursor: Optional[Dict] = N
         logger.error("pubmed_fetch_job_failed", error=str(e))
 
         # 커서 상태 업데이트: failed
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "pubmed").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "pubmed")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
         # 로그 실패
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
 
 async def pubmed_chunk_job(ctx, doc_ids: list):
     """
-    문헌 청킹 Job
+    문헌 청킹 Job (증분 재조정)
+
+    문서 일괄 조회 → ChunkingService 청킹 → 기존 청크와 체크섬 매칭
+    → 바뀐 청크만 삽입/삭제/순서 변경 (내용이 같은 청크는 행과 임베딩 유지)
 
     Args:
         ctx: Arq 컨텍스트
@@ -298,74 +338,23 @@ async def pubmed_chunk_job(ctx, doc_ids: list):
     """
     logger.info("pubmed_chunk_job_started", doc_count=len(doc_ids))
 
-    db = get_supabase()
+    db = await job_db(ctx)
+    chunking = ChunkingService()
 
-    # 토큰 기반 청킹 (간단 버전: 문자 수 기반)
-    CHUNK_SIZE = 1500  # 약 300-400 토큰
-    OVERLAP = 200
+    stats = {"documents": 0, "inserted": 0, "moved": 0, "deleted": 0, "unchanged": 0}
+    embed_ids = []
 
-    chunk_ids = []
-
-    for doc_id in doc_ids:
+    for i in range(0, len(doc_ids), CHUNK_DOC_BATCH):
+        batch = doc_ids[i : i + CHUNK_DOC_BATCH]
         try:
-            # 문헌 조회
-            doc = (
-                db.table("literature_documents")
-                .select("id, title, abstract")
-                .eq("id", doc_id)
-                .execute()
-            )
-
-            if not doc.data:
-                continue
-
-            doc_data = doc.data[0]
-
-            # 텍스트 준비
-            title = doc_data.get("title", "")
-            abstract = doc_data.get("abstract", "")
-            content = f"{title}\n\n{abstract}"
-
-            if not content.strip():
-                continue
-
-            # 청킹
-            chunks = []
-            start = 0
-            chunk_idx = 0
-
-            while start < len(content):
-                end = min(start + CHUNK_SIZE, len(content))
-                chunk_text = content[start:end]
-
-                if chunk_text.strip():
-                    chunks.append(
-                        {
-                            "document_id": doc_id,
-                            "chunk_index": chunk_idx,
-                            "content": chunk_text.strip(),
-                            "token_count": len(chunk_text) // 4,  # 대략적 추정
-                            "embedding_status": "pending",
-                        }
-                    )
-                    chunk_idx += 1
-
-                start = end - OVERLAP if end < len(content) else end
-
-            # 청크 저장 (기존 삭제 후 재생성)
-            db.table("literature_chunks").delete().eq("document_id", doc_id).execute()
-
-            if chunks:
-                result = db.table("literature_chunks").insert(chunks).execute()
-                chunk_ids.extend([c["id"] for c in result.data])
-
+            embed_ids.extend(await _reconcile_chunks(db, chunking, batch, stats))
         except Exception as e:
-            logger.warning("chunk_failed", doc_id=doc_id, error=str(e))
+            logger.warning("chunk_batch_failed", doc_count=len(batch), error=str(e))
 
-    logger.info("pubmed_chunk_job_completed", chunks_created=len(chunk_ids))
+    logger.info("pubmed_chunk_job_completed", **stats)
 
-    # 임베딩 Job enqueue
-    if chunk_ids:
+    # 임베딩 Job enqueue (새 청크 + 임베딩 미완료 기존 청크만)
+    if embed_ids:
         from arq import create_pool
         from arq.connections import RedisSettings
 
@@ -373,101 +362,204 @@ async def pubmed_chunk_job(ctx, doc_ids: list):
             RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
         )
 
-        # 배치로 나누어 enqueue
-        BATCH_SIZE = 50
-        for i in range(0, len(chunk_ids), BATCH_SIZE):
-            batch = chunk_ids[i : i + BATCH_SIZE]
+        # 배치로 나누어 enqueue (Job 내부에서 토큰 예산 단위로 다시 묶어 요청)
+        BATCH_SIZE = 500
+        for i in range(0, len(embed_ids), BATCH_SIZE):
+            batch = embed_ids[i : i + BATCH_SIZE]
             await pool.enqueue_job("pubmed_embed_job", batch)
 
-        logger.info("embed_jobs_enqueued", total_chunks=len(chunk_ids))
+        logger.info("embed_jobs_enqueued", total_chunks=len(embed_ids))
+
+    return {"chunks_created": stats["inserted"], **stats}
+
+
+async def _reconcile_chunks(db, chunking: ChunkingService, doc_ids: list, stats):
+    """
+    문서 배치 청크 재조정 (조회/쓰기 모두 배치 단위 일괄 실행)
+
+    Returns:
+        임베딩이 필요한 청크 ID 목록
+    """
+    docs = (
+        await db.table("literature_documents")
+        .select("id, title, abstract")
+        .in_("id", doc_ids)
+        .execute()
+    ).data or []
+
+    existing = {}
+    for row in await _fetch_chunks(db, doc_ids):
+        existing.setdefault(row["document_id"], []).append(row)
+
+    inserts, moves, deletes, embed_ids = [], [], [], []
+    for doc in docs:
+        title = doc.get("title") or ""
+        abstract = doc.get("abstract") or ""
+        if not (title.strip() or abstract.strip()):
+            continue
+
+        chunks = chunking.chunk_document(doc["id"], title, abstract)
+        for chunk in chunks:
+            chunk.polarity = chunking.detect_polarity(chunk)
+
+        plan = chunking.reconcile(existing.get(doc["id"], []), chunks)
+        inserts.extend(plan.inserts)
+        moves.extend(plan.moves)
+        deletes.extend(plan.deletes)
+        embed_ids.extend(
+            row["id"]
+            for row in plan.reused
+            if row.get("embedding_status") != "completed"
+        )
 
-    return {"chunks_created": len(chunk_ids)}
+        stats["documents"] += 1
+        stats["unchanged"] += len(plan.unchanged)
+
+    # 1. 삭제 (빈 chunk_index 확보)
+    for i in range(0, len(deletes), CHUNK_WRITE_BATCH):
+        await (
+            db.table("literature_chunks")
+            .delete()
+            .in_("id", deletes[i : i + CHUNK_WRITE_BATCH])
+            .execute()
+        )
+    stats["deleted"] += len(deletes)
+
+    # 2. 순서 변경: 음수 임시 인덱스 → 최종 인덱스
+    #    (UNIQUE(document_id, chunk_index) 충돌 없이 청크 간 위치 교환)
+    if moves:
+        columns = ("id", "document_id", "chunk_index", "content")
+        final = [{column: row[column] for column in columns} for row in moves]
+        staged = [{**row, "chunk_index": -row["chunk_index"] - 1} for row in final]
+        for rows in (staged, final):
+            for i in range(0, len(rows), CHUNK_WRITE_BATCH):
+                await (
+                    db.table("literature_chunks")
+                    .upsert(rows[i : i + CHUNK_WRITE_BATCH], on_conflict="id")
+                    .execute()
+                )
+    stats["moved"] += len(moves)
+
+    # 3. 새 청크 삽입
+    rows = [
+        {
+            "document_id": chunk.document_id,
+            "chunk_index": chunk.chunk_index,
+            "content": chunk.content,
+            "token_count": chunk.token_count,
+            "polarity": chunk.polarity,
+            "embedding_status": "pending",
+        }
+        for chunk in inserts
+    ]
+    for i in range(0, len(rows), CHUNK_WRITE_BATCH):
+        result = await (
+            db.table("literature_chunks")
+            .insert(rows[i : i + CHUNK_WRITE_BATCH])
+            .execute()
+        )
+        embed_ids.extend(row["id"] for row in result.data)
+    stats["inserted"] += len(rows)
+
+    return embed_ids
+
+
+async def _fetch_chunks(db, doc_ids: list) -> list:
+    """문서 배치의 기존 청크 전체 조회 (PostgREST 최대 행 수 단위 페이지)"""
+    rows = []
+    offset = 0
+    while True:
+        page = (
+            await db.table("literature_chunks")
+            .select("id, document_id, chunk_index, content, embedding_status")
+            .in_("document_id", doc_ids)
+            .order("id")
+            .range(offset, offset + CHUNK_FETCH_PAGE - 1)
+            .execute()
+        ).data or []
+        rows.extend(page)
+        if len(page) < CHUNK_FETCH_PAGE:
+            return rows
+        offset += CHUNK_FETCH_PAGE
 
 
 async def pubmed_embed_job(ctx, chunk_ids: list):
     """
     청크 임베딩 생성 Job
 
+    대기 청크 일괄 조회 → 배치 임베딩 (토큰 예산 단위 요청, TPM 제한) → 벡터 일괄 저장
+
     Args:
         ctx: Arq 컨텍스트
         chunk_ids: 임베딩할 청크 ID 목록
     """
     logger.info("pubmed_embed_job_started", chunk_count=len(chunk_ids))
 
-    db = get_supabase()
+    db = await job_db(ctx)
 
-    # OpenAI API Key 확인
-    openai_key = os.getenv("OPENAI_API_KEY")
-    if not openai_key:
+    client = get_embedding_client()
+    if client is None:
         logger.warning("openai_key_missing", message="Skipping embedding")
         return {"status": "skipped", "reason": "OPENAI_API_KEY not set"}
 
-    import httpx
+    # 1. 대기 청크 일괄 조회 (완료된 청크 제외)
+    chunks = []
+    for i in range(0, len(chunk_ids), EMBED_LOAD_BATCH):
+        result = (
+            await db.table("literature_chunks")
+            .select("id, content")
+            .in_("id", chunk_ids[i : i + EMBED_LOAD_BATCH])
+            .neq("embedding_status", "completed")
+            .execute()
+        )
+        chunks.extend(result.data or [])
+
+    if not chunks:
+        return {"embedded": 0, "total": len(chunk_ids)}
+
+    # 2. 배치 임베딩
+    vectors = await client.embed([chunk["content"] for chunk in chunks])
+
+    # 3. 벡터 일괄 저장: save_chunk_embeddings RPC (배치당 UPDATE 1회)
+    #    id 기준으로 embedding/embedding_status만 갱신
+    #    (조회 이후 재청킹이 chunk_index를 옮겨도 이전 값을 되돌려 쓰지 않음)
+    embedded = [
+        {"id": chunk["id"], "embedding": vector}
+        for chunk, vector in zip(chunks, vectors)
+        if vector is not None
+    ]
+    failed_ids = [
+        chunk["id"] for chunk, vector in zip(chunks, vectors) if vector is None
+    ]
 
     embedded_count = 0
-
-    for chunk_id in chunk_ids:
+    for i in range(0, len(embedded), EMBED_WRITE_BATCH):
+        batch = embedded[i : i + EMBED_WRITE_BATCH]
         try:
-            # 청크 조회
-            chunk = (
-                db.table("literature_chunks")
-                .select("id, content, embedding_status")
-                .eq("id", chunk_id)
-                .execute()
-            )
-
-            if not chunk.data:
-                continue
-
-            chunk_data = chunk.data[0]
-
-            if chunk_data.get("embedding_status") == "completed":
-                continue
-
-            content = chunk_data["content"]
-
-            # OpenAI Embedding API 호출
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {openai_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": "text-embedding-3-small",
-                        "input": content[:8000],  # 토큰 제한
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.warning(
-                        "embedding_api_failed",
-                        chunk_id=chunk_id,
-                        status=response.status_code,
-                    )
-                    continue
-
-                result = response.json()
-                embedding = result["data"][0]["embedding"]
-
-            # 임베딩 저장
-            db.table("literature_chunks").update(
-                {"embedding": embedding, "embedding_status": "completed"}
-            ).eq("id", chunk_id).execute()
-
-            embedded_count += 1
-
-            # Rate limit 고려 (3000 RPM)
-            await asyncio.sleep(0.02)
-
+            result = await db.rpc("save_chunk_embeddings", {"items": batch}).execute()
+            # 반환값 = 실제 갱신 행 수 (조회 이후 삭제된 청크 제외)
+            embedded_count += result.data or 0
         except Exception as e:
-            logger.warning("embed_failed", chunk_id=chunk_id, error=str(e))
-
-            db.table("literature_chunks").update({"embedding_status": "failed"}).eq(
-                "id", chunk_id
-            ).execute()
+            logger.warning("embed_write_failed", chunks=len(batch), error=str(e))
+            failed_ids.extend(row["id"] for row in batch)
+
+    if failed_ids:
+        await (
+            db.table("literature_chunks")
+            .update({"embedding_status": "failed"})
+            .in_("id", failed_ids)
+            .execute()
+        )
 
-    logger.info("pubmed_embed_job_completed", embedded=embedded_count)
+    logger.info(
+        "pubmed_embed_job_completed",
+        embedded=embedded_count,
+        failed=len(failed_ids),
+        requests=client.stats.requests,
+    )
 
-    return {"embedded": embedded_count, "total": len(chunk_ids)}
+    return {
+        "embedded": embedded_count,
+        "failed": len(failed_ids),
+        "total": len(chunk_ids),
+    }
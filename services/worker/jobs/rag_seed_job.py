@@ -6,11 +6,12 @@ PubMed RAG 기반 Seed 생성 Job
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import structlog
-from supabase import create_client, Client
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from app.core.database import job_db
+from app.core.embeddings import get_embedding_client
+
 
 # .env 파일 로드
 def find_env():
@@ -28,13 +29,6 @@ load_dotenv(find_env())
 logger = structlog.get_logger()
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 # --- Dictionaries & Patterns (Simple Rule-based Extraction) ---
 # 실제 운영 시에는 DB나 별도 파일로 관리 권장
 TARGET_DICTIONARY = {
@@ -113,7 +107,7 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
     """
     logger.info("rag_seed_job_started", run_id=run_id, config=config)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     datetime.utcnow()
 
     try:
@@ -138,7 +132,7 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
             "source": "rag",
             "seed_query_set_id": seed_query_set_id,
         }
-        res = db.table("seed_sets").insert(seed_set_data).execute()
+        res = await db.table("seed_sets").insert(seed_set_data).execute()
         seed_set_id = res.data[0]["id"]
         logger.info("seed_set_created", seed_set_id=seed_set_id)
 
@@ -146,7 +140,7 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
         queries = []
         if seed_query_set_id:
             q_res = (
-                db.table("seed_queries")
+                await db.table("seed_queries")
                 .select("query_text")
                 .eq("seed_query_set_id", seed_query_set_id)
                 .execute()
@@ -164,108 +158,102 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
             ]
 
         # 4. 벡터 검색 및 엔티티 추출
-        import httpx
-
-        openai_key = os.getenv("OPENAI_API_KEY")
+        # 4.1 쿼리 임베딩 (1회 배치 요청, 임베딩 캐시 적중 쿼리는 API 호출 없음)
+        embedding_client = get_embedding_client()
+        if embedding_client is None:
+            logger.warning("openai_key_missing", message="Skipping query embedding")
+            query_embeddings = [None] * len(queries)
+        else:
+            query_embeddings = await embedding_client.embed(queries)
 
         extracted_items = []  # list of dict
         seen_combinations = set()
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            for query_text in queries:
-                if len(extracted_items) >= target_count * 2:  # 충분히 모이면 중단
-                    break
+        for query_text, query_embedding in zip(queries, query_embeddings):
+            if len(extracted_items) >= target_count * 2:  # 충분히 모이면 중단
+                break
 
-                logger.info("processing_query", query=query_text)
+            logger.info("processing_query", query=query_text)
 
-                # 4.1 쿼리 임베딩
-                emb_resp = await client.post(
-                    "https://api.openai.com/v1/embeddings",
-                    headers={"Authorization": f"Bearer {openai_key}"},
-                    json={"model": "text-embedding-3-small", "input": query_text},
-                )
-                if emb_resp.status_code != 200:
-                    logger.error("embedding_failed", status=emb_resp.status_code)
+            if query_embedding is None:
+                logger.error("embedding_failed", query=query_text)
+                continue
+
+            # 4.2 벡터 검색 (RPC 호출 권장, 여기서는 직접 쿼리 시뮬레이션)
+            # Supabase pgvector RPC가 있다고 가정: match_literature_chunks
+            try:
+                rpc_params = {
+                    "query_embedding": query_embedding,
+                    "match_threshold": min_similarity,
+                    "match_count": top_k,
+                }
+                # match_literature_chunks 함수는 006_add_search_function.sql 등에서 정의되어야 함.
+                # 없으면 직접 구현하거나 가정. 여기서는 에러 방지를 위해 try-except
+                chunks = (
+                    await db.rpc("match_literature_chunks", rpc_params).execute()
+                ).data
+            except Exception as e:
+                logger.warning("vector_search_rpc_failed", error=str(e))
+                # Fallback: 그냥 최근 chunk 가져오기 (테스트용)
+                chunks = (
+                    await db.table("literature_chunks")
+                    .select("id, content, document_id")
+                    .limit(top_k)
+                    .execute()
+                ).data
+
+            # 4.3 엔티티 추출 (Rule-based)
+            for chunk in chunks:
+                text = chunk.get("content", "").lower()
+                chunk_id = chunk.get("id")
+
+                # Extract Components
+                target = _extract_from_dict(text, TARGET_DICTIONARY)
+                payload = _extract_from_dict(text, PAYLOAD_DICTIONARY)
+                linker = _extract_from_dict(text, LINKER_DICTIONARY)
+                antibody = _extract_antibody(text, ANTIBODY_PATTERNS)
+
+                # Drug Name (Antibody + Payload 조합 등)
+                drug_name = "Unknown"
+                if antibody and payload:
+                    drug_name = f"{antibody}-{payload}"
+                elif antibody:
+                    drug_name = antibody
+
+                # 유효한 조합인가? (적어도 하나는 있어야 함)
+                if not (target or payload or linker or antibody):
                     continue
 
-                query_embedding = emb_resp.json()["data"][0]["embedding"]
+                # 조합 Key
+                combo_key = f"{target}|{antibody}|{linker}|{payload}|{drug_name}"
+                if combo_key in seen_combinations:
+                    continue
 
-                # 4.2 벡터 검색 (RPC 호출 권장, 여기서는 직접 쿼리 시뮬레이션)
-                # Supabase pgvector RPC가 있다고 가정: match_literature_chunks
-                try:
-                    rpc_params = {
-                        "query_embedding": query_embedding,
-                        "match_threshold": min_similarity,
-                        "match_count": top_k,
+                seen_combinations.add(combo_key)
+
+                # 점수 계산
+                score = 0
+                if target:
+                    score += 20
+                if payload:
+                    score += 20
+                if linker:
+                    score += 20
+                if antibody:
+                    score += 10
+
+                extracted_items.append(
+                    {
+                        "target": target,
+                        "antibody": antibody,
+                        "linker": linker,
+                        "payload": payload,
+                        "drug_name": drug_name,
+                        "score": score,
+                        "chunk_id": chunk_id,
+                        "snippet": text[:200],  # 근거용
                     }
-                    # match_literature_chunks 함수는 006_add_search_function.sql 등에서 정의되어야 함.
-                    # 없으면 직접 구현하거나 가정. 여기서는 에러 방지를 위해 try-except
-                    chunks = (
-                        db.rpc("match_literature_chunks", rpc_params).execute().data
-                    )
-                except Exception as e:
-                    logger.warning("vector_search_rpc_failed", error=str(e))
-                    # Fallback: 그냥 최근 chunk 가져오기 (테스트용)
-                    chunks = (
-                        db.table("literature_chunks")
-                        .select("id, content, document_id")
-                        .limit(top_k)
-                        .execute()
-                        .data
-                    )
-
-                # 4.3 엔티티 추출 (Rule-based)
-                for chunk in chunks:
-                    text = chunk.get("content", "").lower()
-                    chunk_id = chunk.get("id")
-
-                    # Extract Components
-                    target = _extract_from_dict(text, TARGET_DICTIONARY)
-                    payload = _extract_from_dict(text, PAYLOAD_DICTIONARY)
-                    linker = _extract_from_dict(text, LINKER_DICTIONARY)
-                    antibody = _extract_antibody(text, ANTIBODY_PATTERNS)
-
-                    # Drug Name (Antibody + Payload 조합 등)
-                    drug_name = "Unknown"
-                    if antibody and payload:
-                        drug_name = f"{antibody}-{payload}"
-                    elif antibody:
-                        drug_name = antibody
-
-                    # 유효한 조합인가? (적어도 하나는 있어야 함)
-                    if not (target or payload or linker or antibody):
-                        continue
-
-                    # 조합 Key
-                    combo_key = f"{target}|{antibody}|{linker}|{payload}|{drug_name}"
-                    if combo_key in seen_combinations:
-                        continue
-
-                    seen_combinations.add(combo_key)
-
-                    # 점수 계산
-                    score = 0
-                    if target:
-                        score += 20
-                    if payload:
-                        score += 20
-                    if linker:
-                        score += 20
-                    if antibody:
-                        score += 10
-
-                    extracted_items.append(
-                        {
-                            "target": target,
-                            "antibody": antibody,
-                            "linker": linker,
-                            "payload": payload,
-                            "drug_name": drug_name,
-                            "score": score,
-                            "chunk_id": chunk_id,
-                            "snippet": text[:200],  # 근거용
-                        }
-                    )
+                )
 
         # 5. DB 저장 (Entity & Seed Set Items)
         saved_count = 0
@@ -276,27 +264,27 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
         for item in extracted_items[:target_count]:
             # 5.1 엔티티 ID 확보 (Get or Create)
             target_id = (
-                _get_or_create_entity(db, "entity_targets", item["target"])
+                await _get_or_create_entity(db, "entity_targets", item["target"])
                 if item["target"]
                 else None
             )
             antibody_id = (
-                _get_or_create_entity(db, "entity_antibodies", item["antibody"])
+                await _get_or_create_entity(db, "entity_antibodies", item["antibody"])
                 if item["antibody"]
                 else None
             )
             linker_id = (
-                _get_or_create_entity(db, "entity_linkers", item["linker"])
+                await _get_or_create_entity(db, "entity_linkers", item["linker"])
                 if item["linker"]
                 else None
             )
             payload_id = (
-                _get_or_create_entity(db, "entity_payloads", item["payload"])
+                await _get_or_create_entity(db, "entity_payloads", item["payload"])
                 if item["payload"]
                 else None
             )
             drug_id = (
-                _get_or_create_entity(db, "entity_drugs", item["drug_name"])
+                await _get_or_create_entity(db, "entity_drugs", item["drug_name"])
                 if item["drug_name"]
                 else None
             )
@@ -304,7 +292,7 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
             # 5.2 Seed Set Item 저장
             try:
                 item_res = (
-                    db.table("seed_set_items")
+                    await db.table("seed_set_items")
                     .insert(
                         {
                             "seed_set_id": seed_set_id,
@@ -326,14 +314,14 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
                     # 실제로는 chunk_id를 통해 원문(PMID)을 찾아야 함
                     # chunk -> document -> pmid
                     chunk_info = (
-                        db.table("literature_chunks")
+                        await db.table("literature_chunks")
                         .select("document_id")
                         .eq("id", item["chunk_id"])
                         .single()
                         .execute()
                     )
                     doc_info = (
-                        db.table("literature_documents")
+                        await db.table("literature_documents")
                         .select("pmid")
                         .eq("id", chunk_info.data["document_id"])
                         .single()
@@ -357,7 +345,7 @@ async def rag_seed_query_job(ctx, run_id: str, config: Dict[str, Any]):
                     # entity_evidence 테이블 스키마에 맞게 조정 필요.
                     # entity_id는 uuid이므로 seed_set_items의 id를 넣으려면 entity_type='seed_item'으로 약속.
 
-                    db.table("entity_evidence").insert(evidence_data).execute()
+                    await db.table("entity_evidence").insert(evidence_data).execute()
 
                 saved_count += 1
 
@@ -397,21 +385,21 @@ def _extract_antibody(text: str, patterns: List[str]) -> Optional[str]:
     return None
 
 
-def _get_or_create_entity(db, table_name, name):
+async def _get_or_create_entity(db, table_name, name):
     if not name:
         return None
     try:
         # Check exist
-        res = db.table(table_name).select("id").eq("name", name).execute()
+        res = await db.table(table_name).select("id").eq("name", name).execute()
         if res.data:
             return res.data[0]["id"]
         # Create
-        res = db.table(table_name).insert({"name": name}).execute()
+        res = await db.table(table_name).insert({"name": name}).execute()
         if res.data:
             return res.data[0]["id"]
     except Exception:
         # Race condition or error
-        res = db.table(table_name).select("id").eq("name", name).execute()
+        res = await db.table(table_name).select("id").eq("name", name).execute()
         if res.data:
             return res.data[0]["id"]
     return None
@@ -1,6 +1,7 @@
 import structlog
 from datetime import datetime
-from supabase import Client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -9,7 +10,7 @@ async def rdkit_batch_job(ctx, batch_size: int = 50):
     """
     Batch job to calculate RDKit descriptors for components that are missing them.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     logger.info("rdkit_batch_job_started")
 
     # 1. Fetch components needing calculation
@@ -1,6 +1,7 @@
 import structlog
 from datetime import datetime
-from supabase import Client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -10,7 +11,7 @@ async def recommendation_job(ctx, target_set: str = "golden_candidates"):
     Recommendation Job
     Calculates confidence scores for candidates based on the active scoring policy.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     logger.info("recommendation_job_started", target_set=target_set)
 
     # 1. Fetch Active Policy
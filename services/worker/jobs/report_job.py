@@ -1,6 +1,7 @@
 import structlog
 from datetime import datetime
-from supabase import Client
+
+from app.core.database import job_db
 
 logger = structlog.get_logger()
 
@@ -10,7 +11,7 @@ async def report_job(ctx, target_set: str = "golden_candidates"):
     Report Job
     Generates summary statistics for the target candidate set.
     """
-    db: Client = ctx["db"]
+    db = await job_db(ctx)
     logger.info("report_job_started", target_set=target_set)
 
     # 1. Fetch Candidates
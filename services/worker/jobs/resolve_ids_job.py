@@ -1,7 +1,7 @@
 from typing import List, Dict, Any
 import structlog
 from datetime import datetime
-from supabase import Client
+from supabase import AsyncClient
 
 logger = structlog.get_logger()
 
@@ -49,7 +49,7 @@ QUERY_PROFILES = {
 }
 
 
-async def resolve_text(db: Client, text: str, entity_type: str) -> Dict[str, Any]:
+async def resolve_text(db: AsyncClient, text: str, entity_type: str) -> Dict[str, Any]:
     """
     Resolve text to a canonical entity ID using caching.
 
@@ -64,7 +64,7 @@ async def resolve_text(db: Client, text: str, entity_type: str) -> Dict[str, Any
 
     # 1. Check Cache
     cache_res = (
-        db.table("mapping_table")
+        await db.table("mapping_table")
         .select("*")
         .eq("normalized_key", normalized_key)
         .eq("entity_type", entity_type)
@@ -86,7 +86,7 @@ async def resolve_text(db: Client, text: str, entity_type: str) -> Dict[str, Any
 
     # Try Exact Match on Name/Canonical Name
     catalog_res = (
-        db.table("component_catalog")
+        await db.table("component_catalog")
         .select("id, name, canonical_name, synonyms")
         .eq("type", entity_type)
         .execute()
@@ -156,9 +156,11 @@ async def resolve_text(db: Client, text: str, entity_type: str) -> Dict[str, Any
     }
 
     try:
-        db.table("mapping_table").upsert(
-            mapping_entry, on_conflict="normalized_key, entity_type"
-        ).execute()
+        await (
+            db.table("mapping_table")
+            .upsert(mapping_entry, on_conflict="normalized_key, entity_type")
+            .execute()
+        )
     except Exception as e:
         logger.error("mapping_cache_upsert_failed", error=str(e))
 
@@ -176,7 +178,7 @@ async def resolve_text(db: Client, text: str, entity_type: str) -> Dict[str, Any
                 "status": "pending",
                 "created_at": datetime.utcnow().isoformat(),
             }
-            db.table("unmapped_queue").insert(queue_entry).execute()
+            await db.table("unmapped_queue").insert(queue_entry).execute()
         except Exception as e:
             # Queue insertion shouldn't fail the job
             logger.warning("unmapped_queue_insert_failed", error=str(e))
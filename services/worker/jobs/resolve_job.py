@@ -2,10 +2,11 @@ import asyncio
 from typing import Dict, Any
 import structlog
 from datetime import datetime
-from .worker import get_supabase
 import httpx
 import urllib.parse
 
+from app.core.database import job_db
+
 logger = structlog.get_logger()
 
 
@@ -17,7 +18,7 @@ async def resolve_fetch_job(ctx, seed: Dict[str, Any] = None):
     2. Compounds (Payload/Linker): name -> PubChem CID/InChIKey -> ChEMBL ID
     """
     logger.info("resolve_job_started")
-    db = get_supabase()
+    db = await job_db(ctx)
 
     stats = {
         "targets_resolved": 0,
@@ -30,7 +31,7 @@ async def resolve_fetch_job(ctx, seed: Dict[str, Any] = None):
         # 1. Resolve Targets (UniProt)
         # uniprot_accession이 없는 Target 조회
         targets = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .eq("type", "target")
             .is_("uniprot_accession", "null")
@@ -55,12 +56,17 @@ async def resolve_fetch_job(ctx, seed: Dict[str, Any] = None):
                         accession = data["results"][0]["primaryAccession"]
 
                         # Update Catalog
-                        db.table("component_catalog").update(
-                            {
-                                "uniprot_accession": accession,
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                        ).eq("id", item["id"]).execute()
+                        await (
+                            db.table("component_catalog")
+                            .update(
+                                {
+                                    "uniprot_accession": accession,
+                                    "updated_at": datetime.utcnow().isoformat(),
+                                }
+                            )
+                            .eq("id", item["id"])
+                            .execute()
+                        )
 
                         stats["targets_resolved"] += 1
                         logger.info(
@@ -80,7 +86,7 @@ async def resolve_fetch_job(ctx, seed: Dict[str, Any] = None):
         # 2. Resolve Compounds (PubChem & ChEMBL)
         # inchikey 또는 pubchem_cid가 없는 Payload/Linker 조회
         compounds = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("*")
             .in_("type", ["payload", "linker"])
             .is_("inchikey", "null")
@@ -138,9 +144,12 @@ async def resolve_fetch_job(ctx, seed: Dict[str, Any] = None):
 
                     if updates:
                         updates["updated_at"] = datetime.utcnow().isoformat()
-                        db.table("component_catalog").update(updates).eq(
-                            "id", item["id"]
-                        ).execute()
+                        await (
+                            db.table("component_catalog")
+                            .update(updates)
+                            .eq("id", item["id"])
+                            .execute()
+                        )
                         stats["compounds_resolved"] += 1
 
                 except Exception as e:
@@ -5,17 +5,28 @@ Run 생성 → 후보 생성 → 스코어링 → 파레토 계산 전체 파이
 체크리스트 §부록C (Worker 실행 순서) 기반
 """
 
+import hashlib
+import json
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from uuid import uuid4
+import numpy as np
 import structlog
 
+from app.core.database import job_db
+from app.rules import RuleLoader, RuleLoadError, RuleSet
 from app.scoring import (
-    BatchScoringEngine,
+    CandidateGenerator,
+    GeneratorStats,
+    ObjectiveStore,
     ParetoCalculator,
-    create_generator_from_catalog,
+    ShardedScoringRunner,
+    acreate_generator_from_catalog,
 )
+from app.services.bulk_writer import CandidateBulkWriter
+from app.services.progress_reporter import ProgressReporter
+from app.services.snapshot_store import SnapshotStore
 
 logger = structlog.get_logger()
 
@@ -28,12 +39,15 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
     1. 입력 정규화 + scoring_version 고정
     2. 카탈로그 로드 (active only)
     3. 후보 생성 (generator) + 하드리젝트 → reject_summaries
-    4. 배치 벡터화 스코어 계산
-    5. 룰 적용 (TODO)
+    4. 룰셋 prescreen + 배치 벡터화 스코어 계산 + 룰 적용 + 배치 즉시 저장 (스트리밍)
+       샤드 완료마다 조합 인덱스 커서 + 통계를 run_progress에 체크포인트,
+       재시도 시 같은 카탈로그/파라미터면 커서부터 재개
+    5. 룰별 리젝트/적중 건수 → reject_summaries
     6. 파레토 프론트 계산
     7. Evidence Engine (TODO - RAG)
     8. Protocol 생성 (TODO)
     9. 상태 업데이트 + run_progress 완료
+       (run_progress는 ProgressReporter로 병합 기록 + Redis 캐시)
 
     Args:
         ctx: Arq context
@@ -42,15 +56,8 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
     Returns:
         {"status": "completed", "stats": {...}}
     """
-    from supabase import create_client
-
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        return {"status": "error", "message": "Supabase not configured"}
-
-    db = create_client(supabase_url, supabase_key)
+    # Worker startup에서 생성한 공유 AsyncClient (HTTP/2 커넥션 풀)
+    db = await job_db(ctx)
     log = logger.bind(run_id=run_id)
 
     start_time = datetime.utcnow()
@@ -68,31 +75,45 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
         # 1. Run 정보 로드 (이미 poll_db_jobs에서 running으로 변경됨)
         log.info("run_starting")
 
-        run_result = db.table("design_runs").select("*").eq("id", run_id).execute()
+        run_result = (
+            await db.table("design_runs").select("*").eq("id", run_id).execute()
+        )
         if not run_result.data:
             return {"status": "error", "message": "Run not found"}
 
         run = run_result.data[0]
 
         # attempt 증가 및 시작 시간 기록
-        db.table("design_runs").update(
-            {
-                "attempt": run.get("attempt", 0) + 1,
-                "started_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("id", run_id).execute()
-
-        # run_progress 초기화
-        db.table("run_progress").upsert(
-            {
-                "run_id": run_id,
-                "phase": "loading",
-                "processed_candidates": 0,
-                "accepted_candidates": 0,
-                "rejected_candidates": 0,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).execute()
+        await (
+            db.table("design_runs")
+            .update(
+                {
+                    "attempt": run.get("attempt", 0) + 1,
+                    "started_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("id", run_id)
+            .execute()
+        )
+
+        # 이전 시도의 체크포인트 (재시도 시 재개용)
+        progress_result = (
+            await db.table("run_progress")
+            .select("cursor, checkpoint")
+            .eq("run_id", run_id)
+            .execute()
+        )
+        previous = progress_result.data[0] if progress_result.data else {}
+
+        # run_progress 초기화 (cursor/checkpoint는 유지)
+        # 배치별 진행률은 시간/진행률 변화 기준으로 병합, phase 변경은 즉시 기록
+        progress = ProgressReporter(db, run_id, redis=ctx.get("redis"))
+        await progress.set_phase(
+            "loading",
+            processed_candidates=0,
+            accepted_candidates=0,
+            rejected_candidates=0,
+        )
 
         # ================================================
         # 2. 카탈로그 로드 (active only)
@@ -102,14 +123,19 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
         target_ids = run.get("target_ids", [])
         constraints = run.get("constraints", {})
 
-        # 룰셋 로드 (TODO: ruleset_v0.1.yaml 지원)
-        hard_reject_rules = []
+        # 룰셋 로드 (Run 고정 버전, 없으면 최신 룰셋)
+        ruleset = _load_ruleset(run.get("ruleset_version"))
+        if ruleset:
+            log.info(
+                "ruleset_loaded", version=ruleset.version, rules=len(ruleset.rules)
+            )
+        else:
+            log.warning("ruleset_not_found", version=run.get("ruleset_version"))
 
-        generator = create_generator_from_catalog(
+        generator = await acreate_generator_from_catalog(
             db,
             target_ids=target_ids,
             constraints=constraints,
-            hard_reject_rules=hard_reject_rules,
         )
 
         stats["total_combinations"] = generator.stats.total_combinations
@@ -120,67 +146,172 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
         # ================================================
         log.info("generating_candidates")
 
-        db.table("run_progress").update(
-            {"phase": "generating", "updated_at": datetime.utcnow().isoformat()}
-        ).eq("run_id", run_id).execute()
+        progress.total = stats["total_combinations"]
+        await progress.set_phase("generating")
 
         # 스코어링 파라미터 로드
         scoring_params = {}
         params_result = (
-            db.table("scoring_params").select("*").eq("is_active", True).execute()
+            await db.table("scoring_params").select("*").eq("is_active", True).execute()
         )
         if params_result.data:
             scoring_params = params_result.data[0].get("params", {})
 
-        scoring_engine = BatchScoringEngine(scoring_params)
+        # 스트리밍: 배치마다 즉시 DB 저장, 파레토용으로는 (id, 4축 점수)만 보관
+        objective_store = ObjectiveStore(
+            spill_threshold=int(
+                os.getenv(
+                    "PARETO_SPILL_THRESHOLD", ObjectiveStore.DEFAULT_SPILL_THRESHOLD
+                )
+            )
+        )
 
-        all_candidates = []
-        batch_num = 0
+        # 재개: 조합 공간/파라미터가 같으면 커서 이전 후보는 그대로 두고 이후만 다시 계산
+        checkpoint_key = _checkpoint_key(generator, scoring_params, ruleset)
+        checkpoint = previous.get("checkpoint") or {}
+        start_index = 0
+        if previous.get("cursor") and checkpoint.get("key") == checkpoint_key:
+            start_index = int(previous["cursor"])
+
+        if start_index:
+            # 커서 이후(중단된 샤드의 일부) 저장분 제거 → 재계산 시 중복 없음
+            await (
+                db.table("candidates")
+                .delete()
+                .eq("run_id", run_id)
+                .gte("combination_index", start_index)
+                .execute()
+            )
+            async for ids, objectives in _load_scored_objectives(db, run_id):
+                objective_store.append(ids, objectives)
+            generator.stats.merge(GeneratorStats.from_checkpoint(checkpoint["stats"]))
+            stats["scored"] = len(objective_store)
+            await progress.flush(processed_candidates=stats["scored"])
+            log.info("run_resuming", cursor=start_index, scored=stats["scored"])
+        else:
+            await db.table("candidates").delete().eq("run_id", run_id).execute()
+
+        # 조합 인덱스 범위 샤드 단위 스코어링 (DESIGN_RUN_WORKERS > 1이면 프로세스 병렬)
+        # 하드 리젝트/룰 단계/스코어/저장 포맷은 executor에서 계산, 이벤트 루프는 대기만 함
+        # 룰 리젝트 후보는 저장/파레토에서 제외, penalty는 Fit에 반영된 상태로 전달
+        runner = ShardedScoringRunner(
+            generator,
+            scoring_params,
+            workers=int(os.getenv("DESIGN_RUN_WORKERS", "1")),
+            shard_candidates=int(
+                os.getenv(
+                    "DESIGN_RUN_SHARD_CANDIDATES",
+                    ShardedScoringRunner.DEFAULT_SHARD_CANDIDATES,
+                )
+            ),
+            ruleset=ruleset,
+            start_index=start_index,
+        )
 
-        for batch in generator.generate_batches():
-            batch_num += 1
-            log.info("processing_batch", batch=batch_num, size=len(batch))
-
-            # 스코어 계산
-            scores = scoring_engine.score_batch(batch)
-
-            # 후보 + 스코어 합치기
-            for candidate, score in zip(batch, scores):
-                candidate_data = {
-                    "id": str(uuid4()),
-                    "run_id": run_id,
-                    "target_id": candidate["target"].get("id"),
-                    "antibody_id": candidate["antibody"].get("id"),
-                    "linker_id": candidate["linker"].get("id"),
-                    "payload_id": candidate["payload"].get("id"),
-                    "conjugation_id": candidate["conjugation"].get("id"),
-                    "candidate_hash": candidate["candidate_hash"],
-                    "snapshot": {
-                        "target": candidate["target"],
-                        "antibody": candidate["antibody"],
-                        "linker": candidate["linker"],
-                        "payload": candidate["payload"],
-                    },
-                    "eng_fit": score.eng_fit,
-                    "bio_fit": score.bio_fit,
-                    "safety_fit": score.safety_fit,
-                    "evidence_fit": score.evidence_fit,
-                    "score_components": scoring_engine.score_to_dict(score).get(
-                        "score_components", {}
-                    ),
-                }
-                all_candidates.append(candidate_data)
+        # 컴포넌트 스냅샷은 Run당 1회 저장, 후보는 content_hash로 참조
+        components = {
+            "target": generator.targets,
+            "antibody": generator.antibodies,
+            "linker": generator.linkers,
+            "payload": generator.payloads,
+        }
+        snapshot_hashes = await SnapshotStore(db).register_run(run_id, components)
 
-            stats["scored"] += len(batch)
+        # 후보/스코어 대량 저장 (바이트 예산 청크, 동시 업로드, DATABASE_URL 있으면 COPY)
+        writer = CandidateBulkWriter(
+            db,
+            dsn=os.getenv("DATABASE_URL"),
+            chunk_bytes=int(
+                os.getenv(
+                    "DESIGN_RUN_WRITE_CHUNK_BYTES",
+                    CandidateBulkWriter.DEFAULT_CHUNK_BYTES,
+                )
+            ),
+            concurrency=int(
+                os.getenv(
+                    "DESIGN_RUN_WRITE_CONCURRENCY",
+                    CandidateBulkWriter.DEFAULT_CONCURRENCY,
+                )
+            ),
+        )
+        batch_num = 0
 
-            # 진행률 업데이트
-            db.table("run_progress").update(
-                {
-                    "processed_candidates": stats["scored"],
-                    "updated_at": datetime.utcnow().isoformat(),
+        async for shard in runner.iter_shards():
+            for shard_batch in shard.batches:
+                batch_num += 1
+                log.info(
+                    "processing_batch",
+                    batch=batch_num,
+                    shard=shard.shard_index,
+                    size=len(shard_batch),
+                )
+
+                index_batch = shard_batch.index_batch
+                fits = shard_batch.objectives.tolist()
+                candidate_ids = [str(uuid4()) for _ in range(len(shard_batch))]
+                role_indices = {
+                    "target": index_batch.target_idx.tolist(),
+                    "antibody": index_batch.antibody_idx.tolist(),
+                    "linker": index_batch.linker_idx.tolist(),
+                    "payload": index_batch.payload_idx.tolist(),
                 }
-            ).eq("run_id", run_id).execute()
+                conjugation_indices = index_batch.conjugation_idx.tolist()
+                combination_indices = shard_batch.combination_index.tolist()
+
+                # 후보 + 스코어 레코드 (배치 단위로만 유지)
+                candidate_records = [
+                    {
+                        "id": candidate_ids[i],
+                        "run_id": run_id,
+                        **{
+                            f"{role}_id": components[role][indices[i]].get("id")
+                            for role, indices in role_indices.items()
+                        },
+                        "conjugation_id": generator.conjugations[
+                            conjugation_indices[i]
+                        ].get("id"),
+                        "candidate_hash": shard_batch.candidate_hashes[i],
+                        "combination_index": combination_indices[i],
+                        "snapshot_refs": {
+                            role: snapshot_hashes[role][indices[i]]
+                            for role, indices in role_indices.items()
+                        },
+                    }
+                    for i in range(len(shard_batch))
+                ]
+                score_records = [
+                    {
+                        "id": str(uuid4()),
+                        "candidate_id": candidate_ids[i],
+                        "eng_fit": fits[i][0],
+                        "bio_fit": fits[i][1],
+                        "safety_fit": fits[i][2],
+                        "evidence_fit": fits[i][3],
+                        "score_components": shard_batch.score_components[i],
+                    }
+                    for i in range(len(shard_batch))
+                ]
+
+                # 업로드 예약 (청크 저장은 다음 배치 스코어링/변환과 병행)
+                await writer.write(candidate_records, score_records)
+
+                objective_store.append(candidate_ids, shard_batch.objectives)
+                stats["scored"] += len(shard_batch)
+
+                # 진행률 (병합 기록)
+                await progress.update(processed_candidates=stats["scored"])
+
+            # 샤드 저장 완료 → 커서 체크포인트 (통계는 [0, cursor) 구간과 정확히 일치)
+            await writer.flush()
+            await progress.flush(
+                cursor=shard.index_range[1],
+                checkpoint={
+                    "key": checkpoint_key,
+                    "stats": generator.stats.to_checkpoint(),
+                },
+            )
 
+        await writer.close()
         stats["hard_rejected"] = generator.stats.hard_rejected
         stats["accepted"] = generator.stats.accepted
 
@@ -189,89 +320,59 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
             accepted=stats["accepted"],
             rejected=stats["hard_rejected"],
             scored=stats["scored"],
+            objectives_spilled=objective_store.spilled,
+            write_chunks=writer.stats.chunks,
+            write_retries=writer.stats.retries,
+            copy_chunks=writer.stats.copy_chunks,
         )
 
         # ================================================
-        # 4. 하드 리젝트 요약 저장
+        # 4. 리젝트 요약 저장 (하드 리젝트 + 룰별 리젝트/적중 건수)
         # ================================================
-        reject_summaries = generator.get_reject_summary()
+        reject_summaries = (
+            generator.get_reject_summary() + generator.get_rule_hit_summary()
+        )
         for summary in reject_summaries:
-            db.table("candidate_reject_summaries").upsert(
-                {
-                    "run_id": run_id,
-                    "reason_code": summary["reason_code"],
-                    "reason_text": summary["reason_text"],
-                    "rejected_count": summary["rejected_count"],
-                    "updated_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="run_id,reason_code",
-            ).execute()
-
-        # ================================================
-        # 5. 후보 DB 저장
-        # ================================================
-        log.info("saving_candidates")
-
-        db.table("run_progress").update(
-            {"phase": "saving", "updated_at": datetime.utcnow().isoformat()}
-        ).eq("run_id", run_id).execute()
-
-        # 배치 인서트 (500개씩)
-        for i in range(0, len(all_candidates), 500):
-            batch = all_candidates[i : i + 500]
-
-            # candidates 테이블
-            candidate_records = [
-                {
-                    "id": c["id"],
-                    "run_id": c["run_id"],
-                    "target_id": c["target_id"],
-                    "antibody_id": c["antibody_id"],
-                    "linker_id": c["linker_id"],
-                    "payload_id": c["payload_id"],
-                    "conjugation_id": c["conjugation_id"],
-                    "candidate_hash": c["candidate_hash"],
-                    "snapshot": c["snapshot"],
-                }
-                for c in batch
-            ]
-            db.table("candidates").insert(candidate_records).execute()
-
-            # candidate_scores 테이블
-            score_records = [
-                {
-                    "candidate_id": c["id"],
-                    "eng_fit": c["eng_fit"],
-                    "bio_fit": c["bio_fit"],
-                    "safety_fit": c["safety_fit"],
-                    "evidence_fit": c["evidence_fit"],
-                    "score_components": c["score_components"],
-                }
-                for c in batch
-            ]
-            db.table("candidate_scores").insert(score_records).execute()
+            await (
+                db.table("candidate_reject_summaries")
+                .upsert(
+                    {
+                        "run_id": run_id,
+                        "reason_code": summary["reason_code"],
+                        "reason_text": summary["reason_text"],
+                        "rejected_count": summary["rejected_count"],
+                        "updated_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="run_id,reason_code",
+                )
+                .execute()
+            )
 
         # ================================================
-        # 6. 파레토 프론트 계산
+        # 5. 파레토 프론트 계산 (후보는 3단계에서 이미 저장됨)
         # ================================================
         log.info("calculating_pareto")
 
-        db.table("run_progress").update(
-            {"phase": "pareto", "updated_at": datetime.utcnow().isoformat()}
-        ).eq("run_id", run_id).execute()
+        await progress.set_phase("pareto")
 
-        pareto_calculator = ParetoCalculator()
-        fronts = pareto_calculator.calculate(all_candidates, max_fronts=5)
+        pareto_calculator = ParetoCalculator(
+            backend=os.getenv("PARETO_BACKEND", "auto")
+        )
+        with objective_store:
+            fronts = pareto_calculator.calculate_matrix(
+                objective_store.matrix(), objective_store.ids(), max_fronts=5
+            )
 
         stats["pareto_fronts"] = len(fronts)
 
-        # 파레토 프론트 저장
+        # 파레토 프론트 저장 (재시도 시 이전 시도 프론트 교체, 멤버는 cascade)
         front_records, member_records = pareto_calculator.to_db_format(fronts, run_id)
+        await db.table("run_pareto_fronts").delete().eq("run_id", run_id).execute()
 
         if front_records:
-            db.table("run_pareto_fronts").insert(front_records).execute()
+            await db.table("run_pareto_fronts").insert(front_records).execute()
         if member_records:
-            db.table("run_pareto_members").insert(member_records).execute()
+            await db.table("run_pareto_members").insert(member_records).execute()
 
         # Top-N 후보 (RAG/Protocol 우선 처리용)
         top_candidates = pareto_calculator.get_top_candidates(fronts, top_n=50)
@@ -284,46 +385,55 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
         )
 
         # ================================================
-        # 7. 보고서 오케스트레이션 (Orchestrator)
+        # 6. 보고서 오케스트레이션 (Orchestrator)
         # ================================================
         log.info("starting_orchestrator")
         from jobs.orchestrator import ReportOrchestrator
 
-        orchestrator = ReportOrchestrator(db, run_id)
+        orchestrator = ReportOrchestrator(
+            db,
+            run_id,
+            front_candidate_ids=(
+                [member.candidate_id for member in fronts[0].members] if fronts else []
+            ),
+        )
         report_data = await orchestrator.execute()
 
         # TODO: PDF 렌더링 및 Artifact 저장 로직 추가
 
         # ================================================
-        # 9. 완료 상태 업데이트
+        # 8. 완료 상태 업데이트
         # ================================================
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-        db.table("design_runs").update(
-            {
-                "status": "completed",
-                "completed_at": datetime.utcnow().isoformat(),
-                "result_summary": {
-                    "total_combinations": stats["total_combinations"],
-                    "accepted_candidates": stats["accepted"],
-                    "rejected_candidates": stats["hard_rejected"],
-                    "pareto_fronts": stats["pareto_fronts"],
-                    "top_candidates": stats["top_candidates"],
-                    "duration_ms": duration_ms,
-                },
-                "locked_by": None,
-                "locked_at": None,
-            }
-        ).eq("id", run_id).execute()
-
-        db.table("run_progress").update(
-            {
-                "phase": "completed",
-                "accepted_candidates": stats["accepted"],
-                "rejected_candidates": stats["hard_rejected"],
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("run_id", run_id).execute()
+        await (
+            db.table("design_runs")
+            .update(
+                {
+                    "status": "completed",
+                    "completed_at": datetime.utcnow().isoformat(),
+                    "result_summary": {
+                        "total_combinations": stats["total_combinations"],
+                        "accepted_candidates": stats["accepted"],
+                        "rejected_candidates": stats["hard_rejected"],
+                        "pareto_fronts": stats["pareto_fronts"],
+                        "top_candidates": stats["top_candidates"],
+                        "duration_ms": duration_ms,
+                    },
+                    "locked_by": None,
+                    "locked_at": None,
+                }
+            )
+            .eq("id", run_id)
+            .execute()
+        )
+
+        await progress.complete(
+            phase="completed",
+            processed_candidates=stats["scored"],
+            accepted_candidates=stats["accepted"],
+            rejected_candidates=stats["hard_rejected"],
+        )
 
         log.info("run_completed", duration_ms=duration_ms, stats=stats)
 
@@ -337,6 +447,12 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
     except Exception as e:
         log.error("run_failed", error=str(e))
 
+        # 파레토 임시 파일 정리 + 미완료 업로드 취소
+        if "objective_store" in locals():
+            objective_store.close()
+        if "writer" in locals():
+            await writer.close()
+
         # 재시도 시간 계산
         attempt = run.get("attempt", 0) + 1 if "run" in locals() else 1
         delays = [60, 300, 900]
@@ -346,31 +462,123 @@ async def design_run_execute(ctx: Dict[str, Any], run_id: str) -> Dict[str, Any]
         next_retry = (datetime.utcnow() + timedelta(seconds=delay)).isoformat()
 
         # 실패 상태 업데이트 및 Lock 해제
-        db.table("design_runs").update(
-            {
-                "status": "failed",
-                "result_summary": {"error": str(e)},
-                "next_retry_at": next_retry,
-                "locked_by": None,
-                "locked_at": None,
-            }
-        ).eq("id", run_id).execute()
-
-        db.table("run_progress").update(
-            {"phase": "failed", "updated_at": datetime.utcnow().isoformat()}
-        ).eq("run_id", run_id).execute()
+        await (
+            db.table("design_runs")
+            .update(
+                {
+                    "status": "failed",
+                    "result_summary": {"error": str(e)},
+                    "next_retry_at": next_retry,
+                    "locked_by": None,
+                    "locked_at": None,
+                }
+            )
+            .eq("id", run_id)
+            .execute()
+        )
+
+        if "progress" in locals():
+            await progress.complete(phase="failed")
+        else:
+            await (
+                db.table("run_progress")
+                .update(
+                    {"phase": "failed", "updated_at": datetime.utcnow().isoformat()}
+                )
+                .eq("run_id", run_id)
+                .execute()
+            )
 
         # 알림 생성
         try:
-            db.table("alerts").insert(
-                {
-                    "type": "error",
-                    "source": "worker:design_run",
-                    "message": f"Design run failed: {str(e)}",
-                    "details": {"run_id": run_id, "attempt": attempt},
-                }
-            ).execute()
+            await (
+                db.table("alerts")
+                .insert(
+                    {
+                        "type": "error",
+                        "source": "worker:design_run",
+                        "message": f"Design run failed: {str(e)}",
+                        "details": {"run_id": run_id, "attempt": attempt},
+                    }
+                )
+                .execute()
+            )
         except Exception as alert_err:
             log.error("failed_to_create_alert", error=str(alert_err))
 
         return {"status": "error", "run_id": run_id, "error": str(e)}
+
+
+def _load_ruleset(version: str = None) -> Optional[RuleSet]:
+    """design_runs.ruleset_version 룰셋 로드 ("v0.1" / "0.1"), 없으면 최신 파일"""
+    loader = RuleLoader()
+    if version:
+        try:
+            return loader.load_by_version(str(version).lstrip("v"))
+        except RuleLoadError:
+            pass
+    return loader.load_active()
+
+
+def _checkpoint_key(
+    generator: CandidateGenerator,
+    scoring_params: Dict[str, Any],
+    ruleset: Optional[RuleSet],
+) -> str:
+    """커서 재개 가능 여부 판별 키 (조합 공간 구성 + 스코어링 파라미터 + 룰셋 버전)"""
+    payload = {
+        "components": [
+            [component.get("id") for component in components]
+            for components in (
+                generator.targets,
+                generator.antibodies,
+                generator.linkers,
+                generator.payloads,
+                generator.conjugations,
+            )
+        ],
+        "hard_reject_rules": generator.hard_reject_filter.rules,
+        "scoring_params": scoring_params,
+        "ruleset": ruleset.version if ruleset else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+async def _load_scored_objectives(
+    db, run_id: str, page_size: int = 1000
+) -> AsyncIterator[Tuple[List[str], np.ndarray]]:
+    """커서 이전에 저장된 후보의 (id, 4축 Fit) 페이지 (조합 인덱스 = 원래 저장 순서)"""
+    offset = 0
+    while True:
+        result = (
+            await db.table("candidates")
+            .select(
+                "id, combination_index, "
+                "candidate_scores(eng_fit, bio_fit, safety_fit, evidence_fit)"
+            )
+            .eq("run_id", run_id)
+            .order("combination_index")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        rows = result.data or []
+        ids, objectives = [], []
+        for row in rows:
+            scores = row.get("candidate_scores") or []
+            if isinstance(scores, dict):
+                scores = [scores]
+            if not scores:
+                continue
+            ids.append(row["id"])
+            objectives.append(
+                [
+                    float(scores[0][key] or 0)
+                    for key in ("eng_fit", "bio_fit", "safety_fit", "evidence_fit")
+                ]
+            )
+        if ids:
+            yield ids, np.asarray(objectives, dtype=np.float64)
+        if len(rows) < page_size:
+            return
+        offset += page_size
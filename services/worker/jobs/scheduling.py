@@ -216,20 +216,13 @@ async def fingerprint_daily_compute(ctx: Dict[str, Any]):
 
     pending_compute 상태인 화합물의 fingerprint 계산
     """
-    import os
-    from supabase import create_client
+    from app.core.database import job_db
 
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not supabase_key:
-        return {"status": "error", "message": "Supabase not configured"}
-
-    db = create_client(supabase_url, supabase_key)
+    db = await job_db(ctx)
 
     # pending_compute 상태인 화합물 조회
     pending = (
-        db.table("component_catalog")
+        await db.table("component_catalog")
         .select("id, smiles")
         .eq("status", "pending_compute")
         .not_.is_("smiles", "null")
@@ -258,24 +251,32 @@ async def fingerprint_daily_compute(ctx: Dict[str, Any]):
 
             if fp_result and descriptors:
                 # 상태 업데이트
-                db.table("component_catalog").update(
-                    {
-                        "status": "active",
-                        "properties": {
-                            "rdkit": {
-                                "fingerprint_bits": fp_result["on_bit_count"],
-                                **descriptors,
-                            }
-                        },
-                    }
-                ).eq("id", compound["id"]).execute()
+                await (
+                    db.table("component_catalog")
+                    .update(
+                        {
+                            "status": "active",
+                            "properties": {
+                                "rdkit": {
+                                    "fingerprint_bits": fp_result["on_bit_count"],
+                                    **descriptors,
+                                }
+                            },
+                        }
+                    )
+                    .eq("id", compound["id"])
+                    .execute()
+                )
 
                 processed += 1
             else:
                 # 실패 시 상태 변경
-                db.table("component_catalog").update({"status": "failed"}).eq(
-                    "id", compound["id"]
-                ).execute()
+                await (
+                    db.table("component_catalog")
+                    .update({"status": "failed"})
+                    .eq("id", compound["id"])
+                    .execute()
+                )
 
                 errors += 1
 
@@ -1,10 +1,10 @@
 from typing import Dict, Any
 import structlog
 from datetime import datetime
-import os
 from pathlib import Path
 from dotenv import load_dotenv
-from supabase import create_client, Client
+
+from app.core.database import job_db
 
 
 # .env 파일 로드
@@ -21,13 +21,6 @@ def find_env():
 load_dotenv(find_env())
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 logger = structlog.get_logger()
 
 # Gold Standard Data Definitions
@@ -168,7 +161,7 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
     2. targets_seed_200.json 파일이 있으면 추가 로드
     """
     logger.info("seed_fetch_job_started")
-    db = get_supabase()
+    db = await job_db(ctx)
 
     stats = {"targets": 0, "antibodies": 0, "linkers": 0, "payloads": 0}
 
@@ -237,7 +230,7 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
             if data.get("gene_symbol"):
                 # Check existing by gene_symbol
                 existing = (
-                    db.table("component_catalog")
+                    await db.table("component_catalog")
                     .select("id")
                     .eq("type", "target")
                     .eq("gene_symbol", data["gene_symbol"])
@@ -245,15 +238,18 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                     .execute()
                 )
                 if existing.data:
-                    db.table("component_catalog").update(data).eq(
-                        "id", existing.data[0]["id"]
-                    ).execute()
+                    await (
+                        db.table("component_catalog")
+                        .update(data)
+                        .eq("id", existing.data[0]["id"])
+                        .execute()
+                    )
                 else:
-                    db.table("component_catalog").insert(data).execute()
+                    await db.table("component_catalog").insert(data).execute()
             else:
                 # Check existing by name
                 existing = (
-                    db.table("component_catalog")
+                    await db.table("component_catalog")
                     .select("id")
                     .eq("type", "target")
                     .eq("name", data["name"])
@@ -261,11 +257,14 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                     .execute()
                 )
                 if existing.data:
-                    db.table("component_catalog").update(data).eq(
-                        "id", existing.data[0]["id"]
-                    ).execute()
+                    await (
+                        db.table("component_catalog")
+                        .update(data)
+                        .eq("id", existing.data[0]["id"])
+                        .execute()
+                    )
                 else:
-                    db.table("component_catalog").insert(data).execute()
+                    await db.table("component_catalog").insert(data).execute()
             stats["targets"] += 1
 
         # 2. Antibodies
@@ -282,7 +281,7 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
             }
             # Explicit check for partial index (workspace_id is null)
             existing = (
-                db.table("component_catalog")
+                await db.table("component_catalog")
                 .select("id")
                 .eq("type", "antibody")
                 .eq("name", item["name"])
@@ -290,11 +289,14 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                 .execute()
             )
             if existing.data:
-                db.table("component_catalog").update(data).eq(
-                    "id", existing.data[0]["id"]
-                ).execute()
+                await (
+                    db.table("component_catalog")
+                    .update(data)
+                    .eq("id", existing.data[0]["id"])
+                    .execute()
+                )
             else:
-                db.table("component_catalog").insert(data).execute()
+                await db.table("component_catalog").insert(data).execute()
             stats["antibodies"] += 1
 
         # 3. Linkers
@@ -313,7 +315,7 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                 "updated_at": datetime.utcnow().isoformat(),
             }
             existing = (
-                db.table("component_catalog")
+                await db.table("component_catalog")
                 .select("id")
                 .eq("type", "linker")
                 .eq("name", item["name"])
@@ -321,11 +323,14 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                 .execute()
             )
             if existing.data:
-                db.table("component_catalog").update(data).eq(
-                    "id", existing.data[0]["id"]
-                ).execute()
+                await (
+                    db.table("component_catalog")
+                    .update(data)
+                    .eq("id", existing.data[0]["id"])
+                    .execute()
+                )
             else:
-                db.table("component_catalog").insert(data).execute()
+                await db.table("component_catalog").insert(data).execute()
             stats["linkers"] += 1
 
         # 4. Payloads
@@ -343,7 +348,7 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                 "updated_at": datetime.utcnow().isoformat(),
             }
             existing = (
-                db.table("component_catalog")
+                await db.table("component_catalog")
                 .select("id")
                 .eq("type", "payload")
                 .eq("name", item["name"])
@@ -351,11 +356,14 @@ async def seed_fetch_job(ctx, seed: Dict[str, Any] = None):
                 .execute()
             )
             if existing.data:
-                db.table("component_catalog").update(data).eq(
-                    "id", existing.data[0]["id"]
-                ).execute()
+                await (
+                    db.table("component_catalog")
+                    .update(data)
+                    .eq("id", existing.data[0]["id"])
+                    .execute()
+                )
             else:
-                db.table("component_catalog").insert(data).execute()
+                await db.table("component_catalog").insert(data).execute()
             stats["payloads"] += 1
 
     except Exception as e:
@@ -7,11 +7,11 @@ import asyncio
 from datetime import datetime
 from typing import Dict, Any, List
 import structlog
-from supabase import create_client, Client
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from app.core.database import job_db
+
 
 # .env 파일 로드
 def find_env():
@@ -29,13 +29,6 @@ load_dotenv(find_env())
 logger = structlog.get_logger()
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
     """
     UniProt Target 동기화 Job
@@ -52,7 +45,7 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
     """
     logger.info("uniprot_sync_job_started", seed=seed)
 
-    db = get_supabase()
+    db = await job_db(ctx)
     start_time = datetime.utcnow()
 
     # 커서 해시 생성 (inline implementation)
@@ -67,7 +60,7 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
         logger.info("uniprot_batch_mode_enabled")
         # Fetch targets with uniprot_accession
         targets = (
-            db.table("component_catalog")
+            await db.table("component_catalog")
             .select("uniprot_accession")
             .eq("type", "target")
             .not_.is_("uniprot_accession", "null")
@@ -96,20 +89,24 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
     ]
 
     # 커서 상태 업데이트: running
-    db.table("ingestion_cursors").upsert(
-        {
-            "source": "uniprot",
-            "query_hash": query_hash,
-            "status": "running",
-            "config": seed,
-            "updated_at": datetime.utcnow().isoformat(),
-        },
-        on_conflict="source,query_hash",
-    ).execute()
+    await (
+        db.table("ingestion_cursors")
+        .upsert(
+            {
+                "source": "uniprot",
+                "query_hash": query_hash,
+                "status": "running",
+                "config": seed,
+                "updated_at": datetime.utcnow().isoformat(),
+            },
+            on_conflict="source,query_hash",
+        )
+        .execute()
+    )
 
     # 로그 시작
     log_id = (
-        db.table("ingestion_logs")
+        await db.table("ingestion_logs")
         .insert(
             {
                 "source": "uniprot",
@@ -119,8 +116,7 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
             }
         )
         .execute()
-        .data[0]["id"]
-    )
+    ).data[0]["id"]
 
     try:
         # UniProt API 호출 (inline implementation)
@@ -199,16 +195,20 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
                     json.dumps(payload, sort_keys=True).encode()
                 ).hexdigest()
 
-                db.table("raw_source_records").upsert(
-                    {
-                        "source": "uniprot",
-                        "external_id": primary_accession,
-                        "payload": payload,
-                        "checksum": checksum,
-                        "fetched_at": datetime.utcnow().isoformat(),
-                    },
-                    on_conflict="source,external_id",
-                ).execute()
+                await (
+                    db.table("raw_source_records")
+                    .upsert(
+                        {
+                            "source": "uniprot",
+                            "external_id": primary_accession,
+                            "payload": payload,
+                            "checksum": checksum,
+                            "fetched_at": datetime.utcnow().isoformat(),
+                        },
+                        on_conflict="source,external_id",
+                    )
+                    .execute()
+                )
 
                 # Target Profile 저장 (Upsert)
                 target_data = {
@@ -224,45 +224,59 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
 
                 # 기존 데이터 확인
                 existing = (
-                    db.table("target_profiles")
+                    await db.table("target_profiles")
                     .select("id")
                     .eq("uniprot_id", primary_accession)
                     .execute()
                 )
 
                 if existing.data:
-                    db.table("target_profiles").update(target_data).eq(
-                        "uniprot_id", primary_accession
-                    ).execute()
+                    await (
+                        db.table("target_profiles")
+                        .update(target_data)
+                        .eq("uniprot_id", primary_accession)
+                        .execute()
+                    )
                     updated_count += 1
                 else:
-                    db.table("target_profiles").insert(target_data).execute()
+                    await db.table("target_profiles").insert(target_data).execute()
                     new_count += 1
 
         stats = {"fetched": fetched_count, "new": new_count, "updated": updated_count}
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
         # 커서 상태 업데이트: idle
-        db.table("ingestion_cursors").update(
-            {
-                "status": "idle",
-                "last_success_at": datetime.utcnow().isoformat(),
-                "stats": stats,
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "uniprot").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "idle",
+                    "last_success_at": datetime.utcnow().isoformat(),
+                    "stats": stats,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "uniprot")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
         # 로그 완료
-        db.table("ingestion_logs").update(
-            {
-                "status": "completed",
-                "duration_ms": duration_ms,
-                "records_fetched": stats.get("fetched", 0),
-                "records_new": stats.get("new", 0),
-                "records_updated": stats.get("updated", 0),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "completed",
+                    "duration_ms": duration_ms,
+                    "records_fetched": stats.get("fetched", 0),
+                    "records_new": stats.get("new", 0),
+                    "records_updated": stats.get("updated", 0),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         logger.info("uniprot_sync_job_completed", stats=stats)
 
@@ -272,24 +286,35 @@ async def uniprot_fetch_job(ctx, seed: Dict[str, Any]):
         logger.error("uniprot_sync_job_failed", error=str(e))
 
         # 커서 상태 업데이트: failed
-        db.table("ingestion_cursors").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("source", "uniprot").eq("query_hash", query_hash).execute()
+        await (
+            db.table("ingestion_cursors")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("source", "uniprot")
+            .eq("query_hash", query_hash)
+            .execute()
+        )
 
         # 로그 실패
-        db.table("ingestion_logs").update(
-            {
-                "status": "failed",
-                "error_message": str(e),
-                "duration_ms": int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                ),
-            }
-        ).eq("id", log_id).execute()
+        await (
+            db.table("ingestion_logs")
+            .update(
+                {
+                    "status": "failed",
+                    "error_message": str(e),
+                    "duration_ms": int(
+                        (datetime.utcnow() - start_time).total_seconds() * 1000
+                    ),
+                }
+            )
+            .eq("id", log_id)
+            .execute()
+        )
 
         raise
 
@@ -321,7 +346,7 @@ async def uniprot_batch_sync_job(ctx, uniprot_ids: List[str]):
     """
     logger.info("uniprot_batch_sync_started", total=len(uniprot_ids))
 
-    db = get_supabase()
+    db = await job_db(ctx)
 
     # 배치 크기
     BATCH_SIZE = 25
@@ -402,16 +427,20 @@ async def uniprot_batch_sync_job(ctx, uniprot_ids: List[str]):
                         json.dumps(payload, sort_keys=True).encode()
                     ).hexdigest()
 
-                    db.table("raw_source_records").upsert(
-                        {
-                            "source": "uniprot",
-                            "external_id": primary_accession,
-                            "payload": payload,
-                            "checksum": checksum,
-                            "fetched_at": datetime.utcnow().isoformat(),
-                        },
-                        on_conflict="source,external_id",
-                    ).execute()
+                    await (
+                        db.table("raw_source_records")
+                        .upsert(
+                            {
+                                "source": "uniprot",
+                                "external_id": primary_accession,
+                                "payload": payload,
+                                "checksum": checksum,
+                                "fetched_at": datetime.utcnow().isoformat(),
+                            },
+                            on_conflict="source,external_id",
+                        )
+                        .execute()
+                    )
 
                     # Target Profile 저장
                     target_data = {
@@ -426,19 +455,22 @@ async def uniprot_batch_sync_job(ctx, uniprot_ids: List[str]):
                     }
 
                     existing = (
-                        db.table("target_profiles")
+                        await db.table("target_profiles")
                         .select("id")
                         .eq("uniprot_id", primary_accession)
                         .execute()
                     )
 
                     if existing.data:
-                        db.table("target_profiles").update(target_data).eq(
-                            "uniprot_id", primary_accession
-                        ).execute()
+                        await (
+                            db.table("target_profiles")
+                            .update(target_data)
+                            .eq("uniprot_id", primary_accession)
+                            .execute()
+                        )
                         updated_count += 1
                     else:
-                        db.table("target_profiles").insert(target_data).execute()
+                        await db.table("target_profiles").insert(target_data).execute()
                         new_count += 1
 
                 total_stats["fetched"] += fetched_count
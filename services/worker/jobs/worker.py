@@ -8,7 +8,6 @@ from arq.cron import cron
 import os
 from dotenv import load_dotenv
 import structlog
-from supabase import create_client, Client
 from pathlib import Path
 import sys
 
@@ -35,13 +34,6 @@ load_dotenv(find_env())
 logger = structlog.get_logger()
 
 
-def get_supabase() -> Client:
-    """Supabase 클라이언트"""
-    return create_client(
-        os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    )
-
-
 # === Job Functions ===
 
 
@@ -55,14 +47,19 @@ async def compute_component_descriptors(ctx, component_id: str):
     4. properties.rdkit.descriptors 업데이트
     5. status = 'active' 또는 'failed'
     """
+    from app.core.database import job_db
+
     logger.info("compute_descriptors_started", component_id=component_id)
 
-    db = get_supabase()
+    db = await job_db(ctx)
 
     try:
         # 1. 컴포넌트 조회
         result = (
-            db.table("component_catalog").select("*").eq("id", component_id).execute()
+            await db.table("component_catalog")
+            .select("*")
+            .eq("id", component_id)
+            .execute()
         )
         if not result.data:
             logger.error("component_not_found", component_id=component_id)
@@ -74,9 +71,14 @@ async def compute_component_descriptors(ctx, component_id: str):
 
         if not smiles:
             # SMILES 없으면 바로 active로 전환 (디스크립터 계산 불필요)
-            db.table("component_catalog").update(
-                {"status": "active", "computed_at": datetime.utcnow().isoformat()}
-            ).eq("id", component_id).execute()
+            await (
+                db.table("component_catalog")
+                .update(
+                    {"status": "active", "computed_at": datetime.utcnow().isoformat()}
+                )
+                .eq("id", component_id)
+                .execute()
+            )
 
             logger.info("no_smiles_skipped", component_id=component_id)
             return {"status": "active", "message": "No SMILES - skipped"}
@@ -88,13 +90,18 @@ async def compute_component_descriptors(ctx, component_id: str):
 
         if descriptors is None:
             # 계산 실패
-            db.table("component_catalog").update(
-                {
-                    "status": "failed",
-                    "compute_error": "Invalid SMILES or calculation failed",
-                    "computed_at": datetime.utcnow().isoformat(),
-                }
-            ).eq("id", component_id).execute()
+            await (
+                db.table("component_catalog")
+                .update(
+                    {
+                        "status": "failed",
+                        "compute_error": "Invalid SMILES or calculation failed",
+                        "computed_at": datetime.utcnow().isoformat(),
+                    }
+                )
+                .eq("id", component_id)
+                .execute()
+            )
 
             logger.error("computation_failed", component_id=component_id)
             return {"status": "failed", "error": "Computation failed"}
@@ -102,14 +109,19 @@ async def compute_component_descriptors(ctx, component_id: str):
         # 3. 결과 저장
         properties["rdkit"] = {"descriptors": descriptors}
 
-        db.table("component_catalog").update(
-            {
-                "properties": properties,
-                "status": "active",
-                "compute_error": None,
-                "computed_at": datetime.utcnow().isoformat(),
-            }
-        ).eq("id", component_id).execute()
+        await (
+            db.table("component_catalog")
+            .update(
+                {
+                    "properties": properties,
+                    "status": "active",
+                    "compute_error": None,
+                    "computed_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .eq("id", component_id)
+            .execute()
+        )
 
         logger.info(
             "compute_descriptors_completed",
@@ -126,13 +138,18 @@ async def compute_component_descriptors(ctx, component_id: str):
 
         # 에러 기록
         try:
-            db.table("component_catalog").update(
-                {
-                    "status": "failed",
-                    "compute_error": str(e),
-                    "computed_at": datetime.utcnow().isoformat(),
-                }
-            ).eq("id", component_id).execute()
+            await (
+                db.table("component_catalog")
+                .update(
+                    {
+                        "status": "failed",
+                        "compute_error": str(e),
+                        "computed_at": datetime.utcnow().isoformat(),
+                    }
+                )
+                .eq("id", component_id)
+                .execute()
+            )
         except Exception:
             pass
 
@@ -183,7 +200,9 @@ async def poll_db_jobs(ctx):
     Supabase DB를 폴링하여 대기 중인 작업을 찾아 실행합니다.
     Locking 및 Retry 로직을 포함합니다.
     """
-    db: Client = ctx["db"]
+    from app.core.database import job_db
+
+    db = await job_db(ctx)
     worker_id = os.getenv("HOSTNAME", "worker-default")
     now = datetime.utcnow().isoformat()
     stale_timeout = 600  # 10분
@@ -197,7 +216,7 @@ async def poll_db_jobs(ctx):
     # 1. Connector Runs 폴링 (RPC 기반 Atomic Pickup)
     try:
         # RPC 호출로 안전하게 작업 가져오기 (SKIP LOCKED)
-        rpc_res = db.rpc("pick_connector_run", {"worker_id": worker_id}).execute()
+        rpc_res = await db.rpc("pick_connector_run", {"worker_id": worker_id}).execute()
 
         if rpc_res.data:
             run = rpc_res.data
@@ -214,7 +233,7 @@ async def poll_db_jobs(ctx):
 
     # 2. Design Runs 폴링 및 잠금
     design_query = (
-        db.table("design_runs")
+        await db.table("design_runs")
         .select("id, status, attempt")
         .or_(
             "status.eq.queued,"
@@ -230,7 +249,7 @@ async def poll_db_jobs(ctx):
 
         for run in design_result:
             lock_res = (
-                db.table("design_runs")
+                await db.table("design_runs")
                 .update({"status": "running", "locked_by": worker_id, "locked_at": now})
                 .eq("id", run["id"])
                 .or_(
@@ -248,7 +267,7 @@ async def poll_db_jobs(ctx):
     # 3. Golden Seed Runs 폴링 (새로운 UI 작업 처리)
     try:
         seed_query = (
-            db.table("golden_seed_runs")
+            await db.table("golden_seed_runs")
             .select("id, config")
             .eq("status", "queued")
             .order("created_at")
@@ -263,7 +282,7 @@ async def poll_db_jobs(ctx):
 
             # Lock the run
             lock_res = (
-                db.table("golden_seed_runs")
+                await db.table("golden_seed_runs")
                 .update(
                     {
                         "status": "running",
@@ -287,25 +306,35 @@ async def poll_db_jobs(ctx):
                     result = await execute_golden_seed(ctx, run_id, config)
 
                     # Mark as completed
-                    db.table("golden_seed_runs").update(
-                        {
-                            "status": "completed",
-                            "result": result,
-                            "completed_at": datetime.utcnow().isoformat(),
-                        }
-                    ).eq("id", run_id).execute()
+                    await (
+                        db.table("golden_seed_runs")
+                        .update(
+                            {
+                                "status": "completed",
+                                "result": result,
+                                "completed_at": datetime.utcnow().isoformat(),
+                            }
+                        )
+                        .eq("id", run_id)
+                        .execute()
+                    )
 
                     logger.info("golden_seed_run_completed", run_id=run_id)
 
                 except Exception as e:
                     # Mark as failed
-                    db.table("golden_seed_runs").update(
-                        {
-                            "status": "failed",
-                            "error_message": str(e),
-                            "completed_at": datetime.utcnow().isoformat(),
-                        }
-                    ).eq("id", run_id).execute()
+                    await (
+                        db.table("golden_seed_runs")
+                        .update(
+                            {
+                                "status": "failed",
+                                "error_message": str(e),
+                                "completed_at": datetime.utcnow().isoformat(),
+                            }
+                        )
+                        .eq("id", run_id)
+                        .execute()
+                    )
 
                     logger.error("golden_seed_run_failed", run_id=run_id, error=str(e))
 
@@ -321,12 +350,20 @@ async def poll_db_jobs(ctx):
 
 async def startup(ctx):
     """워커 시작 시 초기화"""
+    from app.core.database import ASYNC_DB_CTX_KEY, create_async_db
+
     logger.info("worker_started")
-    ctx["db"] = get_supabase()
+    # 비동기 Job 공용 AsyncClient (HTTP/2 커넥션 풀, job_db(ctx)로 사용)
+    ctx[ASYNC_DB_CTX_KEY] = await create_async_db()
 
 
 async def shutdown(ctx):
     """워커 종료 시 정리"""
+    from app.core.database import ASYNC_DB_CTX_KEY, close_async_db
+    from app.core.embeddings import close_embedding_client
+
+    await close_async_db(ctx.get(ASYNC_DB_CTX_KEY))
+    await close_embedding_client()
     logger.info("worker_stopped")
 
 